@@ -0,0 +1,99 @@
+"""Benchmark: spatial-grid vs NumPy collision backends.
+
+Scatters zombies across a platformer-sized level, fires a burst of
+projectiles through the crowd and times one collision pass per frame with
+each backend. Both backends must agree on every (projectile, zombie) pair.
+
+Usage:
+    python benchmarks/bench_collision_backends.py
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from collision import (  # noqa: E402
+    NUMPY_AVAILABLE,
+    SpatialGrid,
+    VectorizedCollisionBackend,
+    check_collisions_with_spatial_grid,
+)
+from models import Vector2  # noqa: E402
+from projectile import Projectile  # noqa: E402
+from zombie import Zombie  # noqa: E402
+
+ENTITY_COUNTS = (100, 1000, 10000)
+PROJECTILES = 40
+FRAMES = 30
+LEVEL_WIDTH = 27200
+LEVEL_HEIGHT = 960
+
+
+def _population(count: int, rng: random.Random):
+    """Build zombies and projectiles aimed into the crowd."""
+    zombies = [
+        Zombie(
+            identity_id=f"bench-{i}",
+            identity_name=f"unused-identity-{i}",
+            position=Vector2(rng.uniform(0, LEVEL_WIDTH - 40), rng.uniform(0, LEVEL_HEIGHT - 40)),
+        )
+        for i in range(count)
+    ]
+    projectiles = []
+    for i in range(PROJECTILES):
+        target = zombies[rng.randrange(count)] if i % 2 == 0 else None
+        if target is not None:
+            bounds = target.get_bounds()
+            x, y = bounds.centerx, bounds.centery
+        else:
+            x, y = rng.uniform(0, LEVEL_WIDTH), rng.uniform(0, LEVEL_HEIGHT)
+        projectiles.append(Projectile(Vector2(x, y)))
+    return zombies, projectiles
+
+
+def _step(zombies, rng: random.Random) -> None:
+    """Jitter a slice of the crowd as if they walked this frame."""
+    for zombie in zombies[:: max(1, len(zombies) // 50)]:
+        zombie.position.x += rng.uniform(-2, 2)
+
+
+def main() -> None:
+    """Print per-frame cost for each backend and entity count."""
+    if not NUMPY_AVAILABLE:
+        print("numpy not installed - only the spatial grid backend is available")
+        return
+
+    print(f"{'entities':>9} {'grid (ms/frame)':>16} {'numpy (ms/frame)':>17} {'hits':>5}")
+    for count in ENTITY_COUNTS:
+        rng = random.Random(1234)
+        zombies, projectiles = _population(count, rng)
+        grid = SpatialGrid(LEVEL_WIDTH, LEVEL_HEIGHT)
+        backend = VectorizedCollisionBackend()
+
+        grid_time = numpy_time = 0.0
+        for _ in range(FRAMES):
+            _step(zombies, rng)
+
+            start = time.perf_counter()
+            grid_hits = check_collisions_with_spatial_grid(projectiles, zombies, grid)
+            grid_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            numpy_hits = backend.check(projectiles, zombies)
+            numpy_time += time.perf_counter() - start
+
+            assert grid_hits == numpy_hits, "backends disagree"
+
+        print(
+            f"{count:>9} {grid_time / FRAMES * 1e3:>16.2f} "
+            f"{numpy_time / FRAMES * 1e3:>17.2f} {len(grid_hits):>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+"""Benchmark: headless frame times of the real game loop, with baseline comparison.
+
+Drives GameEngine and Renderer under SDL's dummy video driver with synthetic
+zombie populations, a fake Sonrai client that answers instantly and a fixed
+script of key presses (walk, shoot, jump). Every scenario is seeded, so two
+runs on the same machine simulate the same frames. Each frame is timed twice:
+"update" covers handle_input + update, "frame" adds main.render_game (the
+exact draw calls of the main loop, minus the final scale and flip).
+
+Scenarios: lobby, platformer (Sandbox level), arcade (arcade session in the
+level), boss_battle (the FIGHTING genre each level uses) and the space_shooter,
+racing and maze_chase genre controllers.
+
+Results are written as JSON. Passing --baseline compares p50/p95 against a
+stored run and exits with status 1 if any scenario got slower than the
+tolerance, so a regression in _update_playing or render_zombies shows up
+before a booth event. Record the baseline on the machine that will be
+compared against it, with nothing else running.
+
+Usage:
+    python benchmarks/bench_game_loop.py
+    python benchmarks/bench_game_loop.py --zombies 100 1000 --scenarios platformer arcade
+    python benchmarks/bench_game_loop.py --output run.json --baseline baseline.json
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PHOTO_BOOTH_ENABLED", "false")  # Never open a webcam
+os.environ.setdefault("PHOTO_BOOTH_AUTO_DETECT_CAMERA", "false")
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pygame  # noqa: E402
+
+from frame_profiler import percentile  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+from level_manager import LevelManager  # noqa: E402
+from main import render_game  # noqa: E402
+from models import GameStatus, QuarantineReport, QuarantineResult, Vector2  # noqa: E402
+from renderer import Renderer  # noqa: E402
+from save_manager import SaveManager  # noqa: E402
+from zombie import Zombie  # noqa: E402
+
+ZOMBIE_COUNTS = (100, 1000, 10000)
+FRAMES = 300
+WARMUP_FRAMES = 30
+SEED = 1337
+DELTA_TIME = 1 / 60
+SCREEN_WIDTH = 1280
+SCREEN_HEIGHT = 720
+
+# A p50 this much slower than the baseline counts as a regression (p95 gets
+# twice the slack: tail frames are noisier)
+TOLERANCE = 0.15
+# ...unless it is below this many milliseconds (timer noise on tiny scenarios)
+MIN_REGRESSION_MS = 0.25
+
+# The lobby map surface grows with the square of the org's zombie count, so
+# level scenarios lay the lobby out for at most this many zombies (the level
+# itself still gets every zombie). The lobby scenario uses the real count.
+LOBBY_LAYOUT_MAX_ZOMBIES = 1000
+
+SANDBOX_ACCOUNT = "577945324761"
+PRODUCTION_ACCOUNT = "613056517323"
+LEVELS_CSV = (
+    "Account ID,Name,Environment Type,Order\n"
+    f"{SANDBOX_ACCOUNT},MyHealth - Sandbox,sandbox,1\n"
+    f"{PRODUCTION_ACCOUNT},MyHealth - Production,production,6\n"
+)
+
+
+class FakeSonraiClient:
+    """Stands in for SonraiAPIClient: every call succeeds immediately, no network."""
+
+    def quarantine_identity(self, identity_id: str, *args, **kwargs) -> QuarantineResult:
+        return QuarantineResult(success=True, identity_id=identity_id)
+
+    def batch_quarantine_identities(self, zombies: List, chunk_size: int = 0) -> QuarantineReport:
+        return QuarantineReport(total_queued=len(zombies), successful=len(zombies))
+
+    def block_third_party(self, third_party_id: str, *args, **kwargs) -> QuarantineResult:
+        return QuarantineResult(success=True, identity_id=third_party_id)
+
+    def get_unprotected_services(self, account_id: str) -> List[str]:
+        return []  # No hacker race: it would pause the level on a timer
+
+    def protect_service(self, service_type: str, *args, **kwargs) -> QuarantineResult:
+        return QuarantineResult(success=True, identity_id=service_type)
+
+    def fetch_permission_sets(self, account_id: str) -> List[dict]:
+        return []
+
+    def fetch_jit_configuration(self, account_id: str) -> dict:
+        return {"enrolledPermissionSets": []}
+
+    def apply_jit_protection(self, account_id: str, permission_set_id: str, *args, **kwargs):
+        return QuarantineResult(success=True, identity_id=permission_set_id)
+
+
+def _key(event_type: int, key: int) -> pygame.event.Event:
+    """Build a keyboard event like the ones pygame delivers."""
+    return pygame.event.Event(event_type, key=key, mod=0, unicode="", scancode=0)
+
+
+def scripted_events(frame: int, jump: bool = True) -> List[pygame.event.Event]:
+    """
+    Input for one frame: walk right and left in 4 s sweeps, shoot 7.5 times a
+    second and jump every second.
+
+    Args:
+        frame: Frame number since the scenario started
+        jump: Whether to press UP (off in the lobby, where UP enters doors)
+
+    Returns:
+        Events for the frame
+    """
+    events = []
+    if frame % 240 == 0:
+        right = (frame // 240) % 2 == 0
+        events.append(_key(pygame.KEYUP, pygame.K_LEFT if right else pygame.K_RIGHT))
+        events.append(_key(pygame.KEYDOWN, pygame.K_RIGHT if right else pygame.K_LEFT))
+    if frame % 8 == 0:
+        events.append(_key(pygame.KEYDOWN, pygame.K_SPACE))
+    elif frame % 8 == 1:
+        events.append(_key(pygame.KEYUP, pygame.K_SPACE))
+    if jump and frame % 60 == 30:
+        events.append(_key(pygame.KEYDOWN, pygame.K_UP))
+    elif jump and frame % 60 == 34:
+        events.append(_key(pygame.KEYUP, pygame.K_UP))
+    return events
+
+
+def _make_engine(zombie_count: int, workdir: Path, lobby_count: int) -> GameEngine:
+    """
+    Create a started lobby engine whose Sandbox account holds zombie_count zombies.
+
+    Args:
+        zombie_count: Zombies in the Sandbox account
+        workdir: Directory for the level CSV and save file
+        lobby_count: Sandbox zombie count the lobby rooms are laid out for
+    """
+    levels_csv = workdir / "levels.csv"
+    levels_csv.write_text(LEVELS_CSV)
+
+    rng = random.Random(SEED)
+    zombies = [
+        Zombie(
+            identity_id=f"srn:aws:iam::{SANDBOX_ACCOUNT}/User/bench-{i}",
+            identity_name=f"unused-identity-{i}",
+            position=Vector2(rng.uniform(0, 2000), rng.uniform(0, 600)),
+            account=SANDBOX_ACCOUNT,
+            scope=f"aws/r-bench/{SANDBOX_ACCOUNT}",
+        )
+        for i in range(zombie_count)
+    ]
+    engine = GameEngine(
+        api_client=FakeSonraiClient(),
+        zombies=zombies,
+        screen_width=SCREEN_WIDTH,
+        screen_height=SCREEN_HEIGHT,
+        use_map=True,
+        account_data={SANDBOX_ACCOUNT: lobby_count, PRODUCTION_ACCOUNT: 0},
+        third_party_data={},
+        level_manager=LevelManager(str(levels_csv)),
+    )
+    engine.save_manager = SaveManager(str(workdir / "save.json"))
+    engine.photo_booth = None
+    engine.start()
+    return engine
+
+
+def _enter_sandbox(engine: GameEngine) -> None:
+    """Enter the Sandbox level through its lobby door, as a platformer."""
+    door = next(d for d in engine.game_map.doors if d.destination_room_name == "MyHealth - Sandbox")
+    engine._enter_level(door)
+    engine.wait_for_quest_requests()
+
+
+def _setup_arcade(engine: GameEngine) -> None:
+    """Enter the Sandbox level and start an arcade session."""
+    _enter_sandbox(engine)
+    engine._start_arcade_mode()
+
+
+def _genre(init: str) -> Callable[[GameEngine], None]:
+    """Setup entering the Sandbox level under the genre controller built by init."""
+
+    def setup(engine: GameEngine) -> None:
+        _enter_sandbox(engine)
+        getattr(engine, init)()
+
+    return setup
+
+
+# Scenario name -> setup run on a fresh lobby engine (not timed)
+SCENARIOS: Dict[str, Callable[[GameEngine], None]] = {
+    "lobby": lambda engine: None,
+    "platformer": _enter_sandbox,
+    "arcade": _setup_arcade,
+    "boss_battle": _genre("_init_boss_battle_controller"),
+    "space_shooter": _genre("_init_space_shooter_controller"),
+    "racing": _genre("_init_racing_controller"),
+    "maze_chase": _genre("_init_maze_chase_controller"),
+}
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    """Mean and percentiles of frame times in milliseconds."""
+    values = sorted(s * 1000 for s in samples)
+    return {
+        "mean": round(sum(values) / len(values), 4),
+        "p50": round(percentile(values, 0.50), 4),
+        "p95": round(percentile(values, 0.95), 4),
+        "p99": round(percentile(values, 0.99), 4),
+        "max": round(values[-1], 4),
+    }
+
+
+def run_scenario(name: str, zombie_count: int, frames: int, warmup: int) -> dict:
+    """
+    Time one scenario.
+
+    Args:
+        name: Key of SCENARIOS
+        zombie_count: Zombies in the Sandbox account
+        frames: Frames measured
+        warmup: Frames run before measuring (fills caches, spawns arcade zombies)
+
+    Returns:
+        Result record with update and frame timings in milliseconds, or with
+        an "error" if the scenario could not be set up at this size
+    """
+    random.seed(SEED)
+    lobby_count = zombie_count if name == "lobby" else min(zombie_count, LOBBY_LAYOUT_MAX_ZOMBIES)
+    with tempfile.TemporaryDirectory() as workdir:
+        try:
+            engine = _make_engine(zombie_count, Path(workdir), lobby_count)
+            SCENARIOS[name](engine)
+        except (pygame.error, MemoryError) as e:
+            return {"scenario": name, "zombies": zombie_count, "error": f"{type(e).__name__}: {e}"}
+        renderer = Renderer(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+        engine.renderer = renderer
+        jump = name != "lobby"
+        gc.collect()  # Don't charge setup garbage to the first measured frames
+
+        update_times = []
+        frame_times = []
+        for frame in range(warmup + frames):
+            events = scripted_events(frame, jump)
+            start = time.perf_counter()
+            engine.handle_input(events, renderer.screen)
+            engine.update(DELTA_TIME)
+            updated = time.perf_counter()
+            render_game(renderer, engine, DELTA_TIME)
+            end = time.perf_counter()
+            if frame >= warmup:
+                update_times.append(updated - start)
+                frame_times.append(end - start)
+
+        status = engine.game_state.status
+        active_zombies = len(engine.zombies)
+        engine.shutdown()
+
+    return {
+        "scenario": name,
+        "zombies": zombie_count,
+        "final_status": status.value if isinstance(status, GameStatus) else str(status),
+        "active_zombies": active_zombies,
+        "update_ms": _summary(update_times),
+        "frame_ms": _summary(frame_times),
+    }
+
+
+def compare(results: List[dict], baseline: dict, tolerance: float) -> List[str]:
+    """
+    Find scenarios slower than the baseline.
+
+    Args:
+        results: Records from run_scenario
+        baseline: A previous run's JSON document
+        tolerance: Allowed p50 slowdown as a fraction (0.15 = 15%)
+
+    Returns:
+        One line per regression (empty if none)
+    """
+    previous = {(r["scenario"], r["zombies"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        old = previous.get((result["scenario"], result["zombies"]))
+        if old is None or "error" in old:
+            continue
+        if "error" in result:
+            regressions.append(f"{result['scenario']}/{result['zombies']}: {result['error']}")
+            continue
+        for timing in ("update_ms", "frame_ms"):
+            for stat, slack in (("p50", tolerance), ("p95", tolerance * 2)):
+                before, after = old[timing][stat], result[timing][stat]
+                if after > before * (1 + slack) and after - before > MIN_REGRESSION_MS:
+                    regressions.append(
+                        f"{result['scenario']}/{result['zombies']} {timing[:-3]} {stat}: "
+                        f"{before:.2f} -> {after:.2f} ms ({after / before - 1:+.0%})"
+                    )
+    return regressions
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--zombies", nargs="+", type=int, default=list(ZOMBIE_COUNTS))
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--warmup", type=int, default=WARMUP_FRAMES)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a previous --output file")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark, print a table and compare against the baseline."""
+    args = _parse_args(argv)
+    logging.disable(logging.CRITICAL)
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    print(
+        f"{'scenario':<14} {'zombies':>7} {'update p50':>11} {'p95':>7} "
+        f"{'frame p50':>10} {'p95':>7} {'p99':>7}  status"
+    )
+    results = []
+    for zombie_count in args.zombies:
+        for name in args.scenarios:
+            # GameEngine/GameMap print progress; keep the table readable
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                result = run_scenario(name, zombie_count, args.frames, args.warmup)
+            results.append(result)
+            if "error" in result:
+                print(f"{name:<14} {zombie_count:>7}  setup failed: {result['error']}")
+                continue
+            update, frame = result["update_ms"], result["frame_ms"]
+            print(
+                f"{name:<14} {zombie_count:>7} {update['p50']:>11.2f} {update['p95']:>7.2f} "
+                f"{frame['p50']:>10.2f} {frame['p95']:>7.2f} {frame['p99']:>7.2f}  "
+                f"{result['final_status']}"
+            )
+
+    document = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "seed": SEED,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(document, indent=2))
+        print(f"\nWrote {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) vs {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
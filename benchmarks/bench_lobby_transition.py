@@ -0,0 +1,89 @@
+"""Microbenchmark: level -> lobby transition latency with and without the cached lobby map.
+
+Builds a lobby for several account/zombie counts and times
+GameEngine._return_to_lobby. "rebuild" drops the cached map and lobby zombie
+positions before each return (the old behaviour: a new GameMap and a fresh
+scatter every time); "cached" reuses both and only resets the view, door
+marks and blocked 3rd parties.
+
+Usage:
+    python benchmarks/bench_lobby_transition.py
+"""
+
+import contextlib
+import io
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pygame  # noqa: E402
+
+from game_engine import GameEngine  # noqa: E402
+from models import Vector2  # noqa: E402
+from zombie import Zombie  # noqa: E402
+
+RETURNS = 10
+ACCOUNT_COUNTS = (2, 7)
+ZOMBIES_PER_ACCOUNT = 100
+
+
+def _make_engine(num_accounts: int) -> GameEngine:
+    """Create a lobby engine with num_accounts accounts of zombies."""
+    accounts = [f"{100000000000 + i}" for i in range(num_accounts)]
+    zombies = [
+        Zombie(f"z-{a}-{i}", f"zombie-{i}", Vector2(0, 0), account=a)
+        for a in accounts
+        for i in range(ZOMBIES_PER_ACCOUNT)
+    ]
+    engine = GameEngine(
+        api_client=None,
+        zombies=zombies,
+        screen_width=1280,
+        screen_height=720,
+        use_map=True,
+        account_data={a: ZOMBIES_PER_ACCOUNT for a in accounts},
+        third_party_data={},
+    )
+    engine.all_zombies = zombies
+    engine.start()
+    return engine
+
+
+def _time_returns(engine: GameEngine, rebuild: bool) -> float:
+    """Average seconds per _return_to_lobby call."""
+    total = 0.0
+    for _ in range(RETURNS):
+        if rebuild:
+            engine.lobby_map = None
+            engine.lobby_zombie_positions.clear()
+        start = time.perf_counter()
+        engine._return_to_lobby()
+        total += time.perf_counter() - start
+    return total / RETURNS
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    logging.disable(logging.CRITICAL)
+    pygame.init()
+    print(f"{'accounts':>8} {'zombies':>8} {'rebuild ms':>11} {'cached ms':>10} {'speedup':>8}")
+    for num_accounts in ACCOUNT_COUNTS:
+        # GameMap/GameEngine print progress; keep the table readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine = _make_engine(num_accounts)
+            rebuild = _time_returns(engine, rebuild=True)
+            cached = _time_returns(engine, rebuild=False)
+        print(
+            f"{num_accounts:>8} {num_accounts * ZOMBIES_PER_ACCOUNT:>8} "
+            f"{rebuild * 1000:>11.1f} {cached * 1000:>10.1f} {rebuild / cached:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
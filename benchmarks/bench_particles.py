@@ -0,0 +1,103 @@
+"""Stress benchmark: thousands of live boss particles per frame.
+
+Keeps a constant population of falling droplets alive and measures the cost
+of one 60 FPS frame (update + draw) with the old per-particle dicts and
+per-frame SRCALPHA surfaces versus ParticleSystem. The frame budget at
+60 FPS is 16.7 ms.
+
+Usage:
+    python benchmarks/bench_particles.py
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pygame  # noqa: E402
+
+from particle_system import ParticleSystem  # noqa: E402
+
+FRAMES = 120
+DELTA_TIME = 1 / 60
+SCREEN_SIZE = (1280, 720)
+POPULATIONS = (500, 2000, 5000)
+LIFETIME = 1.0
+
+
+def _spawn_args():
+    """Random droplet start state."""
+    return (
+        random.uniform(0, SCREEN_SIZE[0]),
+        random.uniform(0, SCREEN_SIZE[1] / 2),
+        random.uniform(-50, 50),
+        random.uniform(-100, 0),
+    )
+
+
+def _run_dicts(population: int, screen: pygame.Surface) -> float:
+    """Old path: dict per particle, list.remove, surface built per draw."""
+    particles = []
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        while len(particles) < population:
+            x, y, vx, vy = _spawn_args()
+            particles.append(
+                {"x": x, "y": y, "vx": vx, "vy": vy, "lifetime": random.uniform(0.1, LIFETIME)}
+            )
+        for particle in particles[:]:
+            particle["lifetime"] -= DELTA_TIME
+            particle["x"] += particle["vx"] * DELTA_TIME
+            particle["y"] += particle["vy"] * DELTA_TIME
+            particle["vy"] += 200.0 * DELTA_TIME
+            particle["alpha"] = int(255 * (particle["lifetime"] / LIFETIME))
+            if particle["lifetime"] <= 0:
+                particles.remove(particle)
+        for particle in particles:
+            color = (220, 20, 20, max(0, particle["alpha"]))
+            surface = pygame.Surface((6, 8), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (3, 2), 2)
+            pygame.draw.polygon(surface, color, [(1, 3), (5, 3), (3, 7)])
+            screen.blit(surface, (int(particle["x"]) - 3, int(particle["y"]) - 4))
+    return time.perf_counter() - start
+
+
+def _run_system(population: int, screen: pygame.Surface) -> float:
+    """New path: ParticleSystem update + batched stamp blits."""
+    sprite = pygame.Surface((6, 8), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (220, 20, 20), (3, 2), 2)
+    pygame.draw.polygon(sprite, (220, 20, 20), [(1, 3), (5, 3), (3, 7)])
+    particles = ParticleSystem(capacity=population, gravity=200.0)
+    particles.add_style(sprite, anchor=(3, 4))
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        while len(particles) < population:
+            x, y, vx, vy = _spawn_args()
+            particles.emit(x, y, vx, vy, random.uniform(0.1, LIFETIME))
+        particles.update(DELTA_TIME)
+        particles.draw(screen)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print per-frame cost for each population."""
+    pygame.init()
+    screen = pygame.Surface(SCREEN_SIZE)
+    print(f"{'particles':>10} {'dicts (ms/frame)':>18} {'system (ms/frame)':>19} {'60 FPS':>7}")
+    for population in POPULATIONS:
+        random.seed(population)
+        baseline = _run_dicts(population, screen) / FRAMES * 1000
+        random.seed(population)
+        pooled = _run_system(population, screen) / FRAMES * 1000
+        verdict = "yes" if pooled < 1000 / 60 else "no"
+        print(f"{population:>10} {baseline:>18.2f} {pooled:>19.2f} {verdict:>7}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
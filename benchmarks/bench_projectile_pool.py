@@ -0,0 +1,77 @@
+"""Microbenchmark: sustained fire with and without ProjectilePool.
+
+Simulates a player holding the trigger at several fire rates for a fixed
+number of 60 FPS frames. Each frame fires the due shots, advances every live
+projectile and retires the ones that travelled off the map, mirroring
+GameEngine._update_playing.
+
+Usage:
+    python benchmarks/bench_projectile_pool.py
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models import Vector2  # noqa: E402
+from projectile import Projectile, ProjectilePool  # noqa: E402
+
+FRAMES = 3600  # one minute at 60 FPS
+DELTA_TIME = 1 / 60
+MAP_WIDTH = 2000
+MAP_HEIGHT = 720
+FIRE_RATES = (10, 30, 120)  # shots per second
+
+
+def _run(fire_rate: int, pool: ProjectilePool = None) -> float:
+    """Run one sustained-fire simulation and return elapsed seconds."""
+    direction = Vector2(1, 0)
+    projectiles = []
+    shot_interval = 1.0 / fire_rate
+    shot_timer = 0.0
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        shot_timer += DELTA_TIME
+        while shot_timer >= shot_interval:
+            shot_timer -= shot_interval
+            if pool is not None:
+                projectiles.append(pool.acquire(100, 360, direction))
+            else:
+                projectiles.append(Projectile(Vector2(100, 360), direction))
+
+        if pool is not None:
+            for projectile in projectiles:
+                projectile.update(DELTA_TIME)
+                if projectile.is_off_screen(MAP_WIDTH, MAP_HEIGHT, map_mode=True):
+                    pool.release(projectile)
+            projectiles[:] = [p for p in projectiles if p.active]
+        else:
+            for projectile in projectiles[:]:
+                projectile.update(DELTA_TIME)
+                if projectile.is_off_screen(MAP_WIDTH, MAP_HEIGHT, map_mode=True):
+                    projectiles.remove(projectile)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print per-frame cost for each fire rate."""
+    print(f"{'shots/s':>8} {'no pool (us/frame)':>20} {'pool (us/frame)':>17} {'reuse':>7}")
+    for fire_rate in FIRE_RATES:
+        baseline = _run(fire_rate)
+        pool = ProjectilePool()
+        pooled = _run(fire_rate, pool)
+        total = pool.created + pool.reused
+        reuse = pool.reused / total if total else 0.0
+        print(
+            f"{fire_rate:>8} {baseline / FRAMES * 1e6:>20.1f} "
+            f"{pooled / FRAMES * 1e6:>17.1f} {reuse:>7.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark: cost of one save per quarantine with thousands of identities.
+
+Simulates an arcade burst where every quarantine triggers a save, and
+compares the old full JSON rewrite (indent=2, whole identity list) with
+SaveManager's append-only journal.
+
+Usage:
+    python benchmarks/bench_save_journal.py
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models import GameStatus, Vector2  # noqa: E402
+from save_manager import SaveManager  # noqa: E402
+
+EXISTING = (1000, 5000, 20000)
+BURST = 200  # Quarantines (and saves) measured per run
+
+
+def _state(identities):
+    """Save payload in the old on-disk format."""
+    return {
+        "version": "2.0",
+        "player": {"score": len(identities), "eliminations": len(identities)},
+        "quarantined_identities": list(identities),
+        "blocked_third_parties": [],
+    }
+
+
+def _run_rewrite(directory: Path, existing: int) -> float:
+    """Old path: serialize everything with indent=2 on every save."""
+    path = directory / "rewrite.json"
+    identities = {f"srn:aws:iam::1/User/User/u{i}" for i in range(existing)}
+    start = time.perf_counter()
+    for i in range(BURST):
+        identities.add(f"srn:aws:iam::1/User/User/new{i}")
+        temp = path.with_suffix(".tmp")
+        with open(temp, "w") as f:
+            json.dump(_state(identities), f, indent=2)
+        temp.replace(path)
+    return time.perf_counter() - start
+
+
+def _run_journal(directory: Path, existing: int) -> float:
+    """New path: SaveManager appends only what changed."""
+    manager = SaveManager(str(directory / "journal.json"))
+    identities = {f"srn:aws:iam::1/User/User/u{i}" for i in range(existing)}
+
+    def save():
+        manager.save_game(
+            player_score=len(identities),
+            player_eliminations=len(identities),
+            damage_multiplier=1.0,
+            player_position=Vector2(0, 0),
+            game_status=GameStatus.PLAYING,
+            current_level="111",
+            play_time=0.0,
+            completed_levels=[],
+            unlocked_levels=["111"],
+            quarantined_identities=identities,
+            blocked_third_parties=set(),
+        )
+
+    save()  # First save of a session writes the snapshot
+    start = time.perf_counter()
+    for i in range(BURST):
+        identities.add(f"srn:aws:iam::1/User/User/new{i}")
+        save()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Print per-save cost for each existing identity count."""
+    print(f"{'identities':>10} {'rewrite (ms/save)':>18} {'journal (ms/save)':>18}")
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for existing in EXISTING:
+            rewrite = _run_rewrite(directory, existing) / BURST * 1000
+            journal = _run_journal(directory, existing) / BURST * 1000
+            print(f"{existing:>10} {rewrite:>18.2f} {journal:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
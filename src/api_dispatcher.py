@@ -0,0 +1,164 @@
+"""Bounded worker pool for fire-and-forget Sonrai API calls."""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (future, fn, args, kwargs) waiting for a worker
+_Task = Tuple[Future, Callable[..., Any], tuple, dict]
+
+
+class ApiDispatcher:
+    """
+    Runs API calls on a fixed set of worker threads fed by a bounded queue.
+
+    Eliminations used to start one thread each, so a combo in arcade mode
+    could open dozens of connections at once. The dispatcher caps concurrency
+    at max_workers and the backlog at max_queued: submit() raises queue.Full
+    instead of growing without bound, so the caller decides whether to retry
+    later. Every call returns a Future the game loop can poll without blocking.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queued: int = 32, name: str = "api"):
+        """
+        Initialize the dispatcher (worker threads start on first submit).
+
+        Args:
+            max_workers: Maximum number of API calls running at once
+            max_queued: Maximum number of calls waiting for a worker
+            name: Prefix for worker thread names
+        """
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.name = name
+
+        self._queue: "queue.Queue[Optional[_Task]]" = queue.Queue(maxsize=max_queued)
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._closed = False
+
+        # Futures handed out and not yet returned by poll_completed(); every
+        # caller must poll, or this grows with each call (guarded by _lock)
+        self._pending: List[Future] = []
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running on a worker."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a free worker."""
+        return self._queue.qsize()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Queue a call to run on a worker thread.
+
+        Args:
+            fn: Callable to run (typically an API client method)
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future resolved with fn's return value (or exception)
+
+        Raises:
+            queue.Full: If max_queued calls are already waiting
+            RuntimeError: If the dispatcher has been shut down
+        """
+        if self._closed:
+            raise RuntimeError("ApiDispatcher has been shut down")
+
+        self._start_workers()
+        future: Future = Future()
+        self._queue.put_nowait((future, fn, args, kwargs))
+        with self._lock:
+            self._pending.append(future)
+        return future
+
+    def poll_completed(self) -> List[Future]:
+        """
+        Collect futures that finished since the last poll (never blocks).
+
+        Returns:
+            Completed futures, in submission order
+        """
+        done: List[Future] = []
+        pending: List[Future] = []
+        with self._lock:
+            # One done() check per future, so a call finishing mid-poll lands
+            # in exactly one of the lists (and in done on the next poll)
+            for future in self._pending:
+                (done if future.done() else pending).append(future)
+            self._pending = pending
+        return done
+
+    def shutdown(self, timeout: float = 5.0) -> bool:
+        """
+        Stop accepting calls and let queued and running calls finish.
+
+        Args:
+            timeout: Maximum seconds to wait for the queue to drain
+
+        Returns:
+            True if every worker finished within the timeout
+        """
+        self._closed = True
+        deadline = time.monotonic() + timeout
+
+        # One sentinel per worker, queued behind the remaining calls
+        for _ in self._workers:
+            try:
+                self._queue.put(None, timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                break
+
+        for worker in self._workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+
+        drained = not any(worker.is_alive() for worker in self._workers)
+        if not drained:
+            logger.warning(
+                f"API dispatcher shut down with {self.in_flight} running, {self.queued} queued"
+            )
+        return drained
+
+    def _start_workers(self) -> None:
+        """Start worker threads up to max_workers."""
+        with self._lock:
+            while len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"{self.name}-worker-{len(self._workers)}",
+                    daemon=True,  # Never keep the process alive on exit
+                )
+                self._workers.append(worker)
+                worker.start()
+
+    def _work(self) -> None:
+        """Worker loop: run queued calls until a sentinel arrives."""
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+
+            future, fn, args, kwargs = task
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            with self._lock:
+                self._in_flight += 1
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
@@ -305,3 +305,8 @@ class Boss:
         return pygame.Rect(
             int(self.position.x), int(self.position.y), self.width, self.height
         )
+
+    @property
+    def is_being_eliminated(self) -> bool:
+        """True once defeated (no longer a collision target)."""
+        return self.is_defeated
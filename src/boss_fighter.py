@@ -14,6 +14,7 @@ from typing import List, Optional
 import pygame
 
 from models import Attack, BossAIState, FighterState, Vector2
+from particle_system import ParticleSystem
 
 logger = logging.getLogger(__name__)
 
@@ -231,7 +232,10 @@ class BossFighter:
 
         # Animation
         self.animation_timer = 0.0
-        self.effect_particles: List[dict] = []
+        self.effect_particles = ParticleSystem(capacity=128)
+        # One solid circle style per radius: attack sparks in the effect color, hit sparks in white
+        self._attack_particle_styles = self._add_particle_styles(self.design.effect_color)
+        self._hit_particle_styles = self._add_particle_styles((255, 255, 255))
 
         logger.info(f"BossFighter initialized: {self.design.name}")
 
@@ -266,34 +270,48 @@ class BossFighter:
             self._make_ai_decision(player_position, delta_time)
             self.ai_decision_timer = 0.2
 
+    def _add_particle_styles(self, color: tuple) -> List[int]:
+        """Register one circle particle style per radius from 3 to 8px."""
+        styles = []
+        for size in range(3, 9):
+            sprite = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (size, size), size)
+            styles.append(self.effect_particles.add_style(sprite, fade=False))
+        return styles
+
     def _update_particles(self, delta_time: float) -> None:
         """Update effect particles."""
-        for particle in self.effect_particles[:]:
-            particle["life"] -= delta_time
-            particle["x"] += particle["vx"] * delta_time
-            particle["y"] += particle["vy"] * delta_time
-            if particle["life"] <= 0:
-                self.effect_particles.remove(particle)
+        self.effect_particles.update(delta_time)
 
     def _spawn_attack_particles(self) -> None:
         """Spawn particles for current attack."""
         if not self.current_attack:
             return
 
-        color = self.design.effect_color
         direction = 1 if self.facing_right else -1
 
         for _ in range(5):
-            self.effect_particles.append(
-                {
-                    "x": self.position.x + direction * 30,
-                    "y": self.position.y - 40 + random.randint(-20, 20),
-                    "vx": direction * random.randint(100, 200),
-                    "vy": random.randint(-50, 50),
-                    "life": 0.3,
-                    "color": color,
-                    "size": random.randint(3, 8),
-                }
+            self.effect_particles.emit(
+                x=self.position.x + direction * 30,
+                y=self.position.y - 40 + random.randint(-20, 20),
+                vx=direction * random.randint(100, 200),
+                vy=random.randint(-50, 50),
+                lifetime=0.3,
+                style=random.choice(self._attack_particle_styles),
+            )
+
+    def _spawn_hit_particles(self) -> None:
+        """Spawn a burst of sparks where the boss was struck."""
+        for _ in range(6):
+            angle = random.uniform(0, 2 * math.pi)
+            speed = random.randint(80, 160)
+            self.effect_particles.emit(
+                x=self.position.x,
+                y=self.position.y - 50 + random.randint(-15, 15),
+                vx=math.cos(angle) * speed,
+                vy=math.sin(angle) * speed,
+                lifetime=0.2,
+                style=random.choice(self._hit_particle_styles),
             )
 
     def _end_action(self) -> None:
@@ -396,6 +414,7 @@ class BossFighter:
             actual_damage = damage
             self.state = FighterState.HIT
             self.hit_stun = 0.3
+            self._spawn_hit_particles()
 
         self.health -= actual_damage
         self.health = max(0, self.health)
@@ -521,13 +540,7 @@ class BossFighter:
                 pygame.draw.rect(surface, design.effect_color, hitbox, 2)
 
         # Draw effect particles
-        for particle in self.effect_particles:
-            pygame.draw.circle(
-                surface,
-                particle["color"],
-                (int(particle["x"]), int(particle["y"])),
-                particle["size"],
-            )
+        self.effect_particles.draw(surface)
 
     def _render_boss_details(
         self, surface: pygame.Surface, x: int, y: int, head_y: int, bob: int
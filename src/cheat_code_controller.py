@@ -20,6 +20,7 @@ class CheatCodeAction(Enum):
     SPAWN_BOSS = auto()  # Konami code
     START_ARCADE = auto()  # Arcade cheat code
     TRIGGER_OUTAGE = auto()  # Production outage test
+    TOGGLE_PROFILER = auto()  # Frame-time profiler overlay
 
 
 @dataclass
@@ -40,6 +41,7 @@ class CheatCodeController:
     - SKIP code (skips current level)
     - Konami code (spawns boss)
     - Arcade code (starts arcade mode)
+    - TIMING code (toggles the frame profiler overlay)
     """
 
     # Cheat code definitions
@@ -71,6 +73,14 @@ class CheatCodeController:
         pygame.K_b,
     ]
     OUTAGE_CODE = [pygame.K_p, pygame.K_r, pygame.K_o, pygame.K_d]  # "PROD"
+    PROFILER_CODE = [
+        pygame.K_t,
+        pygame.K_i,
+        pygame.K_m,
+        pygame.K_i,
+        pygame.K_n,
+        pygame.K_g,
+    ]
 
     # Timeout for resetting input sequences (seconds)
     INPUT_TIMEOUT = 2.0
@@ -196,6 +206,15 @@ class CheatCodeController:
                 message=None,  # Outage handled by GameEngine
             )
 
+        # Check TIMING (profiler) code
+        if self.cheat_buffer == self.PROFILER_CODE:
+            self.cheat_buffer = []
+            logger.info("⏱️  TIMING CODE ACTIVATED - Toggling frame profiler")
+            return CheatCodeResult(
+                action=CheatCodeAction.TOGGLE_PROFILER,
+                message=None,  # Toggle handled by GameEngine
+            )
+
         return CheatCodeResult(action=CheatCodeAction.NONE)
 
     def process_controller_button(
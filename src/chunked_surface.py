@@ -0,0 +1,162 @@
+"""Chunked, lazily rendered surfaces for levels too large to keep in memory."""
+
+import logging
+import math
+from collections import OrderedDict
+from typing import Callable, Iterator, Optional
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+# Renders the world-space area of one chunk onto a new surface of the same size
+ChunkRenderer = Callable[[pygame.Rect], pygame.Surface]
+
+
+class ChunkedSurface:
+    """
+    A very wide world surface split into fixed-width vertical chunks.
+
+    Chunks are rendered on demand (when the camera approaches) and kept in an
+    LRU cache with a fixed capacity, so resident memory and level-entry time
+    depend on the viewport size rather than the level width.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        render_chunk: ChunkRenderer,
+        chunk_width: int = 512,
+        max_chunks: int = 8,
+    ):
+        """
+        Initialize the chunked surface (nothing is rendered yet).
+
+        Args:
+            width: Full world width in pixels
+            height: Full world height in pixels
+            render_chunk: Callback that paints one world-space chunk area
+            chunk_width: Width of each chunk in pixels
+            max_chunks: Maximum number of chunks kept in memory
+        """
+        self.width = width
+        self.height = height
+        self.chunk_width = chunk_width
+        self.max_chunks = max_chunks
+        self.chunk_count = max(1, math.ceil(width / chunk_width))
+        self._render_chunk = render_chunk
+        self._chunks: "OrderedDict[int, pygame.Surface]" = OrderedDict()
+
+        # Stats
+        self.renders = 0
+        self.evictions = 0
+
+    def get_size(self) -> tuple:
+        """Full world size (matches pygame.Surface.get_size)."""
+        return (self.width, self.height)
+
+    def chunk_rect(self, index: int) -> pygame.Rect:
+        """World-space area covered by a chunk."""
+        left = index * self.chunk_width
+        return pygame.Rect(left, 0, min(self.chunk_width, self.width - left), self.height)
+
+    def get_chunk(self, index: int) -> pygame.Surface:
+        """
+        Get a chunk surface, rendering it (and evicting the LRU chunk) if needed.
+
+        Args:
+            index: Chunk index (0 = leftmost)
+
+        Returns:
+            Chunk surface covering chunk_rect(index)
+        """
+        chunk = self._chunks.get(index)
+        if chunk is not None:
+            self._chunks.move_to_end(index)
+            return chunk
+
+        chunk = self._render_chunk(self.chunk_rect(index))
+        self.renders += 1
+        self._chunks[index] = chunk
+        while len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+            self.evictions += 1
+        return chunk
+
+    def _indices(self, left: float, right: float) -> Iterator[int]:
+        """Chunk indices overlapping the world-space span [left, right)."""
+        first = max(0, int(left // self.chunk_width))
+        last = min(self.chunk_count - 1, int((right - 1) // self.chunk_width))
+        return iter(range(first, last + 1))
+
+    def prefetch(self, view: pygame.Rect, margin: Optional[int] = None) -> None:
+        """
+        Render chunks around a view so scrolling into them never stalls.
+
+        Args:
+            view: World-space camera rectangle
+            margin: Extra pixels to cover on each side (default: one chunk)
+        """
+        margin = self.chunk_width if margin is None else margin
+        for index in self._indices(view.left - margin, view.right + margin):
+            if index not in self._chunks:
+                self.get_chunk(index)
+
+    def blit_view(self, screen: pygame.Surface, view: pygame.Rect) -> None:
+        """
+        Blit only the chunks visible in a world-space view at 1:1 scale.
+
+        Args:
+            screen: Destination surface (view.topleft maps to (0, 0))
+            view: World-space camera rectangle
+        """
+        for index in self._indices(view.left, view.right):
+            area = self.chunk_rect(index)
+            clip = area.clip(view)
+            if clip.width <= 0 or clip.height <= 0:
+                continue
+            source = clip.move(-area.x, 0)
+            screen.blit(self.get_chunk(index), (clip.x - view.x, clip.y - view.y), source)
+
+    def render_scaled(self, scaled_width: int, scaled_height: int) -> pygame.Surface:
+        """
+        Render the whole world downscaled (e.g. for an overview map).
+
+        Chunks not already cached are rendered transiently and not kept, so
+        building an overview never evicts the chunks around the camera.
+
+        Args:
+            scaled_width: Output width
+            scaled_height: Output height
+
+        Returns:
+            New surface with the full world scaled to the given size
+        """
+        overview = pygame.Surface((max(1, scaled_width), max(1, scaled_height)))
+        scale_x = scaled_width / self.width
+        for index in range(self.chunk_count):
+            area = self.chunk_rect(index)
+            chunk = self._chunks.get(index)
+            if chunk is None:
+                chunk = self._render_chunk(area)
+            left = int(area.left * scale_x)
+            right = int(area.right * scale_x)
+            if right > left:
+                piece = pygame.transform.smoothscale(chunk, (right - left, overview.get_height()))
+                overview.blit(piece, (left, 0))
+        return overview
+
+    def clear(self) -> None:
+        """Drop all cached chunks."""
+        self._chunks.clear()
+
+    @property
+    def resident_chunks(self) -> int:
+        """Number of chunks currently in memory."""
+        return len(self._chunks)
+
+    @property
+    def resident_bytes(self) -> int:
+        """Approximate memory held by cached chunks."""
+        return sum(c.get_width() * c.get_height() * c.get_bytesize() for c in self._chunks.values())
@@ -1,11 +1,23 @@
 """Collision detection utilities."""
 
 import pygame
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from projectile import Projectile
 from zombie import Zombie
 
+# Optional: NumPy enables the vectorized broadphase for large crowds
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Entity count at which check_collisions() switches to the NumPy backend
+# (crossover measured with benchmarks/bench_collision_backends.py)
+VECTORIZED_ENTITY_THRESHOLD = 100
+
 
 def check_collision(projectile: Projectile, zombie: Zombie) -> bool:
     """
@@ -54,7 +66,13 @@ def check_projectile_zombie_collisions(
 
 class SpatialGrid:
     """
-    Spatial partitioning grid for efficient collision detection with many zombies.
+    Persistent spatial hash for collision detection with many entities.
+
+    Entities of any type (zombies, third parties, power-ups, bosses) share one
+    index. Each entity's cell span is remembered, so update() only touches
+    cells when its bounds cross a cell boundary, and remove() is O(1). Cells
+    are stored sparsely, so very wide platformer levels cost nothing for empty
+    space.
     """
 
     def __init__(self, width: int, height: int, cell_size: int = 50):
@@ -71,66 +89,135 @@ class SpatialGrid:
         self.cell_size = cell_size
         self.cols = (width + cell_size - 1) // cell_size
         self.rows = (height + cell_size - 1) // cell_size
-        self.grid: List[List[List[Zombie]]] = [
-            [[] for _ in range(self.cols)] for _ in range(self.rows)
-        ]
+
+        # (col, row) -> {id(entity): entity}; only occupied cells exist
+        self.cells: Dict[Tuple[int, int], Dict[int, Any]] = {}
+        # id(entity) -> (min_col, min_row, max_col, max_row)
+        self._spans: Dict[int, Tuple[int, int, int, int]] = {}
+
+    def _span(self, bounds: pygame.Rect) -> Tuple[int, int, int, int]:
+        """Get the clamped (min_col, min_row, max_col, max_row) covered by bounds."""
+        cell_size = self.cell_size
+        return (
+            max(0, int(bounds.left // cell_size)),
+            max(0, int(bounds.top // cell_size)),
+            min(self.cols - 1, int(bounds.right // cell_size)),
+            min(self.rows - 1, int(bounds.bottom // cell_size)),
+        )
 
     def clear(self) -> None:
-        """Clear all zombies from the grid."""
-        for row in self.grid:
-            for cell in row:
-                cell.clear()
+        """Remove every entity from the grid."""
+        self.cells.clear()
+        self._spans.clear()
 
-    def add_zombie(self, zombie: Zombie) -> None:
+    def update(self, entity: Any) -> None:
         """
-        Add a zombie to the appropriate grid cell(s).
+        Insert an entity or refresh its position.
+
+        Cells are only touched when the entity's cell span changed since the
+        last update, so stationary and slow-moving entities cost a single
+        tuple comparison.
 
         Args:
-            zombie: The zombie to add
+            entity: Any object with get_bounds()
         """
-        bounds = zombie.get_bounds()
+        key = id(entity)
+        span = self._span(entity.get_bounds())
+        old_span = self._spans.get(key)
+        if span == old_span:
+            return
 
-        # Calculate which cells the zombie occupies
-        min_col = max(0, int(bounds.left // self.cell_size))
-        max_col = min(self.cols - 1, int(bounds.right // self.cell_size))
-        min_row = max(0, int(bounds.top // self.cell_size))
-        max_row = min(self.rows - 1, int(bounds.bottom // self.cell_size))
+        if old_span is not None:
+            self._unlink(key, old_span)
 
-        # Add zombie to all cells it occupies
+        min_col, min_row, max_col, max_row = span
+        cells = self.cells
         for row in range(min_row, max_row + 1):
             for col in range(min_col, max_col + 1):
-                self.grid[row][col].append(zombie)
+                cell = cells.get((col, row))
+                if cell is None:
+                    cell = cells[(col, row)] = {}
+                cell[key] = entity
+        self._spans[key] = span
 
-    def get_nearby_zombies(self, projectile: Projectile) -> List[Zombie]:
+    def remove(self, entity: Any) -> None:
         """
-        Get zombies near a projectile's position.
+        Remove an entity from the grid (no-op if it is not indexed).
 
         Args:
-            projectile: The projectile to check
+            entity: Entity previously passed to update()
+        """
+        key = id(entity)
+        span = self._spans.pop(key, None)
+        if span is not None:
+            self._unlink(key, span)
+
+    def _unlink(self, key: int, span: Tuple[int, int, int, int]) -> None:
+        """Drop an entity key from every cell in a span, freeing empty cells."""
+        min_col, min_row, max_col, max_row = span
+        cells = self.cells
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                cell = cells.get((col, row))
+                if cell is not None:
+                    cell.pop(key, None)
+                    if not cell:
+                        del cells[(col, row)]
 
-        Returns:
-            List of zombies in nearby cells
+    def __contains__(self, entity: Any) -> bool:
+        """Check whether an entity is currently indexed."""
+        return id(entity) in self._spans
+
+    def __len__(self) -> int:
+        """Number of indexed entities."""
+        return len(self._spans)
+
+    def query(self, bounds: pygame.Rect) -> List[Any]:
         """
-        bounds = projectile.get_bounds()
+        Get entities in the cells overlapped by a rectangle.
+
+        Args:
+            bounds: Area to search
 
-        # Calculate which cells to check
-        min_col = max(0, int(bounds.left // self.cell_size))
-        max_col = min(self.cols - 1, int(bounds.right // self.cell_size))
-        min_row = max(0, int(bounds.top // self.cell_size))
-        max_row = min(self.rows - 1, int(bounds.bottom // self.cell_size))
+        Returns:
+            Candidate entities (may not actually overlap bounds)
+        """
+        min_col, min_row, max_col, max_row = self._span(bounds)
+        cells = self.cells
 
-        # Collect zombies from nearby cells
-        nearby = []
-        seen = set()  # Avoid duplicates
+        # Fast path: a projectile usually sits in a single cell
+        if min_col == max_col and min_row == max_row:
+            cell = cells.get((min_col, min_row))
+            return list(cell.values()) if cell else []
 
+        nearby = {}
         for row in range(min_row, max_row + 1):
             for col in range(min_col, max_col + 1):
-                for zombie in self.grid[row][col]:
-                    if id(zombie) not in seen:
-                        nearby.append(zombie)
-                        seen.add(id(zombie))
+                cell = cells.get((col, row))
+                if cell:
+                    nearby.update(cell)
+        return list(nearby.values())
+
+    def add_zombie(self, zombie: Zombie) -> None:
+        """
+        Add a zombie to the appropriate grid cell(s).
+
+        Args:
+            zombie: The zombie to add
+        """
+        self.update(zombie)
+
+    def get_nearby_zombies(self, projectile: Projectile) -> List[Zombie]:
+        """
+        Get zombies near a projectile's position.
 
-        return nearby
+        Args:
+            projectile: The projectile to check
+
+        Returns:
+            List of zombies in nearby cells
+        """
+        return self.query(projectile.get_bounds())
 
 
 def check_collisions_with_spatial_grid(
@@ -139,46 +226,172 @@ def check_collisions_with_spatial_grid(
     """
     Check for collisions using spatial partitioning for better performance.
 
+    The grid is persistent: entities are moved only when they cross a cell
+    boundary and entities being eliminated are dropped from it. Only entities
+    in the given list can be hit, even if the grid also indexes others. When a
+    projectile overlaps several entities it hits the earliest one in the list.
+
     Args:
         projectiles: List of active projectiles
-        zombies: List of active zombies
+        zombies: List of active entities (zombies, third parties, ...)
         grid: Spatial grid for partitioning
 
     Returns:
         List of (projectile, zombie) tuples that collided
     """
-    # Rebuild grid with current zombie/entity positions
-    grid.clear()
-    for zombie in zombies:
-        # Check if it's being eliminated (quarantined for zombies, blocked for 3rd parties)
-        is_being_eliminated = False
-        if hasattr(zombie, "is_quarantining"):
-            is_being_eliminated = zombie.is_quarantining
-        elif hasattr(zombie, "is_blocking"):
-            is_being_eliminated = zombie.is_blocking
-
-        if not is_being_eliminated:
-            grid.add_zombie(zombie)
+    # Sync grid with current entity positions (id -> list order for tie-breaks)
+    targets: Dict[int, int] = {}
+    for index, zombie in enumerate(zombies):
+        # Quarantined zombies / blocked 3rd parties can't be hit
+        if zombie.is_being_eliminated:
+            grid.remove(zombie)
+        else:
+            grid.update(zombie)
+            targets[id(zombie)] = index
 
     collisions = []
+    if not targets:
+        return collisions
 
     for projectile in projectiles:
-        # Only check zombies in nearby cells
-        nearby_zombies = grid.get_nearby_zombies(projectile)
-
-        for zombie in nearby_zombies:
-            # Check if it's being eliminated (quarantined for zombies, blocked for 3rd parties)
-            is_being_eliminated = False
-            if hasattr(zombie, "is_quarantining"):
-                is_being_eliminated = zombie.is_quarantining
-            elif hasattr(zombie, "is_blocking"):
-                is_being_eliminated = zombie.is_blocking
-
-            if is_being_eliminated:
-                continue
+        proj_bounds = projectile.get_bounds()
 
-            if check_collision(projectile, zombie):
-                collisions.append((projectile, zombie))
-                break  # Each projectile can only hit one zombie
+        # Only check entities in nearby cells; each projectile hits one entity
+        hit = None
+        hit_index = len(zombies)
+        for zombie in grid.query(proj_bounds):
+            index = targets.get(id(zombie))
+            if index is not None and index < hit_index:
+                if proj_bounds.colliderect(zombie.get_bounds()):
+                    hit = zombie
+                    hit_index = index
+
+        if hit is not None:
+            collisions.append((projectile, hit))
 
     return collisions
+
+
+class VectorizedCollisionBackend:
+    """
+    NumPy broadphase that resolves every projectile/entity overlap in one batch.
+
+    Entity and projectile AABBs are packed into reusable structure-of-arrays
+    buffers (left, top, right, bottom) and tested with a single broadcast per
+    projectile chunk. Results match check_collisions_with_spatial_grid: each
+    projectile hits at most one entity, the earliest one in the list, and
+    entities being eliminated are never hit.
+    """
+
+    # Max projectile x entity cells tested per broadcast (bounds temp memory)
+    CHUNK_CELLS = 1 << 20
+
+    def __init__(self):
+        """Initialize empty buffers (grown on demand, reused across frames)."""
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("VectorizedCollisionBackend requires numpy")
+        self._entity_boxes = np.empty((4, 0), dtype=np.int32)
+        self._projectile_boxes = np.empty((4, 0), dtype=np.int32)
+
+    @staticmethod
+    def _fill(buffer: "np.ndarray", rects: List[Tuple[int, int, int, int]]) -> "np.ndarray":
+        """Pack (x, y, w, h) tuples into a [left, top, right, bottom] SoA buffer."""
+        count = len(rects)
+        if buffer.shape[1] < count:
+            buffer = np.empty((4, max(count, buffer.shape[1] * 2)), dtype=np.int32)
+        view = buffer[:, :count]
+        if count:
+            view[:] = np.array(rects, dtype=np.int32).T
+            view[2] += view[0]
+            view[3] += view[1]
+        return buffer
+
+    def check(
+        self, projectiles: List[Projectile], entities: List[Any]
+    ) -> List[Tuple[Projectile, Any]]:
+        """
+        Find (projectile, entity) hits with first-hit-wins semantics.
+
+        Args:
+            projectiles: List of active projectiles
+            entities: List of active entities (zombies, third parties, ...)
+
+        Returns:
+            List of (projectile, entity) tuples that collided
+        """
+        # Zero-size rects never collide (matches pygame.Rect.colliderect)
+        entity_rects = []
+        entity_indices = []
+        for index, entity in enumerate(entities):
+            if entity.is_being_eliminated:
+                continue
+            rect = entity.get_bounds()
+            if rect.width > 0 and rect.height > 0:
+                entity_rects.append((rect.x, rect.y, rect.width, rect.height))
+                entity_indices.append(index)
+
+        projectile_rects = []
+        shooters = []
+        for projectile in projectiles:
+            rect = projectile.get_bounds()
+            if rect.width > 0 and rect.height > 0:
+                projectile_rects.append((rect.x, rect.y, rect.width, rect.height))
+                shooters.append(projectile)
+
+        entity_count = len(entity_rects)
+        if not entity_count or not shooters:
+            return []
+
+        self._entity_boxes = self._fill(self._entity_boxes, entity_rects)
+        self._projectile_boxes = self._fill(self._projectile_boxes, projectile_rects)
+        e_left, e_top, e_right, e_bottom = self._entity_boxes[:, :entity_count]
+        p_boxes = self._projectile_boxes[:, : len(shooters)]
+
+        collisions = []
+        chunk = max(1, self.CHUNK_CELLS // entity_count)
+        for start in range(0, len(shooters), chunk):
+            p_left, p_top, p_right, p_bottom = (
+                column[start : start + chunk, None] for column in p_boxes
+            )
+            overlap = (
+                (p_left < e_right) & (e_left < p_right) & (p_top < e_bottom) & (e_top < p_bottom)
+            )
+            hit_rows = np.flatnonzero(overlap.any(axis=1))
+            if not hit_rows.size:
+                continue
+            # argmax returns the first True column = earliest entity in the list
+            first_hits = overlap[hit_rows].argmax(axis=1)
+            for row, column in zip(hit_rows.tolist(), first_hits.tolist()):
+                collisions.append((shooters[start + row], entities[entity_indices[column]]))
+
+        return collisions
+
+
+_vectorized_backend: Optional[VectorizedCollisionBackend] = None
+
+
+def check_collisions(
+    projectiles: List[Projectile], zombies: List[Zombie], grid: SpatialGrid
+) -> List[Tuple[Projectile, Zombie]]:
+    """
+    Check collisions with the fastest backend for the current entity count.
+
+    Large crowds (VECTORIZED_ENTITY_THRESHOLD entities and up) use the NumPy
+    broadphase when numpy is installed; everything else uses the spatial grid.
+    Both return identical results.
+
+    Args:
+        projectiles: List of active projectiles
+        zombies: List of active entities (zombies, third parties, ...)
+        grid: Spatial grid for the pure-Python path
+
+    Returns:
+        List of (projectile, zombie) tuples that collided
+    """
+    global _vectorized_backend
+
+    if NUMPY_AVAILABLE and projectiles and len(zombies) >= VECTORIZED_ENTITY_THRESHOLD:
+        if _vectorized_backend is None:
+            _vectorized_backend = VectorizedCollisionBackend()
+        return _vectorized_backend.check(projectiles, zombies)
+    return check_collisions_with_spatial_grid(projectiles, zombies, grid)
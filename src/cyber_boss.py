@@ -13,6 +13,7 @@ from typing import List, Optional
 import pygame
 
 from models import Vector2
+from particle_system import ParticleSystem
 
 logger = logging.getLogger(__name__)
 
@@ -337,6 +338,11 @@ class MiniSpider:
         """Get the bounding rectangle for collision detection."""
         return pygame.Rect(int(self.position.x), int(self.position.y), self.width, self.height)
 
+    @property
+    def is_being_eliminated(self) -> bool:
+        """True once defeated (no longer a collision target)."""
+        return self.is_defeated
+
 
 class ScatteredSpiderBoss:
     """Scattered Spider - Swarm of 5 mini spiders (identity theft attack)."""
@@ -452,7 +458,8 @@ class HeartbleedBoss:
         self.teleport_animation_timer = 0.0
 
         # Visual effects
-        self.bleeding_particles = []  # Red data leak particles
+        self.bleeding_particles = ParticleSystem(capacity=256, gravity=200.0)  # Red data leaks
+        self.bleeding_particles.add_style(self._create_blood_drop_sprite(), anchor=(3, 4))
         self.particle_spawn_timer = 0.0
         self.glow_pulse_timer = 0.0
         self.is_flashing = False
@@ -782,15 +789,24 @@ class HeartbleedBoss:
 
     def _spawn_bleeding_particle(self):
         """Spawn a red particle representing leaked data."""
-        particle = {
-            "x": self.position.x + self.width // 2,
-            "y": self.position.y + self.height // 2,
-            "vx": (pygame.time.get_ticks() % 100 - 50) / 10.0,
-            "vy": -50.0 - (pygame.time.get_ticks() % 50),
-            "lifetime": 1.0,
-            "alpha": 255,
-        }
-        self.bleeding_particles.append(particle)
+        self.bleeding_particles.emit(
+            x=self.position.x + self.width // 2,
+            y=self.position.y + self.height // 2,
+            vx=(pygame.time.get_ticks() % 100 - 50) / 10.0,
+            vy=-50.0 - (pygame.time.get_ticks() % 50),
+            lifetime=1.0,
+        )
+
+    @staticmethod
+    def _create_blood_drop_sprite() -> pygame.Surface:
+        """Create the red droplet stamp used for bleeding particles."""
+        sprite = pygame.Surface((6, 8), pygame.SRCALPHA)
+        color = (220, 20, 20)
+        # Top circle
+        pygame.draw.circle(sprite, color, (3, 2), 2)
+        # Bottom point
+        pygame.draw.polygon(sprite, color, [(1, 3), (5, 3), (3, 7)])
+        return sprite
 
     def update(self, delta_time: float, player_position: Vector2, game_map=None) -> None:
         """Update boss logic."""
@@ -806,16 +822,8 @@ class HeartbleedBoss:
         # Update glow pulse
         self.glow_pulse_timer += delta_time
 
-        # Update bleeding particles
-        for particle in self.bleeding_particles[:]:
-            particle["lifetime"] -= delta_time
-            particle["x"] += particle["vx"] * delta_time
-            particle["y"] += particle["vy"] * delta_time
-            particle["vy"] += 200.0 * delta_time  # Gravity on particles
-            particle["alpha"] = int(255 * (particle["lifetime"] / 1.0))
-
-            if particle["lifetime"] <= 0:
-                self.bleeding_particles.remove(particle)
+        # Update bleeding particles (gravity and fade handled by the particle system)
+        self.bleeding_particles.update(delta_time)
 
         # Spawn bleeding particles periodically (data leak visual)
         self.particle_spawn_timer += delta_time
@@ -889,6 +897,11 @@ class HeartbleedBoss:
         """Get bounding box for collision detection."""
         return pygame.Rect(int(self.position.x), int(self.position.y), self.width, self.height)
 
+    @property
+    def is_being_eliminated(self) -> bool:
+        """True once defeated (no longer a collision target)."""
+        return self.is_defeated
+
 
 class WannaCryBoss:
     """
@@ -931,7 +944,8 @@ class WannaCryBoss:
         self.ground_y = 0
 
         # Crying mechanics
-        self.tear_particles = []  # Falling tears
+        self.tear_particles = ParticleSystem(capacity=256, gravity=300.0)  # Falling tears
+        self.tear_particles.add_style(self._create_tear_sprite(), anchor=(4, 5))
         self.tear_spawn_timer = 0.0
         self.puddles = []  # Tear puddles on ground (max 10)
         self.max_puddles = 10
@@ -1206,16 +1220,26 @@ class WannaCryBoss:
     def _spawn_tear_particle(self):
         """Spawn a falling tear droplet."""
         # Tears fall from eyes
-        tear = {
-            "x": self.position.x + self.width // 2 + (10 if time.time() % 2 < 1 else -10),
-            "y": self.position.y + 25,  # Eye level
-            "vx": (time.time() % 40 - 20) * 2,  # Slight horizontal spread
-            "vy": 100.0,  # Falling speed
-            "lifetime": 2.0,
-            "alpha": 255,
-            "on_ground": False,
-        }
-        self.tear_particles.append(tear)
+        self.tear_particles.emit(
+            x=self.position.x + self.width // 2 + (10 if time.time() % 2 < 1 else -10),
+            y=self.position.y + 25,  # Eye level
+            vx=(time.time() % 40 - 20) * 2,  # Slight horizontal spread
+            vy=100.0,  # Falling speed
+            lifetime=2.0,
+        )
+
+    @staticmethod
+    def _create_tear_sprite() -> pygame.Surface:
+        """Create the teardrop stamp used for tear particles."""
+        sprite = pygame.Surface((8, 10), pygame.SRCALPHA)
+        color = (135, 206, 235)  # Sky blue
+        # Top circle
+        pygame.draw.circle(sprite, color, (4, 3), 3)
+        # Bottom point
+        pygame.draw.polygon(sprite, color, [(2, 4), (6, 4), (4, 9)])
+        # Add highlight (makes it look wet)
+        pygame.draw.circle(sprite, (224, 255, 255), (3, 2), 1)
+        return sprite
 
     def _trigger_sob_wave(self):
         """Trigger the sob wave attack."""
@@ -1273,21 +1297,12 @@ class WannaCryBoss:
             self._spawn_tear_particle()
             self.tear_spawn_timer = 0.0
 
-        # Update tear particles
-        for tear in self.tear_particles[:]:
-            tear["lifetime"] -= delta_time
-            tear["x"] += tear["vx"] * delta_time
-            tear["y"] += tear["vy"] * delta_time
-            tear["vy"] += 300.0 * delta_time  # Gravity
-            tear["alpha"] = int(255 * (tear["lifetime"] / 2.0))
-
-            # Check if tear hit ground
-            if game_map and tear["y"] >= self.ground_y and not tear["on_ground"]:
-                tear["on_ground"] = True
-                self._create_puddle(tear["x"], tear["y"])
-
-            if tear["lifetime"] <= 0:
-                self.tear_particles.remove(tear)
+        # Update tear particles; tears reaching the ground leave a puddle
+        landings = self.tear_particles.update(
+            delta_time, ground_y=self.ground_y if game_map else None
+        )
+        for x, y in landings:
+            self._create_puddle(x, y)
 
         # Update puddles
         for puddle in self.puddles[:]:
@@ -1363,6 +1378,11 @@ class WannaCryBoss:
         """Get bounding box for collision detection."""
         return pygame.Rect(int(self.position.x), int(self.position.y), self.width, self.height)
 
+    @property
+    def is_being_eliminated(self) -> bool:
+        """True once defeated (no longer a collision target)."""
+        return self.is_defeated
+
     def get_sob_wave_bounds(self) -> Optional[pygame.Rect]:
         """Get sob wave collision bounds if active."""
         if self.sob_wave and self.sob_wave["active"]:
@@ -10,20 +10,24 @@ Usage:
     # Screenshot
     filename = evidence.take_screenshot(screen)
 
-    # Recording
+    # Recording (frames are encoded to disk on a background thread)
     evidence.toggle_recording(current_time)  # Start
     evidence.capture_frame(screen, current_time)  # Each frame
-    filename = evidence.toggle_recording(current_time)  # Stop and save
+    filename = evidence.toggle_recording(current_time)  # Stop, finishes in background
+    evidence.wait_for_recording(timeout)  # Before exit
 """
 
 import logging
 import math
 import os
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import pygame
 
+from recording_encoder import FRAME_FORMAT, RecordingEncoder, create_encoder
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,18 +42,35 @@ class EvidenceCapture:
     # Recording settings
     MAX_RECORDING_SECONDS: int = 60
     RECORDING_FPS: int = 30
+    RECORDING_FORMATS = ("gif", "mp4")
 
     # Flash settings
     FLASH_DURATION: float = 0.15  # Seconds
 
-    def __init__(self):
-        """Initialize evidence capture system."""
+    def __init__(self, recording_format: Optional[str] = None):
+        """
+        Initialize evidence capture system.
+
+        Args:
+            recording_format: "gif" or "mp4" (defaults to EVIDENCE_RECORDING_FORMAT, then gif)
+        """
+        if recording_format is None:
+            recording_format = os.getenv("EVIDENCE_RECORDING_FORMAT", "gif").lower()
+        if recording_format not in self.RECORDING_FORMATS:
+            logger.warning(f"⚠️ Unknown recording format '{recording_format}', using gif")
+            recording_format = "gif"
+        self.recording_format = recording_format
+
         # State
         self.is_recording: bool = False
         self.recording_start_time: float = 0.0
-        self.recording_frames: List[pygame.Surface] = []
         self.last_frame_time: float = 0.0
 
+        # Encoder for the clip being recorded (created at its first frame) and
+        # encoders of stopped clips that may still be finishing in the background
+        self.encoder: Optional[RecordingEncoder] = None
+        self._finishing: List[RecordingEncoder] = []
+
         # Visual feedback
         self.flash_alpha: int = 0
 
@@ -145,26 +166,32 @@ class EvidenceCapture:
             return
         self.is_recording = True
         self.recording_start_time = current_time
-        self.recording_frames = []
         self.last_frame_time = current_time
         logger.info("🔴 Recording started...")
 
     def stop_recording(self) -> Optional[str]:
         """
-        Stop recording and save to file.
+        Stop recording and finish the file in the background.
+
+        Returns immediately; the encoder writes any queued frames and closes
+        the file on its own thread (see wait_for_recording()).
 
         Returns:
-            Filename if successful, None if no frames or failed
+            Filename the recording is being saved to, None if no frames were captured
         """
         if not self.is_recording:
             return None
         self.is_recording = False
 
-        if not self.recording_frames:
+        encoder, self.encoder = self.encoder, None
+        if encoder is None:
             logger.warning("⚠️ No frames captured, recording discarded")
             return None
 
-        return self._save_recording()
+        encoder.close()
+        self._finishing = [e for e in self._finishing if not e.done] + [encoder]
+        filename = os.path.basename(encoder.path.rstrip("/"))
+        return filename + "/" if encoder.path.endswith("/") else filename
 
     def toggle_recording(self, current_time: float) -> Optional[str]:
         """
@@ -174,7 +201,7 @@ class EvidenceCapture:
             current_time: Current game time
 
         Returns:
-            Filename if recording was stopped and saved, None otherwise
+            Filename if recording was stopped and is being saved, None otherwise
         """
         if self.is_recording:
             return self.stop_recording()
@@ -186,6 +213,10 @@ class EvidenceCapture:
         """
         Capture frame if recording and enough time has passed.
 
+        The frame is copied out as raw bytes and handed to the encoder
+        thread; if the encoder has fallen behind the frame is dropped rather
+        than stalling the game.
+
         Args:
             screen: The pygame surface to capture
             current_time: Current game time
@@ -203,65 +234,37 @@ class EvidenceCapture:
         # Capture at recording FPS (not every frame)
         frame_interval = 1.0 / self.RECORDING_FPS
         if current_time - self.last_frame_time >= frame_interval:
-            # Copy the screen surface
-            frame = screen.copy()
-            self.recording_frames.append(frame)
+            if self.encoder is None:
+                self._start_encoder(screen.get_size())
+            self.encoder.submit(pygame.image.tobytes(screen, FRAME_FORMAT))
             self.last_frame_time = current_time
 
-    def _save_recording(self) -> Optional[str]:
-        """Save recorded frames as GIF."""
-        filename = self._generate_filename("gif")
-        filepath = os.path.join(self.RECORDINGS_DIR, filename)
-
-        frame_count = len(self.recording_frames)
-        logger.info(f"🎬 Saving {frame_count} frames as GIF...")
-
-        try:
-            from PIL import Image
-
-            images = []
-            for frame in self.recording_frames:
-                # Convert pygame surface to PIL Image
-                data = pygame.image.tostring(frame, "RGB")
-                size = frame.get_size()
-                img = Image.frombytes("RGB", size, data)
-                images.append(img)
-
-            if images:
-                # Save as animated GIF
-                images[0].save(
-                    filepath,
-                    save_all=True,
-                    append_images=images[1:],
-                    duration=int(1000 / self.RECORDING_FPS),  # ms per frame
-                    loop=0,
-                )
-                logger.info(f"🎬 Recording saved: {filepath}")
-
-        except ImportError:
-            logger.warning("⚠️ Pillow not installed, saving frames as PNGs")
-            filename = self._save_frames_as_pngs()
-
-        except Exception as e:
-            logger.error(f"❌ Recording save failed: {e}")
-            filename = self._save_frames_as_pngs()
+    def wait_for_recording(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop any recording and block until every clip is fully written (e.g. before exit).
 
-        self.recording_frames = []  # Clear memory
-        return filename
+        Args:
+            timeout: Maximum seconds to wait in total (None waits forever)
 
-    def _save_frames_as_pngs(self) -> str:
-        """Fallback: save frames as numbered PNGs in a folder."""
+        Returns:
+            True if no recording is still being written
+        """
+        self.stop_recording()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for encoder in self._finishing:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not encoder.wait(remaining):
+                logger.warning(f"⚠️ Recording still encoding on exit: {encoder.path}")
+                return False
+        self._finishing = []
+        return True
+
+    def _start_encoder(self, size: Tuple[int, int]) -> None:
+        """Start a background encoder for a new clip at the first captured frame."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        folder_name = f"ZB_{timestamp}"
-        folder_path = os.path.join(self.RECORDINGS_DIR, folder_name)
-        os.makedirs(folder_path, exist_ok=True)
-
-        for i, frame in enumerate(self.recording_frames):
-            filepath = os.path.join(folder_path, f"frame_{i:04d}.png")
-            pygame.image.save(frame, filepath)
-
-        logger.info(f"🎬 Frames saved to: {folder_path}/")
-        return folder_name + "/"
+        base_path = os.path.join(self.RECORDINGS_DIR, f"ZB_{timestamp}")
+        self.encoder = create_encoder(self.recording_format, base_path, size, self.RECORDING_FPS)
+        logger.info(f"🎬 Encoding recording to {self.encoder.path}")
 
     # =========================================================================
     # VISUAL FEEDBACK
@@ -0,0 +1,193 @@
+"""Fixed-rate simulation stepping and render-time interpolation for the game loop."""
+
+import logging
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default simulation rate in updates per second
+DEFAULT_UPDATE_RATE = 60
+
+# Most simulation steps run for one rendered frame; time beyond that is
+# dropped, so a long hitch slows the game down instead of freezing it while
+# it replays hundreds of steps
+MAX_STEPS_PER_FRAME = 5
+
+# Entities that moved further than this (in pixels) during one step were
+# teleported (respawn, level change, pooled projectile reuse) and are drawn
+# where they are rather than smeared across the screen
+SNAP_DISTANCE = 128.0
+
+
+class FixedTimestep:
+    """
+    Accumulator that turns variable frame times into fixed simulation steps.
+
+    Each frame, advance(frame_time) adds the elapsed time to the accumulator
+    and returns how many steps of `step` seconds to simulate; the remainder
+    carries over to the next frame. alpha is how far the simulation has got
+    towards the next step, used to interpolate what is drawn between the two
+    most recent states.
+    """
+
+    def __init__(
+        self, update_rate: float = DEFAULT_UPDATE_RATE, max_steps: int = MAX_STEPS_PER_FRAME
+    ):
+        """
+        Initialize the stepper.
+
+        Args:
+            update_rate: Simulation steps per second
+            max_steps: Most steps returned by one advance() call
+
+        Raises:
+            ValueError: If update_rate or max_steps is not positive
+        """
+        if update_rate <= 0:
+            raise ValueError(f"update_rate must be positive, got {update_rate}")
+        if max_steps < 1:
+            raise ValueError(f"max_steps must be at least 1, got {max_steps}")
+        self.step = 1.0 / update_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step accumulated since the last one, from 0.0 to 1.0."""
+        return min(1.0, self.accumulator / self.step)
+
+    def advance(self, frame_time: float) -> int:
+        """
+        Add one frame's elapsed time and take the steps it completes.
+
+        Args:
+            frame_time: Seconds since the previous frame
+
+        Returns:
+            Number of fixed steps to simulate this frame
+        """
+        self.accumulator += max(0.0, frame_time)
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            dropped = self.accumulator - self.max_steps * self.step
+            self.dropped_time += dropped
+            logger.debug(
+                f"⏱️  Frame took {frame_time * 1000:.0f}ms - dropping {dropped * 1000:.0f}ms "
+                f"of simulation to catch up"
+            )
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    def reset(self) -> None:
+        """Discard accumulated time (e.g. after a blocking load)."""
+        self.accumulator = 0.0
+
+
+class Interpolator:
+    """
+    Draws entities part way between their previous and current step.
+
+    capture() records positions before the last simulation step of a frame.
+    apply(alpha) then moves every position (and the map camera) to
+    previous + (current - previous) * alpha for rendering, and restore()
+    puts the simulated values back before the next step. Positions are
+    tracked by object identity, so entities added since capture() are simply
+    drawn where they are.
+    """
+
+    def __init__(self, snap_distance: float = SNAP_DISTANCE):
+        """
+        Initialize an empty interpolator.
+
+        Args:
+            snap_distance: Movement per step beyond which an entity is not interpolated
+        """
+        self.snap_distance = snap_distance
+        # id(position) -> (position, x, y)
+        self._previous: Dict[int, Tuple[Any, float, float]] = {}
+        self._previous_camera: Optional[Tuple[Any, float, float]] = None
+        self._restore: list = []
+        self._restore_camera: Optional[Tuple[Any, float, float]] = None
+
+    @staticmethod
+    def _positions(game_engine) -> Iterable[Any]:
+        """Position vectors of everything the renderer draws from the engine."""
+        player = game_engine.get_player()
+        if player is not None:
+            yield player.position
+        for entity in game_engine.get_zombies():
+            yield entity.position
+        for entity in game_engine.get_third_parties():
+            yield entity.position
+        for entity in game_engine.get_projectiles():
+            yield entity.position
+        boss = game_engine.get_boss()
+        if boss is not None:
+            yield boss.position
+
+    def capture(self, game_engine) -> None:
+        """
+        Record the current positions as the previous state.
+
+        Args:
+            game_engine: Engine about to run its last step of the frame
+        """
+        self._previous = {
+            id(position): (position, position.x, position.y)
+            for position in self._positions(game_engine)
+        }
+        game_map = game_engine.get_game_map()
+        self._previous_camera = (
+            (game_map, game_map.camera_x, game_map.camera_y) if game_map is not None else None
+        )
+
+    def apply(self, game_engine, alpha: float) -> None:
+        """
+        Move positions to their interpolated values for rendering.
+
+        Args:
+            game_engine: Engine whose entities are about to be drawn
+            alpha: Fraction of the way from the previous to the current state
+        """
+        self.restore()
+        if alpha >= 1.0:
+            return
+        snap = self.snap_distance
+        moved = set()
+        for position in self._positions(game_engine):
+            previous = self._previous.get(id(position))
+            if previous is None or previous[0] is not position or id(position) in moved:
+                continue
+            moved.add(id(position))
+            x, y = position.x, position.y
+            dx, dy = x - previous[1], y - previous[2]
+            if (dx == 0 and dy == 0) or abs(dx) > snap or abs(dy) > snap:
+                continue
+            self._restore.append((position, x, y))
+            position.x = previous[1] + dx * alpha
+            position.y = previous[2] + dy * alpha
+
+        game_map = game_engine.get_game_map()
+        if self._previous_camera is not None and self._previous_camera[0] is game_map:
+            x, y = game_map.camera_x, game_map.camera_y
+            _, previous_x, previous_y = self._previous_camera
+            if abs(x - previous_x) <= snap and abs(y - previous_y) <= snap:
+                self._restore_camera = (game_map, x, y)
+                game_map.camera_x = previous_x + (x - previous_x) * alpha
+                game_map.camera_y = previous_y + (y - previous_y) * alpha
+
+    def restore(self) -> None:
+        """Put back the simulated positions changed by apply()."""
+        for position, x, y in self._restore:
+            position.x = x
+            position.y = y
+        self._restore.clear()
+        if self._restore_camera is not None:
+            game_map, x, y = self._restore_camera
+            game_map.camera_x = x
+            game_map.camera_y = y
+            self._restore_camera = None
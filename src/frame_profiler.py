@@ -0,0 +1,243 @@
+"""Low-overhead per-frame timing of named game loop sections."""
+
+import csv
+import json
+import logging
+import time
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Frames kept for the overlay graph and percentiles (4 s at 60 FPS)
+WINDOW_FRAMES = 240
+
+# Frames kept for trace dumps (10 min at 60 FPS)
+TRACE_FRAMES = 36000
+
+# Name of the whole-frame entry in samples and traces
+FRAME = "frame"
+
+_NULL_SECTION = nullcontext()
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of pre-sorted values.
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction (0.95 for p95)
+
+    Returns:
+        The percentile, or 0.0 for no values
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class _Section:
+    """Context manager adding its elapsed time to a profiler section."""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        """Bind the section to a profiler (timing starts on __enter__)."""
+        self._profiler = profiler
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> "_Section":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._profiler.add(self._name, time.perf_counter() - self._start)
+
+
+class FrameProfiler:
+    """
+    Times named sections of each frame and keeps rolling statistics.
+
+    The main loop calls begin_frame() after the frame-rate wait, mark(name)
+    after each stage (the time since the previous mark is charged to name)
+    and end_frame() once the frame is on screen. Code deeper in the engine
+    can time a nested piece of work with `with PROFILER.section(name):`;
+    nested sections are also counted inside the mark that encloses them.
+    While disabled every call returns immediately, so the hooks can stay in
+    the game loop permanently.
+    """
+
+    def __init__(self, window: int = WINDOW_FRAMES, trace_frames: int = TRACE_FRAMES):
+        """
+        Initialize a disabled profiler.
+
+        Args:
+            window: Frames kept for the overlay graph and percentiles
+            trace_frames: Frames kept for dump()
+        """
+        self.enabled = False
+        self.window = window
+
+        # Section name -> last `window` durations in seconds (0.0 if absent that frame)
+        self._samples: Dict[str, Deque[float]] = {}
+        # Per-frame section durations in seconds, for dump()
+        self.trace: Deque[Dict[str, float]] = deque(maxlen=trace_frames)
+        self.frames = 0
+
+        self._current: Dict[str, float] = {}
+        self._frame_start: Optional[float] = None
+        self._last_mark = 0.0
+
+    def toggle(self) -> bool:
+        """
+        Switch profiling on or off (takes effect at the next frame).
+
+        Returns:
+            True if the profiler is now enabled
+        """
+        self.enabled = not self.enabled
+        if not self.enabled:
+            self._frame_start = None
+        logger.info(f"⏱️  Frame profiler {'enabled' if self.enabled else 'disabled'}")
+        return self.enabled
+
+    def begin_frame(self) -> None:
+        """Start timing a frame."""
+        if not self.enabled:
+            return
+        self._current = {}
+        self._frame_start = self._last_mark = time.perf_counter()
+
+    def mark(self, name: str) -> None:
+        """
+        Charge the time since the previous mark (or frame start) to a section.
+
+        Args:
+            name: Section name, e.g. "update" or "flip"
+        """
+        if self._frame_start is None:
+            return
+        now = time.perf_counter()
+        self._current[name] = self._current.get(name, 0.0) + now - self._last_mark
+        self._last_mark = now
+
+    def section(self, name: str):
+        """
+        Time a nested block of work.
+
+        Args:
+            name: Section name, e.g. "collisions"
+
+        Returns:
+            Context manager (a no-op while no frame is being profiled)
+        """
+        if self._frame_start is None:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def add(self, name: str, seconds: float) -> None:
+        """
+        Add an externally measured duration to a section of the current frame.
+
+        Args:
+            name: Section name
+            seconds: Duration to add
+        """
+        if self._frame_start is None:
+            return
+        self._current[name] = self._current.get(name, 0.0) + seconds
+
+    def end_frame(self) -> None:
+        """Finish the frame and fold its timings into the statistics."""
+        if self._frame_start is None:
+            return
+        current = self._current
+        current[FRAME] = time.perf_counter() - self._frame_start
+        self._frame_start = None
+
+        for name in current:
+            if name not in self._samples:
+                # Pad so every section's window lines up with the frame window
+                self._samples[name] = deque(
+                    [0.0] * min(self.frames, self.window), maxlen=self.window
+                )
+        for name, samples in self._samples.items():
+            samples.append(current.get(name, 0.0))
+
+        self.trace.append(current)
+        self.frames += 1
+
+    def sections(self) -> List[str]:
+        """Section names in first-seen order, whole frame first."""
+        names = [name for name in self._samples if name != FRAME]
+        return [FRAME] + names if FRAME in self._samples else names
+
+    def frame_times(self) -> List[float]:
+        """Whole-frame durations in the rolling window, oldest first (seconds)."""
+        return list(self._samples.get(FRAME, ()))
+
+    def stats(self, name: str) -> Tuple[float, float, float]:
+        """
+        Percentiles of a section over the rolling window.
+
+        Args:
+            name: Section name (or FRAME)
+
+        Returns:
+            (p50, p95, p99) in milliseconds
+        """
+        values = sorted(self._samples.get(name, ()))
+        return tuple(percentile(values, p) * 1000 for p in (0.50, 0.95, 0.99))
+
+    def reset(self) -> None:
+        """Forget all samples and the trace."""
+        self._samples.clear()
+        self.trace.clear()
+        self.frames = 0
+
+    def dump(self, path: str) -> bool:
+        """
+        Write the per-frame trace for offline analysis.
+
+        A .json path gets a list of {section: milliseconds} objects; any other
+        path gets CSV with one row per frame and one column per section.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            True if written, False if there was nothing to write or on error
+        """
+        if not self.trace:
+            return False
+
+        target = Path(path)
+        names = [FRAME] + sorted({name for frame in self.trace for name in frame} - {FRAME})
+        rows = [
+            {name: round(frame.get(name, 0.0) * 1000, 3) for name in names} for frame in self.trace
+        ]
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.suffix.lower() == ".json":
+                with open(target, "w") as f:
+                    json.dump({"unit": "ms", "frames": rows}, f)
+            else:
+                with open(target, "w", newline="") as f:
+                    writer = csv.DictWriter(f, fieldnames=names)
+                    writer.writeheader()
+                    writer.writerows(rows)
+        except OSError as e:
+            logger.error(f"Failed to write frame trace {target}: {e}")
+            return False
+
+        logger.info(f"⏱️  Wrote {len(rows)} frame timings to {target}")
+        return True
+
+
+# Shared by the main loop, the engine (cheat toggle, nested sections) and the renderer
+PROFILER = FrameProfiler()
@@ -1,12 +1,15 @@
 """Core game engine and game loop."""
 
 import logging
-import threading
+import queue
 import time
-from typing import List, Optional, Union
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 import pygame
 
+from api_dispatcher import ApiDispatcher
 from approval import ApprovalManager
 from arcade_mode import ArcadeModeManager
 from arcade_results_controller import (
@@ -19,7 +22,7 @@ from boss import Boss  # DEPRECATED - kept for backwards compatibility
 from boss_battle_controller import BossBattleController
 from boss_dialogue_controller import BossDialogueController
 from cheat_code_controller import CheatCodeAction, CheatCodeController
-from collision import SpatialGrid, check_collisions_with_spatial_grid
+from collision import SpatialGrid, check_collisions
 from combo_tracker import ComboTracker
 from cyber_boss import (
     BOSS_LEVEL_MAP,
@@ -36,6 +39,7 @@ from dialogue_renderer import DialogueRenderer
 from difficulty_config import EnvironmentDifficulty, get_difficulty_for_environment
 from education_manager import EducationManager
 from evidence_capture import EvidenceCapture
+from frame_profiler import PROFILER
 from game_map import GameMap
 
 # Genre selection removed - using static level-to-genre mapping instead
@@ -56,7 +60,7 @@ from pause_menu_controller import PauseMenuAction, PauseMenuController
 from player import Player
 from powerup import PowerUp, PowerUpManager, PowerUpType, spawn_random_powerups
 from production_outage import ProductionOutageManager
-from projectile import Projectile
+from projectile import Projectile, ProjectilePool
 from reinvent_stats_tracker import record_arcade_session
 from save_manager import SaveManager
 from service_protection_quest import (
@@ -127,6 +131,13 @@ class GameEngine:
         self.account_data = account_data or {}
         self.third_party_data = third_party_data or {}
 
+        # Lobby map is deterministic for the account/3rd party data, so it is
+        # built once and reused across level transitions
+        self.lobby_map = None
+        # Where each zombie (by identity_id) stands in the lobby, so returning
+        # from a level restores the layout instead of re-scattering everyone
+        self.lobby_zombie_positions: Dict[str, Vector2] = {}
+
         # Initialize game map if enabled (LOBBY mode - main branch style)
         if use_map:
             # LOBBY MODE: Use main branch style (no reveal_radius, no api_client in GameMap)
@@ -137,12 +148,13 @@ class GameEngine:
                 account_data,
                 third_party_data,
             )
+            self.lobby_map = self.game_map
 
             # LOBBY: Distribute all zombies across rooms (visible in lobby, like main branch)
             # This allows players to see zombies in rooms before entering
             if zombies:
                 self.zombies = zombies  # Show all zombies in lobby
-                self.game_map.scatter_zombies(self.zombies)
+                self._place_lobby_zombies()
                 # Make zombies visible in lobby (they're hidden by default)
                 for zombie in self.zombies:
                     zombie.is_hidden = False
@@ -184,6 +196,7 @@ class GameEngine:
 
         # Game entities
         self.projectiles: List[Projectile] = []
+        self.projectile_pool = ProjectilePool()
 
         # AWS-themed power-ups
         self.powerup_manager = PowerUpManager()
@@ -239,6 +252,17 @@ class GameEngine:
             set()
         )  # Track third-party names that have been blocked
 
+        # Quarantine/block calls run on a small worker pool instead of a thread per kill.
+        # Calls that arrive while the pool's queue is full wait here (backpressure)
+        self.api_dispatcher = ApiDispatcher(max_workers=4, max_queued=32)
+        self._deferred_api_calls: Deque[Callable[[], bool]] = deque()
+
+        # Quest API calls (JIT setup, service/JIT protection) run on their own pool
+        # so level entry and quest interactions never wait on the network.
+        # key -> (future, HUD label, callback applied to the result on the main thread)
+        self.quest_dispatcher = ApiDispatcher(max_workers=2, max_queued=8, name="quest")
+        self._quest_requests: Dict[str, Tuple[Future, str, Callable[[Any], None]]] = {}
+
         # Evidence capture (screenshots & recordings)
         self.evidence_capture = EvidenceCapture()
         self.last_autosave_time = 0.0  # Track last autosave for periodic saves
@@ -332,8 +356,7 @@ class GameEngine:
             self.photo_booth.initialize()
             print(
                 f"📸 Photo booth initialized: state={self.photo_booth.state}, "
-                f"camera_available={self.photo_booth.is_camera_available}, "
-                f"webcam_open={self.photo_booth._webcam is not None and self.photo_booth._webcam.isOpened() if self.photo_booth._webcam else 'No webcam'}"
+                f"camera_service={self.photo_booth._camera is not None}"
             )
             logger.info(
                 f"📸 Photo booth initialized: state={self.photo_booth.state}, "
@@ -538,6 +561,9 @@ class GameEngine:
         """
         Initialize JIT Access Quest for production accounts.
 
+        The permission set and JIT configuration queries run on the quest pool;
+        the quest entities appear once both have arrived (see _setup_jit_quest).
+
         Args:
             account_id: AWS account ID to check
         """
@@ -553,22 +579,61 @@ class GameEngine:
             )
             return
 
-        try:
-            logger.info(
-                f"🔍 Checking for admin/privileged permission sets in account {account_id}..."
-            )
+        logger.info(
+            f"🔍 Checking for admin/privileged permission sets in account {account_id}..."
+        )
+        self._request_quest_call(
+            f"jit_quest:{account_id}",
+            "Checking admin roles",
+            lambda: self._fetch_jit_quest_data(account_id),
+            lambda data: self._setup_jit_quest(account_id, *data),
+        )
 
-            # Fetch permission sets (admin/privileged roles)
-            permission_sets_data = self.api_client.fetch_permission_sets(account_id)
+    def _fetch_jit_quest_data(self, account_id: str) -> Tuple[List[dict], dict]:
+        """
+        Fetch the permission sets and JIT configuration for the JIT quest (worker thread).
+
+        Args:
+            account_id: AWS account ID to check
+
+        Returns:
+            (permission sets, JIT configuration); the configuration is not
+            fetched when there are no permission sets
+        """
+        # Fetch permission sets (admin/privileged roles)
+        permission_sets_data = self.api_client.fetch_permission_sets(account_id)
+        if not permission_sets_data:
+            return [], {}
+
+        # Fetch JIT configuration to see which are already protected
+        return permission_sets_data, self.api_client.fetch_jit_configuration(account_id)
 
+    def _setup_jit_quest(
+        self, account_id: str, permission_sets_data: List[dict], jit_config: dict
+    ) -> None:
+        """
+        Create the JIT Access Quest entities once its API data has arrived.
+
+        Args:
+            account_id: AWS account ID the data was fetched for
+            permission_sets_data: Admin/privileged permission sets
+            jit_config: JIT configuration (enrolledPermissionSets)
+        """
+        # The player may have left the level while the data was loading
+        if (
+            self.game_state.current_level_account_id != account_id
+            or self.game_state.jit_quest is not None
+        ):
+            logger.info(f"⏭️  Ignoring JIT quest data for {account_id} - level no longer active")
+            return
+
+        try:
             if not permission_sets_data:
                 logger.info(
                     f"⏭️  No admin/privileged permission sets found - skipping JIT quest"
                 )
                 return
 
-            # Fetch JIT configuration to see which are already protected
-            jit_config = self.api_client.fetch_jit_configuration(account_id)
             enrolled_ids = set(jit_config.get("enrolledPermissionSets", []))
 
             # Create PermissionSet objects and mark which have JIT
@@ -757,19 +822,43 @@ class GameEngine:
         """
         Attempt to protect service via Sonrai API.
 
+        The call runs on the quest pool; the outcome is applied by
+        _on_service_protect_result on a later frame. Repeat attempts while
+        a call is pending are ignored.
+
         Args:
             quest: Active quest
             service_node: Service node to protect
         """
+        # Call REAL Sonrai API to protect the service!
+        account_id = self.game_state.current_level_account_id
+        self._request_quest_call(
+            f"protect_service:{quest.service_type}",
+            f"Protecting {quest.service_type}",
+            lambda: self.api_client.protect_service(
+                service_type=quest.service_type,
+                account_id=account_id,
+                service_name=f"{quest.service_type.capitalize()} Service",
+            ),
+            lambda result: self._on_service_protect_result(quest, service_node, result),
+        )
+
+    def _on_service_protect_result(self, quest, service_node: ServiceNode, result) -> None:
+        """
+        Apply the outcome of a protect_service call.
+
+        Args:
+            quest: Quest the service belongs to
+            service_node: Service node that was protected
+            result: QuarantineResult from protect_service
+        """
         try:
             from models import QuestStatus
 
-            # Call REAL Sonrai API to protect the service!
-            result = self.api_client.protect_service(
-                service_type=quest.service_type,
-                account_id=self.game_state.current_level_account_id,
-                service_name=f"{quest.service_type.capitalize()} Service",
-            )
+            if quest.status == QuestStatus.COMPLETED:
+                # The hacker won (or the quest ended) while the call was in flight
+                logger.info("⏭️  Ignoring protect_service result - quest already over")
+                return
 
             if result.success:
                 # Success! Player won the race
@@ -869,20 +958,43 @@ class GameEngine:
         """
         Apply JIT protection to an admin role via Sonrai API.
 
+        The call runs on the quest pool; the outcome is applied by
+        _on_jit_protection_result on a later frame. Touching the role again
+        while the call is pending does nothing.
+
         Args:
             admin_role: AdminRole entity to protect
         """
-        try:
-            logger.info(
-                f"Applying JIT protection to {admin_role.permission_set.name}..."
-            )
-
+        permission_set = admin_role.permission_set
+        account_id = self.game_state.current_level_account_id
+        if self._request_quest_call(
+            f"apply_jit:{permission_set.id}",
+            f"Applying JIT to {permission_set.name}",
             # Call REAL Sonrai API to apply JIT protection
-            result = self.api_client.apply_jit_protection(
-                account_id=self.game_state.current_level_account_id,
-                permission_set_id=admin_role.permission_set.id,
-                permission_set_name=admin_role.permission_set.name,
-            )
+            lambda: self.api_client.apply_jit_protection(
+                account_id=account_id,
+                permission_set_id=permission_set.id,
+                permission_set_name=permission_set.name,
+            ),
+            lambda result: self._on_jit_protection_result(admin_role, result),
+        ):
+            logger.info(f"Applying JIT protection to {permission_set.name}...")
+
+    def _on_jit_protection_result(self, admin_role: AdminRole, result) -> None:
+        """
+        Apply the outcome of an apply_jit_protection call.
+
+        Args:
+            admin_role: AdminRole entity that was protected
+            result: QuarantineResult from apply_jit_protection
+        """
+        try:
+            # The player may have left the level while the call was in flight
+            if not self.game_state.jit_quest or admin_role not in self.admin_roles:
+                logger.info("⏭️  Ignoring JIT protection result - quest no longer active")
+                return
+            if admin_role.has_jit:
+                return
 
             if result.success:
                 # Success! Mark role as protected
@@ -951,6 +1063,10 @@ class GameEngine:
         Args:
             delta_time: Time elapsed since last frame in seconds
         """
+        # Collect finished quarantine/block and quest calls without waiting on the network
+        self._poll_api_calls()
+        self._poll_quest_requests()
+
         # Periodic autosave (every 30 seconds during gameplay)
         current_time = time.time()
         if current_time - self.last_autosave_time >= self.autosave_interval:
@@ -976,6 +1092,10 @@ class GameEngine:
             if self.game_state.resource_message_timer <= 0:
                 self.game_state.resource_message = None
 
+        # Collect the photo booth composite once its background job finishes
+        if getattr(self.game_state, "photo_booth_summary_active", False) and self.photo_booth:
+            self._poll_photo_booth_composite()
+
         # Handle photo booth consent timeout
         if (
             getattr(self.game_state, "photo_booth_consent_active", False)
@@ -1145,7 +1265,7 @@ class GameEngine:
                         break
 
         # Update projectiles (for zapping third parties)
-        for projectile in self.projectiles[:]:
+        for projectile in self.projectiles:
             projectile.update(delta_time)
             # Remove projectiles that are off screen
             if (
@@ -1154,19 +1274,19 @@ class GameEngine:
                 or projectile.position.y < 0
                 or projectile.position.y > self.game_map.map_height
             ):
-                self.projectiles.remove(projectile)
+                self.projectile_pool.release(projectile)
+        self._compact_projectiles()
 
         # Check projectile collisions with third parties
         if self.game_map and hasattr(self.game_map, "third_parties"):
-            for projectile in self.projectiles[:]:
+            for projectile in self.projectiles:
                 for third_party in self.game_map.third_parties[:]:
                     if not third_party.is_blocking and not third_party.is_protected:
                         if projectile.get_bounds().colliderect(
                             third_party.get_bounds()
                         ):
-                            # Remove projectile
-                            if projectile in self.projectiles:
-                                self.projectiles.remove(projectile)
+                            # Return projectile to the pool
+                            self.projectile_pool.release(projectile)
 
                             # Apply damage (third parties have 10 health)
                             eliminated = third_party.take_damage(projectile.damage)
@@ -1176,6 +1296,7 @@ class GameEngine:
                                 self._block_third_party(third_party)
 
                             break
+            self._compact_projectiles()
 
     def _enter_level(self, door) -> None:
         """
@@ -1358,7 +1479,7 @@ class GameEngine:
             self.powerup_manager = PowerUpManager()
             self.powerups = []
             self.star_power_touched_zombies.clear()
-            self.projectiles = []
+            self.projectile_pool.release_all(self.projectiles)
             self.boss = None
             self.boss_spawned = False
 
@@ -1484,14 +1605,8 @@ class GameEngine:
                 self.game_state.completed_levels.add(completed_account_id)
                 logger.info(f"✅ Level {completed_account_id} marked as completed")
 
-        # Reinitialize game map for lobby (main branch style)
-        self.game_map = GameMap(
-            "assets/reinvent_floorplan.png",
-            self.screen_width,
-            self.screen_height,
-            self.account_data,
-            self.third_party_data,
-        )
+        # Restore the cached lobby map (only built here if the engine started without one)
+        self.game_map = self._get_lobby_map()
 
         # Recreate spatial grid for lobby dimensions (matches _enter_level fix)
         self.spatial_grid = SpatialGrid(
@@ -1501,7 +1616,8 @@ class GameEngine:
             f"✅ Spatial grid recreated for lobby: {self.game_map.map_width}x{self.game_map.map_height}"
         )
 
-        # Mark doors as completed based on completed levels
+        # Mark doors as completed based on completed levels (the lobby map is reused,
+        # so marks are re-derived rather than only ever added)
         if self.game_map and hasattr(self.game_map, "doors") and self.level_manager:
             for door in self.game_map.doors:
                 # Find the level that matches this door
@@ -1509,8 +1625,10 @@ class GameEngine:
                     for level in self.level_manager.levels:
                         if level.account_name == door.destination_room_name:
                             # Check if this level's account ID is completed
-                            if level.account_id in self.completed_level_account_ids:
-                                door.is_completed = True
+                            door.is_completed = (
+                                level.account_id in self.completed_level_account_ids
+                            )
+                            if door.is_completed:
                                 logger.info(
                                     f"✅ Door to {door.destination_room_name} marked as completed"
                                 )
@@ -1531,7 +1649,7 @@ class GameEngine:
         )
 
         # Clear level-specific entities and restore lobby zombies
-        self.projectiles = []
+        self.projectile_pool.release_all(self.projectiles)
         self.powerups = []
         self.boss = None
         self.boss_spawned = False
@@ -1542,8 +1660,8 @@ class GameEngine:
             # Make sure they're visible and scattered across rooms
             for zombie in self.zombies:
                 zombie.is_hidden = False
-            # Re-scatter them across rooms (in case positions were modified)
-            self.game_map.scatter_zombies(self.zombies)
+            # Put them back where they stood (levels move the same Zombie objects)
+            self._place_lobby_zombies()
             logger.info(f"🏛️  Restored {len(self.zombies)} zombies to lobby")
         else:
             self.zombies = []  # No zombies in classic mode
@@ -1581,6 +1699,98 @@ class GameEngine:
 
         logger.info("✅ Returned to lobby")
 
+    def _get_lobby_map(self) -> GameMap:
+        """
+        Get the lobby map, building it only the first time.
+
+        The tiles, rooms and doors never change for a given account/3rd party
+        data set, so the map is kept alive across levels and only its dynamic
+        state is reset: the camera/zoom here, door completion marks by the caller.
+
+        Returns:
+            Lobby GameMap ready for the player to return to
+        """
+        if self.lobby_map is None:
+            self.lobby_map = GameMap(
+                "assets/reinvent_floorplan.png",
+                self.screen_width,
+                self.screen_height,
+                self.account_data,
+                self.third_party_data,
+            )
+            logger.info("🏛️  Lobby map built")
+        else:
+            self.lobby_map.reset_view()
+            logger.info("🏛️  Reusing cached lobby map")
+
+        # Blocked 3rd parties stay gone (also covers ones restored from a save)
+        third_parties = getattr(self.lobby_map, "third_parties", None)
+        if isinstance(third_parties, list) and self.blocked_third_parties:
+            third_parties[:] = [
+                tp for tp in third_parties if tp.name not in self.blocked_third_parties
+            ]
+        return self.lobby_map
+
+    def add_zombies(self, zombies: List[Zombie]) -> None:
+        """
+        Add zombies that finished loading after the engine started.
+
+        Startup opens the lobby as soon as the account summary is in and
+        streams each account's zombies in behind it; they join the pool used
+        for level loading and, while in the lobby, appear in their rooms.
+
+        Args:
+            zombies: Newly loaded zombie entities
+        """
+        known = {z.identity_id for z in self.all_zombies}
+        new_zombies = [z for z in zombies if z.identity_id not in known]
+        if not new_zombies:
+            return
+
+        self.all_zombies.extend(new_zombies)
+        if self.use_map and self.game_state.status == GameStatus.LOBBY:
+            self.zombies = self.all_zombies
+            self._place_lobby_zombies()
+            # Lobby zombies are shown in their rooms (scattering hides them)
+            for zombie in new_zombies:
+                zombie.is_hidden = False
+        logger.info(
+            f"🧟 {len(new_zombies)} zombies arrived ({len(self.all_zombies)} loaded in total)"
+        )
+
+    def show_no_zombies_message(self) -> None:
+        """
+        Tell the player that loading finished without finding any zombies.
+
+        Startup used to exit when no account had unused identities; with
+        zombies streaming in behind an open lobby, the player is told instead.
+        """
+        logger.warning("No unused identities found in any account")
+        if self.game_state.congratulations_message:
+            return  # Don't replace a message the player hasn't dismissed yet
+        self.game_state.previous_status = self.game_state.status
+        self.game_state.status = GameStatus.PAUSED
+        self.game_state.congratulations_message = (
+            "🎉 No unused identities found!\n\n"
+            "Your cloud is already secure.\n\n"
+            "Press A/B/Start or ENTER to continue"
+        )
+
+    def _place_lobby_zombies(self) -> None:
+        """Scatter zombies not yet placed in the lobby and restore everyone else's spot."""
+        unplaced = [
+            z for z in self.zombies if z.identity_id not in self.lobby_zombie_positions
+        ]
+        if unplaced:
+            self.game_map.scatter_zombies(unplaced)
+            for zombie in unplaced:
+                position = zombie.position
+                self.lobby_zombie_positions[zombie.identity_id] = Vector2(position.x, position.y)
+
+        for zombie in self.zombies:
+            position = self.lobby_zombie_positions[zombie.identity_id]
+            zombie.position = Vector2(position.x, position.y)
+
     def _update_arcade_mode(self, delta_time: float) -> None:
         """
         Update arcade mode logic.
@@ -1808,7 +2018,13 @@ class GameEngine:
             is_new_high_score=is_new_high_score,
         )
 
+        # Arcade is over: drop the camera back to its idle frame rate
+        if self.photo_booth:
+            self.photo_booth.set_camera_active(False)
+
         # Generate photo booth composite if enabled and minimum time passed
+        photo_booth_started = False
+        self.game_state.photo_booth_path = None
         if self.photo_booth and self.photo_booth.is_consent_complete():
             logger.info(
                 f"📸 Photo booth end-of-arcade status: "
@@ -1822,15 +2038,16 @@ class GameEngine:
             if self.photo_booth.has_minimum_arcade_time():
                 # Only generate if we have a gameplay screenshot
                 if self.photo_booth.gameplay_captured:
-                    logger.info("📸 Generating photo booth composite...")
-                    photo_path = self.photo_booth.generate_composite(
+                    # Built in the background; the summary screen polls its progress
+                    logger.info("📸 Starting photo booth composite...")
+                    preview_size = (
+                        self.renderer.photo_booth_preview_size if self.renderer else None
+                    )
+                    photo_booth_started = self.photo_booth.start_composite(
                         stats.total_eliminations,
                         is_new_high_score=is_new_high_score,
+                        preview_size=preview_size,
                     )
-                    if photo_path:
-                        logger.info(f"📸 Photo booth image saved: {photo_path}")
-                        # Store path for display on results screen
-                        self.game_state.photo_booth_path = photo_path
                 else:
                     logger.info(
                         "📸 No gameplay screenshot captured - skipping photo booth"
@@ -1845,8 +2062,8 @@ class GameEngine:
         self.game_state.previous_status = self.game_state.status
         self.game_state.status = GameStatus.PAUSED
 
-        # If photo booth image was generated, show summary screen first
-        if self.game_state.photo_booth_path:
+        # If a photo booth image is being generated, show summary screen first
+        if photo_booth_started:
             logger.info("📸 Showing photo booth summary screen")
             self.game_state.photo_booth_summary_active = True
             self._photo_booth_summary_shown_time = (
@@ -1868,6 +2085,21 @@ class GameEngine:
             has_controller=self.joystick is not None
         )
 
+    def _poll_photo_booth_composite(self) -> None:
+        """Store the finished composite's path, or skip to results if it failed."""
+        if self.game_state.photo_booth_path or self.photo_booth.is_compositing:
+            return
+
+        photo_path = self.photo_booth.poll_composite()
+        if photo_path:
+            logger.info(f"📸 Photo booth image saved: {photo_path}")
+            # Store path for display on results screen
+            self.game_state.photo_booth_path = photo_path
+        elif self.photo_booth.state == PhotoBoothState.ERROR:
+            logger.warning("📸 Photo booth composite failed - showing results")
+            self._photo_booth_summary_shown_time = 0.0  # Skip the dismissal cooldown
+            self._dismiss_photo_booth_summary()
+
     def _dismiss_photo_booth_summary(self) -> None:
         """Dismiss photo booth summary and show arcade results menu."""
         if not self.game_state.photo_booth_summary_active:
@@ -1884,6 +2116,9 @@ class GameEngine:
 
         logger.info("📸 Dismissing photo booth summary, showing arcade results")
         self.game_state.photo_booth_summary_active = False
+        if self.photo_booth:
+            # Player skipped before the photo was finished
+            self.photo_booth.cancel_composite()
 
         # Now show the arcade results with the pending stats
         if self._pending_arcade_stats:
@@ -2231,14 +2466,14 @@ class GameEngine:
             # Update JIT Access Quest
             self._update_jit_quest(delta_time)
 
-        # Update projectiles
-        for projectile in self.projectiles[:]:
+        # Update projectiles (spent ones go back to the pool, list compacted once)
+        for projectile in self.projectiles:
             projectile.update(delta_time)
 
             # Check wall collision (map mode only)
             if self.use_map and self.game_map:
                 if projectile.hits_wall(self.game_map):
-                    self.projectiles.remove(projectile)
+                    self.projectile_pool.release(projectile)
                     continue  # Skip other checks if hit wall
 
             # Remove off-screen/off-map projectiles
@@ -2247,13 +2482,14 @@ class GameEngine:
                 if projectile.is_off_screen(
                     self.game_map.map_width, self.game_map.map_height, map_mode=True
                 ):
-                    self.projectiles.remove(projectile)
+                    self.projectile_pool.release(projectile)
             else:
                 # Classic mode: check against screen bounds
                 if projectile.is_off_screen(
                     self.screen_width, self.screen_height, map_mode=False
                 ):
-                    self.projectiles.remove(projectile)
+                    self.projectile_pool.release(projectile)
+        self._compact_projectiles()
 
         # Skip zombie collisions during boss battle
         if self.game_state.status != GameStatus.BOSS_BATTLE:
@@ -2307,9 +2543,10 @@ class GameEngine:
                         f"  Zombie[0]: pos=({z.position.x:.1f}, {z.position.y:.1f}), bounds={z.get_bounds()}, is_quarantining={z.is_quarantining}, is_hidden={z.is_hidden}"
                     )
 
-            collisions = check_collisions_with_spatial_grid(
-                self.projectiles, visible_zombies, self.spatial_grid
-            )
+            with PROFILER.section("collisions"):
+                collisions = check_collisions(
+                    self.projectiles, visible_zombies, self.spatial_grid
+                )
 
             # DEBUG: Log collision results
             if len(self.projectiles) > 0:
@@ -2321,9 +2558,8 @@ class GameEngine:
 
         # Handle zombie collisions
         for projectile, zombie in collisions:
-            # Remove projectile
-            if projectile in self.projectiles:
-                self.projectiles.remove(projectile)
+            # Return projectile to the pool
+            self.projectile_pool.release(projectile)
 
             # Apply damage to zombie
             eliminated = zombie.take_damage(projectile.damage)
@@ -2331,6 +2567,8 @@ class GameEngine:
             # Only handle elimination if zombie health reached 0
             if eliminated:
                 self._handle_zombie_elimination(zombie)
+        if collisions:
+            self._compact_projectiles()
 
         # Check collisions with 3rd parties
         third_parties = self.get_third_parties()
@@ -2348,22 +2586,21 @@ class GameEngine:
             else:
                 visible_third_parties = third_parties
 
-            third_party_collisions = check_collisions_with_spatial_grid(
-                self.projectiles, visible_third_parties, self.spatial_grid
-            )
+            with PROFILER.section("collisions"):
+                third_party_collisions = check_collisions(
+                    self.projectiles, visible_third_parties, self.spatial_grid
+                )
 
             # Handle 3rd party collisions
             for projectile, third_party in third_party_collisions:
                 # Skip protected third parties (Sonrai)
                 if third_party.is_protected:
                     # Remove projectile but don't damage protected entity
-                    if projectile in self.projectiles:
-                        self.projectiles.remove(projectile)
+                    self.projectile_pool.release(projectile)
                     continue
 
-                # Remove projectile
-                if projectile in self.projectiles:
-                    self.projectiles.remove(projectile)
+                # Return projectile to the pool
+                self.projectile_pool.release(projectile)
 
                 # Apply damage to third party
                 eliminated = third_party.take_damage(projectile.damage)
@@ -2371,6 +2608,12 @@ class GameEngine:
                 # Only handle blocking if third party health reached 0
                 if eliminated:
                     self._handle_third_party_blocking(third_party)
+            if third_party_collisions:
+                self._compact_projectiles()
+
+    def _compact_projectiles(self) -> None:
+        """Drop projectiles released to the pool this frame in one O(n) pass."""
+        self.projectiles[:] = [p for p in self.projectiles if p.active]
 
     def _handle_zombie_elimination(self, zombie: Zombie) -> None:
         """
@@ -2379,6 +2622,9 @@ class GameEngine:
         Args:
             zombie: The zombie that was hit
         """
+        # Drop from the collision index right away (O(1))
+        self.spatial_grid.remove(zombie)
+
         # ARCADE MODE: Queue elimination instead of immediate quarantine
         if self.arcade_manager.is_active():
             # Hide zombie immediately for visual feedback
@@ -2488,6 +2734,7 @@ class GameEngine:
         # IMMEDIATE FEEDBACK: Hide third party right away (no lag)
         third_party.is_hidden = True
         third_party.is_blocking = True
+        self.spatial_grid.remove(third_party)
 
         # STORY MODE: Trigger educational dialogue on first third-party block
         if self.game_state.is_story_mode:
@@ -3068,8 +3315,8 @@ class GameEngine:
                 self._spawn_boss()
                 logger.info("All zombies cleared! Spawning boss...")
 
-        # Fire-and-forget API call in background thread
-        def do_quarantine():
+        # Fire-and-forget API call on the worker pool
+        def do_quarantine() -> bool:
             try:
                 # Extract root scope from full scope path
                 root_scope = None
@@ -3090,19 +3337,17 @@ class GameEngine:
 
                 if result.success:
                     logger.info(f"✅ [ASYNC] Quarantined {zombie.identity_name}")
-                    # Save in background too (non-blocking)
-                    self._save_game()
                 else:
                     logger.error(
                         f"❌ [ASYNC] Quarantine failed: {result.error_message}"
                     )
+                return result.success
 
             except Exception as e:
                 logger.error(f"❌ [ASYNC] Exception during quarantine: {e}")
+                return False
 
-        # Start background thread (daemon=True so it won't block game exit)
-        thread = threading.Thread(target=do_quarantine, daemon=True)
-        thread.start()
+        self._submit_api_call(do_quarantine)
 
     def _block_third_party(self, third_party) -> None:
         """
@@ -3118,8 +3363,8 @@ class GameEngine:
             self.game_state.third_parties_blocked += 1
             self.blocked_third_parties.add(third_party.name)
 
-        # Fire-and-forget API call in background thread
-        def do_block():
+        # Fire-and-forget API call on the worker pool
+        def do_block() -> bool:
             try:
                 logger.info(f"🔍 [ASYNC] Blocking 3rd party: {third_party.name}")
 
@@ -3130,16 +3375,150 @@ class GameEngine:
 
                 if result.success:
                     logger.info(f"✅ [ASYNC] Blocked {third_party.name}")
-                    self._save_game()
                 else:
                     logger.error(f"❌ [ASYNC] Block failed: {result.error_message}")
+                return result.success
 
             except Exception as e:
                 logger.error(f"❌ [ASYNC] Exception during block: {e}")
+                return False
+
+        self._submit_api_call(do_block)
+
+    def _submit_api_call(self, call: Callable[[], bool]) -> None:
+        """
+        Hand an API call to the worker pool, or defer it while the pool is backed up.
 
-        # Start background thread (daemon=True so it won't block game exit)
-        thread = threading.Thread(target=do_block, daemon=True)
-        thread.start()
+        Args:
+            call: Callable returning True if the API call succeeded (must not raise)
+        """
+        if not self._deferred_api_calls:
+            try:
+                self.api_dispatcher.submit(call)
+                return
+            except queue.Full:
+                logger.info("⏳ API queue full, deferring call until a worker frees up")
+        self._deferred_api_calls.append(call)
+
+    def _poll_api_calls(self) -> None:
+        """Handle finished API calls and feed deferred ones to the pool (never blocks)."""
+        self._collect_api_calls()
+
+        while self._deferred_api_calls:
+            try:
+                self.api_dispatcher.submit(self._deferred_api_calls[0])
+            except queue.Full:
+                break
+            self._deferred_api_calls.popleft()
+
+        self._update_api_call_counts()
+
+    def _update_api_call_counts(self) -> None:
+        """Refresh the HUD's running/queued API call counts."""
+        self.game_state.api_calls_in_flight = self.api_dispatcher.in_flight
+        self.game_state.api_calls_queued = self.api_dispatcher.queued + len(
+            self._deferred_api_calls
+        )
+
+    def _collect_api_calls(self) -> None:
+        """
+        Handle finished API calls without submitting new ones.
+
+        Saves run here on the main thread, once per batch of successful calls,
+        instead of concurrently from every worker.
+        """
+        completed = self.api_dispatcher.poll_completed()
+        if any(future.result() for future in completed):
+            self._save_game()
+
+    def _request_quest_call(
+        self,
+        key: str,
+        label: str,
+        call: Callable[[], Any],
+        on_result: Callable[[Any], None],
+    ) -> bool:
+        """
+        Start a quest API call without blocking the frame.
+
+        Args:
+            key: Identifies the call; a second request with a pending key is ignored
+            label: Short description shown on the HUD while the call is pending
+            call: Callable performing the API request (runs on a worker thread)
+            on_result: Callback given call's return value on the main thread
+
+        Returns:
+            True if the call was started, False if already pending or the pool is full
+        """
+        if key in self._quest_requests:
+            return False
+        try:
+            future = self.quest_dispatcher.submit(call)
+        except (queue.Full, RuntimeError) as e:
+            logger.warning(f"⏳ Could not start quest API call {key}: {e!r}")
+            return False
+
+        self._quest_requests[key] = (future, label, on_result)
+        self.game_state.quest_calls_pending = self._quest_call_labels()
+        return True
+
+    def _poll_quest_requests(self) -> None:
+        """Apply the results of finished quest API calls (never blocks)."""
+        finished = set(self.quest_dispatcher.poll_completed())
+        if not finished:
+            return
+
+        for key, (future, _label, on_result) in list(self._quest_requests.items()):
+            if future not in finished:
+                continue
+            del self._quest_requests[key]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"❌ Quest API call {key} failed: {e}")
+                continue
+            on_result(result)
+
+        self.game_state.quest_calls_pending = self._quest_call_labels()
+
+    def _quest_call_labels(self) -> List[str]:
+        """HUD labels of the pending quest API calls."""
+        return [label for _future, label, _on_result in self._quest_requests.values()]
+
+    def wait_for_quest_requests(self, timeout: float = 5.0) -> None:
+        """
+        Poll until every pending quest API call has been applied (for callers without a frame loop).
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        deadline = time.monotonic() + timeout
+        while self._quest_requests and time.monotonic() < deadline:
+            self._poll_quest_requests()
+            if self._quest_requests:
+                time.sleep(0.01)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Finish outstanding quarantine/block calls before the game exits.
+
+        Args:
+            timeout: Maximum seconds to wait for pending API calls
+        """
+        deadline = time.monotonic() + timeout
+        while self._deferred_api_calls and time.monotonic() < deadline:
+            self._poll_api_calls()
+            time.sleep(0.05)
+
+        # The dispatcher is closed from here on, so only collect what finished
+        self.api_dispatcher.shutdown(max(0.0, deadline - time.monotonic()))
+        self._collect_api_calls()
+        self._update_api_call_counts()
+        if self._deferred_api_calls:
+            logger.warning(f"Dropped {len(self._deferred_api_calls)} API calls on exit")
+
+        # Quest results are only meaningful in-game, so don't wait for them
+        self.quest_dispatcher.shutdown(timeout=1.0)
 
     def handle_input(
         self, events: List[pygame.event.Event], screen: pygame.Surface = None
@@ -3352,6 +3731,9 @@ class GameEngine:
                         self.outage_manager.trigger()
                         logger.info("🚨 CHEAT: Production outage triggered!")
 
+                elif cheat_result.action == CheatCodeAction.TOGGLE_PROFILER:
+                    PROFILER.toggle()
+
                 # Handle boss dialogue dismissal (ENTER key only)
                 if event.key == pygame.K_RETURN:
                     if self.boss_dialogue_controller.is_showing:
@@ -3427,7 +3809,7 @@ class GameEngine:
                         GameStatus.PLAYING,
                         GameStatus.BOSS_BATTLE,
                     ):
-                        projectile = self.player.fire_projectile()
+                        projectile = self.player.fire_projectile(self.projectile_pool)
                         self.projectiles.append(projectile)
 
                 # F12 - Screenshot (deferred until after render completes)
@@ -3437,10 +3819,11 @@ class GameEngine:
 
                 # F9 - Toggle Recording
                 elif event.key == pygame.K_F9:
-                    current_time = time.time()
+                    # Same clock the main loop passes to capture_frame()
+                    current_time = pygame.time.get_ticks() / 1000.0
                     result = self.evidence_capture.toggle_recording(current_time)
                     if result:
-                        logger.info(f"🎬 Recording saved: {result}")
+                        logger.info(f"🎬 Recording stopped, finishing {result} in background")
                     continue
 
                 # ESC key - Pause/Resume or Quit
@@ -3502,8 +3885,7 @@ class GameEngine:
                 if consent_active and self.photo_booth:
                     logger.info(
                         f"📸 PRE-CONSENT: state={self.photo_booth.state}, "
-                        f"camera_available={self.photo_booth.is_camera_available}, "
-                        f"webcam_exists={self.photo_booth._webcam is not None}"
+                        f"camera_available={self.photo_booth.is_camera_available}"
                     )
                     # Accept EITHER A (0) or B (1) as "Yes" for selfie - some controllers have swapped buttons
                     # This ensures the user can opt-in regardless of button mapping
@@ -3567,10 +3949,11 @@ class GameEngine:
                     continue
                 # Y button (3) = Toggle Recording
                 elif event.button == 3:
-                    current_time = time.time()
+                    # Same clock the main loop passes to capture_frame()
+                    current_time = pygame.time.get_ticks() / 1000.0
                     result = self.evidence_capture.toggle_recording(current_time)
                     if result:
-                        logger.info(f"🎬 Recording saved: {result}")
+                        logger.info(f"🎬 Recording stopped, finishing {result} in background")
                     continue
 
                 if self.joystick:
@@ -3668,7 +4051,7 @@ class GameEngine:
                             GameStatus.PLAYING,
                             GameStatus.BOSS_BATTLE,
                         ):
-                            projectile = self.player.fire_projectile()
+                            projectile = self.player.fire_projectile(self.projectile_pool)
                             self.projectiles.append(projectile)
                     # B button (1) - Jump (only in level mode) OR dismiss messages OR start quest
                     elif event.button == 1:
@@ -4597,10 +4980,10 @@ class GameEngine:
                 return
 
             # Check bleeding particle damage
-            for particle in self.boss.bleeding_particles:
+            for particle_x, particle_y in self.boss.bleeding_particles.positions():
                 particle_bounds = pygame.Rect(
-                    int(particle["x"] - 5),
-                    int(particle["y"] - 5),
+                    int(particle_x - 5),
+                    int(particle_y - 5),
                     10,
                     10,
                 )
@@ -4676,7 +5059,7 @@ class GameEngine:
             self._check_boss_player_collision()
 
         # Update projectiles
-        for projectile in self.projectiles[:]:
+        for projectile in self.projectiles:
             projectile.update(delta_time)
 
             # Remove off-screen projectiles
@@ -4684,18 +5067,19 @@ class GameEngine:
                 if projectile.is_off_screen(
                     self.game_map.map_width, self.game_map.map_height, map_mode=True
                 ):
-                    self.projectiles.remove(projectile)
+                    self.projectile_pool.release(projectile)
             else:
                 if projectile.is_off_screen(
                     self.screen_width, self.screen_height, map_mode=False
                 ):
-                    self.projectiles.remove(projectile)
+                    self.projectile_pool.release(projectile)
+        self._compact_projectiles()
 
         # Check projectile collisions with boss
         if self.boss:
             # Handle swarm boss (Scattered Spider) - check collision with each spider
             if isinstance(self.boss, ScatteredSpiderBoss):
-                for projectile in self.projectiles[:]:
+                for projectile in self.projectiles:
                     proj_bounds = projectile.get_bounds()
                     hit = False
 
@@ -4721,21 +5105,22 @@ class GameEngine:
 
                             break  # Projectile can only hit one spider
 
-                    if hit and projectile in self.projectiles:
-                        self.projectiles.remove(projectile)
+                    if hit:
+                        self.projectile_pool.release(projectile)
 
             else:
                 # Standard boss collision
                 boss_bounds = self.boss.get_bounds()
-                for projectile in self.projectiles[:]:
+                for projectile in self.projectiles:
                     proj_bounds = projectile.get_bounds()
                     if proj_bounds.colliderect(boss_bounds):
                         # Hit boss
-                        self.projectiles.remove(projectile)
+                        self.projectile_pool.release(projectile)
                         defeated = self.boss.take_damage(projectile.damage)
                         if defeated:
                             # Boss defeated
                             logger.info("Boss defeated!")
+            self._compact_projectiles()
 
         # Update camera - follow player, but also show boss if boss is far away
         if self.use_map and self.game_map:
@@ -1,17 +1,22 @@
 """Map system for navigating the AWS re:invent floorplan."""
 
 import logging
+import math
 import os
 import random
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pygame
+from PIL import Image
 
+from chunked_surface import ChunkedSurface
 from collectible import Collectible
 from door import Door
 from models import Vector2
+from palette_quantizer import get_quantizer
 from third_party import ThirdParty
 from zombie import Zombie
+from zoom_pyramid import ZoomPyramid, quantize_zoom
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +24,19 @@ logger = logging.getLogger(__name__)
 class GameMap:
     """Handles the floorplan map, camera, and zombie placement."""
 
+    # Platformer levels are rendered lazily in vertical strips this wide
+    PLATFORMER_CHUNK_WIDTH = 512
+
+    # 8-bit map palette (Game Boy style with some variation)
+    RETRO_MAP_PALETTE = [
+        (15, 56, 15),  # Dark green (walls/dark areas)
+        (48, 98, 48),  # Medium green
+        (139, 172, 15),  # Light green (floors)
+        (155, 188, 15),  # Lightest green (highlights)
+        (200, 200, 200),  # Light gray (text/details)
+        (100, 100, 100),  # Dark gray (shadows)
+    ]
+
     def __init__(
         self,
         map_image_path: str,
@@ -67,6 +85,12 @@ class GameMap:
         self.third_party_data = third_party_data or {}
         self.api_client = api_client
 
+        # Platformer levels render lazily into chunks instead of one map_surface
+        self.map_chunks: Optional[ChunkedSurface] = None
+        self._landing_overview: Optional[pygame.Surface] = None
+        # Pre-scaled map levels for the landing zone zoom (built on first use)
+        self._zoom_pyramid: Optional[ZoomPyramid] = None
+
         # Create map based on mode
         if mode == "platformer":
             print("Creating platformer-style level...")
@@ -420,9 +444,6 @@ class GameMap:
         self.map_width = tiles_wide * self.tile_size
         self.map_height = tiles_high * self.tile_size
 
-        # Create map surface
-        self.map_surface = pygame.Surface((self.map_width, self.map_height))
-
         # Cyberpunk/Sonrai color palette - much more visually interesting!
         # Sky gradient from deep purple (top) to orange/pink horizon
         SKY_TOP = (25, 15, 45)  # Deep purple/black (night sky)
@@ -430,21 +451,6 @@ class GameMap:
         SKY_HORIZON = (120, 50, 90)  # Pink/magenta horizon
         SKY_GLOW = (180, 80, 60)  # Orange glow near horizon
 
-        # Ground colors - Sonrai purple theme
-        GROUND_PURPLE = (50, 30, 70)
-        GROUND_LIGHT = (70, 45, 95)
-        GROUND_TOP = (90, 55, 120)
-        BLACK = (0, 0, 0)
-
-        # Cloud/building colors for background elements
-        CLOUD_DARK = (40, 25, 55)
-        CLOUD_LIGHT = (70, 45, 90)
-        BUILDING_DARK = (20, 12, 30)
-        BUILDING_LIGHT = (35, 22, 50)
-        STAR_COLOR = (255, 255, 200)
-        NEON_PURPLE = (180, 100, 255)
-        NEON_CYAN = (100, 255, 255)
-
         # Create tile map (0 = air/sky, 1 = ground/platform)
         tile_map = [[0 for _ in range(tiles_wide)] for _ in range(tiles_high)]
 
@@ -515,68 +521,50 @@ class GameMap:
             }
         }
 
-        # Render tiles to surface
+        # Cyberpunk sky with multi-color gradient (top to bottom), one color per tile row
+        # 0.0 = top (dark purple), 1.0 = bottom (orange glow)
+        self._sky_row_colors = []
         for y in range(tiles_high):
-            for x in range(tiles_wide):
-                tile_x = x * self.tile_size
-                tile_y = y * self.tile_size
-
-                if tile_map[y][x] == 1:
-                    # Ground or platform tile
-                    if y >= tiles_high - ground_height:
-                        # Ground tiles
-                        if y == tiles_high - ground_height:
-                            self._draw_ground_top_tile(tile_x, tile_y)
-                        else:
-                            # Underground tiles (checkered)
-                            if (x + y) % 2 == 0:
-                                self._draw_floor_tile(tile_x, tile_y, GROUND_PURPLE)
-                            else:
-                                self._draw_floor_tile(tile_x, tile_y, GROUND_LIGHT)
-                    else:
-                        # Floating platform
-                        self._draw_wall_tile(tile_x, tile_y)
-                else:
-                    # Cyberpunk sky with multi-color gradient (top to bottom)
-                    # 0.0 = top (dark purple), 1.0 = bottom (orange glow)
-                    sky_progress = y / (tiles_high * 0.7)
-                    sky_progress = max(0, min(1, sky_progress))
-
-                    # Three-stage gradient: top -> mid -> horizon -> glow
-                    if sky_progress < 0.3:
-                        # Top section: deep purple to mid purple
-                        t = sky_progress / 0.3
-                        r = int(SKY_TOP[0] + (SKY_MID[0] - SKY_TOP[0]) * t)
-                        g = int(SKY_TOP[1] + (SKY_MID[1] - SKY_TOP[1]) * t)
-                        b = int(SKY_TOP[2] + (SKY_MID[2] - SKY_TOP[2]) * t)
-                    elif sky_progress < 0.7:
-                        # Mid section: mid purple to pink horizon
-                        t = (sky_progress - 0.3) / 0.4
-                        r = int(SKY_MID[0] + (SKY_HORIZON[0] - SKY_MID[0]) * t)
-                        g = int(SKY_MID[1] + (SKY_HORIZON[1] - SKY_MID[1]) * t)
-                        b = int(SKY_MID[2] + (SKY_HORIZON[2] - SKY_MID[2]) * t)
-                    else:
-                        # Bottom section: pink to orange glow
-                        t = (sky_progress - 0.7) / 0.3
-                        r = int(SKY_HORIZON[0] + (SKY_GLOW[0] - SKY_HORIZON[0]) * t)
-                        g = int(SKY_HORIZON[1] + (SKY_GLOW[1] - SKY_HORIZON[1]) * t)
-                        b = int(SKY_HORIZON[2] + (SKY_GLOW[2] - SKY_HORIZON[2]) * t)
+            sky_progress = y / (tiles_high * 0.7)
+            sky_progress = max(0, min(1, sky_progress))
+
+            # Three-stage gradient: top -> mid -> horizon -> glow
+            if sky_progress < 0.3:
+                # Top section: deep purple to mid purple
+                t = sky_progress / 0.3
+                start, end = SKY_TOP, SKY_MID
+            elif sky_progress < 0.7:
+                # Mid section: mid purple to pink horizon
+                t = (sky_progress - 0.3) / 0.4
+                start, end = SKY_MID, SKY_HORIZON
+            else:
+                # Bottom section: pink to orange glow
+                t = (sky_progress - 0.7) / 0.3
+                start, end = SKY_HORIZON, SKY_GLOW
+            self._sky_row_colors.append(tuple(int(a + (b - a) * t) for a, b in zip(start, end)))
 
-                    pygame.draw.rect(
-                        self.map_surface,
-                        (r, g, b),
-                        (tile_x, tile_y, self.tile_size, self.tile_size),
-                    )
+        # Store tile map for collision detection (also drives chunk rendering)
+        self.tile_map = tile_map
+        self.tiles_wide = tiles_wide
+        self.tiles_high = tiles_high
+        self._ground_height = ground_height
 
-        # Add cyberpunk background decorations (stars, cityscape, clouds)
-        self._draw_platformer_background_decorations(
+        # Record cyberpunk background decorations (stars, clouds, rain) as draw ops
+        self._build_platformer_background_decorations(
             tiles_wide, tiles_high, tile_map, ground_height
         )
 
-        # Store tile map for collision detection
-        self.tile_map = tile_map
-        self.tiles_wide = tiles_wide
-        self.tiles_high = tiles_high
+        # Tiles and decorations are painted per chunk as the camera approaches,
+        # so level entry no longer allocates/paints one surface for the whole level
+        self.map_surface = None
+        self.map_chunks = ChunkedSurface(
+            self.map_width,
+            self.map_height,
+            self._render_platformer_chunk,
+            chunk_width=self.PLATFORMER_CHUNK_WIDTH,
+            # Visible strips plus one prefetched strip on each side (and one spare)
+            max_chunks=math.ceil(self.screen_width / self.PLATFORMER_CHUNK_WIDTH) + 3,
+        )
 
         # No doors or third parties in platformer levels
         self.doors = []
@@ -589,10 +577,15 @@ class GameMap:
             f"Generated platformer level: {tiles_wide}x{tiles_high} tiles with {len(self.platform_positions)} platform segments"
         )
 
-    def _draw_platformer_background_decorations(
+    def _build_platformer_background_decorations(
         self, tiles_wide: int, tiles_high: int, tile_map: list, ground_height: int
     ) -> None:
-        """Draw dramatic thunderstorm dusk sky with clouds and lightning."""
+        """
+        Lay out dramatic thunderstorm dusk sky with clouds and lightning.
+
+        Decorations are recorded as world-space draw ops (in paint order) and
+        replayed by _render_platformer_chunk onto whichever chunk they overlap.
+        """
         # Colors for thunderstorm at dusk - BRIGHTER for visibility
         STAR_BRIGHT = (255, 255, 255)  # Pure white stars
         STAR_DIM = (220, 220, 200)  # Brighter dim stars
@@ -613,6 +606,8 @@ class GameMap:
         random.seed(123)  # Consistent decorations
 
         sky_height = (tiles_high - ground_height) * self.tile_size
+        self._decorations = []
+        add = self._add_decoration
 
         # === LAYER 1: MORE VISIBLE Stars (across top 50% of sky) ===
         star_zone_height = int(sky_height * 0.5)
@@ -629,23 +624,24 @@ class GameMap:
                     star_type = random.randint(0, 10)
                     if star_type < 4:
                         # Small dim star (single pixel)
-                        self.map_surface.set_at((star_x, star_y), STAR_DIM)
+                        add("pixel", STAR_DIM, (star_x, star_y))
                     elif star_type < 7:
                         # Medium bright star (2x2)
-                        pygame.draw.rect(self.map_surface, STAR_BRIGHT, (star_x, star_y, 2, 2))
+                        add("rect", STAR_BRIGHT, (star_x, star_y, 2, 2))
                     elif star_type < 9:
                         # Large yellow star (3x3 with glow)
-                        pygame.draw.rect(self.map_surface, STAR_YELLOW, (star_x, star_y, 3, 3))
-                        pygame.draw.rect(self.map_surface, STAR_DIM, (star_x - 1, star_y, 1, 3))
-                        pygame.draw.rect(self.map_surface, STAR_DIM, (star_x + 3, star_y, 1, 3))
+                        add("rect", STAR_YELLOW, (star_x, star_y, 3, 3))
+                        add("rect", STAR_DIM, (star_x - 1, star_y, 1, 3))
+                        add("rect", STAR_DIM, (star_x + 3, star_y, 1, 3))
                     else:
                         # Purple twinkling star (cross shape)
-                        pygame.draw.rect(self.map_surface, STAR_PURPLE, (star_x, star_y - 1, 2, 4))
-                        pygame.draw.rect(self.map_surface, STAR_PURPLE, (star_x - 1, star_y, 4, 2))
+                        add("rect", STAR_PURPLE, (star_x, star_y - 1, 2, 4))
+                        add("rect", STAR_PURPLE, (star_x - 1, star_y, 4, 2))
 
         # === LAYER 2: Dusk Horizon Glow (bottom of sky) ===
         # Only draw horizon glow on sky tiles, not over platforms
         horizon_start = int(sky_height * 0.7)
+        self._horizon_rows = []
         for y in range(horizon_start, int(sky_height)):
             tile_y = y // self.tile_size
             if tile_y >= tiles_high:
@@ -655,12 +651,9 @@ class GameMap:
             r = int(HORIZON_PURPLE[0] + (HORIZON_ORANGE[0] - HORIZON_PURPLE[0]) * progress)
             g = int(HORIZON_PURPLE[1] + (HORIZON_ORANGE[1] - HORIZON_PURPLE[1]) * progress)
             b = int(HORIZON_PURPLE[2] + (HORIZON_ORANGE[2] - HORIZON_PURPLE[2]) * progress)
-            # Draw horizon glow only on sky pixels, skip platform tiles
-            for x in range(0, self.map_width, self.tile_size):
-                tile_x = x // self.tile_size
-                if tile_x < tiles_wide and tile_map[tile_y][tile_x] == 0:
-                    # Sky tile - draw horizon glow
-                    pygame.draw.line(self.map_surface, (r, g, b), (x, y), (x + self.tile_size, y))
+            self._horizon_rows.append((y, (r, g, b)))
+        # Painted per chunk (it spans the whole level), between stars and clouds
+        add("horizon", None, None)
 
         # === LAYER 3: Large Storm Clouds (dramatic, layered) - MORE VISIBLE ===
         # Draw multiple layers of clouds for depth
@@ -678,9 +671,7 @@ class GameMap:
                 cy = cloud_y + random.randint(-10, cloud_height // 2)
                 rx = random.randint(50, 100)  # Bigger
                 ry = random.randint(30, 60)
-                pygame.draw.ellipse(
-                    self.map_surface, CLOUD_DARK, (cx - rx, cy - ry, rx * 2, ry * 2)
-                )
+                add("ellipse", CLOUD_DARK, (cx - rx, cy - ry, rx * 2, ry * 2))
 
         # Mid-layer clouds (medium tone) - MORE VISIBLE
         for _ in range(15):  # More clouds
@@ -693,7 +684,7 @@ class GameMap:
                 cy = cloud_y + random.randint(-20, 20)
                 rx = random.randint(40, 70)
                 ry = random.randint(25, 50)
-                pygame.draw.ellipse(self.map_surface, CLOUD_MID, (cx - rx, cy - ry, rx * 2, ry * 2))
+                add("ellipse", CLOUD_MID, (cx - rx, cy - ry, rx * 2, ry * 2))
 
         # Foreground clouds (lighter edges, smaller) - BRIGHTER
         for _ in range(18):  # More clouds
@@ -704,10 +695,10 @@ class GameMap:
                 cx = cloud_x + i * 40 + random.randint(-8, 8)
                 cy = cloud_y + random.randint(-10, 10)
                 r = random.randint(25, 45)  # Bigger
-                pygame.draw.circle(self.map_surface, CLOUD_LIGHT, (cx, cy), r)
+                add("circle", CLOUD_LIGHT, (cx, cy, r))
                 # Purple tint on some clouds
                 if random.random() < 0.4:
-                    pygame.draw.circle(self.map_surface, CLOUD_PURPLE, (cx, cy - 5), r - 5)
+                    add("circle", CLOUD_PURPLE, (cx, cy - 5, r - 5))
 
         # === LAYER 4: Store Lightning Bolt positions for dynamic flashing ===
         # Don't draw lightning here - store positions for renderer to flash
@@ -762,38 +753,156 @@ class GameMap:
                     end_x = rain_x + rain_length // 3
                     end_y = rain_y + rain_length
                     rain_color = (100, 100, 120, 80)  # Semi-transparent blue-gray
-                    pygame.draw.line(
-                        self.map_surface, (80, 80, 100), (rain_x, rain_y), (end_x, end_y), 1
+                    add("line", (80, 80, 100), (rain_x, rain_y, end_x, end_y))
+
+    def _add_decoration(self, kind: str, color: Optional[tuple], shape: Optional[tuple]) -> None:
+        """
+        Record one background decoration with the horizontal span it can touch.
+
+        Args:
+            kind: "pixel", "rect", "ellipse", "circle", "line" or "horizon"
+            color: Draw color (None for the horizon glow)
+            shape: World-space geometry for the draw call (see _render_platformer_chunk)
+        """
+        if kind in ("pixel", "rect", "ellipse"):
+            left = shape[0]
+            right = left + (shape[2] if kind != "pixel" else 1)
+        elif kind == "circle":
+            left, right = shape[0] - shape[2], shape[0] + shape[2] + 1
+        elif kind == "line":
+            left, right = min(shape[0], shape[2]), max(shape[0], shape[2]) + 1
+        else:
+            left, right = 0, self.map_width
+        # Pad the span: rasterization can land a pixel outside the nominal bounds
+        self._decorations.append((left - 2, right + 2, kind, color, shape))
+
+    def _render_platformer_chunk(self, area: pygame.Rect) -> pygame.Surface:
+        """
+        Paint one world-space strip of the platformer level.
+
+        Produces exactly the pixels the full-level surface would hold for this
+        area: neighbouring tile columns are repainted (clipped) in the same
+        row-major order so their edge spill matches, then decorations that
+        overlap the strip are replayed in their original order.
+
+        Args:
+            area: World-space area of the chunk (full level height)
+
+        Returns:
+            New surface the size of the area
+        """
+        surface = pygame.Surface(area.size)
+        offset = area.x
+        tile_size = self.tile_size
+        first_col = max(0, area.left // tile_size - 1)
+        last_col = min(self.tiles_wide - 1, (area.right - 1) // tile_size + 1)
+        ground_top = self.tiles_high - self._ground_height
+
+        # Ground colors - Sonrai purple theme
+        GROUND_PURPLE = (50, 30, 70)
+        GROUND_LIGHT = (70, 45, 95)
+
+        for y in range(self.tiles_high):
+            row = self.tile_map[y]
+            tile_y = y * tile_size
+            for x in range(first_col, last_col + 1):
+                tile_x = x * tile_size - offset
+
+                if row[x] == 1:
+                    # Ground or platform tile
+                    if y >= ground_top:
+                        # Ground tiles
+                        if y == ground_top:
+                            self._draw_ground_top_tile(tile_x, tile_y, surface)
+                        else:
+                            # Underground tiles (checkered)
+                            if (x + y) % 2 == 0:
+                                self._draw_floor_tile(tile_x, tile_y, GROUND_PURPLE, surface)
+                            else:
+                                self._draw_floor_tile(tile_x, tile_y, GROUND_LIGHT, surface)
+                    else:
+                        # Floating platform
+                        self._draw_wall_tile(tile_x, tile_y, surface)
+                else:
+                    pygame.draw.rect(
+                        surface,
+                        self._sky_row_colors[y],
+                        (tile_x, tile_y, tile_size, tile_size),
                     )
 
-    def _draw_ground_top_tile(self, x: int, y: int) -> None:
+        for left, right, kind, color, shape in self._decorations:
+            if right <= area.left or left >= area.right:
+                continue
+            if kind == "pixel":
+                surface.set_at((shape[0] - offset, shape[1]), color)
+            elif kind == "rect":
+                pygame.draw.rect(surface, color, (shape[0] - offset, *shape[1:]))
+            elif kind == "ellipse":
+                pygame.draw.ellipse(surface, color, (shape[0] - offset, *shape[1:]))
+            elif kind == "circle":
+                pygame.draw.circle(surface, color, (shape[0] - offset, shape[1]), shape[2])
+            elif kind == "line":
+                x1, y1, x2, y2 = shape
+                if area.left <= min(x1, x2) and max(x1, x2) < area.right:
+                    pygame.draw.line(surface, color, (x1 - offset, y1), (x2 - offset, y2), 1)
+                else:
+                    # Clipping shifts where a diagonal line's pixels land, so draw
+                    # seam-crossing lines whole on a stencil and blit that instead
+                    left, top = min(x1, x2), min(y1, y2)
+                    stencil = pygame.Surface((abs(x2 - x1) + 1, abs(y2 - y1) + 1))
+                    stencil.set_colorkey((0, 0, 0))
+                    pygame.draw.line(
+                        stencil, color, (x1 - left, y1 - top), (x2 - left, y2 - top), 1
+                    )
+                    surface.blit(stencil, (left - offset, top))
+            else:
+                # Horizon glow only on sky tiles (each line spills 1px into the next tile)
+                for y, glow_color in self._horizon_rows:
+                    row = self.tile_map[y // tile_size]
+                    for x in range(first_col, last_col + 1):
+                        if row[x] == 0:
+                            tile_x = x * tile_size - offset
+                            pygame.draw.line(
+                                surface, glow_color, (tile_x, y), (tile_x + tile_size, y)
+                            )
+
+        return surface
+
+    def _draw_ground_top_tile(
+        self, x: int, y: int, surface: Optional[pygame.Surface] = None
+    ) -> None:
         """Draw the top layer of ground (grass-like)."""
         GROUND_TOP = (120, 90, 140)
         GRASS_DARK = (100, 70, 120)
         BLACK = (0, 0, 0)
+        surface = self.map_surface if surface is None else surface
 
         # Main ground top
-        pygame.draw.rect(self.map_surface, GROUND_TOP, (x, y, self.tile_size, self.tile_size))
+        pygame.draw.rect(surface, GROUND_TOP, (x, y, self.tile_size, self.tile_size))
 
         # Add grass-like details
         for i in range(3):
             grass_x = x + 2 + i * 5
-            pygame.draw.line(self.map_surface, GRASS_DARK, (grass_x, y), (grass_x, y + 3), 1)
+            pygame.draw.line(surface, GRASS_DARK, (grass_x, y), (grass_x, y + 3), 1)
 
         # Black outline
-        pygame.draw.rect(self.map_surface, BLACK, (x, y, self.tile_size, self.tile_size), 1)
+        pygame.draw.rect(surface, BLACK, (x, y, self.tile_size, self.tile_size), 1)
 
-    def _draw_floor_tile(self, x: int, y: int, base_color: tuple) -> None:
+    def _draw_floor_tile(
+        self, x: int, y: int, base_color: tuple, surface: Optional[pygame.Surface] = None
+    ) -> None:
         """Draw a simple Mario-style floor tile."""
+        surface = self.map_surface if surface is None else surface
         # Fill with base color
-        pygame.draw.rect(self.map_surface, base_color, (x, y, self.tile_size, self.tile_size))
+        pygame.draw.rect(surface, base_color, (x, y, self.tile_size, self.tile_size))
 
         # Add subtle border for tile definition
         border_color = tuple(max(0, c - 20) for c in base_color)
-        pygame.draw.rect(self.map_surface, border_color, (x, y, self.tile_size, self.tile_size), 1)
+        pygame.draw.rect(surface, border_color, (x, y, self.tile_size, self.tile_size), 1)
 
-    def _draw_wall_tile(self, x: int, y: int) -> None:
+    def _draw_wall_tile(self, x: int, y: int, surface: Optional[pygame.Surface] = None) -> None:
         """Draw a NEON BRIGHT floating platform - VERY VISIBLE."""
+        surface = self.map_surface if surface is None else surface
         # NEON BRIGHT colors - impossible to miss
         PLATFORM_MAIN = (180, 120, 255)  # Bright neon purple
         PLATFORM_TOP = (255, 200, 255)  # Almost white top highlight
@@ -802,27 +911,25 @@ class GameMap:
         NEON_EDGE = (255, 100, 255)  # Hot pink neon edge
 
         # Main block - bright purple
-        pygame.draw.rect(self.map_surface, PLATFORM_MAIN, (x, y, self.tile_size, self.tile_size))
+        pygame.draw.rect(surface, PLATFORM_MAIN, (x, y, self.tile_size, self.tile_size))
 
         # Top highlight - almost white (4 pixels thick)
-        pygame.draw.line(self.map_surface, PLATFORM_TOP, (x, y), (x + self.tile_size - 1, y), 4)
-        pygame.draw.line(self.map_surface, PLATFORM_TOP, (x, y), (x, y + self.tile_size - 1), 4)
+        pygame.draw.line(surface, PLATFORM_TOP, (x, y), (x + self.tile_size - 1, y), 4)
+        pygame.draw.line(surface, PLATFORM_TOP, (x, y), (x, y + self.tile_size - 1), 4)
 
         # Glow effect - second layer
-        pygame.draw.line(
-            self.map_surface, PLATFORM_GLOW, (x, y + 4), (x + self.tile_size - 1, y + 4), 2
-        )
+        pygame.draw.line(surface, PLATFORM_GLOW, (x, y + 4), (x + self.tile_size - 1, y + 4), 2)
 
         # Bottom and right shadows
         pygame.draw.line(
-            self.map_surface,
+            surface,
             PLATFORM_SHADOW,
             (x, y + self.tile_size - 1),
             (x + self.tile_size - 1, y + self.tile_size - 1),
             3,
         )
         pygame.draw.line(
-            self.map_surface,
+            surface,
             PLATFORM_SHADOW,
             (x + self.tile_size - 1, y),
             (x + self.tile_size - 1, y + self.tile_size - 1),
@@ -830,7 +937,7 @@ class GameMap:
         )
 
         # Neon pink outline for extra visibility
-        pygame.draw.rect(self.map_surface, NEON_EDGE, (x, y, self.tile_size, self.tile_size), 2)
+        pygame.draw.rect(surface, NEON_EDGE, (x, y, self.tile_size, self.tile_size), 2)
 
     def _add_room_labels(self) -> None:
         """Add AWS account labels to rooms."""
@@ -995,8 +1102,6 @@ class GameMap:
 
         # If we have org-level 3rd parties, place them ALL around MyHealth Production room
         if org_third_parties and self.room_accounts:
-            import math
-
             # Find the MyHealth Production room (account 613056517323)
             production_room_index = None
             production_account = "613056517323"
@@ -1493,8 +1598,6 @@ class GameMap:
 
         # Draw three triangular sections (simplified biohazard)
         for angle in [0, 120, 240]:
-            import math
-
             rad = math.radians(angle)
             outer_x = x + int(size * 0.7 * math.cos(rad))
             outer_y = y + int(size * 0.7 * math.sin(rad))
@@ -1616,50 +1719,10 @@ class GameMap:
         Returns:
             Surface with reduced color palette
         """
-        width = surface.get_width()
-        height = surface.get_height()
-
-        # Create a new surface
-        new_surface = surface.copy()
-
-        # Define 8-bit color palette (Game Boy style with some variation)
-        palette = [
-            (15, 56, 15),  # Dark green (walls/dark areas)
-            (48, 98, 48),  # Medium green
-            (139, 172, 15),  # Light green (floors)
-            (155, 188, 15),  # Lightest green (highlights)
-            (200, 200, 200),  # Light gray (text/details)
-            (100, 100, 100),  # Dark gray (shadows)
-        ]
-
-        # Process each pixel and map to nearest palette color
-        # Note: This is slow for large images, but works without numpy
-        for x in range(width):
-            for y in range(height):
-                # Get the current pixel color
-                color = surface.get_at((x, y))
-                r, g, b = color[:3]
-
-                # Find nearest color in palette
-                min_distance = float("inf")
-                closest_color = palette[0]
-
-                for palette_color in palette:
-                    # Calculate color distance
-                    distance = (
-                        (r - palette_color[0]) ** 2
-                        + (g - palette_color[1]) ** 2
-                        + (b - palette_color[2]) ** 2
-                    )
-
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_color = palette_color
-
-                # Set the new pixel color
-                new_surface.set_at((x, y), closest_color)
-
-        return new_surface
+        size = surface.get_size()
+        image = Image.frombytes("RGB", size, pygame.image.tobytes(surface, "RGB"))
+        reduced = get_quantizer(self.RETRO_MAP_PALETTE).quantize_image(image)
+        return pygame.image.frombytes(reduced.tobytes(), size, "RGB")
 
     def get_random_position(self) -> Vector2:
         """
@@ -1777,8 +1840,8 @@ class GameMap:
                     f"Platformer mode: Placing {len(account_zombies)} zombies ON {len(self.platform_positions)} platforms with {min_distance}px spacing"
                 )
 
-                # Place zombies on platforms
-                placed_positions = []
+                # Place zombies on platforms (placed positions bucketed by min_distance cells)
+                placed_positions: Dict[Tuple[int, int], List[Vector2]] = {}
                 platform_index = 0
 
                 for i, zombie in enumerate(account_zombies):
@@ -1813,20 +1876,12 @@ class GameMap:
                         candidate_pos = Vector2(x, y)
 
                         # Check minimum distance from other zombies
-                        too_close = False
-                        for placed_pos in placed_positions:
-                            dx = candidate_pos.x - placed_pos.x
-                            dy = candidate_pos.y - placed_pos.y
-                            distance = (dx * dx + dy * dy) ** 0.5
-
-                            if distance < min_distance:
-                                too_close = True
-                                break
+                        too_close = self._too_close(placed_positions, candidate_pos, min_distance)
 
                         if not too_close:
                             # Good position found on this platform!
                             zombie.position = candidate_pos
-                            placed_positions.append(candidate_pos)
+                            self._add_placed(placed_positions, candidate_pos, min_distance)
                             position_found = True
                             zombie.on_ground = True  # Zombie starts on platform
                             zombie.velocity.y = 0  # No falling
@@ -1843,7 +1898,7 @@ class GameMap:
                         x = platform_x + platform_width // 2
                         y = platform_y - 16
                         zombie.position = Vector2(x, y)
-                        placed_positions.append(zombie.position)
+                        self._add_placed(placed_positions, zombie.position, min_distance)
                         zombie.on_ground = True
                         zombie.velocity.y = 0
                         platform_index += 1
@@ -1857,7 +1912,7 @@ class GameMap:
                 )
 
                 # Place each zombie in this room
-                placed_positions = []
+                placed_positions: Dict[Tuple[int, int], List[Vector2]] = {}
                 for i, zombie in enumerate(account_zombies):
                     max_attempts = 100
                     position_found = False
@@ -1874,20 +1929,12 @@ class GameMap:
                         candidate_pos = Vector2(x, y)
 
                         # Check minimum distance from other zombies in this room
-                        too_close = False
-                        for placed_pos in placed_positions:
-                            dx = candidate_pos.x - placed_pos.x
-                            dy = candidate_pos.y - placed_pos.y
-                            distance = (dx * dx + dy * dy) ** 0.5
-
-                            if distance < min_distance:
-                                too_close = True
-                                break
+                        too_close = self._too_close(placed_positions, candidate_pos, min_distance)
 
                         if not too_close:
                             # Good position found!
                             zombie.position = candidate_pos
-                            placed_positions.append(candidate_pos)
+                            self._add_placed(placed_positions, candidate_pos, min_distance)
                             position_found = True
                             break
 
@@ -1896,7 +1943,7 @@ class GameMap:
                         x = rand.uniform(room_x_min, room_x_max)
                         y = rand.uniform(room_y_min, room_y_max)
                         zombie.position = Vector2(x, y)
-                        placed_positions.append(zombie.position)
+                        self._add_placed(placed_positions, zombie.position, min_distance)
 
                 # PLATFORMER MODE: Zombies visible from start (no fog-of-war)
                 # LOBBY MODE: Zombies start hidden (fog-of-war)
@@ -1906,6 +1953,46 @@ class GameMap:
             f"Successfully scattered {len(zombies)} zombies across {len(self.room_accounts)} rooms"
         )
 
+    @staticmethod
+    def _too_close(
+        placed: Dict[Tuple[int, int], List[Vector2]], pos: Vector2, min_distance: float
+    ) -> bool:
+        """
+        Check whether a position is closer than min_distance to a placed zombie.
+
+        Placed positions are bucketed into min_distance-sized cells, so only the
+        3x3 cells around pos can hold a zombie that is too close.
+
+        Args:
+            placed: Placed positions by cell (see _add_placed)
+            pos: Candidate position
+            min_distance: Minimum distance in pixels
+
+        Returns:
+            True if some placed zombie is closer than min_distance
+        """
+        # Cells stay at least a pixel wide, so min_distance=0 (no spacing) still works
+        cell_size = max(min_distance, 1)
+        cell_x = int(pos.x // cell_size)
+        cell_y = int(pos.y // cell_size)
+        for nx in (cell_x - 1, cell_x, cell_x + 1):
+            for ny in (cell_y - 1, cell_y, cell_y + 1):
+                for placed_pos in placed.get((nx, ny), ()):
+                    dx = pos.x - placed_pos.x
+                    dy = pos.y - placed_pos.y
+                    if (dx * dx + dy * dy) ** 0.5 < min_distance:
+                        return True
+        return False
+
+    @staticmethod
+    def _add_placed(
+        placed: Dict[Tuple[int, int], List[Vector2]], pos: Vector2, min_distance: float
+    ) -> None:
+        """Record a placed zombie position in its min_distance-sized cell."""
+        cell_size = max(min_distance, 1)
+        cell = (int(pos.x // cell_size), int(pos.y // cell_size))
+        placed.setdefault(cell, []).append(pos)
+
     def update_camera(self, player_x: float, player_y: float) -> None:
         """
         Update camera position to follow the player.
@@ -1927,6 +2014,14 @@ class GameMap:
             self.camera_x = max(0, min(self.camera_x, self.map_width - self.screen_width))
             self.camera_y = max(0, min(self.camera_y, self.map_height - self.screen_height))
 
+    def reset_view(self) -> None:
+        """Reset camera and zoom to their initial state (e.g. when the map is reused)."""
+        self.camera_x = 0
+        self.camera_y = 0
+        self.zoom = 1.0
+        self.target_zoom = 1.0
+        self.landing_zone_view = False
+
     def toggle_landing_zone_view(self) -> None:
         """Toggle between normal view and landing zone (zoomed out) view."""
         self.landing_zone_view = not self.landing_zone_view
@@ -1970,6 +2065,16 @@ class GameMap:
             if abs(self.zoom - self.target_zoom) < 0.01:
                 self.zoom = self.target_zoom
 
+    @property
+    def display_zoom(self) -> float:
+        """
+        Zoom actually used for drawing: zoom snapped to a zoom pyramid step.
+
+        The map, sprites and world_to_screen all use this value so that every
+        layer lines up while the zoom animates.
+        """
+        return quantize_zoom(self.zoom, self.target_zoom)
+
     def reveal_nearby_zombies(self, player_pos: Vector2, zombies: List[Zombie]) -> None:
         """
         Reveal zombies that are within the reveal radius of the player.
@@ -2000,14 +2105,15 @@ class GameMap:
             Tuple of (screen_x, screen_y)
         """
         # Apply zoom and camera offset
-        screen_x = int((world_x - self.camera_x) * self.zoom)
-        screen_y = int((world_y - self.camera_y) * self.zoom)
+        zoom = self.display_zoom
+        screen_x = int((world_x - self.camera_x) * zoom)
+        screen_y = int((world_y - self.camera_y) * zoom)
 
         # Center the zoomed view on screen
         if self.landing_zone_view:
             # Offset to center the map on screen
-            offset_x = (self.screen_width - self.map_width * self.zoom) // 2
-            offset_y = (self.screen_height - self.map_height * self.zoom) // 2
+            offset_x = (self.screen_width - self.map_width * zoom) // 2
+            offset_y = (self.screen_height - self.map_height * zoom) // 2
             screen_x += int(offset_x)
             screen_y += int(offset_y)
 
@@ -2043,14 +2149,10 @@ class GameMap:
             screen: Pygame surface to render to
         """
         if self.landing_zone_view and self.zoom < 1.0:
-            # Landing zone view: render entire map scaled to fit screen
-            scaled_width = int(self.map_width * self.zoom)
-            scaled_height = int(self.map_height * self.zoom)
-
-            # Scale the entire map
-            scaled_map = pygame.transform.smoothscale(
-                self.map_surface, (scaled_width, scaled_height)
-            )
+            # Landing zone view: render entire map scaled to fit screen, using a
+            # pre-scaled level from the zoom pyramid instead of rescaling per frame
+            scaled_map = self._get_zoom_pyramid().get(self.display_zoom)
+            scaled_width, scaled_height = scaled_map.get_size()
 
             # Center the scaled map on screen
             offset_x = (self.screen_width - scaled_width) // 2
@@ -2068,9 +2170,51 @@ class GameMap:
                 min(self.screen_height, self.map_height - int(self.camera_y)),
             )
 
+            if self.map_chunks is not None:
+                # Only the strips under the camera are blitted; neighbours are
+                # rendered ahead of time so scrolling into them never stalls
+                self.map_chunks.prefetch(camera_rect)
+                self.map_chunks.blit_view(screen, camera_rect)
+                return
+
             try:
                 map_view = self.map_surface.subsurface(camera_rect)
                 screen.blit(map_view, (0, 0))
             except ValueError:
                 # Handle edge cases where subsurface is invalid
                 screen.fill((240, 240, 240))
+
+    def _get_landing_overview(self) -> pygame.Surface:
+        """
+        Get the whole chunked level scaled to the landing zone zoom (built once).
+
+        Returns:
+            Overview surface at calculate_landing_zone_zoom() scale
+        """
+        if self._landing_overview is None:
+            zoom = self.calculate_landing_zone_zoom()
+            self._landing_overview = self.map_chunks.render_scaled(
+                int(self.map_width * zoom), int(self.map_height * zoom)
+            )
+        return self._landing_overview
+
+    def _get_zoom_pyramid(self) -> ZoomPyramid:
+        """
+        Get the zoom pyramid for the landing zone view (built once per map surface).
+
+        Returns:
+            Pyramid over map_surface, or over the landing overview for chunked levels
+        """
+        if self.map_chunks is not None:
+            base = self._get_landing_overview()
+            base_zoom = base.get_width() / self.map_width
+        else:
+            base = self.map_surface
+            base_zoom = 1.0
+
+        if self._zoom_pyramid is None or self._zoom_pyramid.base is not base:
+            # Chunked overviews are small, so allow at least a few screenfuls of levels
+            screen_pixels = self.screen_width * self.screen_height
+            max_pixels = max(base.get_width() * base.get_height(), 4 * screen_pixels)
+            self._zoom_pyramid = ZoomPyramid(base, base_zoom, max_pixels=max_pixels)
+        return self._zoom_pyramid
@@ -8,7 +8,9 @@ integration with the game engine.
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+import pygame
 
 from models import CONTROL_SCHEMES, ControlScheme, GenreType, Vector2
 
@@ -60,6 +62,9 @@ class GenreController(ABC):
         self.is_initialized = False
         self.is_complete = False
 
+        # Fonts by size, created on first use instead of every frame
+        self._fonts: Dict[int, pygame.font.Font] = {}
+
         logger.info(f"Created {genre.value} controller")
 
     @abstractmethod
@@ -115,6 +120,21 @@ class GenreController(ABC):
         """
         pass
 
+    def _get_font(self, size: int) -> pygame.font.Font:
+        """Get the default font at a size, creating it on first use.
+
+        Args:
+            size: Font size in pixels
+
+        Returns:
+            Font shared by every render of this controller
+        """
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self._fonts[size] = font
+        return font
+
     def get_control_scheme(self) -> ControlScheme:
         """Return the control scheme for this genre.
 
@@ -3,6 +3,7 @@
 import logging
 import os
 import sys
+import time
 from typing import List, Optional
 
 import pygame
@@ -46,15 +47,21 @@ def _pre_init_camera() -> Optional[object]:
     return None
 
 
-# Pre-init camera immediately on module load (before pygame.init)
-_pre_init_camera()
+# Pre-init camera immediately on module load (before pygame.init), unless the
+# photo booth is switched off in the environment (benchmarks, camera-less kiosks)
+if os.getenv("PHOTO_BOOTH_ENABLED", "true").lower() == "true":
+    _pre_init_camera()
 
+from fixed_timestep import FixedTimestep, Interpolator
+from frame_profiler import PROFILER
 from game_engine import GameEngine
 from level_manager import LevelManager
 from models import GameStatus, Vector2
 from renderer import Renderer
+from response_cache import ResponseCache
 from save_manager import SaveManager
 from sonrai_client import SonraiAPIClient
+from startup_loader import StartupLoader
 from zombie import Zombie
 
 # Configure logging
@@ -83,10 +90,19 @@ def load_configuration() -> dict:
         "game_width": int(os.getenv("GAME_WIDTH", "1280")),  # Base rendering resolution
         "game_height": int(os.getenv("GAME_HEIGHT", "720")),
         "fullscreen": os.getenv("FULLSCREEN", "false").lower() == "true",  # Fullscreen mode
-        "target_fps": int(os.getenv("TARGET_FPS", "60")),
+        "target_fps": int(os.getenv("TARGET_FPS", "60")),  # Render rate
+        # Fixed simulation rate, independent of the render rate (e.g. render 30 FPS, simulate 60 Hz)
+        "update_rate": int(os.getenv("UPDATE_RATE", "60")),
         "max_zombies": int(
             os.getenv("MAX_ZOMBIES", "1000")
         ),  # Default to 1000 to capture all API zombies
+        # On-disk GraphQL response cache (warm starts) and offline replay of recorded responses
+        "response_cache": os.getenv("SONRAI_RESPONSE_CACHE", "true").lower() == "true",
+        "response_cache_dir": os.getenv("SONRAI_RESPONSE_CACHE_DIR", ".sonrai_cache"),
+        "offline": os.getenv("SONRAI_OFFLINE", "false").lower() == "true",
+        # Frame profiler overlay (also toggled in game with the TIMING cheat code)
+        "profile": os.getenv("SONRAI_PROFILE", "false").lower() == "true",
+        "profile_trace": os.getenv("SONRAI_PROFILE_TRACE"),  # CSV/JSON trace written on exit
     }
 
     # Validate required configuration
@@ -280,8 +296,293 @@ def fetch_zombies(
         raise RuntimeError(f"Failed to fetch unused identities: {e}")
 
 
+def present_frame(
+    display: pygame.Surface, game_surface: pygame.Surface, config: dict, is_fullscreen: bool
+) -> None:
+    """
+    Scale the game surface onto the display (letterboxed if needed) and flip.
+
+    Args:
+        display: The actual window/screen
+        game_surface: Internal rendering surface at base resolution
+        config: Configuration with game_width/game_height
+        is_fullscreen: Whether the display is in fullscreen mode
+    """
+    if is_fullscreen or display.get_size() != game_surface.get_size():
+        # Calculate scaled dimensions with letterboxing/pillarboxing
+        display_width, display_height = display.get_size()
+        scaled_width, scaled_height, offset_x, offset_y = calculate_scaled_dimensions(
+            config["game_width"],
+            config["game_height"],
+            display_width,
+            display_height,
+        )
+
+        # Clear display (black background for letterboxing)
+        display.fill((0, 0, 0))
+
+        # Scale game surface and blit to display
+        scaled_surface = pygame.transform.scale(game_surface, (scaled_width, scaled_height))
+        display.blit(scaled_surface, (offset_x, offset_y))
+    else:
+        # Windowed mode at native resolution - direct blit
+        display.blit(game_surface, (0, 0))
+    PROFILER.mark("scale")
+
+    # Update display
+    pygame.display.flip()
+    PROFILER.mark("flip")
+
+
+def render_game(renderer: Renderer, game_engine: GameEngine, delta_time: float) -> None:
+    """
+    Render one frame of the game world and UI onto the renderer's surface.
+
+    Used by the main loop and by the headless benchmarks, so both measure the
+    same draw calls.
+
+    Args:
+        renderer: Renderer drawing onto the game surface
+        game_engine: Engine whose state is drawn
+        delta_time: Time elapsed since last frame in seconds
+    """
+    renderer.clear_screen()
+
+    # Get game map (if using map mode)
+    game_map = game_engine.get_game_map()
+
+    # Check if we're in a special genre mode that handles its own rendering
+    from models import GenreType
+
+    game_state = game_engine.get_game_state()
+    is_space_shooter = (
+        game_state.current_genre == GenreType.SPACE_SHOOTER and game_engine.active_genre_controller
+    )
+    is_racing = game_state.current_genre == GenreType.RACING and game_engine.active_genre_controller
+    is_maze_chase = (
+        game_state.current_genre == GenreType.MAZE_CHASE and game_engine.active_genre_controller
+    )
+    is_special_genre = is_space_shooter or is_racing or is_maze_chase
+
+    # Render background (map or grid) - skip for special genres that render their own
+    if is_special_genre:
+        # Special genres handle their own background rendering
+        pass  # Background rendered by controller
+    else:
+        renderer.render_background(game_map)
+
+        # Render flashing lightning (platformer mode only)
+        renderer.render_lightning(game_map, delta_time, game_state.play_time)
+
+        # Render doors (if using map mode)
+        if game_map and hasattr(game_map, "doors"):
+            renderer.render_doors(game_map.doors, game_map)
+
+        # Render collectibles (if using map mode)
+        if game_map and hasattr(game_map, "collectibles"):
+            renderer.render_collectibles(game_map.collectibles, game_map)
+
+        # Render powerups (AWS-themed power-ups)
+        powerups = game_engine.get_powerups()
+        if powerups and game_map:
+            renderer.render_powerups(powerups, game_map)
+    PROFILER.mark("map")
+
+    # Update renderer scroll (classic mode only)
+    if not game_map:
+        renderer.update_scroll(game_engine.get_scroll_offset() - renderer.scroll_offset)
+
+    # Render game entities (skip in special genre modes - they handle their own rendering)
+    zombies = game_engine.get_zombies()
+    if not is_special_genre:
+        renderer.render_zombies(zombies, game_map)
+        PROFILER.mark("zombies")
+        renderer.render_zombie_labels(zombies, game_map)
+
+        # Render health bars for zombies (skip hidden zombies)
+        for zombie in zombies:
+            if not zombie.is_hidden:
+                renderer.render_health_bar(zombie, game_map)
+        PROFILER.mark("labels")
+
+    # Render 3rd parties (skip in special genre modes)
+    if not is_special_genre:
+        third_parties = game_engine.get_third_parties()
+        renderer.render_third_parties(third_parties, game_map)
+        renderer.render_third_party_labels(third_parties, game_map)
+
+        # Render health bars for 3rd parties
+        for third_party in third_parties:
+            renderer.render_health_bar(third_party, game_map)
+
+        # Render purple shields for protected 3rd parties
+        for third_party in third_parties:
+            if third_party.is_protected:
+                renderer.render_shield(third_party, game_map, game_state.play_time)
+
+        renderer.render_projectiles(game_engine.get_projectiles(), game_map)
+
+        # Render normal player
+        renderer.render_player(game_engine.get_player(), game_map)
+    else:
+        # Special genre mode - the controller handles ALL rendering
+        # Pass player for controllers that render custom player (like WALLy in maze chase)
+        player = game_engine.get_player()
+        if hasattr(game_engine.active_genre_controller, "render"):
+            # Try to pass player if the render method accepts it
+            try:
+                game_engine.active_genre_controller.render(renderer.screen, Vector2(0, 0), player)
+            except TypeError:
+                # Fallback for controllers that don't accept player parameter
+                game_engine.active_genre_controller.render(renderer.screen, Vector2(0, 0))
+
+    # Render boss if in boss battle
+    boss = game_engine.get_boss()
+    if boss:
+        # Import cyber boss types for type checking
+        from cyber_boss import HeartbleedBoss, ScatteredSpiderBoss, WannaCryBoss
+
+        # Render appropriate boss type
+        if isinstance(boss, ScatteredSpiderBoss):
+            renderer.render_scattered_spider(boss, game_map)
+        elif isinstance(boss, HeartbleedBoss):
+            renderer.render_heartbleed_boss(boss, game_map)
+        elif isinstance(boss, WannaCryBoss):
+            renderer.render_wannacry_boss(boss, game_map)
+        else:
+            renderer.render_boss(boss, game_map)
+
+        # Render health bar for all boss types
+        renderer.render_boss_health_bar(boss, game_map)
+
+    # Render service protection quest elements
+    if game_map and game_map.mode == "platformer":
+        # Render service nodes (Bedrock icons)
+        service_nodes = game_engine.get_service_nodes()
+        if service_nodes:
+            renderer.render_service_nodes(service_nodes, game_map, game_state.play_time)
+
+        # Render hacker character
+        hacker = game_engine.get_hacker()
+        if hacker:
+            renderer.render_hacker(hacker, game_map)
+
+        # Render race timer and quest messages
+        active_quest = game_engine.get_active_quest()
+        if active_quest:
+            # Render countdown timer
+            renderer.render_race_timer(active_quest.time_remaining, active_quest.status)
+
+            # Render quest warning message
+            if game_state.quest_message and game_state.quest_message_timer > 0:
+                renderer.render_message_bubble(game_state.quest_message)
+
+        # Render service hint
+        if game_state.service_hint_message and game_state.service_hint_timer > 0:
+            renderer.render_service_hint(
+                game_state.service_hint_message, game_state.service_hint_timer
+            )
+
+    # Render JIT Access Quest elements
+    if (
+        game_state.status == GameStatus.PLAYING
+        and game_state.jit_quest
+        and game_state.jit_quest.active
+    ):
+        # Render auditor
+        auditor = game_engine.auditor
+        if auditor:
+            renderer.render_auditor(auditor, game_map)
+
+        # Render admin roles
+        admin_roles = game_engine.admin_roles
+        if admin_roles:
+            renderer.render_admin_roles(admin_roles, game_map, game_state.play_time)
+
+        # Render JIT quest messages
+        renderer.render_jit_quest_message(game_state.jit_quest)
+    PROFILER.mark("entities")
+
+    # Render UI (including player health)
+    player = game_engine.get_player()
+    renderer.render_ui(game_state, player)
+
+    # Render minimap (if using map mode, but not in platformer levels or landing zone view)
+    if game_map and game_map.mode != "platformer" and not game_map.landing_zone_view:
+        renderer.render_minimap(game_map, player.position, zombies)
+
+    # Render landing zone overlay (if in landing zone view)
+    if game_map and game_map.landing_zone_view:
+        renderer.render_landing_zone_overlay(game_map)
+
+    # Render production outage overlay (if active)
+    if game_state.status == GameStatus.PLAYING:
+        outage_state = game_engine.outage_manager.get_state()
+        if outage_state.active:
+            renderer.render_production_outage(outage_state)
+
+    # Render boss dialogue if showing
+    if game_engine.showing_boss_dialogue and game_engine.boss_dialogue_content:
+        renderer.render_boss_dialogue(game_engine.boss_dialogue_content)
+
+    # Render educational dialogue if active (Story Mode)
+    if game_state.is_dialogue_active:
+        renderer.render_educational_dialogue(
+            game_engine.dialogue_renderer,
+            game_state,
+        )
+
+    # Render photo booth summary screen if active (takes over entire screen)
+    if getattr(game_state, "photo_booth_summary_active", False) and game_engine.photo_booth:
+        renderer.render_photo_booth_summary(
+            game_engine.photo_booth.composite_preview,
+            game_engine.photo_booth.composite_progress,
+        )
+    # Render congratulations message if present (not while photo booth summary is showing)
+    elif game_state.status == GameStatus.PAUSED and game_state.congratulations_message:
+        renderer.render_message_bubble(game_state.congratulations_message)
+    PROFILER.mark("ui")
+
+
+def run_loading_screen(
+    loader: StartupLoader,
+    game_surface: pygame.Surface,
+    renderer: Renderer,
+    config: dict,
+) -> bool:
+    """
+    Show live startup progress until the lobby data has loaded.
+
+    Args:
+        loader: Startup loader to drive
+        game_surface: Internal rendering surface at base resolution
+        renderer: Renderer drawing to game_surface
+        config: Configuration dictionary
+
+    Returns:
+        False if the window was closed while loading, True otherwise
+    """
+    clock = pygame.time.Clock()
+    loader.start()
+
+    while not loader.lobby_ready and loader.error is None:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.VIDEORESIZE:
+                pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+
+        loader.poll()
+        renderer.render_loading_screen(loader.progress, loader.status_message)
+        present_frame(pygame.display.get_surface(), game_surface, config, config["fullscreen"])
+        clock.tick(30)
+
+    return True
+
+
 def main():
     """Main game loop."""
+    startup_started = time.perf_counter()
     try:
         # Load configuration
         logger.info("Loading configuration...")
@@ -303,6 +604,9 @@ def main():
         )
         is_fullscreen = config["fullscreen"]
 
+        # Render the shared zombie sprites once instead of per identity
+        Zombie.prewarm_sprites()
+
     except RuntimeError as e:
         print(f"\n❌ Pygame Initialization Error: {e}")
         print("\nPlease check your graphics drivers and Pygame installation.")
@@ -328,30 +632,20 @@ def main():
 
         # Initialize Sonrai API client
         logger.info("Initializing Sonrai API client...")
+        response_cache = None
+        if config["response_cache"] or config["offline"]:
+            response_cache = ResponseCache(config["response_cache_dir"], offline=config["offline"])
+            if config["offline"]:
+                logger.info(
+                    f"📼 Offline mode: replaying responses from {config['response_cache_dir']}"
+                )
         api_client = SonraiAPIClient(
             api_url=config["api_url"],
             org_id=config["org_id"],
             api_token=config["api_token"],
+            response_cache=response_cache,
         )
 
-        # Authenticate
-        if not api_client.authenticate():
-            raise RuntimeError("Failed to authenticate with Sonrai API")
-
-        # Fetch accounts and their zombie counts
-        logger.info("Fetching AWS accounts from Sonrai API...")
-        account_data = api_client.fetch_accounts_with_unused_identities()
-
-        if not account_data:
-            print("\n🎉 No unused identities found! Your cloud is already secure!")
-            pygame.quit()
-            sys.exit(0)
-
-        # Log account information
-        logger.info(f"Found {len(account_data)} AWS accounts:")
-        for account, count in sorted(account_data.items(), key=lambda x: x[1], reverse=True):
-            logger.info(f"  {account}: {count} zombies")
-
         # Initialize level manager
         logger.info("Initializing level manager...")
         try:
@@ -365,9 +659,40 @@ def main():
             logger.error(f"Failed to initialize level manager: {e}")
             level_manager = None
 
-        # Fetch 3rd party access information (MyHealth organization)
-        logger.info("Fetching 3rd party access from Sonrai API...")
-        third_party_data = api_client.fetch_third_parties_by_account(root_scope="aws/r-ipxz")
+        # Load accounts, 3rd parties and zombies concurrently behind a progress screen.
+        # The lobby opens once accounts and 3rd parties are in; zombies stream in later.
+        renderer = Renderer(game_surface)
+        loader = StartupLoader(
+            api_client,
+            zombie_fetcher=lambda account_num, zombie_count: fetch_zombies(
+                api_client,
+                aws_account=account_num,
+                filter_test_users=False,
+                max_zombies=zombie_count,  # Fetch exact number for this account
+                quarantined_identities=quarantined_identities,  # Filter out quarantined identities
+            ),
+        )
+        if not run_loading_screen(loader, game_surface, renderer, config):
+            logger.info("Window closed during startup")
+            loader.dispatcher.shutdown(timeout=0)
+            pygame.quit()
+            sys.exit(0)
+        if loader.error is not None:
+            raise loader.error
+        display = pygame.display.get_surface()  # May have been resized while loading
+
+        account_data = loader.account_data
+        if not account_data:
+            print("\n🎉 No unused identities found! Your cloud is already secure!")
+            pygame.quit()
+            sys.exit(0)
+
+        # Log account information
+        logger.info(f"Found {len(account_data)} AWS accounts:")
+        for account, count in sorted(account_data.items(), key=lambda x: x[1], reverse=True):
+            logger.info(f"  {account}: {count} zombies")
+
+        third_party_data = loader.third_party_data
         logger.info(f"Found 3rd parties in {len(third_party_data)} accounts")
         for account, parties in third_party_data.items():
             if parties:
@@ -375,34 +700,8 @@ def main():
                     f"  Account {account}: {len(parties)} 3rd parties - {', '.join([p['name'] for p in parties[:3]])}{'...' if len(parties) > 3 else ''}"
                 )
 
-        # Fetch zombies from ALL AWS accounts (for level loading)
-        all_zombies = []
-        for account_num, zombie_count in account_data.items():
-            if zombie_count > 0:
-                logger.info(f"Fetching {zombie_count} zombies from account {account_num}...")
-                try:
-                    account_zombies = fetch_zombies(
-                        api_client,
-                        aws_account=account_num,
-                        filter_test_users=False,
-                        max_zombies=zombie_count,  # Fetch exact number for this account
-                        quarantined_identities=quarantined_identities,  # Filter out quarantined identities
-                    )
-                    all_zombies.extend(account_zombies)
-                    logger.info(
-                        f"  -> Added {len(account_zombies)} zombies from account {account_num}"
-                    )
-                except Exception as e:
-                    logger.warning(f"  -> Failed to fetch zombies from account {account_num}: {e}")
-                    continue
-
-        zombies = all_zombies
-        logger.info(f"Total zombies across all accounts: {len(zombies)}")
-
-        if not zombies:
-            print("\n🎉 No unused identities found! Your cloud is already secure!")
-            pygame.quit()
-            sys.exit(0)
+        # Zombies that already arrived; the rest are added by the game loop
+        zombies = list(loader.zombies)
 
     except RuntimeError as e:
         print(f"\n❌ API Connection Error: {e}")
@@ -433,23 +732,41 @@ def main():
     # Don't distribute zombies - we start in lobby mode with no zombies
     # Zombies will be loaded when entering levels
 
-    # Initialize renderer
-    # Initialize renderer with game surface (not display)
-    renderer = Renderer(game_surface)
-
     # Connect renderer to game engine for photo booth capture
     game_engine.renderer = renderer
 
     # Start the game
     game_engine.start()
 
-    # Game loop
+    # Game loop: the simulation advances in fixed steps of 1/update_rate seconds
+    # however long a frame takes, and rendering interpolates between the last two steps
     clock = pygame.time.Clock()
-    logger.info("Starting game loop...")
+    timestep = FixedTimestep(config["update_rate"])
+    interpolator = Interpolator()
+    logger.info(
+        f"Starting game loop ({config['target_fps']} FPS render, "
+        f"{config['update_rate']} Hz simulation)..."
+    )
+
+    first_frame = True
+    zombies_loaded = False
+    PROFILER.enabled = config["profile"]
 
     while game_engine.is_running():
         # Calculate delta time
         delta_time = clock.tick(config["target_fps"]) / 1000.0
+        PROFILER.begin_frame()
+
+        # Stream in zombies from accounts that finished loading after the lobby opened
+        if not zombies_loaded:
+            if not loader.done:
+                new_zombies = loader.poll()
+                if new_zombies:
+                    game_engine.add_zombies(new_zombies)
+            if loader.done:
+                zombies_loaded = True
+                if not game_engine.all_zombies:
+                    game_engine.show_no_zombies_message()
 
         # Handle input
         events = pygame.event.get()
@@ -487,204 +804,20 @@ def main():
                 display = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
 
         game_engine.handle_input(events, game_surface)
+        PROFILER.mark("input")
 
-        # Update game state
-        game_engine.update(delta_time)
-
-        # Render
-        renderer.clear_screen()
-
-        # Get game map (if using map mode)
-        game_map = game_engine.get_game_map()
-
-        # Check if we're in a special genre mode that handles its own rendering
-        from models import GenreType
-
-        game_state = game_engine.get_game_state()
-        is_space_shooter = (
-            game_state.current_genre == GenreType.SPACE_SHOOTER
-            and game_engine.active_genre_controller
-        )
-        is_racing = (
-            game_state.current_genre == GenreType.RACING and game_engine.active_genre_controller
-        )
-        is_maze_chase = (
-            game_state.current_genre == GenreType.MAZE_CHASE and game_engine.active_genre_controller
-        )
-        is_special_genre = is_space_shooter or is_racing or is_maze_chase
-
-        # Render background (map or grid) - skip for special genres that render their own
-        if is_special_genre:
-            # Special genres handle their own background rendering
-            pass  # Background rendered by controller
-        else:
-            renderer.render_background(game_map)
-
-            # Render flashing lightning (platformer mode only)
-            renderer.render_lightning(game_map, delta_time, game_state.play_time)
-
-            # Render doors (if using map mode)
-            if game_map and hasattr(game_map, "doors"):
-                renderer.render_doors(game_map.doors, game_map)
-
-            # Render collectibles (if using map mode)
-            if game_map and hasattr(game_map, "collectibles"):
-                renderer.render_collectibles(game_map.collectibles, game_map)
-
-            # Render powerups (AWS-themed power-ups)
-            powerups = game_engine.get_powerups()
-            if powerups and game_map:
-                renderer.render_powerups(powerups, game_map)
-
-        # Update renderer scroll (classic mode only)
-        if not game_map:
-            renderer.update_scroll(game_engine.get_scroll_offset() - renderer.scroll_offset)
-
-        # Render game entities (skip in special genre modes - they handle their own rendering)
-        zombies = game_engine.get_zombies()
-        if not is_special_genre:
-            renderer.render_zombies(zombies, game_map)
-            renderer.render_zombie_labels(zombies, game_map)
-
-            # Render health bars for zombies (skip hidden zombies)
-            for zombie in zombies:
-                if not zombie.is_hidden:
-                    renderer.render_health_bar(zombie, game_map)
-
-        # Render 3rd parties (skip in special genre modes)
-        if not is_special_genre:
-            third_parties = game_engine.get_third_parties()
-            renderer.render_third_parties(third_parties, game_map)
-            renderer.render_third_party_labels(third_parties, game_map)
-
-            # Render health bars for 3rd parties
-            for third_party in third_parties:
-                renderer.render_health_bar(third_party, game_map)
-
-            # Render purple shields for protected 3rd parties
-            for third_party in third_parties:
-                if third_party.is_protected:
-                    renderer.render_shield(third_party, game_map, game_state.play_time)
-
-            renderer.render_projectiles(game_engine.get_projectiles(), game_map)
-
-            # Render normal player
-            renderer.render_player(game_engine.get_player(), game_map)
-        else:
-            # Special genre mode - the controller handles ALL rendering
-            # Pass player for controllers that render custom player (like WALLy in maze chase)
-            player = game_engine.get_player()
-            if hasattr(game_engine.active_genre_controller, "render"):
-                # Try to pass player if the render method accepts it
-                try:
-                    game_engine.active_genre_controller.render(
-                        renderer.screen, Vector2(0, 0), player
-                    )
-                except TypeError:
-                    # Fallback for controllers that don't accept player parameter
-                    game_engine.active_genre_controller.render(renderer.screen, Vector2(0, 0))
-
-        # Render boss if in boss battle
-        boss = game_engine.get_boss()
-        if boss:
-            # Import cyber boss types for type checking
-            from cyber_boss import HeartbleedBoss, ScatteredSpiderBoss, WannaCryBoss
-
-            # Render appropriate boss type
-            if isinstance(boss, ScatteredSpiderBoss):
-                renderer.render_scattered_spider(boss, game_map)
-            elif isinstance(boss, HeartbleedBoss):
-                renderer.render_heartbleed_boss(boss, game_map)
-            elif isinstance(boss, WannaCryBoss):
-                renderer.render_wannacry_boss(boss, game_map)
-            else:
-                renderer.render_boss(boss, game_map)
-
-            # Render health bar for all boss types
-            renderer.render_boss_health_bar(boss, game_map)
-
-        # Render service protection quest elements
-        if game_map and game_map.mode == "platformer":
-            # Render service nodes (Bedrock icons)
-            service_nodes = game_engine.get_service_nodes()
-            if service_nodes:
-                renderer.render_service_nodes(service_nodes, game_map, game_state.play_time)
-
-            # Render hacker character
-            hacker = game_engine.get_hacker()
-            if hacker:
-                renderer.render_hacker(hacker, game_map)
-
-            # Render race timer and quest messages
-            active_quest = game_engine.get_active_quest()
-            if active_quest:
-                # Render countdown timer
-                renderer.render_race_timer(active_quest.time_remaining, active_quest.status)
-
-                # Render quest warning message
-                if game_state.quest_message and game_state.quest_message_timer > 0:
-                    renderer.render_message_bubble(game_state.quest_message)
-
-            # Render service hint
-            if game_state.service_hint_message and game_state.service_hint_timer > 0:
-                renderer.render_service_hint(
-                    game_state.service_hint_message, game_state.service_hint_timer
-                )
+        # Update game state in fixed steps (none on a frame shorter than one step)
+        steps = timestep.advance(delta_time)
+        for step in range(steps):
+            if step == steps - 1:
+                interpolator.capture(game_engine)
+            game_engine.update(timestep.step)
+        PROFILER.mark("update")
 
-        # Render JIT Access Quest elements
-        if (
-            game_state.status == GameStatus.PLAYING
-            and game_state.jit_quest
-            and game_state.jit_quest.active
-        ):
-            # Render auditor
-            auditor = game_engine.auditor
-            if auditor:
-                renderer.render_auditor(auditor, game_map)
-
-            # Render admin roles
-            admin_roles = game_engine.admin_roles
-            if admin_roles:
-                renderer.render_admin_roles(admin_roles, game_map, game_state.play_time)
-
-            # Render JIT quest messages
-            renderer.render_jit_quest_message(game_state.jit_quest)
-
-        # Render UI (including player health)
-        player = game_engine.get_player()
-        renderer.render_ui(game_state, player)
-
-        # Render minimap (if using map mode, but not in platformer levels or landing zone view)
-        if game_map and game_map.mode != "platformer" and not game_map.landing_zone_view:
-            renderer.render_minimap(game_map, player.position, zombies)
-
-        # Render landing zone overlay (if in landing zone view)
-        if game_map and game_map.landing_zone_view:
-            renderer.render_landing_zone_overlay(game_map)
-
-        # Render production outage overlay (if active)
-        if game_state.status == GameStatus.PLAYING:
-            outage_state = game_engine.outage_manager.get_state()
-            if outage_state.active:
-                renderer.render_production_outage(outage_state)
-
-        # Render boss dialogue if showing
-        if game_engine.showing_boss_dialogue and game_engine.boss_dialogue_content:
-            renderer.render_boss_dialogue(game_engine.boss_dialogue_content)
-
-        # Render educational dialogue if active (Story Mode)
-        if game_state.is_dialogue_active:
-            renderer.render_educational_dialogue(
-                game_engine.dialogue_renderer,
-                game_state,
-            )
-
-        # Render photo booth summary screen if active (takes over entire screen)
-        if getattr(game_state, "photo_booth_summary_active", False) and game_state.photo_booth_path:
-            renderer.render_photo_booth_summary(game_state.photo_booth_path)
-        # Render congratulations message if present (not while photo booth summary is showing)
-        elif game_state.status == GameStatus.PAUSED and game_state.congratulations_message:
-            renderer.render_message_bubble(game_state.congratulations_message)
+        # Render the game world and UI onto the game surface
+        interpolator.apply(game_engine, timestep.alpha)
+        render_game(renderer, game_engine, delta_time)
+        interpolator.restore()
 
         # Evidence capture - frame capture and visual feedback
         current_time = pygame.time.get_ticks() / 1000.0
@@ -697,33 +830,33 @@ def main():
 
         # Render flash overlay AFTER screenshot capture
         game_engine.evidence_capture.render_flash(game_surface)
+        PROFILER.mark("capture")
 
-        # Scale and display game surface with aspect ratio preservation
-        if is_fullscreen or display.get_size() != game_surface.get_size():
-            # Calculate scaled dimensions with letterboxing/pillarboxing
-            display_width, display_height = display.get_size()
-            scaled_width, scaled_height, offset_x, offset_y = calculate_scaled_dimensions(
-                config["game_width"],
-                config["game_height"],
-                display_width,
-                display_height,
-            )
-
-            # Clear display (black background for letterboxing)
-            display.fill((0, 0, 0))
+        # Profiler overlay goes on last so screenshots and recordings stay clean
+        if PROFILER.enabled:
+            renderer.render_profiler_overlay(PROFILER)
+            PROFILER.mark("overlay")
 
-            # Scale game surface and blit to display
-            scaled_surface = pygame.transform.scale(game_surface, (scaled_width, scaled_height))
-            display.blit(scaled_surface, (offset_x, offset_y))
-        else:
-            # Windowed mode at native resolution - direct blit
-            display.blit(game_surface, (0, 0))
+        # Scale and display game surface with aspect ratio preservation
+        present_frame(display, game_surface, config, is_fullscreen)
+        PROFILER.end_frame()
 
-        # Update display
-        pygame.display.flip()
+        if first_frame:
+            first_frame = False
+            elapsed = time.perf_counter() - startup_started
+            logger.info(f"⏱️  Time to first frame: {elapsed:.2f}s")
 
     # Cleanup
     logger.info("Game ended. Cleaning up...")
+    if not loader.done:
+        loader.dispatcher.shutdown(timeout=0)
+    game_engine.shutdown()
+    # A recording stopped just before quitting may still be encoding
+    game_engine.evidence_capture.wait_for_recording(timeout=10.0)
+    api_client.log_request_stats()
+    api_client.close()
+    if config["profile_trace"]:
+        PROFILER.dump(config["profile_trace"])
     pygame.quit()
     logger.info("Goodbye!")
 
@@ -17,6 +17,7 @@ import pygame
 
 from genre_controller import GenreController, GenreControllerFactory, InputState
 from models import GenreType, Vector2
+from text_cache import TEXT_CACHE
 
 logger = logging.getLogger(__name__)
 
@@ -567,9 +568,8 @@ class MazeChaseController(GenreController):
             pygame.draw.line(surface, body_color, (px + 10, py - 2), (px + 16, py - 6), 3)
 
             # Name label
-            font = pygame.font.Font(None, 14)
             name = zombie.identity_name[:8] if hasattr(zombie, "identity_name") else "Zombie"
-            label = font.render(name, True, (200, 255, 200))
+            label = TEXT_CACHE.render(name, self._get_font(14), (200, 255, 200))
             surface.blit(label, (px - label.get_width() // 2, py + size // 2 + 2))
 
     def render_player(self, surface, player, camera_offset: Vector2) -> None:
@@ -625,13 +625,11 @@ class MazeChaseController(GenreController):
             pygame.draw.circle(surface, (100, 255, 100), (arrow_x, arrow_y), 6)
             pygame.draw.circle(surface, (50, 200, 50), (arrow_x, arrow_y), 4)
             # "CHOMP" text when moving
-            font = pygame.font.Font(None, 14)
-            chomp_label = font.render("CHOMP!", True, (100, 255, 100))
+            chomp_label = TEXT_CACHE.render("CHOMP!", self._get_font(14), (100, 255, 100))
             surface.blit(chomp_label, (px - chomp_label.get_width() // 2, py - size // 2 - 18))
         else:
             # Show "MOVE TO ATTACK" hint when stationary
-            font = pygame.font.Font(None, 12)
-            hint = font.render("Move to attack!", True, (200, 200, 100))
+            hint = TEXT_CACHE.render("Move to attack!", self._get_font(12), (200, 200, 100))
             surface.blit(hint, (px - hint.get_width() // 2, py - size // 2 - 14))
 
 
@@ -309,6 +309,11 @@ class GameState:
     damage_multiplier: float = 1.0  # Current damage multiplier
     genre_preferences: Dict[str, GenreType] = field(default_factory=dict)  # Per-level genre choices
 
+    # Background API calls (for the HUD)
+    api_calls_in_flight: int = 0  # Quarantine/block calls running right now
+    api_calls_queued: int = 0  # Calls waiting for a free worker
+    quest_calls_pending: List[str] = field(default_factory=list)  # Labels of quest API calls
+
     @property
     def is_dialogue_active(self) -> bool:
         """Check if an educational dialogue is currently active."""
@@ -405,6 +410,22 @@ class QuarantineReport:
     error_messages: list = field(default_factory=list)  # List of error messages
 
 
+@dataclass
+class EndpointStats:
+    """Request counters and latency for one Sonrai GraphQL root field."""
+
+    requests: int = 0  # HTTP requests sent (cache hits are not counted)
+    failures: int = 0  # Requests that raised or returned an HTTP error
+    retries: int = 0  # Requests re-sent by the retry policy
+    total_latency: float = 0.0  # Seconds spent waiting on responses
+    max_latency: float = 0.0  # Slowest single response in seconds
+
+    @property
+    def average_latency(self) -> float:
+        """Mean response time in seconds."""
+        return self.total_latency / self.requests if self.requests else 0.0
+
+
 @dataclass
 class EducationalProgress:
     """Tracks which educational content the player has seen in Story Mode."""
@@ -0,0 +1,184 @@
+"""Fixed-palette color quantization through cached 3D lookup tables."""
+
+import logging
+from typing import Dict, Optional, Sequence, Tuple
+
+from PIL import Image
+
+# Optional: NumPy enables the lookup-table path; without it Pillow maps the colors
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+Color = Tuple[int, int, int]
+
+# Bits kept per channel when indexing the lookup table (5 -> 32x32x32 bins)
+LUT_BITS = 5
+
+# Pixels mapped per chunk; bounds the temporaries to a few hundred KB
+CHUNK_PIXELS = 1 << 16
+
+# Peak-to-peak size of the ordered-dither offset, in 0-255 channel levels
+DITHER_SPREAD = 32
+
+# 4x4 Bayer matrix, thresholds 0-15
+_BAYER_4X4 = (
+    (0, 8, 2, 10),
+    (12, 4, 14, 6),
+    (3, 11, 1, 9),
+    (15, 7, 13, 5),
+)
+
+_QUANTIZERS: Dict[Tuple[Tuple[Color, ...], int], "PaletteQuantizer"] = {}
+
+
+class PaletteQuantizer:
+    """
+    Maps colors to the nearest entry of a fixed palette.
+
+    The nearest palette entry is precomputed for the center of every bin of
+    a (2**bits)^3 RGB grid, so mapping a pixel is a shift and a table lookup
+    instead of a distance to every palette color. Pixels are mapped in
+    chunks of CHUNK_PIXELS with integer math, so memory use does not grow
+    with image or palette size. Use get_quantizer() to share one instance
+    (and its table) per palette.
+    """
+
+    def __init__(self, palette: Sequence[Color], bits: int = LUT_BITS):
+        """
+        Build the lookup table for a palette.
+
+        Args:
+            palette: RGB tuples to map onto (at most 256)
+            bits: Bits kept per channel when indexing the table
+
+        Raises:
+            ValueError: If the palette is empty or has more than 256 colors
+        """
+        if not 0 < len(palette) <= 256:
+            raise ValueError(f"Palette must have 1-256 colors, got {len(palette)}")
+        self.palette: Tuple[Color, ...] = tuple(tuple(color) for color in palette)
+        self.bits = bits
+        self._shift = 8 - bits
+
+        # Pillow palette image, used for the fallback path without NumPy
+        self._palette_image = Image.new("P", (1, 1))
+        flat = [channel for color in self.palette for channel in color]
+        self._palette_image.putpalette(flat + flat[:3] * (256 - len(self.palette)))
+
+        if NUMPY_AVAILABLE:
+            self._colors = np.array(self.palette, dtype=np.uint8)
+            self._index_dtype = np.uint16 if 3 * bits <= 16 else np.uint32
+            self._lut = self._build_lut()
+
+    def _build_lut(self) -> "np.ndarray":
+        """Nearest palette index for the center of every bin, flattened to 1D."""
+        bins = 1 << self.bits
+        step = 1 << self._shift
+        centers = np.arange(bins, dtype=np.int32) * step + step // 2
+        colors = self._colors.astype(np.int32)
+
+        # One red slice (bins^2 cells x palette) at a time keeps the build small
+        green, blue = np.meshgrid(centers, centers, indexing="ij")
+        plane = np.stack([green.ravel(), blue.ravel()], axis=1)
+        plane_distance = (plane[:, None, 0] - colors[None, :, 1]) ** 2 + (
+            plane[:, None, 1] - colors[None, :, 2]
+        ) ** 2
+        lut = np.empty((bins, bins * bins), dtype=np.uint8)
+        for r, red in enumerate(centers):
+            distance = plane_distance + (red - colors[None, :, 0]) ** 2
+            lut[r] = np.argmin(distance, axis=1)
+
+        # Pixels exactly on a palette color keep it, even when another entry
+        # is nearer the center of its bin
+        indices = (colors >> self._shift) @ np.array([bins * bins, bins, 1])
+        lut.ravel()[indices] = np.arange(len(colors), dtype=np.uint8)
+        return lut.ravel()
+
+    def quantize_array(
+        self, pixels: "np.ndarray", dither: bool = False, out: Optional["np.ndarray"] = None
+    ) -> "np.ndarray":
+        """
+        Map an RGB array onto the palette.
+
+        Args:
+            pixels: uint8 array of shape (rows, columns, 3)
+            dither: Apply 4x4 ordered dithering before mapping
+            out: Optional uint8 array of the same shape to write into
+
+        Returns:
+            uint8 array of palette colors with the shape of pixels
+        """
+        rows, columns = pixels.shape[:2]
+        if out is None:
+            out = np.empty((rows, columns, 3), dtype=np.uint8)
+        chunk_rows = max(1, CHUNK_PIXELS // max(1, columns))
+
+        if dither:
+            bayer = np.array(_BAYER_4X4, dtype=np.int16)
+            # Offsets centered on zero, spanning DITHER_SPREAD levels
+            offsets = (bayer * 2 + 1 - 16) * DITHER_SPREAD // 32
+            column_offsets = offsets[:, np.arange(columns) % 4]
+
+        bits, shift = self.bits, self._shift
+        for start in range(0, rows, chunk_rows):
+            block = pixels[start : start + chunk_rows]
+            if dither:
+                block = block.astype(np.int16)
+                block += column_offsets[(np.arange(start, start + len(block)) % 4)][..., None]
+                np.clip(block, 0, 255, out=block)
+                block = block.astype(np.uint8)
+            binned = block >> shift
+            index = binned[..., 0].astype(self._index_dtype) << (2 * bits)
+            index |= binned[..., 1].astype(self._index_dtype) << bits
+            index |= binned[..., 2]
+            target = out[start : start + chunk_rows]
+            np.take(self._colors, np.take(self._lut, index), axis=0, out=target)
+        return out
+
+    def quantize_image(self, image: Image.Image, dither: bool = False) -> Image.Image:
+        """
+        Map a PIL image onto the palette.
+
+        Args:
+            image: Image in any mode (converted to RGB)
+            dither: Apply 4x4 ordered dithering (the fallback without NumPy
+                uses Floyd-Steinberg instead)
+
+        Returns:
+            RGB image containing only palette colors
+        """
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        if not NUMPY_AVAILABLE:
+            return image.quantize(
+                palette=self._palette_image,
+                dither=Image.Dither.FLOYDSTEINBERG if dither else Image.Dither.NONE,
+            ).convert("RGB")
+
+        return Image.fromarray(self.quantize_array(np.asarray(image), dither=dither), mode="RGB")
+
+
+def get_quantizer(palette: Sequence[Color], bits: int = LUT_BITS) -> PaletteQuantizer:
+    """
+    Shared quantizer for a palette, building its lookup table on first use.
+
+    Args:
+        palette: RGB tuples to map onto
+        bits: Bits kept per channel when indexing the table
+
+    Returns:
+        The cached PaletteQuantizer for this palette
+    """
+    key = (tuple(tuple(color) for color in palette), bits)
+    quantizer = _QUANTIZERS.get(key)
+    if quantizer is None:
+        quantizer = _QUANTIZERS[key] = PaletteQuantizer(key[0], bits)
+        logger.debug(f"🎨 Built {1 << bits}^3 color lookup table for {len(key[0])}-color palette")
+    return quantizer
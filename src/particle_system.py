@@ -0,0 +1,234 @@
+"""Fixed-capacity particle system shared by boss visual effects."""
+
+from typing import List, Optional, Tuple
+
+import pygame
+
+# Number of pre-rendered opacity levels per particle stamp
+ALPHA_STEPS = 16
+
+
+def build_alpha_stamps(base: pygame.Surface, steps: int = ALPHA_STEPS) -> List[pygame.Surface]:
+    """
+    Pre-render copies of a particle sprite at evenly spaced opacities.
+
+    Args:
+        base: Fully opaque particle sprite (per-pixel alpha is kept)
+        steps: Number of opacity levels
+
+    Returns:
+        Stamps ordered from faintest (index 0) to fully opaque (index steps - 1)
+    """
+    stamps = []
+    for step in range(1, steps + 1):
+        stamp = base.copy()
+        stamp.set_alpha(round(255 * step / steps))
+        stamps.append(stamp)
+    return stamps
+
+
+class ParticleSystem:
+    """
+    Particle emitter with fixed-capacity, struct-of-arrays storage.
+
+    Boss effects used to keep one dict per particle, remove dead ones with
+    list.remove() and build a fresh SRCALPHA surface per particle per frame.
+    Here each attribute lives in its own preallocated list, dead particles are
+    swap-removed in the update pass, and drawing is a single Surface.blits()
+    of stamps rendered once per style and opacity level. Once capacity is
+    reached new particles are dropped rather than growing the arrays.
+    """
+
+    def __init__(self, capacity: int = 256, gravity: float = 0.0):
+        """
+        Initialize an empty particle system.
+
+        Args:
+            capacity: Maximum number of live particles
+            gravity: Downward acceleration applied to every particle (px/s^2)
+        """
+        self.capacity = capacity
+        self.gravity = gravity
+        self.count = 0
+        self.dropped = 0
+
+        self.x = [0.0] * capacity
+        self.y = [0.0] * capacity
+        self.vx = [0.0] * capacity
+        self.vy = [0.0] * capacity
+        self.life = [0.0] * capacity
+        self.max_life = [1.0] * capacity
+        self.style = [0] * capacity
+        self.landed = [False] * capacity
+
+        # Per style: (stamps from faintest to opaque, anchor x, anchor y)
+        self._styles: List[Tuple[List[pygame.Surface], int, int]] = []
+
+    def __len__(self) -> int:
+        """Number of live particles."""
+        return self.count
+
+    def add_style(
+        self,
+        sprite: pygame.Surface,
+        anchor: Optional[Tuple[int, int]] = None,
+        fade: bool = True,
+    ) -> int:
+        """
+        Register a particle look.
+
+        Args:
+            sprite: Fully opaque particle sprite
+            anchor: Pixel of the sprite placed on the particle position
+                (defaults to the sprite center)
+            fade: Fade the particle out over its lifetime
+
+        Returns:
+            Style index to pass to emit()
+        """
+        if anchor is None:
+            anchor = (sprite.get_width() // 2, sprite.get_height() // 2)
+        stamps = build_alpha_stamps(sprite) if fade else [sprite]
+        self._styles.append((stamps, anchor[0], anchor[1]))
+        return len(self._styles) - 1
+
+    def emit(
+        self,
+        x: float,
+        y: float,
+        vx: float,
+        vy: float,
+        lifetime: float,
+        style: int = 0,
+    ) -> bool:
+        """
+        Spawn a particle.
+
+        Args:
+            x: Start X position
+            y: Start Y position
+            vx: Horizontal velocity (px/s)
+            vy: Vertical velocity (px/s)
+            lifetime: Seconds until the particle disappears
+            style: Style index returned by add_style()
+
+        Returns:
+            True if spawned, False if the system is full
+        """
+        i = self.count
+        if i >= self.capacity:
+            self.dropped += 1
+            return False
+
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = lifetime
+        self.max_life[i] = lifetime
+        self.style[i] = style
+        self.landed[i] = False
+        self.count = i + 1
+        return True
+
+    def update(
+        self, delta_time: float, ground_y: Optional[float] = None
+    ) -> List[Tuple[float, float]]:
+        """
+        Advance every particle and retire the expired ones.
+
+        Args:
+            delta_time: Time since last update in seconds
+            ground_y: Optional ground line; particles crossing it are reported once
+
+        Returns:
+            (x, y) of particles that reached ground_y during this update
+        """
+        xs, ys, vxs, vys = self.x, self.y, self.vx, self.vy
+        life, landed = self.life, self.landed
+        gravity_step = self.gravity * delta_time
+        landings: List[Tuple[float, float]] = []
+
+        i = 0
+        count = self.count
+        while i < count:
+            remaining = life[i] - delta_time
+            if remaining <= 0:
+                count -= 1
+                self._move(count, i)
+                continue
+
+            life[i] = remaining
+            xs[i] += vxs[i] * delta_time
+            ys[i] += vys[i] * delta_time
+            vys[i] += gravity_step
+
+            if ground_y is not None and not landed[i] and ys[i] >= ground_y:
+                landed[i] = True
+                landings.append((xs[i], ys[i]))
+            i += 1
+
+        self.count = count
+        return landings
+
+    def positions(self) -> List[Tuple[float, float]]:
+        """Positions of all live particles."""
+        return list(zip(self.x[: self.count], self.y[: self.count]))
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        origin_x: float = 0.0,
+        origin_y: float = 0.0,
+        zoom: float = 1.0,
+    ) -> None:
+        """
+        Blit every live particle in one batch.
+
+        A particle at (x, y) lands on screen at ((x - origin_x) * zoom,
+        (y - origin_y) * zoom), matching GameMap.world_to_screen when the
+        camera position is passed as the origin.
+
+        Args:
+            surface: Surface to draw on
+            origin_x: World X drawn at the surface's left edge
+            origin_y: World Y drawn at the surface's top edge
+            zoom: Scale applied to positions (stamps are not scaled)
+        """
+        if not self.count:
+            return
+
+        styles = self._styles
+        xs, ys, life, max_life, style = self.x, self.y, self.life, self.max_life, self.style
+        batch = []
+        for i in range(self.count):
+            stamps, anchor_x, anchor_y = styles[style[i]]
+            steps = len(stamps)
+            level = min(steps - 1, int(life[i] / max_life[i] * steps))
+            batch.append(
+                (
+                    stamps[level],
+                    (
+                        int((xs[i] - origin_x) * zoom) - anchor_x,
+                        int((ys[i] - origin_y) * zoom) - anchor_y,
+                    ),
+                )
+            )
+        surface.blits(batch, doreturn=False)
+
+    def clear(self) -> None:
+        """Remove all particles (styles are kept)."""
+        self.count = 0
+
+    def _move(self, src: int, dst: int) -> None:
+        """Copy particle src into slot dst (swap-remove of dst)."""
+        if src == dst:
+            return
+        self.x[dst] = self.x[src]
+        self.y[dst] = self.y[src]
+        self.vx[dst] = self.vx[src]
+        self.vy[dst] = self.vy[src]
+        self.life[dst] = self.life[src]
+        self.max_life[dst] = self.max_life[src]
+        self.style[dst] = self.style[src]
+        self.landed[dst] = self.landed[src]
@@ -0,0 +1,266 @@
+"""
+Persistent webcam capture for the photo booth.
+
+Keeps the camera open on a background thread and holds a short rolling
+buffer of recent frames, so taking a selfie is a buffer lookup instead of
+a cold camera open and read.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Optional, Tuple
+
+from PIL import Image
+
+# Try to import OpenCV, but don't fail if not available
+try:
+    import cv2
+
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+    logging.warning("OpenCV not available - webcam capture disabled")
+
+logger = logging.getLogger(__name__)
+
+# Recent frames kept (about 20 MB at 1280x720)
+BUFFER_FRAMES = 6
+
+# Capture rates while arcade mode is running and while it is not; the idle
+# rate only keeps the device warm and the buffer from going stale
+ACTIVE_FPS = 30.0
+IDLE_FPS = 2.0
+
+# Age in seconds of the buffered frames a selfie is picked from
+SELFIE_WINDOW = 0.5
+
+# Frames are scaled to this width before their sharpness is scored
+SHARPNESS_WIDTH = 160
+
+# Consecutive failed reads before the camera is closed and reopened
+MAX_READ_FAILURES = 10
+
+# Seconds between attempts to (re)open the camera
+REOPEN_DELAY = 2.0
+
+
+class CameraService:
+    """
+    Webcam kept open on a daemon thread, feeding a rolling frame buffer.
+
+    The thread reads at ACTIVE_FPS while set_active(True) and drops to
+    IDLE_FPS otherwise. If a working camera stops delivering frames it is
+    closed and reopened every REOPEN_DELAY seconds; if no camera can be
+    opened at all the thread just exits. capture_image() never touches
+    the device: it returns the sharpest frame (by variance of the Laplacian)
+    from the last SELFIE_WINDOW seconds of the buffer.
+    """
+
+    def __init__(
+        self,
+        camera_index: int = 0,
+        capture: Optional[Any] = None,
+        buffer_frames: int = BUFFER_FRAMES,
+    ):
+        """
+        Initialize the service (the camera is not read until start()).
+
+        Args:
+            camera_index: OpenCV camera index to open
+            capture: Already-open cv2.VideoCapture to adopt instead of opening one
+            buffer_frames: Number of recent frames to keep
+        """
+        self.camera_index = camera_index
+        self.frames_captured = 0
+
+        self._capture = capture
+        # (monotonic time read, BGR frame)
+        self._frames: Deque[Tuple[float, Any]] = deque(maxlen=buffer_frames)
+        self._lock = threading.Lock()
+        self._active = False
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._first_frame = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_open(self) -> bool:
+        """True while the camera is open and delivering frames."""
+        return self._capture is not None and self._first_frame.is_set()
+
+    @property
+    def active(self) -> bool:
+        """True while capturing at ACTIVE_FPS."""
+        return self._active
+
+    def start(self) -> None:
+        """Start the capture thread (opens the camera on that thread if needed)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="photo-booth-camera", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stop capturing and release the camera.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread to finish
+        """
+        self._stop.set()
+        self._wake.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                return  # Still inside read(); the thread releases the camera on exit
+        self._release()
+
+    def set_active(self, active: bool) -> None:
+        """
+        Switch between the full and the throttled capture rate.
+
+        Args:
+            active: True while arcade mode (or its consent prompt) is running
+        """
+        if active != self._active:
+            self._active = active
+            self._wake.set()  # Cut an idle sleep short
+            logger.info(f"📷 Camera capture {'active' if active else 'throttled'}")
+
+    def wait_for_frame(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the first frame has been captured.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if a frame is available
+        """
+        return self._first_frame.wait(timeout)
+
+    def latest_frame(self) -> Optional[Any]:
+        """Most recent BGR frame, or None if nothing has been captured."""
+        with self._lock:
+            return self._frames[-1][1] if self._frames else None
+
+    def sharpest_frame(self, window: float = SELFIE_WINDOW) -> Optional[Any]:
+        """
+        Sharpest buffered BGR frame read within window seconds of the newest.
+
+        Args:
+            window: Maximum age in seconds relative to the newest frame
+
+        Returns:
+            BGR frame, or None if nothing has been captured
+        """
+        with self._lock:
+            frames = list(self._frames)
+        if not frames:
+            return None
+
+        newest = frames[-1][0]
+        recent = [frame for read_at, frame in frames if newest - read_at <= window]
+        if len(recent) == 1:
+            return recent[0]
+        return max(recent, key=self._sharpness)
+
+    def capture_image(self, timeout: float = 0.0) -> Optional[Image.Image]:
+        """
+        Take a selfie from the buffer.
+
+        Args:
+            timeout: Seconds to wait if no frame has been captured yet
+
+        Returns:
+            RGB image of the sharpest recent frame, or None if there is none
+        """
+        if timeout > 0:
+            self.wait_for_frame(timeout)
+        frame = self.sharpest_frame()
+        if frame is None:
+            return None
+        return Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+    @staticmethod
+    def _sharpness(frame: Any) -> float:
+        """Variance of the Laplacian of a downscaled grayscale copy (higher is sharper)."""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        height, width = gray.shape
+        if width > SHARPNESS_WIDTH:
+            size = (SHARPNESS_WIDTH, max(1, height * SHARPNESS_WIDTH // width))
+            gray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+        return float(cv2.Laplacian(gray, cv2.CV_64F).var())
+
+    def _run(self) -> None:
+        """Capture loop: keep the camera open and the buffer filled."""
+        failures = 0
+        worked = False  # Only retry opening a camera that has delivered frames
+        while not self._stop.is_set():
+            if self._capture is None and not self._open():
+                if not worked:
+                    logger.info(
+                        f"📷 Camera {self.camera_index} not available - selfie capture disabled"
+                    )
+                    return
+                self._stop.wait(REOPEN_DELAY)
+                continue
+
+            started = time.monotonic()
+            try:
+                ok, frame = self._capture.read()
+            except Exception as e:
+                logger.warning(f"📷 Camera read error: {e}")
+                ok, frame = False, None
+
+            if ok and frame is not None:
+                with self._lock:
+                    self._frames.append((time.monotonic(), frame))
+                self.frames_captured += 1
+                self._first_frame.set()
+                failures = 0
+                worked = True
+            else:
+                failures += 1
+                if failures >= MAX_READ_FAILURES:
+                    logger.warning("📷 Camera stopped delivering frames - reopening")
+                    self._release()
+                    failures = 0
+                    continue
+
+            interval = 1.0 / (ACTIVE_FPS if self._active else IDLE_FPS)
+            remaining = interval - (time.monotonic() - started)
+            if remaining > 0 and self._wake.wait(remaining):
+                self._wake.clear()
+        self._release()
+
+    def _open(self) -> bool:
+        """Open the camera (runs on the capture thread)."""
+        try:
+            capture = cv2.VideoCapture(self.camera_index)
+        except Exception as e:
+            logger.warning(f"📷 Failed to open camera {self.camera_index}: {e}")
+            return False
+        if not capture.isOpened():
+            capture.release()
+            return False
+        # Keep the driver queue short so frames are fresh after an idle period
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._capture = capture
+        logger.info(f"📷 Camera {self.camera_index} opened")
+        return True
+
+    def _release(self) -> None:
+        """Release the camera and mark the buffer stale."""
+        capture, self._capture = self._capture, None
+        self._first_frame.clear()
+        with self._lock:
+            self._frames.clear()
+        if capture is not None:
+            try:
+                capture.release()
+            except Exception:
+                pass
@@ -0,0 +1,200 @@
+"""
+Background photo booth composite pipeline.
+
+Runs the whole composite (gameplay decode, selfie effects, layout, preview,
+PNG encode) on a worker thread as a sequence of stages, so the arcade
+results screen can come up immediately and poll for progress.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+import pygame
+from PIL import Image
+
+from .compositor import PhotoBoothCompositor
+from .config import PhotoBoothConfig
+from .retro_filter import RetroFilter
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages in the order they run
+STAGES = ("gameplay", "selfie", "layout", "preview", "encode")
+
+# Layout of captured gameplay frames. RGBX matches the screen's 32-bit
+# pixels, so grabbing a frame on the game thread is a straight copy
+FRAME_FORMAT = "RGBX"
+
+# Returns (selfie, already_processed) for the composite; waits on the worker
+# thread for any in-flight selfie processing, giving up early once the event is set
+SelfieSource = Callable[[threading.Event], Tuple[Optional[Image.Image], bool]]
+
+
+class CompositeCancelled(Exception):
+    """Raised inside the worker when the job is cancelled between stages."""
+
+
+class CompositeJob:
+    """
+    One photo booth composite, built stage by stage on a daemon thread.
+
+    The game thread starts the job, then polls stage, progress and done each
+    frame; nothing here blocks it. The preview (a pygame surface scaled to
+    fit preview_size) is published before the PNG encode starts, so the
+    summary screen can show the photo while it is still being written.
+    cancel() stops the job at the next stage boundary and nothing is saved.
+    """
+
+    def __init__(
+        self,
+        compositor: PhotoBoothCompositor,
+        config: PhotoBoothConfig,
+        gameplay_frame: bytes,
+        gameplay_size: Tuple[int, int],
+        zombie_count: int,
+        is_new_high_score: bool = False,
+        selfie_source: Optional[SelfieSource] = None,
+        preview_size: Optional[Tuple[int, int]] = None,
+    ):
+        """
+        Initialize the job (nothing runs until start()).
+
+        Args:
+            compositor: Compositor used for layout and saving
+            config: Photo booth configuration (output directory, branding)
+            gameplay_frame: Raw FRAME_FORMAT bytes of the gameplay screenshot
+            gameplay_size: Size of the gameplay screenshot
+            zombie_count: Number of zombies eliminated
+            is_new_high_score: If True, display a "NEW HIGH SCORE!" badge
+            selfie_source: Supplies the selfie (None for a gameplay-only composite)
+            preview_size: Largest preview to produce (None skips the preview)
+        """
+        self.compositor = compositor
+        self.config = config
+        self.zombie_count = zombie_count
+        self.is_new_high_score = is_new_high_score
+        self.preview_size = preview_size
+
+        self._gameplay_frame = gameplay_frame
+        self._gameplay_size = gameplay_size
+        self._selfie_source = selfie_source
+
+        self.stage: Optional[str] = None
+        self.path: Optional[str] = None
+        self.preview: Optional[pygame.Surface] = None
+        self.error: Optional[Exception] = None
+
+        self._stages_done = 0
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def progress(self) -> float:
+        """Fraction of stages finished, from 0.0 to 1.0."""
+        return self._stages_done / len(STAGES)
+
+    @property
+    def done(self) -> bool:
+        """True once the job has finished, failed or been cancelled."""
+        return self._done.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True if cancel() was called."""
+        return self._cancel.is_set()
+
+    @property
+    def succeeded(self) -> bool:
+        """True once the composite has been saved."""
+        return self.done and self.path is not None
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        self._thread = threading.Thread(target=self._run, name="photo-booth-composite", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Stop at the next stage boundary without saving (never blocks)."""
+        self._cancel.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the job finishes.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if the job finished within the timeout
+        """
+        return self._done.wait(timeout)
+
+    def _run(self) -> None:
+        """Worker: run each stage in turn, checking for cancellation in between."""
+        started = time.perf_counter()
+        try:
+            gameplay = self._stage("gameplay", self._decode_gameplay)
+            selfie = self._stage("selfie", self._prepare_selfie)
+            composite = self._stage("layout", lambda: self._layout(gameplay, selfie))
+            self.preview = self._stage("preview", lambda: self._make_preview(composite))
+            self.path = self._stage("encode", lambda: self.compositor.save(composite, self.config))
+            logger.info(
+                f"📸 Composite saved to {self.path} in {time.perf_counter() - started:.2f}s"
+            )
+        except CompositeCancelled:
+            logger.info(f"📸 Composite cancelled during {self.stage} stage")
+        except Exception as e:
+            self.error = e
+            logger.error(f"📸 Composite failed during {self.stage} stage: {e}", exc_info=True)
+        finally:
+            self._gameplay_frame = None
+            self._done.set()
+
+    def _stage(self, name: str, fn: Callable[[], object]) -> object:
+        """Run one stage unless the job has been cancelled."""
+        if self._cancel.is_set():
+            raise CompositeCancelled(name)
+        self.stage = name
+        result = fn()
+        self._stages_done += 1
+        return result
+
+    def _decode_gameplay(self) -> Image.Image:
+        """Convert the raw gameplay frame into an RGB image."""
+        return Image.frombytes(
+            "RGB", self._gameplay_size, self._gameplay_frame, "raw", FRAME_FORMAT
+        )
+
+    def _prepare_selfie(self) -> Optional[Image.Image]:
+        """Get the selfie and apply the arcade effect if it has not been applied yet."""
+        if self._selfie_source is None:
+            return None
+        selfie, processed = self._selfie_source(self._cancel)
+        if selfie is None or processed:
+            return selfie
+        return RetroFilter.apply_enhanced_arcade_effect(selfie)
+
+    def _layout(self, gameplay: Image.Image, selfie: Optional[Image.Image]) -> Image.Image:
+        """Lay out panels, header, footer, border and overlay."""
+        return self.compositor.generate(
+            selfie=selfie,
+            gameplay=gameplay,
+            zombie_count=self.zombie_count,
+            config=self.config,
+            skip_selfie_retro=True,
+            is_new_high_score=self.is_new_high_score,
+        )
+
+    def _make_preview(self, composite: Image.Image) -> Optional[pygame.Surface]:
+        """Scale the composite to fit preview_size (never up) as a pygame surface."""
+        if self.preview_size is None:
+            return None
+        max_width, max_height = self.preview_size
+        scale = min(max_width / composite.width, max_height / composite.height, 1.0)
+        size = (max(1, int(composite.width * scale)), max(1, int(composite.height * scale)))
+        if size != composite.size:
+            composite = composite.resize(size, Image.BILINEAR, reducing_gap=2.0)
+        return pygame.image.frombytes(composite.tobytes(), size, "RGB")
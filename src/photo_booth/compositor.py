@@ -7,7 +7,7 @@ score, branding, and retro arcade frame.
 
 import os
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -43,6 +43,10 @@ class PhotoBoothCompositor:
         self.pixel_font_medium = self._load_font(32)
         self.pixel_font_small = self._load_font(20)
 
+        # Assets are large (the logo is ~6000px wide) but always drawn at the
+        # same size, so each is resized once: (asset name, size) -> image
+        self._scaled_assets: Dict[Tuple[str, Tuple[int, int]], Image.Image] = {}
+
     def generate(
         self,
         selfie: Optional[Image.Image],
@@ -418,7 +422,7 @@ class PhotoBoothCompositor:
             logo_height = self.FOOTER_HEIGHT - 30
             logo_ratio = self.sonrai_logo.width / self.sonrai_logo.height
             logo_width = int(logo_height * logo_ratio)
-            logo_resized = self.sonrai_logo.resize((logo_width, logo_height), Image.LANCZOS)
+            logo_resized = self._scaled_asset("logo", self.sonrai_logo, (logo_width, logo_height))
 
             # Handle transparency
             if logo_resized.mode == "RGBA":
@@ -456,7 +460,7 @@ class PhotoBoothCompositor:
 
         if self.qr_code:
             # Use actual QR code image
-            qr_resized = self.qr_code.resize((qr_size, qr_size), Image.LANCZOS)
+            qr_resized = self._scaled_asset("qr", self.qr_code, (qr_size, qr_size))
             # Handle transparency if present
             if qr_resized.mode == "RGBA":
                 canvas.paste(qr_resized, (qr_x, footer_y + 5), qr_resized)
@@ -515,10 +519,28 @@ class PhotoBoothCompositor:
 
         # Resize overlay to match canvas if needed
         if overlay.size != canvas.size:
-            overlay = overlay.resize(canvas.size, Image.LANCZOS)
+            overlay = self._scaled_asset("overlay", overlay, canvas.size)
 
         return Image.alpha_composite(canvas, overlay)
 
+    def _scaled_asset(self, name: str, image: Image.Image, size: Tuple[int, int]) -> Image.Image:
+        """
+        Resize an asset, reusing the result for later composites.
+
+        Args:
+            name: Cache key for the asset
+            image: Full-size asset
+            size: Target size
+
+        Returns:
+            The asset at the requested size
+        """
+        key = (name, size)
+        scaled = self._scaled_assets.get(key)
+        if scaled is None:
+            scaled = self._scaled_assets[key] = image.resize(size, Image.LANCZOS)
+        return scaled
+
     def _load_frame_overlay(self) -> Optional[Image.Image]:
         """Load the arcade frame overlay asset."""
         try:
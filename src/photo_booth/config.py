@@ -4,13 +4,19 @@ Photo Booth Configuration.
 Loads settings from environment variables with sensible defaults.
 """
 
+import importlib.util
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Camera indices probed by detect_best_camera()
+CAMERA_PROBE_COUNT = 5
+
 
 def get_project_root() -> Path:
     """Get the project root directory (parent of src/)."""
@@ -37,9 +43,8 @@ def detect_best_camera() -> int:
         print("📷 CAMERA DETECTION: macOS detected, using camera 0 (built-in)")
         return 0
 
-    try:
-        import cv2
-    except ImportError:
+    # The probes import cv2 themselves; only check that it is installed here
+    if importlib.util.find_spec("cv2") is None:
         print("📷 CAMERA DETECTION: OpenCV not available")
         return 0
 
@@ -48,31 +53,30 @@ def detect_best_camera() -> int:
     best_fps = 0.0
     cameras_found = []
 
-    # Check first 5 camera indices
-    for i in range(5):
+    # Probe every index at once: each cold open + read can take hundreds of
+    # milliseconds, so probing in turn made startup wait for all of them
+    with ThreadPoolExecutor(max_workers=CAMERA_PROBE_COUNT) as pool:
+        probes = [(i, pool.submit(_probe_camera, i)) for i in range(CAMERA_PROBE_COUNT)]
+
+    for i, probe in probes:
         try:
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                ret, _ = cap.read()
-                if ret:
-                    fps = cap.get(cv2.CAP_PROP_FPS)
-                    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                    # Try to get camera name/backend
-                    backend = cap.getBackendName()
-                    camera_info = f"Camera {i}: {width}x{height} @ {fps} FPS (backend: {backend})"
-                    cameras_found.append(camera_info)
-                    print(f"📷 FOUND: {camera_info}")
-                    logger.info(f"📷 Camera {i}: {width}x{height} @ {fps} FPS")
-
-                    # Prefer higher FPS (external cameras usually have better FPS)
-                    # Also prefer higher index if FPS is similar (external usually higher index)
-                    if fps > best_fps or (fps == best_fps and i > best_camera):
-                        best_fps = fps
-                        best_camera = i
-                cap.release()
+            result = probe.result()
         except Exception as e:
             print(f"📷 Camera {i}: Error - {e}")
+            continue
+        if result is None:
+            continue
+
+        fps, camera_info = result
+        cameras_found.append(camera_info)
+        print(f"📷 FOUND: {camera_info}")
+        logger.info(f"📷 {camera_info}")
+
+        # Prefer higher FPS (external cameras usually have better FPS)
+        # Also prefer higher index if FPS is similar (external usually higher index)
+        if fps > best_fps or (fps == best_fps and i > best_camera):
+            best_fps = fps
+            best_camera = i
 
     if cameras_found:
         print(f"📷 CAMERA DETECTION: Found {len(cameras_found)} camera(s)")
@@ -84,6 +88,35 @@ def detect_best_camera() -> int:
     return best_camera
 
 
+def _probe_camera(index: int) -> Optional[Tuple[float, str]]:
+    """
+    Open one camera index and describe it.
+
+    Args:
+        index: Camera index to probe
+
+    Returns:
+        (FPS, description) if the camera delivers a frame, otherwise None
+    """
+    import cv2
+
+    cap = cv2.VideoCapture(index)
+    try:
+        if not cap.isOpened():
+            return None
+        ret, _ = cap.read()
+        if not ret:
+            return None
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        # Try to get camera name/backend
+        backend = cap.getBackendName()
+        return fps, f"Camera {index}: {width}x{height} @ {fps} FPS (backend: {backend})"
+    finally:
+        cap.release()
+
+
 @dataclass
 class PhotoBoothConfig:
     """Configuration for photo booth feature."""
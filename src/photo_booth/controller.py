@@ -4,32 +4,25 @@ Photo Booth Controller.
 Manages the photo booth capture flow including consent,
 webcam capture, and composite generation.
 
-Uses background threading for slow operations (background removal)
-to avoid blocking the game loop.
+Uses background threading for slow operations (background removal,
+compositing and PNG encoding) to avoid blocking the game loop.
 """
 
 import logging
 import threading
 import time
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
 
 import pygame
 from PIL import Image
 
+from .camera_service import CV2_AVAILABLE, CameraService
+from .composite_job import FRAME_FORMAT, CompositeJob
 from .compositor import PhotoBoothCompositor
 from .config import PhotoBoothConfig
 from .retro_filter import RetroFilter
 
-# Try to import OpenCV, but don't fail if not available
-try:
-    import cv2
-
-    CV2_AVAILABLE = True
-except ImportError:
-    CV2_AVAILABLE = False
-    logging.warning("OpenCV not available - webcam capture disabled")
-
 
 class PhotoBoothState(Enum):
     """Photo booth state machine states."""
@@ -51,12 +44,13 @@ class PhotoBoothController:
 
     Lifecycle:
         1. __init__(config) - Create controller
-        2. initialize() - Setup webcam (call once)
+        2. initialize() - Start the background camera service (call once)
         3. show_consent_prompt() - Start consent flow
         4. handle_consent_input() - Process user choice
         5. capture_selfie() - Capture webcam (if opted in)
         6. capture_gameplay() - Capture game screen
-        7. generate_composite() - Create final image
+        7. start_composite() - Build final image in the background,
+           then poll_composite() each frame (or generate_composite() to block)
         8. cleanup() - Release resources
     """
 
@@ -74,16 +68,17 @@ class PhotoBoothController:
             else PhotoBoothState.INACTIVE
         )
         self._selfie_opted_in = False
-        self._webcam = None
-        self._camera_available = False
+        self._camera: Optional[CameraService] = None
 
         # Captured images
         self._selfie_image: Optional[Image.Image] = None  # Raw webcam capture
         self._selfie_processed: Optional[Image.Image] = (
             None  # After bg removal + effects
         )
-        self._gameplay_image: Optional[Image.Image] = None
+        # Raw FRAME_FORMAT bytes and size; decoded on the composite thread
+        self._gameplay_frame: Optional[Tuple[bytes, Tuple[int, int]]] = None
         self._composite_path: Optional[str] = None
+        self._composite_job: Optional[CompositeJob] = None
 
         # Timing
         self._consent_prompt_start: float = 0.0
@@ -113,14 +108,33 @@ class PhotoBoothController:
 
     @property
     def is_camera_available(self) -> bool:
-        """Whether webcam is available."""
-        return self._camera_available
+        """Whether the webcam is open and delivering frames."""
+        return self._camera is not None and self._camera.is_open
 
     @property
     def composite_path(self) -> Optional[str]:
         """Path to generated composite image."""
         return self._composite_path
 
+    @property
+    def composite_progress(self) -> float:
+        """Progress of the background composite (1.0 once saved or if none is running)."""
+        if self._composite_job is None:
+            return 1.0
+        return self._composite_job.progress
+
+    @property
+    def composite_preview(self) -> Optional[pygame.Surface]:
+        """Screen-sized preview of the composite, available before it is saved."""
+        if self._composite_job is None:
+            return None
+        return self._composite_job.preview
+
+    @property
+    def is_compositing(self) -> bool:
+        """Whether a background composite is still running."""
+        return self._composite_job is not None and not self._composite_job.done
+
     @property
     def is_selfie_ready(self) -> bool:
         """Whether processed selfie is ready for compositing."""
@@ -142,7 +156,10 @@ class PhotoBoothController:
 
     def initialize(self) -> bool:
         """
-        Initialize webcam and resources.
+        Start the camera service and resources.
+
+        The camera is opened and read on the service's own thread, so this
+        returns immediately; is_camera_available turns True once frames arrive.
 
         Returns:
             True if initialization successful (webcam is optional)
@@ -158,92 +175,55 @@ class PhotoBoothController:
 
         self._state = PhotoBoothState.INACTIVE
 
-        # Try to use pre-initialized camera from main.py (avoids macOS pygame conflicts)
-        if CV2_AVAILABLE:
-            try:
-                # First, check if there's a pre-initialized camera from main.py
-                try:
-                    import main
-
-                    pre_cam = getattr(main, "_pre_initialized_camera", None)
-                    if (
-                        pre_cam is not None
-                        and hasattr(pre_cam, "isOpened")
-                        and pre_cam.isOpened()
-                    ):
-                        self._webcam = pre_cam
-                        self._camera_available = True
-                        self._logger.info(
-                            "📸 Using PRE-INITIALIZED webcam from main.py!"
-                        )
-                        # Test read
-                        ret, _ = pre_cam.read()
-                        if ret:
-                            self._logger.info(
-                                "📸 Pre-initialized webcam test read successful"
-                            )
-                            return True
-                        else:
-                            self._logger.warning(
-                                "📸 Pre-initialized webcam read failed, trying fresh open"
-                            )
-                except (ImportError, AttributeError) as e:
-                    self._logger.info(f"📸 No pre-initialized camera available: {e}")
-
-                # Fallback: try to open camera directly
-                self._logger.info(
-                    f"📸 Opening webcam at index {self.config.camera_index}"
-                )
-                self._webcam = cv2.VideoCapture(self.config.camera_index)
-                if self._webcam is not None and self._webcam.isOpened():
-                    self._camera_available = True
-                    self._logger.info(
-                        f"📸 Webcam initialized successfully (index {self.config.camera_index})"
-                    )
-                    # Test read to ensure camera is really working
-                    ret, _ = self._webcam.read()
-                    if ret:
-                        self._logger.info("📸 Webcam test read successful")
-                    else:
-                        self._logger.warning("📸 Webcam opened but test read failed")
-                elif self._webcam is not None:
-                    self._webcam.release()
-                    self._webcam = None
-                    self._camera_available = False
-                    self._logger.warning(
-                        "📸 Webcam not available - selfie capture disabled"
-                    )
-            except Exception as e:
-                self._logger.error(
-                    f"📸 Failed to initialize webcam: {e}", exc_info=True
-                )
-                self._webcam = None
-                self._camera_available = False
-        else:
-            self._camera_available = False
+        if not CV2_AVAILABLE:
             self._logger.info("📸 OpenCV not installed - selfie capture disabled")
+            return True
+
+        if self._camera is None:
+            # Adopt the camera main.py opened before pygame (avoids macOS conflicts)
+            pre_cam = None
+            try:
+                import main
+
+                pre_cam = getattr(main, "_pre_initialized_camera", None)
+            except ImportError:
+                pass
+            if pre_cam is not None and hasattr(pre_cam, "isOpened") and pre_cam.isOpened():
+                self._logger.info("📸 Using PRE-INITIALIZED webcam from main.py!")
+            else:
+                pre_cam = None
+                self._logger.info(f"📸 Opening webcam at index {self.config.camera_index}")
+
+            self._camera = CameraService(self.config.camera_index, capture=pre_cam)
+            self._camera.start()
 
         self._logger.info(
-            f"📸 initialize() complete: camera_available={self._camera_available}, "
-            f"webcam={self._webcam is not None}, state={self._state}"
+            f"📸 initialize() complete: camera service started, state={self._state}"
         )
         return True
 
     def cleanup(self) -> None:
         """Release all resources."""
-        if self._webcam is not None:
-            try:
-                self._webcam.release()
-            except Exception:
-                pass
-            self._webcam = None
+        self.cancel_composite()
+        if self._camera is not None:
+            self._camera.stop()
+            self._camera = None
 
-        self._camera_available = False
         self._selfie_image = None
-        self._gameplay_image = None
+        self._gameplay_frame = None
         self._state = PhotoBoothState.DISABLED
         self._logger.info("Photo booth resources cleaned up")
 
+    def set_camera_active(self, active: bool) -> None:
+        """
+        Capture at full rate during arcade mode, throttled otherwise.
+
+        Args:
+            active: True while the consent prompt or arcade session is running
+        """
+        if self._camera is not None:
+            self._camera.set_active(active)
+
     def show_consent_prompt(self) -> None:
         """Begin consent prompt flow."""
         if self._state == PhotoBoothState.DISABLED:
@@ -252,6 +232,8 @@ class PhotoBoothController:
         self._state = PhotoBoothState.AWAITING_CONSENT
         self._consent_prompt_start = time.time()
         self._selfie_opted_in = False
+        # Fill the frame buffer at full rate so a selfie is ready on consent
+        self.set_camera_active(True)
         self._logger.info("Showing photo booth consent prompt")
 
     def handle_consent_input(self, opted_in: bool) -> None:
@@ -263,8 +245,7 @@ class PhotoBoothController:
         """
         self._logger.info(
             f"📸 handle_consent_input called: opted_in={opted_in}, "
-            f"current_state={self._state}, camera_available={self._camera_available}, "
-            f"webcam={self._webcam is not None}"
+            f"current_state={self._state}, camera_available={self.is_camera_available}"
         )
 
         if self._state != PhotoBoothState.AWAITING_CONSENT:
@@ -273,7 +254,7 @@ class PhotoBoothController:
             )
             return
 
-        self._selfie_opted_in = opted_in and self._camera_available
+        self._selfie_opted_in = opted_in and self.is_camera_available
         self._state = (
             PhotoBoothState.CONSENT_GIVEN
             if opted_in
@@ -284,7 +265,7 @@ class PhotoBoothController:
             f"📸 Consent processed: selfie_opted_in={self._selfie_opted_in}, new_state={self._state}"
         )
 
-        if opted_in and not self._camera_available:
+        if opted_in and not self.is_camera_available:
             self._logger.warning(
                 "📸 User opted in but camera not available - selfie disabled"
             )
@@ -327,7 +308,7 @@ class PhotoBoothController:
 
     def capture_selfie(self, start_async_processing: bool = True) -> bool:
         """
-        Capture webcam image and optionally start background processing.
+        Take the selfie from the camera buffer and optionally start processing.
 
         Args:
             start_async_processing: If True, immediately start background removal
@@ -339,51 +320,27 @@ class PhotoBoothController:
         """
         self._logger.info(
             f"📸 capture_selfie called: opted_in={self._selfie_opted_in}, "
-            f"camera_available={self._camera_available}, webcam={self._webcam is not None}"
+            f"camera_available={self.is_camera_available}"
         )
 
         if not self._selfie_opted_in:
             self._logger.info("📸 capture_selfie: skipping - not opted in")
             return True  # Not an error, just skipped
 
-        if not self._camera_available or self._webcam is None:
-            self._logger.warning(
-                f"📸 Cannot capture selfie - camera_available={self._camera_available}, "
-                f"webcam={self._webcam is not None}"
-            )
+        if not self.is_camera_available:
+            self._logger.warning("📸 Cannot capture selfie - camera not available")
             return False
 
-        # Verify webcam is still open
-        if not self._webcam.isOpened():
-            self._logger.error(
-                "📸 Webcam was closed unexpectedly! Attempting to reopen..."
-            )
-            try:
-                self._webcam = cv2.VideoCapture(self.config.camera_index)
-                if not self._webcam.isOpened():
-                    self._logger.error("📸 Failed to reopen webcam")
-                    return False
-                self._logger.info("📸 Successfully reopened webcam")
-            except Exception as e:
-                self._logger.error(f"📸 Failed to reopen webcam: {e}")
-                return False
-
         self._state = PhotoBoothState.CAPTURING
 
         try:
-            # Read frame from webcam
-            self._logger.info("📸 Reading frame from webcam...")
-            ret, frame = self._webcam.read()
-
-            if not ret or frame is None:
-                self._logger.error(
-                    f"📸 Failed to read from webcam: ret={ret}, frame={frame is not None}"
-                )
+            # Sharpest recent frame from the rolling buffer; no camera read here
+            image = self._camera.capture_image()
+            if image is None:
+                self._logger.error("📸 No buffered webcam frame available")
                 return False
 
-            # Convert BGR (OpenCV) to RGB (PIL)
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            self._selfie_image = Image.fromarray(frame_rgb)
+            self._selfie_image = image
             self._selfie_captured = True
 
             self._logger.info(
@@ -401,17 +358,18 @@ class PhotoBoothController:
             return False
 
     def _start_async_selfie_capture(self) -> None:
-        """Start background thread to capture AND process selfie (webcam read + bg removal).
+        """Start background thread to take AND process the selfie.
 
-        This runs the entire pipeline in a daemon thread so the game loop is never blocked:
-        1. Read frame from webcam (slow - can take 100-500ms)
+        This runs the pipeline in a daemon thread so the game loop is never blocked:
+        1. Take the sharpest recent frame from the camera buffer (instant once
+           the camera is running; waits up to a second right after it opens)
         2. Apply video game character effect with background removal (slow - can take 2-5s)
         """
         if self._selfie_processing:
             self._logger.warning("📸 Async capture already in progress")
             return
 
-        if not self._camera_available or self._webcam is None:
+        if not self.is_camera_available:
             self._logger.warning("📸 Cannot start async capture - camera not available")
             return
 
@@ -423,28 +381,17 @@ class PhotoBoothController:
         self._logger.info(
             "📸 Starting ASYNC selfie capture + processing in background thread..."
         )
+        camera = self._camera
 
         def capture_and_process():
             try:
-                # Step 1: Read frame from webcam
-                self._logger.info("📸 [ASYNC] Reading frame from webcam...")
-
-                # Verify webcam is still open
-                if not self._webcam.isOpened():
-                    self._logger.error("📸 [ASYNC] Webcam was closed!")
-                    return
-
-                ret, frame = self._webcam.read()
-
-                if not ret or frame is None:
-                    self._logger.error(
-                        f"📸 [ASYNC] Failed to read from webcam: ret={ret}"
-                    )
+                # Step 1: Take the selfie from the rolling frame buffer
+                image = camera.capture_image(timeout=1.0)
+                if image is None:
+                    self._logger.error("📸 [ASYNC] No buffered webcam frame available")
                     return
 
-                # Convert BGR (OpenCV) to RGB (PIL)
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                self._selfie_image = Image.fromarray(frame_rgb)
+                self._selfie_image = image
                 self._selfie_captured = True
                 self._logger.info(
                     f"📸 [ASYNC] Webcam frame captured: {self._selfie_image.size}"
@@ -527,123 +474,160 @@ class PhotoBoothController:
             True if capture successful
         """
         try:
-            # Convert pygame surface to PIL Image
-            # Get raw pixel data
-            raw_str = pygame.image.tostring(screen, "RGB")
+            # Copy the raw pixels only; decoding happens on the composite thread
             size = screen.get_size()
-
-            self._gameplay_image = Image.frombytes("RGB", size, raw_str)
+            self._gameplay_frame = (pygame.image.tobytes(screen, FRAME_FORMAT), size)
             self._gameplay_captured = True
 
-            self._logger.info(f"Gameplay captured: {self._gameplay_image.size}")
+            self._logger.info(f"Gameplay captured: {size}")
             return True
 
         except Exception as e:
             self._logger.error(f"Gameplay capture error: {e}")
             return False
 
-    def generate_composite(
-        self, zombie_count: int, is_new_high_score: bool = False
-    ) -> Optional[str]:
+    def start_composite(
+        self,
+        zombie_count: int,
+        is_new_high_score: bool = False,
+        preview_size: Optional[Tuple[int, int]] = None,
+    ) -> bool:
         """
-        Generate final photo booth composite.
+        Start building the final photo booth composite in the background.
 
-        Uses pre-processed selfie if available (from async background removal),
-        otherwise falls back to raw selfie with synchronous processing.
+        Poll with poll_composite() each frame; composite_progress and
+        composite_preview can be shown while it runs.
 
         Args:
             zombie_count: Number of zombies eliminated
             is_new_high_score: If True, display a "NEW HIGH SCORE!" badge
+            preview_size: Largest preview surface to produce (None for no preview)
 
         Returns:
-            Path to saved composite image, or None on failure
+            True if the job started, False if there is no gameplay screenshot
         """
         self._logger.info(
-            f"📸 generate_composite called: zombie_count={zombie_count}, "
+            f"📸 start_composite called: zombie_count={zombie_count}, "
             f"selfie_image={self._selfie_image is not None}, "
             f"selfie_processed={self._selfie_processed is not None}, "
             f"selfie_ready={self._selfie_ready}, "
-            f"gameplay_image={self._gameplay_image is not None}, "
+            f"gameplay_frame={self._gameplay_frame is not None}, "
             f"selfie_opted_in={self._selfie_opted_in}, "
             f"selfie_captured={self._selfie_captured}"
         )
 
-        if self._gameplay_image is None:
+        if self._gameplay_frame is None:
             self._logger.error("📸 Cannot generate composite - no gameplay image")
-            return None
+            return False
 
+        self.cancel_composite()
+        self._composite_path = None
         self._state = PhotoBoothState.COMPOSITING
 
-        # Determine which selfie image to use
-        selfie_for_composite = None
-        if self._selfie_opted_in and self._selfie_captured:
-            if self._selfie_ready and self._selfie_processed is not None:
-                # Use pre-processed selfie (bg already removed, effects applied)
-                selfie_for_composite = self._selfie_processed
-                self._logger.info(
-                    "📸 Using PRE-PROCESSED selfie (async bg removal done)"
-                )
-            elif self._selfie_image is not None:
-                # Fallback: wait briefly for async processing, then use raw
-                if self._selfie_processing:
-                    self._logger.info(
-                        "📸 Waiting briefly for async processing to complete..."
-                    )
-                    # Wait up to 5 seconds for processing to complete
-                    for _ in range(50):
-                        if self._selfie_ready:
-                            break
-                        time.sleep(0.1)
-
-                if self._selfie_ready and self._selfie_processed is not None:
-                    selfie_for_composite = self._selfie_processed
-                    self._logger.info(
-                        "📸 Using PRE-PROCESSED selfie (waited for completion)"
-                    )
-                else:
-                    # Use raw image - compositor will apply effects synchronously
-                    selfie_for_composite = self._selfie_image
-                    self._logger.warning(
-                        "📸 Using RAW selfie (async processing not ready)"
-                    )
-
-        try:
-            # Generate composite
-            self._logger.info(
-                f"📸 Generating composite with selfie={'PRE-PROCESSED' if selfie_for_composite is self._selfie_processed else 'RAW' if selfie_for_composite else 'NONE'}"
-            )
-
-            # If we have a pre-processed selfie, tell compositor to skip retro filter
-            skip_selfie_retro = selfie_for_composite is self._selfie_processed
+        frame, size = self._gameplay_frame
+        with_selfie = self._selfie_opted_in and self._selfie_captured
+        self._composite_job = CompositeJob(
+            self._compositor,
+            self.config,
+            frame,
+            size,
+            zombie_count,
+            is_new_high_score=is_new_high_score,
+            selfie_source=self._selfie_for_composite if with_selfie else None,
+            preview_size=preview_size,
+        )
+        self._composite_job.start()
+        return True
 
-            composite = self._compositor.generate(
-                selfie=selfie_for_composite,
-                gameplay=self._gameplay_image,
-                zombie_count=zombie_count,
-                config=self.config,
-                skip_selfie_retro=skip_selfie_retro,
-                is_new_high_score=is_new_high_score,
-            )
+    def poll_composite(self) -> Optional[str]:
+        """
+        Collect the result of the background composite (never blocks).
 
-            # Save to file
-            self._composite_path = self._compositor.save(composite, self.config)
+        Returns:
+            Path to the saved composite once it is written, otherwise None
+        """
+        job = self._composite_job
+        if job is None or not job.done or self._state != PhotoBoothState.COMPOSITING:
+            return self._composite_path
 
+        if job.succeeded:
+            self._composite_path = job.path
             self._state = PhotoBoothState.COMPLETE
             self._logger.info(f"📸 Composite saved to: {self._composite_path}")
+        else:
+            self._state = PhotoBoothState.ERROR
+        return self._composite_path
 
-            return self._composite_path
+    def cancel_composite(self) -> None:
+        """Stop a running background composite without saving it (never blocks)."""
+        if self.is_compositing:
+            self._logger.info("📸 Cancelling photo booth composite")
+            self._composite_job.cancel()
+            self._state = PhotoBoothState.INACTIVE
 
-        except Exception as e:
-            self._logger.error(f"📸 Composite generation error: {e}", exc_info=True)
-            self._state = PhotoBoothState.ERROR
+    def generate_composite(
+        self, zombie_count: int, is_new_high_score: bool = False
+    ) -> Optional[str]:
+        """
+        Generate final photo booth composite, blocking until it is saved.
+
+        Runs the same pipeline as start_composite() and waits for it.
+
+        Args:
+            zombie_count: Number of zombies eliminated
+            is_new_high_score: If True, display a "NEW HIGH SCORE!" badge
+
+        Returns:
+            Path to saved composite image, or None on failure
+        """
+        if not self.start_composite(zombie_count, is_new_high_score=is_new_high_score):
             return None
+        self._composite_job.wait()
+        return self.poll_composite()
+
+    def _selfie_for_composite(
+        self, cancelled: threading.Event
+    ) -> Tuple[Optional[Image.Image], bool]:
+        """
+        Pick the selfie for the composite (runs on the composite thread).
+
+        Uses the pre-processed selfie if available (from async background
+        removal), waiting up to 5 seconds for processing still in flight;
+        otherwise falls back to the raw selfie.
+
+        Args:
+            cancelled: Set when the composite is cancelled; stops the wait
+
+        Returns:
+            (selfie or None, whether effects were already applied)
+        """
+        if self._selfie_ready and self._selfie_processed is not None:
+            self._logger.info("📸 Using PRE-PROCESSED selfie (async bg removal done)")
+            return self._selfie_processed, True
+
+        if self._selfie_processing:
+            self._logger.info("📸 Waiting briefly for async processing to complete...")
+            deadline = time.monotonic() + 5.0
+            while not self._selfie_ready and time.monotonic() < deadline:
+                if cancelled.wait(0.1):
+                    return None, False
+
+        if self._selfie_ready and self._selfie_processed is not None:
+            self._logger.info("📸 Using PRE-PROCESSED selfie (waited for completion)")
+            return self._selfie_processed, True
+
+        if self._selfie_image is not None:
+            self._logger.warning("📸 Using RAW selfie (async processing not ready)")
+        return self._selfie_image, False
 
     def reset(self) -> None:
         """Reset controller for next arcade session."""
+        self.cancel_composite()
+        self._composite_job = None
         self._selfie_opted_in = False
         self._selfie_image = None
         self._selfie_processed = None
-        self._gameplay_image = None
+        self._gameplay_frame = None
         self._composite_path = None
         self._consent_prompt_start = 0.0
         self._arcade_start_time = 0.0
@@ -8,8 +8,13 @@ recognizable features.
 
 import logging
 import math
+import threading
+from collections import OrderedDict
+from typing import Callable, Tuple
 
-from PIL import Image, ImageDraw, ImageEnhance
+from PIL import Image, ImageStat
+
+from palette_quantizer import get_quantizer
 
 # Try to import rembg for background removal
 try:
@@ -20,8 +25,58 @@ except ImportError:
     REMBG_AVAILABLE = False
     logging.warning("rembg not available - background removal disabled")
 
+# Optional: NumPy builds vignette masks quickly; without it they are built in Python
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Effect overlays kept, keyed by (effect, size, parameters); the booth only
+# uses a handful of sizes, so this bounds memory without ever rebuilding
+MAX_CACHED_OVERLAYS = 16
+
+# ITU-R 601-2 luma weights, as used by PIL's "L" conversion and ImageEnhance
+_LUMA = (299 / 1000, 587 / 1000, 114 / 1000)
+
+_OVERLAYS: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+_OVERLAYS_LOCK = threading.Lock()
+
+
+def _cached_overlay(key: tuple, build: Callable[[], Image.Image]) -> Image.Image:
+    """
+    Return a cached effect overlay, building it on first use.
+
+    Filters run on the composite job's worker thread as well as the game
+    thread, so the cache is only touched under _OVERLAYS_LOCK.
+
+    Args:
+        key: Effect name, image size and effect parameters
+        build: Creates the overlay on a cache miss
+
+    Returns:
+        The overlay for key
+    """
+    with _OVERLAYS_LOCK:
+        mask = _OVERLAYS.get(key)
+        if mask is None:
+            mask = _OVERLAYS[key] = build()
+            if len(_OVERLAYS) > MAX_CACHED_OVERLAYS:
+                _OVERLAYS.popitem(last=False)
+        else:
+            _OVERLAYS.move_to_end(key)
+        return mask
+
+
+def _black_overlay(alpha: Image.Image) -> Image.Image:
+    """Black RGBA overlay with the given per-pixel opacity."""
+    overlay = Image.new("RGBA", alpha.size, (0, 0, 0, 0))
+    overlay.putalpha(alpha)
+    return overlay
+
 
 class RetroFilter:
     """Applies retro 8-bit effects to images."""
@@ -164,6 +219,9 @@ class RetroFilter:
         (180, 100, 100),
     ]
 
+    # Sonrai brand purple used by add_purple_tint
+    PURPLE_TINT = (138, 43, 226)
+
     @staticmethod
     def pixelate(image: Image.Image, pixel_size: int = 8) -> Image.Image:
         """
@@ -204,35 +262,21 @@ class RetroFilter:
         # Scale back up with bilinear for softer pixels
         return small.resize(image.size, Image.NEAREST)
 
-    @staticmethod
-    def _color_distance(c1: tuple, c2: tuple) -> float:
-        """Calculate Euclidean distance between two RGB colors."""
-        return math.sqrt((c1[0] - c2[0]) ** 2 + (c1[1] - c2[1]) ** 2 + (c1[2] - c2[2]) ** 2)
-
-    @staticmethod
-    def _find_nearest_color(color: tuple, palette: list) -> tuple:
-        """Find the nearest color in the palette."""
-        min_distance = float("inf")
-        nearest = palette[0]
-
-        for palette_color in palette:
-            distance = RetroFilter._color_distance(color, palette_color)
-            if distance < min_distance:
-                min_distance = distance
-                nearest = palette_color
-
-        return nearest
-
     @classmethod
-    def reduce_colors(cls, image: Image.Image, palette: list = None) -> Image.Image:
+    def reduce_colors(
+        cls, image: Image.Image, palette: list = None, dither: bool = False
+    ) -> Image.Image:
         """
         Reduce image to limited color palette.
 
-        Uses numpy for fast vectorized color matching (100x faster than pixel-by-pixel).
+        Colors are mapped through a lookup table cached per palette (see
+        palette_quantizer), in small chunks so even 1080p frames need little
+        extra memory.
 
         Args:
             image: PIL Image to reduce
             palette: List of RGB tuples (defaults to RETRO_PALETTE)
+            dither: Apply ordered dithering for smoother gradients
 
         Returns:
             Image with reduced color palette
@@ -240,55 +284,20 @@ class RetroFilter:
         if palette is None:
             palette = cls.RETRO_PALETTE
 
-        # Convert to RGB if needed
-        if image.mode != "RGB":
-            image = image.convert("RGB")
-
-        # Try numpy for fast processing
-        try:
-            import numpy as np
-
-            # Convert image to numpy array
-            img_array = np.array(image, dtype=np.float32)
-            palette_array = np.array(palette, dtype=np.float32)
-
-            # Reshape for broadcasting: (H, W, 1, 3) vs (1, 1, P, 3)
-            img_reshaped = img_array.reshape(img_array.shape[0], img_array.shape[1], 1, 3)
-            palette_reshaped = palette_array.reshape(1, 1, len(palette), 3)
-
-            # Calculate squared distances to all palette colors
-            distances = np.sum((img_reshaped - palette_reshaped) ** 2, axis=3)
-
-            # Find index of nearest palette color for each pixel
-            nearest_indices = np.argmin(distances, axis=2)
-
-            # Map indices to colors
-            result_array = palette_array[nearest_indices].astype(np.uint8)
-
-            return Image.fromarray(result_array, mode="RGB")
-
-        except ImportError:
-            # Fallback to slow pixel-by-pixel method
-            result = Image.new("RGB", image.size)
-            pixels = image.load()
-            result_pixels = result.load()
-
-            for y in range(image.height):
-                for x in range(image.width):
-                    original_color = pixels[x, y]
-                    nearest_color = cls._find_nearest_color(original_color, palette)
-                    result_pixels[x, y] = nearest_color
-
-            return result
+        return get_quantizer(palette).quantize_image(image, dither=dither)
 
     @classmethod
-    def reduce_colors_smooth(cls, image: Image.Image, num_colors: int = 32) -> Image.Image:
+    def reduce_colors_smooth(
+        cls, image: Image.Image, num_colors: int = 32, tint_strength: float = 0.0
+    ) -> Image.Image:
         """
         Reduce colors using PIL's quantize for smoother results.
 
         Args:
             image: PIL Image to reduce
             num_colors: Number of colors to reduce to
+            tint_strength: Purple tint (0-1) applied to the palette, which
+                matches add_purple_tint() on the result at no per-pixel cost
 
         Returns:
             Image with reduced color palette
@@ -298,6 +307,10 @@ class RetroFilter:
 
         # Use PIL's built-in quantization for better results
         quantized = image.quantize(colors=num_colors, method=Image.MEDIANCUT)
+        if tint_strength:
+            entries = quantized.getpalette("RGB")
+            palette = Image.frombytes("RGB", (len(entries) // 3, 1), bytes(entries))
+            quantized.putpalette(cls.add_purple_tint(palette, tint_strength).tobytes())
         return quantized.convert("RGB")
 
     @staticmethod
@@ -305,6 +318,9 @@ class RetroFilter:
         """
         Add CRT scanline effect.
 
+        The line overlay is drawn once per (size, opacity, spacing) and
+        reused, so each call is a single alpha composite.
+
         Args:
             image: PIL Image to add scanlines to
             opacity: Opacity of scanlines (0-255)
@@ -316,21 +332,22 @@ class RetroFilter:
         if image.mode != "RGBA":
             image = image.convert("RGBA")
 
-        # Create scanline overlay
-        scanlines = Image.new("RGBA", image.size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(scanlines)
+        def build() -> Image.Image:
+            rows = Image.new("L", (1, image.height))
+            rows.putdata([opacity if y % spacing == 0 else 0 for y in range(image.height)])
+            return _black_overlay(rows.resize(image.size, Image.NEAREST))
 
-        # Draw horizontal lines
-        for y in range(0, image.height, spacing):
-            draw.line([(0, y), (image.width, y)], fill=(0, 0, 0, opacity))
-
-        return Image.alpha_composite(image, scanlines)
+        overlay = _cached_overlay(("scanlines", image.size, opacity, spacing), build)
+        return Image.alpha_composite(image, overlay)
 
     @staticmethod
     def add_vignette(image: Image.Image, strength: float = 0.3) -> Image.Image:
         """
         Add subtle vignette effect (darker corners).
 
+        The radial falloff is computed once per (size, strength) and reused,
+        so each call is a single alpha composite.
+
         Args:
             image: PIL Image
             strength: Vignette strength (0-1)
@@ -341,55 +358,117 @@ class RetroFilter:
         if image.mode != "RGBA":
             image = image.convert("RGBA")
 
-        # Create radial gradient for vignette
-        width, height = image.size
-        vignette = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(vignette)
+        overlay = _cached_overlay(
+            ("vignette", image.size, strength),
+            lambda: _black_overlay(RetroFilter._vignette_alpha(image.size, strength)),
+        )
+        return Image.alpha_composite(image, overlay)
+
+    @staticmethod
+    def _vignette_alpha(size: Tuple[int, int], strength: float) -> Image.Image:
+        """
+        Per-pixel darkening for add_vignette().
+
+        Darkening starts at 60% of the center-to-corner distance and reaches
+        255 * strength at the corners.
+
+        Args:
+            size: Image size
+            strength: Vignette strength (0-1)
 
+        Returns:
+            "L" image of overlay opacities
+        """
+        width, height = size
         center_x, center_y = width // 2, height // 2
         max_dist = math.sqrt(center_x**2 + center_y**2)
+        start, span = max_dist * 0.6, max_dist * 0.4
+
+        if NUMPY_AVAILABLE:
+            ys, xs = np.ogrid[:height, :width]
+            dist = np.hypot(xs - center_x, ys - center_y)
+            alpha = ((dist - start) / span * 255 * strength).astype(np.int32)
+            alpha = np.where(dist > start, np.minimum(alpha, 255), 0)
+            return Image.fromarray(alpha.astype(np.uint8), mode="L")
 
+        values = []
         for y in range(height):
             for x in range(width):
                 dist = math.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
-                # Vignette starts at 60% from center
-                if dist > max_dist * 0.6:
-                    alpha = int(((dist - max_dist * 0.6) / (max_dist * 0.4)) * 255 * strength)
-                    alpha = min(255, alpha)
-                    vignette.putpixel((x, y), (0, 0, 0, alpha))
+                alpha = min(255, int((dist - start) / span * 255 * strength)) if dist > start else 0
+                values.append(alpha)
+        alpha_image = Image.new("L", size)
+        alpha_image.putdata(values)
+        return alpha_image
 
-        return Image.alpha_composite(image, vignette)
-
-    @staticmethod
-    def enhance_colors(
-        image: Image.Image, saturation: float = 1.3, contrast: float = 1.1
+    @classmethod
+    def grade_colors(
+        cls,
+        image: Image.Image,
+        saturation: float = 1.0,
+        contrast: float = 1.0,
+        tint_strength: float = 0.0,
+        tint_color: tuple = None,
     ) -> Image.Image:
         """
-        Enhance colors for more vibrant retro look.
+        Adjust saturation and contrast and blend in a tint, in one pass.
+
+        Each step is an affine map of a pixel's RGB (saturation mixes in its
+        luma, contrast mixes in the mean luma, tint mixes in a constant
+        color), so the three compose into a single 3x4 color matrix applied
+        by Pillow in C. Results match ImageEnhance.Color, then
+        ImageEnhance.Contrast, then Image.blend, except that values are only
+        clipped at the end rather than after every step.
 
         Args:
             image: PIL Image
             saturation: Saturation multiplier (1.0 = no change)
             contrast: Contrast multiplier (1.0 = no change)
+            tint_strength: Tint strength (0-1)
+            tint_color: RGB tint (defaults to PURPLE_TINT)
 
         Returns:
-            Enhanced image
+            Graded RGB image
         """
         if image.mode != "RGB":
             image = image.convert("RGB")
+        if tint_color is None:
+            tint_color = cls.PURPLE_TINT
+
+        # Saturation leaves luma unchanged, so the mean can come from the input
+        mean = 0
+        if contrast != 1.0:
+            mean = int(ImageStat.Stat(image.convert("L")).mean[0] + 0.5)
+
+        keep = 1.0 - tint_strength
+        matrix = []
+        for channel in range(3):
+            matrix.extend(
+                keep * contrast * (saturation * (k == channel) + (1.0 - saturation) * _LUMA[k])
+                for k in range(3)
+            )
+            matrix.append(keep * (1.0 - contrast) * mean + tint_strength * tint_color[channel])
+        return image.convert("RGB", tuple(matrix))
 
-        # Boost saturation
-        enhancer = ImageEnhance.Color(image)
-        image = enhancer.enhance(saturation)
+    @classmethod
+    def enhance_colors(
+        cls, image: Image.Image, saturation: float = 1.3, contrast: float = 1.1
+    ) -> Image.Image:
+        """
+        Enhance colors for more vibrant retro look.
 
-        # Boost contrast
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(contrast)
+        Args:
+            image: PIL Image
+            saturation: Saturation multiplier (1.0 = no change)
+            contrast: Contrast multiplier (1.0 = no change)
 
-        return image
+        Returns:
+            Enhanced image
+        """
+        return cls.grade_colors(image, saturation=saturation, contrast=contrast)
 
-    @staticmethod
-    def add_purple_tint(image: Image.Image, strength: float = 0.15) -> Image.Image:
+    @classmethod
+    def add_purple_tint(cls, image: Image.Image, strength: float = 0.15) -> Image.Image:
         """
         Add subtle purple tint to match Sonrai branding.
 
@@ -400,14 +479,7 @@ class RetroFilter:
         Returns:
             Tinted image
         """
-        if image.mode != "RGB":
-            image = image.convert("RGB")
-
-        # Create purple overlay
-        purple = Image.new("RGB", image.size, (138, 43, 226))
-
-        # Blend with original
-        return Image.blend(image, purple, strength)
+        return cls.grade_colors(image, tint_strength=strength)
 
     @classmethod
     def apply_full_retro_effect(
@@ -458,11 +530,8 @@ class RetroFilter:
         # Soft pixelation (preserves more detail)
         img = cls.soft_pixelate(img, pixel_size=pixel_size)
 
-        # Reduce colors but keep more than 16
-        img = cls.reduce_colors_smooth(img, num_colors=num_colors)
-
-        # Add subtle purple tint for branding
-        img = cls.add_purple_tint(img, strength=0.08)
+        # Reduce colors but keep more than 16, tinting the palette purple for branding
+        img = cls.reduce_colors_smooth(img, num_colors=num_colors, tint_strength=0.08)
 
         return img
 
@@ -487,11 +556,8 @@ class RetroFilter:
         # Medium pixelation
         img = cls.pixelate(img, pixel_size=pixel_size)
 
-        # Reduce colors
-        img = cls.reduce_colors_smooth(img, num_colors=num_colors)
-
-        # Add purple tint
-        img = cls.add_purple_tint(img, strength=0.1)
+        # Reduce colors, tinting the palette purple
+        img = cls.reduce_colors_smooth(img, num_colors=num_colors, tint_strength=0.1)
 
         return img
 
@@ -1,12 +1,15 @@
 """Player character implementation."""
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import pygame
 
 from models import Vector2
 
+if TYPE_CHECKING:
+    from projectile import Projectile, ProjectilePool
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,9 +83,15 @@ class Player:
         self.flash_interval: float = 0.1  # Flash every 0.1s during invincibility
         self.is_visible: bool = True  # For flashing effect
 
-        # Create base sprite (facing right)
+        # Create base sprite (facing right) and its mirror image once
         self.base_sprite = self._create_sprite()
-        self.sprite = self.base_sprite.copy()  # Current displayed sprite
+        self._facing_sprites = {
+            1: self.base_sprite.copy(),
+            -1: pygame.transform.flip(self.base_sprite, True, False),
+        }
+        self.sprite = self._facing_sprites[1]  # Current displayed sprite
+        # Stable name of the current sprite (renderer caches scaled copies by it)
+        self.sprite_key = ("player", 1)
 
     def _create_sprite(self) -> pygame.Surface:
         """
@@ -235,10 +244,9 @@ class Player:
 
     def _update_sprite_rotation(self) -> None:
         """Update the sprite to match the current visual direction (only left/right)."""
-        if self.visual_direction > 0:  # Facing right
-            self.sprite = self.base_sprite.copy()
-        else:  # Facing left
-            self.sprite = pygame.transform.flip(self.base_sprite, True, False)
+        direction = 1 if self.visual_direction > 0 else -1
+        self.sprite = self._facing_sprites[direction]
+        self.sprite_key = ("player", direction)
 
     def move_left(self) -> None:
         """Set velocity to move left."""
@@ -298,12 +306,15 @@ class Player:
         self.move_speed = self.base_move_speed * multiplier
         self.jump_speed = self.base_jump_speed * multiplier
 
-    def fire_projectile(self) -> "Projectile":
+    def fire_projectile(self, pool: Optional["ProjectilePool"] = None) -> "Projectile":
         """
         Create a projectile at the player's current position, firing in facing direction.
 
+        Args:
+            pool: Optional projectile pool to recycle spent projectiles from
+
         Returns:
-            New Projectile instance
+            Active Projectile instance (recycled when a pool is given)
         """
         from projectile import Projectile
 
@@ -317,13 +328,13 @@ class Player:
         projectile_x = center_x + (self.facing_direction.x * spawn_offset)
         projectile_y = center_y + (self.facing_direction.y * spawn_offset)
 
-        projectile_pos = Vector2(projectile_x, projectile_y)
-
-        print(
-            f"DEBUG: Firing projectile at ({projectile_pos.x}, {projectile_pos.y}) facing {self.facing_direction.x}, {self.facing_direction.y}"
+        logger.debug(
+            f"Firing projectile at ({projectile_x}, {projectile_y}) facing {self.facing_direction.x}, {self.facing_direction.y}"
         )
 
-        return Projectile(projectile_pos, self.facing_direction)
+        if pool is not None:
+            return pool.acquire(projectile_x, projectile_y, self.facing_direction)
+        return Projectile(Vector2(projectile_x, projectile_y), self.facing_direction)
 
     def update(self, delta_time: float, is_platformer_mode: bool = False) -> None:
         """
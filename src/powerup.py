@@ -186,6 +186,11 @@ class PowerUp:
             self.height,
         )
 
+    @property
+    def is_being_eliminated(self) -> bool:
+        """True once collected (no longer a collision target)."""
+        return self.collected
+
     def render(self, screen: pygame.Surface, camera_x: float, camera_y: float) -> None:
         """
         Render the power-up with bounce animation.
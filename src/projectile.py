@@ -1,14 +1,78 @@
 """Projectile implementation."""
 
+from typing import Dict, List, Optional
+
 import pygame
 
 from models import Vector2
 
+# Projectile speed in pixels/second
+PROJECTILE_SPEED = 400
+
+# Shared sprites - one surface per projectile style, built on first use
+_SPRITE_CACHE: Dict[str, pygame.Surface] = {}
+
+
+def _create_raygun_sprite() -> pygame.Surface:
+    """
+    Create a retro raygun energy beam sprite with purple glow.
+
+    Returns:
+        Pygame surface with the projectile sprite
+    """
+    # Make it larger for better visibility
+    size = 16
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+
+    center = size // 2
+
+    # Outer glow layer (dark purple) - retro soft edge effect
+    pygame.draw.circle(sprite, (80, 40, 120), (center, center), 7)
+
+    # Middle bright layer (light purple)
+    pygame.draw.circle(sprite, (180, 100, 255), (center, center), 5)
+
+    # Inner glow (cyan/white - energy core)
+    pygame.draw.circle(sprite, (100, 200, 255), (center, center), 3)
+
+    # Core white hot center
+    pygame.draw.circle(sprite, (255, 255, 255), (center, center), 2)
+
+    return sprite
+
+
+_SPRITE_BUILDERS = {
+    "raygun": _create_raygun_sprite,
+}
+
+
+def get_projectile_sprite(style: str = "raygun") -> pygame.Surface:
+    """
+    Get the shared sprite for a projectile style, building it once.
+
+    Args:
+        style: Projectile style name
+
+    Returns:
+        Shared surface - callers must not draw onto it
+    """
+    sprite = _SPRITE_CACHE.get(style)
+    if sprite is None:
+        sprite = _SPRITE_BUILDERS[style]()
+        _SPRITE_CACHE[style] = sprite
+    return sprite
+
 
 class Projectile:
     """Represents a fired shot from the player."""
 
-    def __init__(self, position: Vector2, direction: Vector2 = None, damage: int = 1):
+    def __init__(
+        self,
+        position: Vector2,
+        direction: Vector2 = None,
+        damage: int = 1,
+        style: str = "raygun",
+    ):
         """
         Initialize a projectile.
 
@@ -16,59 +80,50 @@ class Projectile:
             position: Starting position (typically from player's gun)
             direction: Direction vector (default: right)
             damage: Amount of damage this projectile deals (default: 1)
+            style: Sprite style (all projectiles of a style share one surface)
         """
         self.position = position
-        self.damage = damage  # Damage dealt on hit
-
-        # Default to moving right if no direction specified
-        if direction is None:
-            self.velocity = Vector2(400, 0)
-        else:
-            # Normalize direction and set speed to 400 pixels/second
-            speed = 400
-            length = (direction.x**2 + direction.y**2) ** 0.5
-            if length > 0:
-                self.velocity = Vector2(
-                    (direction.x / length) * speed, (direction.y / length) * speed
-                )
-            else:
-                self.velocity = Vector2(400, 0)  # Fallback to right
+        self.velocity = Vector2(0, 0)
 
         # Projectile dimensions
         self.radius = 4
 
-        # Create simple sprite
-        self.sprite = self._create_sprite()
+        self.reset(position.x, position.y, direction, damage, style)
 
-    def _create_sprite(self) -> pygame.Surface:
+    def reset(
+        self,
+        x: float,
+        y: float,
+        direction: Optional[Vector2] = None,
+        damage: int = 1,
+        style: str = "raygun",
+    ) -> None:
         """
-        Create a retro raygun energy beam sprite with purple glow.
+        Re-arm this projectile in place (used by ProjectilePool to recycle shots).
 
-        Returns:
-            Pygame surface with the projectile sprite
+        Args:
+            x: Starting X position
+            y: Starting Y position
+            direction: Direction vector (default: right)
+            damage: Amount of damage this projectile deals
+            style: Sprite style
         """
-        # Make it larger for better visibility
-        size = 16
-        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
-
-        center = size // 2
-
-        # Outer glow layer (dithered purple) - for retro soft edge effect
-        for x in range(size):
-            for y in range(size):
-                if (x + y) % 2 == 0:  # Checkerboard dithering
-                    pygame.draw.circle(sprite, (80, 40, 120), (center, center), 7)
-
-        # Middle bright layer (light purple)
-        pygame.draw.circle(sprite, (180, 100, 255), (center, center), 5)
-
-        # Inner glow (cyan/white - energy core)
-        pygame.draw.circle(sprite, (100, 200, 255), (center, center), 3)
+        self.position.x = x
+        self.position.y = y
+        self.damage = damage  # Damage dealt on hit
+        self.active = True  # False once released back to the pool
 
-        # Core white hot center
-        pygame.draw.circle(sprite, (255, 255, 255), (center, center), 2)
+        # Default to moving right if no direction specified
+        self.velocity.x = PROJECTILE_SPEED
+        self.velocity.y = 0
+        if direction is not None:
+            # Normalize direction and set speed to 400 pixels/second
+            length = (direction.x**2 + direction.y**2) ** 0.5
+            if length > 0:
+                self.velocity.x = (direction.x / length) * PROJECTILE_SPEED
+                self.velocity.y = (direction.y / length) * PROJECTILE_SPEED
 
-        return sprite
+        self.sprite = get_projectile_sprite(style)
 
     def update(self, delta_time: float) -> None:
         """
@@ -144,3 +199,85 @@ class Projectile:
             return game_map.tile_map[tile_y][tile_x] != 0
 
         return False
+
+
+class ProjectilePool:
+    """
+    Recycles Projectile instances so sustained fire does not allocate per shot.
+
+    Spent projectiles are released back to the pool and re-armed in place by
+    acquire(), reusing their position/velocity vectors and shared sprite.
+    """
+
+    def __init__(self, max_free: int = 256):
+        """
+        Initialize the pool.
+
+        Args:
+            max_free: Maximum number of idle projectiles kept for reuse
+        """
+        self.max_free = max_free
+        self._free: List[Projectile] = []
+
+        # Stats
+        self.created = 0
+        self.reused = 0
+
+    def acquire(
+        self,
+        x: float,
+        y: float,
+        direction: Optional[Vector2] = None,
+        damage: int = 1,
+        style: str = "raygun",
+    ) -> Projectile:
+        """
+        Get an active projectile at (x, y), reusing an idle one if available.
+
+        Args:
+            x: Starting X position
+            y: Starting Y position
+            direction: Direction vector (default: right)
+            damage: Amount of damage this projectile deals
+            style: Sprite style
+
+        Returns:
+            Active projectile
+        """
+        if self._free:
+            projectile = self._free.pop()
+            projectile.reset(x, y, direction, damage, style)
+            self.reused += 1
+        else:
+            projectile = Projectile(Vector2(x, y), direction, damage, style)
+            self.created += 1
+        return projectile
+
+    def release(self, projectile: Projectile) -> None:
+        """
+        Return a spent projectile to the pool (no-op if already released).
+
+        Args:
+            projectile: Projectile that hit something or left the map
+        """
+        if not projectile.active:
+            return
+        projectile.active = False
+        if len(self._free) < self.max_free:
+            self._free.append(projectile)
+
+    def release_all(self, projectiles: List[Projectile]) -> None:
+        """
+        Release every projectile in a list and empty it in place.
+
+        Args:
+            projectiles: Live projectile list (cleared after release)
+        """
+        for projectile in projectiles:
+            self.release(projectile)
+        projectiles.clear()
+
+    @property
+    def free_count(self) -> int:
+        """Number of idle projectiles ready for reuse."""
+        return len(self._free)
@@ -19,6 +19,7 @@ import pygame
 
 from genre_controller import GenreController, GenreControllerFactory, InputState
 from models import GenreType, Vector2
+from text_cache import TEXT_CACHE
 
 logger = logging.getLogger(__name__)
 
@@ -744,9 +745,9 @@ class RacingController(GenreController):
 
             # === NAME LABEL ===
             if s > 0.2:
-                font = pygame.font.Font(None, max(16, int(24 * s)))
+                font = self._get_font(max(16, int(24 * s)))
                 name = racer.zombie.identity_name[:12]
-                label = font.render(name, True, (255, 255, 255))
+                label = TEXT_CACHE.render(name, font, (255, 255, 255))
                 label_bg = pygame.Surface((label.get_width() + 4, label.get_height() + 2))
                 label_bg.fill((0, 0, 0))
                 label_bg.set_alpha(150)
@@ -0,0 +1,323 @@
+"""Background encoders that stream screen recordings to disk frame by frame."""
+
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import GifImagePlugin, Image, ImageChops
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Optional: NumPy finds the changed rectangle between GIF frames quickly
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import cv2
+
+    CV2_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    CV2_AVAILABLE = False
+
+# Layout of submitted frames. RGBX matches the screen's 32-bit pixels, so
+# pygame.image.tobytes() is a straight copy (~10x faster than packing RGB)
+FRAME_FORMAT = "RGBX"
+
+# Raw frames waiting for the encoder (about 30 MB at 1280x720); frames that
+# arrive while the queue is full are dropped rather than stalling the game
+QUEUE_FRAMES = 8
+
+# Downscale factor of the sample a GIF frame's palette is built from; the full
+# region is then mapped onto it, which is ~3x faster than quantizing it whole
+PALETTE_SAMPLE_REDUCTION = 4
+
+# Colour bits of a FRAME_FORMAT pixel read as a native uint32 (X is the last byte)
+_RGB_MASK = 0x00FFFFFF if sys.byteorder == "little" else 0xFFFFFF00
+
+# Seconds the worker waits for a frame before checking whether it was closed
+_POLL_INTERVAL = 0.1
+
+
+class RecordingEncoder(ABC):
+    """
+    Encodes raw frames on a worker thread, writing each one as it arrives.
+
+    The game thread hands over frames with submit(), which never blocks, and
+    finishes a clip with close(), which also returns immediately; the worker
+    drains the queue, finalizes the file and exits. Only QUEUE_FRAMES raw
+    frames plus whatever the format needs to compare against are ever held,
+    so memory stays flat however long the clip is.
+    """
+
+    extension = ""
+
+    def __init__(self, base_path: str, size: Tuple[int, int], fps: int):
+        """
+        Start the encoder thread.
+
+        Args:
+            base_path: Output path without extension
+            size: Frame size in pixels
+            fps: Frames per second the frames were captured at
+        """
+        self.path = f"{base_path}.{self.extension}" if self.extension else f"{base_path}/"
+        self.size = size
+        self.fps = fps
+
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.error: Optional[Exception] = None
+
+        self._queue: "queue.Queue[bytes]" = queue.Queue(maxsize=QUEUE_FRAMES)
+        self._closing = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"recording-{self.extension or 'png'}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def done(self) -> bool:
+        """True once the file is complete (or encoding failed)."""
+        return self._done.is_set()
+
+    def submit(self, frame: bytes) -> bool:
+        """
+        Queue one frame (never blocks).
+
+        Args:
+            frame: Raw FRAME_FORMAT bytes of a frame of self.size
+
+        Returns:
+            True if queued, False if dropped because the encoder is behind or closed
+        """
+        if self._closing.is_set() or self.error is not None:
+            return False
+        try:
+            self._queue.put_nowait(frame)
+            return True
+        except queue.Full:
+            self.frames_dropped += 1
+            return False
+
+    def close(self) -> None:
+        """Finish the clip once the queued frames are written (never blocks)."""
+        self._closing.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the file is complete.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if encoding finished within the timeout
+        """
+        return self._done.wait(timeout)
+
+    def _run(self) -> None:
+        """Worker loop: open, write frames until closed and drained, then finalize."""
+        started = time.perf_counter()
+        try:
+            self._open()
+            while not (self._closing.is_set() and self._queue.empty()):
+                try:
+                    frame = self._queue.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                self._write(frame)
+                self.frames_written += 1
+            self._finish()
+            logger.info(
+                f"🎬 Recording saved: {self.path} ({self.frames_written} frames, "
+                f"{self.frames_dropped} dropped, finalized in "
+                f"{time.perf_counter() - started:.1f}s)"
+            )
+        except Exception as e:
+            self.error = e
+            logger.error(f"❌ Recording encode failed for {self.path}: {e}")
+        finally:
+            self._done.set()
+
+    def _open(self) -> None:
+        """Prepare the output (runs on the worker thread)."""
+
+    @abstractmethod
+    def _write(self, frame: bytes) -> None:
+        """Encode and write one frame (runs on the worker thread)."""
+
+    def _finish(self) -> None:
+        """Flush and close the output (runs on the worker thread)."""
+
+
+class GifEncoder(RecordingEncoder):
+    """
+    Animated GIF written incrementally with delta frames.
+
+    Each frame is compared with the previous one and only the rectangle that
+    changed is quantized (with its own 256-color palette) and written at its
+    offset; unchanged frames extend the previous frame's delay instead of
+    adding a new one. Frames are written one step behind so their delay is
+    known when the frame header goes out.
+    """
+
+    extension = "gif"
+
+    def _open(self) -> None:
+        """Write the GIF header and the loop-forever extension."""
+        width, height = self.size
+        self._file = open(self.path, "wb")
+        self._file.write(
+            b"GIF89a"
+            + width.to_bytes(2, "little")
+            + height.to_bytes(2, "little")
+            + b"\x00\x00\x00"  # No global color table; every frame has its own
+            + b"!\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00"
+        )
+        self._previous: Optional[bytes] = None
+        # (quantized image, offset, delay in ms) waiting for its final delay
+        self._pending: Optional[Tuple["Image.Image", Tuple[int, int], float]] = None
+        self._frame_ms = 1000 / self.fps
+
+    def _write(self, frame: bytes) -> None:
+        """Queue the changed region of a frame, writing the previously pending one."""
+        if frame == self._previous:
+            # Nothing changed: hold the previous frame on screen longer
+            quantized, offset, delay = self._pending
+            self._pending = (quantized, offset, delay + self._frame_ms)
+            return
+
+        box = (0, 0) + self.size if self._previous is None else self._changed_box(frame)
+        self._previous = frame
+        self._flush_pending()
+
+        image = Image.frombytes("RGB", self.size, frame, "raw", FRAME_FORMAT)
+        region = image.crop(box)
+        sample = region
+        if min(region.size) >= 16 * PALETTE_SAMPLE_REDUCTION:
+            sample = region.reduce(PALETTE_SAMPLE_REDUCTION)
+        palette = sample.quantize(256, method=Image.Quantize.FASTOCTREE)
+        quantized = region.quantize(palette=palette, dither=Image.Dither.NONE)
+        self._pending = (quantized, box[:2], self._frame_ms)
+
+    def _changed_box(self, frame: bytes) -> Tuple[int, int, int, int]:
+        """Bounding box of the pixels that differ from the previous frame."""
+        width, height = self.size
+        if NUMPY_AVAILABLE:
+            changed = np.frombuffer(frame, np.uint32) ^ np.frombuffer(self._previous, np.uint32)
+            changed = (changed & _RGB_MASK).reshape(height, width) != 0
+            rows = np.flatnonzero(changed.any(axis=1))
+            cols = np.flatnonzero(changed.any(axis=0))
+            if not rows.size:
+                # The frames differ only in the padding byte
+                return (0, 0, 1, 1)
+            return (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+
+        current, previous = (
+            Image.frombytes("RGB", self.size, data, "raw", FRAME_FORMAT)
+            for data in (frame, self._previous)
+        )
+        # The frames differ, but possibly only in the padding byte
+        return ImageChops.difference(current, previous).getbbox() or (0, 0, 1, 1)
+
+    def _flush_pending(self) -> None:
+        """Write the pending frame with its accumulated delay."""
+        if self._pending is None:
+            return
+        quantized, offset, delay = self._pending
+        for chunk in GifImagePlugin.getdata(
+            quantized,
+            offset=offset,
+            duration=delay,
+            disposal=1,  # Leave the frame in place; the next delta draws over it
+            include_color_table=True,
+        ):
+            self._file.write(chunk)
+        self._pending = None
+
+    def _finish(self) -> None:
+        """Write the last frame and the GIF trailer."""
+        try:
+            self._flush_pending()
+            self._file.write(b";")
+        finally:
+            self._file.close()
+
+
+class Mp4Encoder(RecordingEncoder):
+    """MP4 (MPEG-4 Part 2) video written through OpenCV's VideoWriter."""
+
+    extension = "mp4"
+
+    def _open(self) -> None:
+        """Open the video writer."""
+        self._writer = cv2.VideoWriter(
+            self.path, cv2.VideoWriter_fourcc(*"mp4v"), self.fps, self.size
+        )
+        if not self._writer.isOpened():
+            raise RuntimeError("OpenCV could not open an mp4v video writer")
+
+    def _write(self, frame: bytes) -> None:
+        """Convert one RGBX frame to BGR and append it to the video."""
+        width, height = self.size
+        rgbx = np.frombuffer(frame, dtype=np.uint8).reshape(height, width, 4)
+        self._writer.write(cv2.cvtColor(rgbx, cv2.COLOR_RGBA2BGR))
+
+    def _finish(self) -> None:
+        """Finalize the video container."""
+        self._writer.release()
+
+
+class PngSequenceEncoder(RecordingEncoder):
+    """Fallback without Pillow: numbered PNGs in a folder, saved as they arrive."""
+
+    def _open(self) -> None:
+        """Create the frame folder."""
+        os.makedirs(self.path, exist_ok=True)
+
+    def _write(self, frame: bytes) -> None:
+        """Save one frame as a PNG."""
+        surface = pygame.image.frombuffer(frame, self.size, FRAME_FORMAT)
+        pygame.image.save(surface, os.path.join(self.path, f"frame_{self.frames_written:04d}.png"))
+
+
+def create_encoder(
+    recording_format: str, base_path: str, size: Tuple[int, int], fps: int
+) -> RecordingEncoder:
+    """
+    Start the best available encoder for a format.
+
+    Args:
+        recording_format: "gif" or "mp4"
+        base_path: Output path without extension
+        size: Frame size in pixels
+        fps: Capture frame rate
+
+    Returns:
+        A running encoder (MP4 falls back to GIF without OpenCV, GIF to PNGs without Pillow)
+    """
+    if recording_format == "mp4" and CV2_AVAILABLE:
+        return Mp4Encoder(base_path, size, fps)
+    if recording_format == "mp4":
+        logger.warning("⚠️ OpenCV not installed, recording GIF instead of MP4")
+    if PIL_AVAILABLE:
+        return GifEncoder(base_path, size, fps)
+    logger.warning("⚠️ Pillow not installed, saving frames as PNGs")
+    return PngSequenceEncoder(base_path, size, fps)
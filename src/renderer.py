@@ -2,21 +2,41 @@
 
 import logging
 import math
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
 
 import pygame
 
 from boss import Boss
 from collectible import Collectible
 from door import Door
+from frame_profiler import FRAME, FrameProfiler
 from game_map import GameMap
 from models import GameState, GameStatus, QuestStatus, Vector2
+from particle_system import build_alpha_stamps
 from player import Player
 from projectile import Projectile
+from text_cache import TEXT_CACHE
 from zombie import Zombie
 
 logger = logging.getLogger(__name__)
 
+# Message/menu panels kept composited (pause, game over, arcade results, ...)
+PANEL_CACHE_SIZE = 16
+
+# Landing zone view sprites kept scaled, per sprite variant and zoom step
+ZOOMED_SPRITE_CACHE_SIZE = 64
+
+# Frames between rebuilds of the profiler overlay (its numbers change every frame)
+PROFILER_OVERLAY_REFRESH = 10
+
+# Frame time at the top of the profiler graph, and the 60 FPS budget line
+PROFILER_GRAPH_MAX_MS = 33.3
+PROFILER_BUDGET_MS = 1000 / 60
+
+# Space kept below the photo booth preview for the "INSERT COIN" prompt
+PHOTO_BOOTH_SUMMARY_FOOTER = 80
+
 
 class Renderer:
     """Manages all visual output using Pygame."""
@@ -52,6 +72,22 @@ class Renderer:
         # Background scroll offset
         self.scroll_offset = 0
 
+        # Composited message/menu panels keyed by (style, message) - see _get_panel
+        self._panel_cache: "OrderedDict[Tuple[str, str], pygame.Surface]" = OrderedDict()
+        self._panel_overlay: Optional[pygame.Surface] = None
+
+        # Frame profiler overlay and the profiler frame it was built at
+        self._profiler_panel: Optional[pygame.Surface] = None
+        self._profiler_panel_frame = -1
+
+        # Landing zone view sprites scaled per zoom step: (sprite key, w, h) -> scaled
+        self._zoomed_sprites: "OrderedDict[Tuple[Hashable, int, int], pygame.Surface]" = (
+            OrderedDict()
+        )
+
+        # Tear puddle stamps per radius, one per opacity level - see _get_puddle_stamps
+        self._puddle_stamps: Dict[int, List[pygame.Surface]] = {}
+
         # Colors
         self.bg_color = (40, 40, 40)
         self.grid_color = (60, 60, 60)
@@ -89,6 +125,41 @@ class Renderer:
         flash_surface.fill((255, 255, 255, 128))
         self.screen.blit(flash_surface, (x, y), special_flags=pygame.BLEND_RGBA_ADD)
 
+    def _get_zoomed_sprite(
+        self,
+        sprite_key: Hashable,
+        sprite: pygame.Surface,
+        width: int,
+        height: int,
+        zoom: float,
+    ) -> pygame.Surface:
+        """
+        Get a sprite scaled for the landing zone view, scaling it once per zoom step.
+
+        Args:
+            sprite_key: Stable name of the sprite variant (entity sprite_key);
+                entities sharing a key must draw identical sprites
+            sprite: Native-size sprite, scaled on a cache miss
+            width: Entity width
+            height: Entity height
+            zoom: Quantized zoom (GameMap.display_zoom)
+
+        Returns:
+            Cached scaled sprite - callers must not draw onto it
+        """
+        size = (max(1, int(width * zoom)), max(1, int(height * zoom)))
+        key = (sprite_key, size[0], size[1])
+        scaled = self._zoomed_sprites.get(key)
+        if scaled is not None:
+            self._zoomed_sprites.move_to_end(key)
+            return scaled
+
+        scaled = pygame.transform.scale(sprite, size)
+        self._zoomed_sprites[key] = scaled
+        if len(self._zoomed_sprites) > ZOOMED_SPRITE_CACHE_SIZE:
+            self._zoomed_sprites.popitem(last=False)
+        return scaled
+
     def render_background(self, game_map: Optional[GameMap] = None) -> None:
         """
         Render the background (map or grid).
@@ -206,9 +277,13 @@ class Renderer:
 
             # Scale sprite if in landing zone view (zoomed out)
             if game_map.landing_zone_view and game_map.zoom < 1.0:
-                scaled_width = max(1, int(player.width * game_map.zoom))
-                scaled_height = max(1, int(player.height * game_map.zoom))
-                scaled_sprite = pygame.transform.scale(player.sprite, (scaled_width, scaled_height))
+                scaled_sprite = self._get_zoomed_sprite(
+                    player.sprite_key,
+                    player.sprite,
+                    player.width,
+                    player.height,
+                    game_map.display_zoom,
+                )
                 self.screen.blit(scaled_sprite, (screen_x, screen_y))
             else:
                 self.screen.blit(player.sprite, (screen_x, screen_y))
@@ -239,35 +314,20 @@ class Renderer:
                         zombie.position.x, zombie.position.y
                     )
 
-                    # Scale sprite if in landing zone view (zoomed out)
+                    # Pre-scaled (landing zone view) and flash sprites come from the shared atlas
                     if game_map.landing_zone_view and game_map.zoom < 1.0:
-                        scaled_width = max(1, int(zombie.width * game_map.zoom))
-                        scaled_height = max(1, int(zombie.height * game_map.zoom))
-                        scaled_sprite = pygame.transform.scale(
-                            zombie.sprite, (scaled_width, scaled_height)
-                        )
-                        self.screen.blit(scaled_sprite, (screen_x, screen_y))
+                        sprite = zombie.get_sprite(game_map.display_zoom)
                     else:
-                        self.screen.blit(zombie.sprite, (screen_x, screen_y))
-
-                    if zombie.is_flashing:
-                        self._apply_flash_effect(screen_x, screen_y, zombie.width, zombie.height)
+                        sprite = zombie.get_sprite()
+                    self.screen.blit(sprite, (screen_x, screen_y))
 
                     rendered_count += 1
             else:
                 # Classic mode: only render zombies that are on or near the screen
                 if -100 < zombie.position.x < self.width + 100:
-                    # Apply flash effect if active
                     self.screen.blit(
-                        zombie.sprite, (int(zombie.position.x), int(zombie.position.y))
+                        zombie.get_sprite(), (int(zombie.position.x), int(zombie.position.y))
                     )
-                    if zombie.is_flashing:
-                        self._apply_flash_effect(
-                            int(zombie.position.x),
-                            int(zombie.position.y),
-                            zombie.width,
-                            zombie.height,
-                        )
                     rendered_count += 1
 
         # Debug log only once at start
@@ -299,10 +359,12 @@ class Renderer:
 
                     # Scale sprite if in landing zone view (zoomed out)
                     if game_map.landing_zone_view and game_map.zoom < 1.0:
-                        scaled_width = max(1, int(third_party.width * game_map.zoom))
-                        scaled_height = max(1, int(third_party.height * game_map.zoom))
-                        scaled_sprite = pygame.transform.scale(
-                            third_party.sprite, (scaled_width, scaled_height)
+                        scaled_sprite = self._get_zoomed_sprite(
+                            third_party.sprite_key,
+                            third_party.sprite,
+                            third_party.width,
+                            third_party.height,
+                            game_map.display_zoom,
                         )
                         self.screen.blit(scaled_sprite, (screen_x, screen_y))
                     else:
@@ -632,19 +694,14 @@ class Renderer:
                     # Fallback: show part of the name
                     label_text = zombie.identity_name[:8]
 
-                label_surface = self.label_font.render(label_text, True, (255, 255, 255))
+                # White label with a black outline for readability (cached, one blit)
+                label_surface = TEXT_CACHE.render(
+                    label_text, self.label_font, (255, 255, 255), outline_color=(0, 0, 0)
+                )
 
-                # Position above the zombie
+                # Position above the zombie (the outline adds a 1px border)
                 label_x = int(screen_x + zombie.width // 2 - label_surface.get_width() // 2)
-                label_y = int(screen_y - 20)
-
-                # Draw black outline for readability
-                outline_offsets = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-                for dx, dy in outline_offsets:
-                    outline_surface = self.label_font.render(label_text, True, (0, 0, 0))
-                    self.screen.blit(outline_surface, (label_x + dx, label_y + dy))
-
-                # Draw the label
+                label_y = int(screen_y - 20) - 1
                 self.screen.blit(label_surface, (label_x, label_y))
 
     def render_third_party_labels(
@@ -684,21 +741,14 @@ class Renderer:
                 # Render 3rd party name (e.g., "nOps", "CrowdStrike")
                 label_text = third_party.name
 
-                label_surface = self.label_font.render(
-                    label_text, True, (255, 215, 0)  # Gold color for 3rd parties
+                # Gold label with a black outline for readability (cached, one blit)
+                label_surface = TEXT_CACHE.render(
+                    label_text, self.label_font, (255, 215, 0), outline_color=(0, 0, 0)
                 )
 
-                # Position above the 3rd party
+                # Position above the 3rd party (the outline adds a 1px border)
                 label_x = int(screen_x + third_party.width // 2 - label_surface.get_width() // 2)
-                label_y = int(screen_y - 20)
-
-                # Draw black outline for readability
-                outline_offsets = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-                for dx, dy in outline_offsets:
-                    outline_surface = self.label_font.render(label_text, True, (0, 0, 0))
-                    self.screen.blit(outline_surface, (label_x + dx, label_y + dy))
-
-                # Draw the label
+                label_y = int(screen_y - 20) - 1
                 self.screen.blit(label_surface, (label_x, label_y))
 
     def render_shield(
@@ -1015,22 +1065,10 @@ class Renderer:
         self, boss: "HeartbleedBoss", screen_x: int, screen_y: int
     ) -> None:
         """Render the bleeding data particles."""
-        for particle in boss.bleeding_particles:
-            # Calculate particle screen position (relative to boss)
-            particle_x = int(particle["x"] - boss.position.x + screen_x)
-            particle_y = int(particle["y"] - boss.position.y + screen_y)
-
-            # Draw bleeding particle (red droplet)
-            particle_color = (220, 20, 20, particle["alpha"])
-            particle_surface = pygame.Surface((6, 8), pygame.SRCALPHA)
-
-            # Draw teardrop/blood drop shape
-            # Top circle
-            pygame.draw.circle(particle_surface, particle_color, (3, 2), 2)
-            # Bottom point
-            pygame.draw.polygon(particle_surface, particle_color, [(1, 3), (5, 3), (3, 7)])
-
-            self.screen.blit(particle_surface, (particle_x - 3, particle_y - 4))
+        # Particles live in world space; draw them relative to the boss sprite
+        boss.bleeding_particles.draw(
+            self.screen, boss.position.x - screen_x, boss.position.y - screen_y
+        )
 
     def _render_card_flip_effect(
         self, boss: "HeartbleedBoss", screen_x: int, screen_y: int
@@ -1146,29 +1184,12 @@ class Renderer:
         game_map: Optional[GameMap],
     ) -> None:
         """Render falling tear droplets."""
-        for tear in boss.tear_particles:
-            # Calculate screen position
-            if game_map:
-                tear_screen_x, tear_screen_y = game_map.world_to_screen(tear["x"], tear["y"])
-            else:
-                tear_screen_x = int(tear["x"])
-                tear_screen_y = int(tear["y"])
-
-            # Create teardrop sprite
-            tear_surface = pygame.Surface((8, 10), pygame.SRCALPHA)
-            tear_color = (135, 206, 235, tear["alpha"])  # Sky blue with fade
-
-            # Teardrop shape
-            # Top circle
-            pygame.draw.circle(tear_surface, tear_color, (4, 3), 3)
-            # Bottom point
-            pygame.draw.polygon(tear_surface, tear_color, [(2, 4), (6, 4), (4, 9)])
-
-            # Add highlight (makes it look wet)
-            highlight = (224, 255, 255, min(255, tear["alpha"] + 50))
-            pygame.draw.circle(tear_surface, highlight, (3, 2), 1)
-
-            self.screen.blit(tear_surface, (tear_screen_x - 4, tear_screen_y - 5))
+        if game_map:
+            boss.tear_particles.draw(
+                self.screen, game_map.camera_x, game_map.camera_y, game_map.display_zoom
+            )
+        else:
+            boss.tear_particles.draw(self.screen)
 
     def _render_tear_puddles(
         self,
@@ -1179,6 +1200,9 @@ class Renderer:
     ) -> None:
         """Render tear puddles on the ground."""
         for puddle in boss.puddles:
+            if puddle["alpha"] <= 0:
+                continue
+
             # Calculate screen position
             if game_map:
                 puddle_screen_x, puddle_screen_y = game_map.world_to_screen(
@@ -1188,31 +1212,52 @@ class Renderer:
                 puddle_screen_x = int(puddle["x"])
                 puddle_screen_y = int(puddle["y"])
 
-            # Create puddle oval
-            puddle_width = puddle["radius"] * 2
-            puddle_height = int(puddle["radius"] * 0.6)  # Squashed oval (perspective)
+            stamps = self._get_puddle_stamps(puddle["radius"])
+            level = min(len(stamps) - 1, puddle["alpha"] * len(stamps) // 256)
+            stamp = stamps[level]
+            self.screen.blit(
+                stamp,
+                (
+                    puddle_screen_x - puddle["radius"],
+                    puddle_screen_y - stamp.get_height() // 2,
+                ),
+            )
 
+    def _get_puddle_stamps(self, radius: int) -> List[pygame.Surface]:
+        """
+        Get the pre-rendered stamps for a tear puddle, one per opacity level.
+
+        Puddles fade out over their lifetime, so they are drawn like particles:
+        the oval is rendered once per radius and faded with build_alpha_stamps
+        instead of building a fresh SRCALPHA surface per puddle per frame.
+
+        Args:
+            radius: Puddle radius in pixels
+
+        Returns:
+            Stamps ordered from faintest to fully opaque
+        """
+        stamps = self._puddle_stamps.get(radius)
+        if stamps is None:
+            puddle_width = radius * 2
+            puddle_height = int(radius * 0.6)  # Squashed oval (perspective)
             puddle_surface = pygame.Surface((puddle_width, puddle_height), pygame.SRCALPHA)
 
             # Puddle base (dark blue)
-            puddle_color = (30, 144, 255, puddle["alpha"])
-            pygame.draw.ellipse(puddle_surface, puddle_color, (0, 0, puddle_width, puddle_height))
+            pygame.draw.ellipse(
+                puddle_surface, (30, 144, 255, 255), (0, 0, puddle_width, puddle_height)
+            )
 
             # Puddle highlight (light blue, makes it look wet)
-            highlight_color = (135, 206, 235, int(puddle["alpha"] * 0.6))
             pygame.draw.ellipse(
                 puddle_surface,
-                highlight_color,
+                (135, 206, 235, int(255 * 0.6)),
                 (2, 2, puddle_width - 8, puddle_height - 4),
             )
 
-            self.screen.blit(
-                puddle_surface,
-                (
-                    puddle_screen_x - puddle["radius"],
-                    puddle_screen_y - puddle_height // 2,
-                ),
-            )
+            stamps = build_alpha_stamps(puddle_surface)
+            self._puddle_stamps[radius] = stamps
+        return stamps
 
     def _render_sob_wave(
         self,
@@ -1476,6 +1521,9 @@ class Renderer:
         if player:
             self._render_player_health(player)
 
+        # Background quarantine/block calls still syncing with Sonrai
+        self._render_api_activity(game_state)
+
         # Check if photo booth consent is active
         if getattr(game_state, "photo_booth_consent_active", False):
             self._render_photo_booth_consent(game_state)
@@ -1509,6 +1557,103 @@ class Renderer:
         if game_state.status == GameStatus.VICTORY:
             self._render_victory_screen(game_state)
 
+    def _render_api_activity(self, game_state: GameState) -> None:
+        """
+        Render a small indicator while quarantine/block or quest API calls are pending.
+
+        Args:
+            game_state: Current game state (api_calls_in_flight / api_calls_queued /
+                quest_calls_pending)
+        """
+        in_flight = getattr(game_state, "api_calls_in_flight", 0)
+        queued = getattr(game_state, "api_calls_queued", 0)
+        quest_calls = getattr(game_state, "quest_calls_pending", None) or []
+
+        lines = [f"{label}..." for label in quest_calls]
+        if in_flight or queued:
+            text = f"Syncing with Sonrai: {in_flight} running"
+            if queued:
+                text += f", {queued} queued"
+            lines.append(text)
+
+        y = self.height - 10
+        for text in reversed(lines):
+            surface = TEXT_CACHE.render(
+                text, self.message_font, (180, 180, 255), outline_color=(0, 0, 0)
+            )
+            y -= surface.get_height()
+            self.screen.blit(surface, (10, y))
+
+    def render_profiler_overlay(self, profiler: FrameProfiler) -> None:
+        """
+        Render the frame profiler: a rolling frame-time graph and per-section percentiles.
+
+        The panel is rebuilt every PROFILER_OVERLAY_REFRESH frames rather than
+        every frame, so the overlay costs one blit most of the time and its
+        ever-changing numbers stay out of TEXT_CACHE.
+
+        Args:
+            profiler: Profiler whose rolling window is shown
+        """
+        if profiler.frames == 0:
+            return
+        if (
+            self._profiler_panel is None
+            or profiler.frames - self._profiler_panel_frame >= PROFILER_OVERLAY_REFRESH
+            or profiler.frames < self._profiler_panel_frame
+        ):
+            self._profiler_panel = self._build_profiler_panel(profiler)
+            self._profiler_panel_frame = profiler.frames
+
+        x = self.width - self._profiler_panel.get_width() - 10
+        self.screen.blit(self._profiler_panel, (x, 10))
+
+    def _build_profiler_panel(self, profiler: FrameProfiler) -> pygame.Surface:
+        """Compose the profiler overlay panel from the profiler's rolling window."""
+        padding = 6
+        graph_width = profiler.window
+        graph_height = 60
+        line_height = self.small_font.get_linesize()
+        sections = profiler.sections()
+
+        width = graph_width + padding * 2
+        height = padding * 3 + graph_height + line_height * (len(sections) + 1)
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+
+        # Frame-time bars, newest on the right; red once over the 60 FPS budget
+        graph_bottom = padding + graph_height
+        scale = graph_height / PROFILER_GRAPH_MAX_MS
+        frame_times = profiler.frame_times()
+        start_x = padding + graph_width - len(frame_times)
+        for i, seconds in enumerate(frame_times):
+            ms = seconds * 1000
+            bar = min(graph_height, max(1, int(ms * scale)))
+            color = (255, 80, 80) if ms > PROFILER_BUDGET_MS else (80, 220, 120)
+            pygame.draw.line(
+                panel, color, (start_x + i, graph_bottom), (start_x + i, graph_bottom - bar)
+            )
+        budget_y = graph_bottom - int(PROFILER_BUDGET_MS * scale)
+        pygame.draw.line(
+            panel, (255, 255, 0), (padding, budget_y), (padding + graph_width, budget_y)
+        )
+
+        # Section table; the font is proportional, so numbers are right-aligned per column
+        column_right = [width - padding - 50 * i for i in (2, 1, 0)]
+        rows = [("ms", ("p50", "p95", "p99"), (180, 180, 180))]
+        for name in sections:
+            color = (255, 255, 255) if name == FRAME else (200, 200, 200)
+            rows.append((name, tuple(f"{ms:.2f}" for ms in profiler.stats(name)), color))
+
+        y = graph_bottom + padding
+        for name, cells, color in rows:
+            panel.blit(self.small_font.render(name, True, color), (padding, y))
+            for right, cell in zip(column_right, cells):
+                surface = self.small_font.render(cell, True, color)
+                panel.blit(surface, (right - surface.get_width(), y))
+            y += line_height
+        return panel
+
     def _render_arcade_ui(self, arcade_state, player: "Player" = None) -> None:
         """
         Render arcade mode UI overlay.
@@ -1757,37 +1902,39 @@ class Renderer:
         timeout_x = box_x + (box_width - timeout_surface.get_width()) // 2
         self.screen.blit(timeout_surface, (timeout_x, box_y + 280))
 
-    def render_photo_booth_summary(self, image_path: str) -> None:
+    @property
+    def photo_booth_preview_size(self) -> Tuple[int, int]:
+        """Largest photo booth preview that fits the summary screen."""
+        return (self.width, self.height - PHOTO_BOOTH_SUMMARY_FOOTER)
+
+    def render_photo_booth_summary(
+        self, preview: Optional[pygame.Surface], progress: float = 1.0
+    ) -> None:
         """
-        Render the photo booth summary screen with the composite image.
+        Render the photo booth summary screen with the composite preview.
 
-        Displays the generated photo booth composite full-screen with
-        "INSERT COIN TO CONTINUE" prompt.
+        Displays the photo booth composite full-screen with "INSERT COIN TO
+        CONTINUE" prompt, or a progress bar while it is still being built.
 
         Args:
-            image_path: Path to the generated photo booth composite image
+            preview: Composite scaled to photo_booth_preview_size (None while
+                the composite is still being generated)
+            progress: Fraction of the composite pipeline finished (0.0 to 1.0)
         """
         # Fill background with dark purple
         self.screen.fill((20, 10, 30))
 
-        try:
-            # Load and scale the composite image to fit screen
-            composite_surface = pygame.image.load(image_path)
-            comp_width, comp_height = composite_surface.get_size()
-
-            # Calculate scaling to fit screen while maintaining aspect ratio
-            # Leave some margin for the "INSERT COIN" text at bottom
-            available_height = self.height - 80
-            scale_w = self.width / comp_width
-            scale_h = available_height / comp_height
-            scale = min(scale_w, scale_h, 1.0)  # Don't upscale
-
-            # Scale the image
-            new_width = int(comp_width * scale)
-            new_height = int(comp_height * scale)
-            scaled_surface = pygame.transform.smoothscale(
-                composite_surface, (new_width, new_height)
-            )
+        available_height = self.height - PHOTO_BOOTH_SUMMARY_FOOTER
+        if preview is not None:
+            comp_width, comp_height = preview.get_size()
+
+            # Only rescale if the window changed size since the preview was made
+            scale = min(self.width / comp_width, available_height / comp_height, 1.0)
+            if scale < 1.0:
+                preview = pygame.transform.smoothscale(
+                    preview, (int(comp_width * scale), int(comp_height * scale))
+                )
+            new_width, new_height = preview.get_size()
 
             # Center the image
             img_x = (self.width - new_width) // 2
@@ -1798,17 +1945,25 @@ class Renderer:
             pygame.draw.rect(self.screen, (138, 43, 226), border_rect, 4)
 
             # Blit the composite image
-            self.screen.blit(scaled_surface, (img_x, img_y))
-
-        except Exception as e:
-            # If image fails to load, show error message
-            logger.error(f"Failed to load photo booth image: {e}")
-            error_font = pygame.font.SysFont(None, 36)
-            error_text = "Photo booth image unavailable"
-            error_surface = error_font.render(error_text, True, (255, 100, 100))
-            error_x = (self.width - error_surface.get_width()) // 2
-            error_y = self.height // 2 - 50
-            self.screen.blit(error_surface, (error_x, error_y))
+            self.screen.blit(preview, (img_x, img_y))
+        else:
+            # Composite still being generated: show its progress
+            status = TEXT_CACHE.render("DEVELOPING YOUR PHOTO...", self.ui_font, (255, 215, 0))
+            center_x = self.width // 2
+            center_y = available_height // 2
+            self.screen.blit(status, status.get_rect(center=(center_x, center_y - 30)))
+
+            bar_width = min(400, self.width - 80)
+            bar_rect = pygame.Rect(center_x - bar_width // 2, center_y, bar_width, 20)
+            fill_width = int((bar_rect.width - 4) * max(0.0, min(1.0, progress)))
+            pygame.draw.rect(self.screen, (40, 20, 60), bar_rect)
+            if fill_width > 0:
+                pygame.draw.rect(
+                    self.screen,
+                    (138, 43, 226),
+                    (bar_rect.x + 2, bar_rect.y + 2, fill_width, bar_rect.height - 4),
+                )
+            pygame.draw.rect(self.screen, (255, 215, 0), bar_rect, 2)
 
         # "INSERT COIN TO CONTINUE" text at bottom
         insert_font = pygame.font.SysFont(None, 42)
@@ -1864,6 +2019,37 @@ class Renderer:
         time_y = stats_y + 40
         self.screen.blit(time_surface, (time_x, time_y))
 
+    def render_loading_screen(self, progress: float, status: str) -> None:
+        """
+        Render the startup progress screen shown while Sonrai data loads.
+
+        Args:
+            progress: Fraction of startup tasks finished (0.0 to 1.0)
+            status: What is currently loading
+        """
+        self.screen.fill((0, 0, 0))
+        center_x = self.width // 2
+        center_y = self.height // 2
+
+        title = TEXT_CACHE.render("SONRAI ZOMBIE BLASTER", self.victory_font, (0, 255, 0))
+        self.screen.blit(title, title.get_rect(center=(center_x, center_y - 80)))
+
+        # Progress bar
+        bar_width = min(500, self.width - 80)
+        bar_rect = pygame.Rect(center_x - bar_width // 2, center_y - 12, bar_width, 24)
+        fill_width = int((bar_rect.width - 4) * max(0.0, min(1.0, progress)))
+        pygame.draw.rect(self.screen, (40, 40, 40), bar_rect)
+        if fill_width > 0:
+            pygame.draw.rect(
+                self.screen,
+                (0, 200, 0),
+                (bar_rect.x + 2, bar_rect.y + 2, fill_width, bar_rect.height - 4),
+            )
+        pygame.draw.rect(self.screen, (0, 255, 0), bar_rect, 2)
+
+        status_surface = TEXT_CACHE.render(status, self.message_font, (200, 200, 200))
+        self.screen.blit(status_surface, status_surface.get_rect(center=(center_x, center_y + 40)))
+
     def render_message_bubble(self, message: str) -> None:
         """
         Render a beautiful purple message bubble or menu.
@@ -1873,6 +2059,18 @@ class Renderer:
         Args:
             message: The message text to display
         """
+        self._blit_panel(self._get_panel("bubble", message, self._build_message_bubble))
+
+    def _build_message_bubble(self, message: str) -> pygame.Surface:
+        """
+        Build the panel for render_message_bubble (menu or plain message).
+
+        Args:
+            message: The message text to display
+
+        Returns:
+            Fully composited panel
+        """
         # Replace emojis with ASCII alternatives that render properly in pygame
         message = self._replace_emojis_with_ascii(message)
 
@@ -1880,10 +2078,58 @@ class Renderer:
         is_menu = "▶" in message or ("Return to Game" in message and "Quit Game" in message)
 
         if is_menu:
-            self._render_purple_menu(message)
-        else:
-            # Use purple theme for ALL messages (consistent UX)
-            self._render_purple_message(message)
+            return self._build_purple_menu(message)
+        # Use purple theme for ALL messages (consistent UX)
+        return self._build_purple_message(message)
+
+    def _get_panel(
+        self, style: str, message: str, build: Callable[[str], pygame.Surface]
+    ) -> pygame.Surface:
+        """
+        Get a composited panel, building it only when its text changes.
+
+        Menus mark the selected option with ▶ in the text itself, so the key
+        (style, message) also changes when the selection moves.
+
+        Args:
+            style: Panel style (which builder produced it)
+            message: Raw message text
+            build: Builder called on a cache miss
+
+        Returns:
+            Cached panel surface - callers must not draw onto it
+        """
+        key = (style, message)
+        panel = self._panel_cache.get(key)
+        if panel is not None:
+            self._panel_cache.move_to_end(key)
+            return panel
+
+        panel = build(message)
+        self._panel_cache[key] = panel
+        if len(self._panel_cache) > PANEL_CACHE_SIZE:
+            self._panel_cache.popitem(last=False)
+        return panel
+
+    def _blit_panel(self, panel: pygame.Surface) -> None:
+        """
+        Dim the screen and blit a panel centered on it.
+
+        Args:
+            panel: Panel from _get_panel
+        """
+        # Semi-transparent dark overlay, built once per screen size
+        if self._panel_overlay is None or self._panel_overlay.get_size() != (
+            self.width,
+            self.height,
+        ):
+            self._panel_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            self._panel_overlay.fill((0, 0, 0, 180))
+        self.screen.blit(self._panel_overlay, (0, 0))
+
+        panel_x = (self.width - panel.get_width()) // 2
+        panel_y = (self.height - panel.get_height()) // 2
+        self.screen.blit(panel, (panel_x, panel_y))
 
     def _replace_emojis_with_ascii(self, message: str) -> str:
         """
@@ -1970,12 +2216,15 @@ class Renderer:
 
         return message
 
-    def _render_purple_menu(self, message: str) -> None:
+    def _build_purple_menu(self, message: str) -> pygame.Surface:
         """
-        Render a beautiful purple vertical menu (Zelda-style).
+        Build a beautiful purple vertical menu (Zelda-style) panel.
 
         Args:
             message: Menu text with options
+
+        Returns:
+            Fully composited menu panel
         """
         # Purple color scheme
         PURPLE_DARK = (60, 40, 80)  # Dark purple background
@@ -2019,10 +2268,7 @@ class Renderer:
             elif not menu_lines:
                 title_lines.append(stripped)
 
-        # DEBUG: Print what we parsed
-        print(f"DEBUG MENU: title_lines={title_lines}")
-        print(f"DEBUG MENU: menu_lines={menu_lines}")
-        print(f"DEBUG MENU: footer_lines={footer_lines}")
+        logger.debug(f"Menu parsed: title={title_lines} items={menu_lines} footer={footer_lines}")
 
         # Menu dimensions
         menu_width = 400
@@ -2039,25 +2285,20 @@ class Renderer:
         footer_height = len(footer_lines) * 25 + 10 if footer_lines else 0
         total_height = logo_height + title_height + menu_height + footer_height + padding * 2
 
-        # Center on screen
-        menu_x = (self.width - menu_width) // 2
-        menu_y = (self.height - total_height) // 2
-
-        # Draw semi-transparent dark overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        # Panel is drawn once at its own origin and centered by _blit_panel
+        panel = pygame.Surface((menu_width, total_height))
+        menu_x, menu_y = 0, 0
 
         # Draw menu background (dark purple)
         menu_rect = pygame.Rect(menu_x, menu_y, menu_width, total_height)
-        pygame.draw.rect(self.screen, PURPLE_DARK, menu_rect)
+        pygame.draw.rect(panel, PURPLE_DARK, menu_rect)
 
         # Draw glowing border (light purple)
-        pygame.draw.rect(self.screen, PURPLE_LIGHT, menu_rect, 4)
+        pygame.draw.rect(panel, PURPLE_LIGHT, menu_rect, 4)
 
         # Inner glow effect
         inner_rect = pygame.Rect(menu_x + 4, menu_y + 4, menu_width - 8, total_height - 8)
-        pygame.draw.rect(self.screen, PURPLE_GLOW, inner_rect, 2)
+        pygame.draw.rect(panel, PURPLE_GLOW, inner_rect, 2)
 
         # Start rendering content
         current_y = menu_y + padding
@@ -2065,7 +2306,7 @@ class Renderer:
         # Render Sonrai logo at top (centered)
         if self.sonrai_logo:
             logo_x = menu_x + (menu_width - self.sonrai_logo.get_width()) // 2
-            self.screen.blit(self.sonrai_logo, (logo_x, current_y))
+            panel.blit(self.sonrai_logo, (logo_x, current_y))
             current_y += self.sonrai_logo.get_height() + 15
 
         # Render title
@@ -2073,7 +2314,7 @@ class Renderer:
             for title_line in title_lines:
                 title_surface = self.name_font.render(title_line, True, GOLD)
                 title_x = menu_x + (menu_width - title_surface.get_width()) // 2
-                self.screen.blit(title_surface, (title_x, current_y))
+                panel.blit(title_surface, (title_x, current_y))
                 current_y += 35
             current_y += 10
 
@@ -2091,21 +2332,21 @@ class Renderer:
                 highlight_rect = pygame.Rect(
                     menu_x + 20, current_y - 5, menu_width - 40, line_height - 10
                 )
-                pygame.draw.rect(self.screen, (100, 60, 140), highlight_rect)
-                pygame.draw.rect(self.screen, PURPLE_GLOW, highlight_rect, 2)
+                pygame.draw.rect(panel, (100, 60, 140), highlight_rect)
+                pygame.draw.rect(panel, PURPLE_GLOW, highlight_rect, 2)
             else:
                 text_color = WHITE
 
             # Render text
             text_surface = self.combo_font.render(display_text, True, text_color)
             text_x = menu_x + (menu_width - text_surface.get_width()) // 2
-            self.screen.blit(text_surface, (text_x, current_y))
+            panel.blit(text_surface, (text_x, current_y))
 
             # Draw arrow for selected item
             if is_selected:
                 arrow_surface = self.combo_font.render("▶", True, GOLD)
                 arrow_x = text_x - arrow_surface.get_width() - 10
-                self.screen.blit(arrow_surface, (arrow_x, current_y))
+                panel.blit(arrow_surface, (arrow_x, current_y))
 
             current_y += line_height
 
@@ -2115,9 +2356,11 @@ class Renderer:
             for footer_line in footer_lines:
                 footer_surface = self.small_font.render(footer_line, True, (180, 180, 180))
                 footer_x = menu_x + (menu_width - footer_surface.get_width()) // 2
-                self.screen.blit(footer_surface, (footer_x, current_y))
+                panel.blit(footer_surface, (footer_x, current_y))
                 current_y += 25
 
+        return panel
+
     def _wrap_text(self, text: str, font: pygame.font.Font, max_width: int) -> List[str]:
         """
         Word-wrap text to fit within a maximum width.
@@ -2136,9 +2379,9 @@ class Renderer:
 
         for word in words:
             test_line = " ".join(current_line + [word])
-            test_surface = font.render(test_line, True, (255, 255, 255))
 
-            if test_surface.get_width() <= max_width:
+            # Measure without rendering a surface
+            if font.size(test_line)[0] <= max_width:
                 current_line.append(word)
             else:
                 if current_line:
@@ -2154,11 +2397,23 @@ class Renderer:
         """
         Render a purple-themed message box (non-menu messages).
 
+        Args:
+            message: Message text to display
+        """
+        self._blit_panel(self._get_panel("message", message, self._build_purple_message))
+
+    def _build_purple_message(self, message: str) -> pygame.Surface:
+        """
+        Build a purple-themed message box panel (non-menu messages).
+
         Uses the same visual style as the pause menu for consistency.
         Text is word-wrapped to fit within the box.
 
         Args:
             message: Message text to display
+
+        Returns:
+            Fully composited message panel
         """
         # Purple color scheme (same as menu)
         PURPLE_DARK = (60, 40, 80)
@@ -2236,25 +2491,20 @@ class Renderer:
 
         total_height = logo_height + title_height + body_height + footer_height + padding * 2
 
-        # Center on screen
-        menu_x = (self.width - menu_width) // 2
-        menu_y = (self.height - total_height) // 2
-
-        # Draw semi-transparent dark overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        # Panel is drawn once at its own origin and centered by _blit_panel
+        panel = pygame.Surface((menu_width, total_height))
+        menu_x, menu_y = 0, 0
 
         # Draw message background (dark purple)
         menu_rect = pygame.Rect(menu_x, menu_y, menu_width, total_height)
-        pygame.draw.rect(self.screen, PURPLE_DARK, menu_rect)
+        pygame.draw.rect(panel, PURPLE_DARK, menu_rect)
 
         # Draw glowing border (light purple)
-        pygame.draw.rect(self.screen, PURPLE_LIGHT, menu_rect, 4)
+        pygame.draw.rect(panel, PURPLE_LIGHT, menu_rect, 4)
 
         # Inner glow effect
         inner_rect = pygame.Rect(menu_x + 4, menu_y + 4, menu_width - 8, total_height - 8)
-        pygame.draw.rect(self.screen, PURPLE_GLOW, inner_rect, 2)
+        pygame.draw.rect(panel, PURPLE_GLOW, inner_rect, 2)
 
         # Start rendering content
         current_y = menu_y + padding
@@ -2262,14 +2512,14 @@ class Renderer:
         # Render Sonrai logo at top (centered)
         if self.sonrai_logo:
             logo_x = menu_x + (menu_width - self.sonrai_logo.get_width()) // 2
-            self.screen.blit(self.sonrai_logo, (logo_x, current_y))
+            panel.blit(self.sonrai_logo, (logo_x, current_y))
             current_y += self.sonrai_logo.get_height() + 15
 
         # Render title (gold, centered)
         for title_line in wrapped_title:
             title_surface = self.name_font.render(title_line, True, GOLD)
             title_x = menu_x + (menu_width - title_surface.get_width()) // 2
-            self.screen.blit(title_surface, (title_x, current_y))
+            panel.blit(title_surface, (title_x, current_y))
             current_y += title_line_height
 
         if wrapped_title:
@@ -2279,7 +2529,7 @@ class Renderer:
         for body_line in wrapped_body:
             body_surface = self.label_font.render(body_line, True, WHITE)
             body_x = menu_x + (menu_width - body_surface.get_width()) // 2
-            self.screen.blit(body_surface, (body_x, current_y))
+            panel.blit(body_surface, (body_x, current_y))
             current_y += line_height
 
         if wrapped_body:
@@ -2290,14 +2540,16 @@ class Renderer:
             for footer_line in wrapped_footer:
                 footer_surface = self.small_font.render(footer_line, True, GRAY)
                 footer_x = menu_x + (menu_width - footer_surface.get_width()) // 2
-                self.screen.blit(footer_surface, (footer_x, current_y))
+                panel.blit(footer_surface, (footer_x, current_y))
                 current_y += footer_line_height
         else:
             # Default footer
             default_footer = "Press ENTER/A to continue"
             footer_surface = self.small_font.render(default_footer, True, GRAY)
             footer_x = menu_x + (menu_width - footer_surface.get_width()) // 2
-            self.screen.blit(footer_surface, (footer_x, current_y))
+            panel.blit(footer_surface, (footer_x, current_y))
+
+        return panel
 
     def _render_message_box(self, message: str) -> None:
         """
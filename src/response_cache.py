@@ -0,0 +1,199 @@
+"""On-disk cache of Sonrai GraphQL responses with TTLs and offline replay."""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached read stays fresh, by GraphQL root field. Reads not listed
+# here (and every mutation) are still recorded for offline replay, but never
+# served while online.
+DEFAULT_TTLS: Dict[str, float] = {
+    "CloudHierarchyList": 24 * 3600,  # Org structure rarely changes
+    "ThreatVectors": 24 * 3600,
+    "ThreatVectorMappings": 24 * 3600,
+    "ThirdParties": 3600,
+    "PermissionSets": 3600,
+    "JitConfiguration": 600,
+    "ProtectedServices": 600,
+    "AppliedExemptedIdentities": 600,
+    "UnusedIdentities": 300,
+}
+
+# Cached reads made stale by a successful mutation, by mutation root field
+INVALIDATED_BY: Dict[str, tuple] = {
+    "ChangeQuarantineStatus": ("UnusedIdentities", "AppliedExemptedIdentities"),
+    "DenyThirdPartyAccess": ("ThirdParties",),
+    "SetJitConfiguration": ("JitConfiguration", "PermissionSets"),
+    "ProtectService": ("ProtectedServices",),
+}
+
+# First field selected inside the operation body, e.g. "UnusedIdentities"
+_ROOT_FIELD = re.compile(r"\{\s*(\w+)")
+
+
+def root_field(query: str) -> str:
+    """
+    Get the root field a GraphQL document selects (its cache namespace).
+
+    Args:
+        query: GraphQL query or mutation text
+
+    Returns:
+        Root field name, or "unknown" if none is found
+    """
+    match = _ROOT_FIELD.search(query)
+    return match.group(1) if match else "unknown"
+
+
+def is_mutation(query: str) -> bool:
+    """Check whether a GraphQL document is a mutation."""
+    return query.lstrip().startswith("mutation")
+
+
+class ResponseCache:
+    """
+    Content-addressed store of GraphQL responses keyed by (query, variables).
+
+    Responses are gzip-compressed JSON files under <cache_dir>/<root field>/
+    named by a SHA-256 of the whitespace-normalized query and the sorted
+    variables. Online, a read is served only while younger than its root
+    field's TTL and mutations invalidate the reads they change. In offline
+    mode every recorded response (reads and mutations) is replayed regardless
+    of age, so kiosks, demos and benchmarks can run without a network.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = ".sonrai_cache",
+        ttls: Optional[Dict[str, float]] = None,
+        offline: bool = False,
+    ):
+        """
+        Initialize the cache (the directory is created on first write).
+
+        Args:
+            cache_dir: Directory holding the recorded responses
+            ttls: Freshness per root field in seconds (defaults to DEFAULT_TTLS)
+            offline: Serve every recorded response and never expire entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.offline = offline
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @staticmethod
+    def make_key(query: str, variables: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the content address for a request.
+
+        Args:
+            query: GraphQL query or mutation text
+            variables: Query variables
+
+        Returns:
+            Hex SHA-256 of the normalized query and variables
+        """
+        normalized = " ".join(query.split())
+        payload = json.dumps(variables or {}, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{normalized}\n{payload}".encode("utf-8")).hexdigest()
+
+    def get(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Optional[dict]:
+        """
+        Look up a recorded response.
+
+        Args:
+            query: GraphQL query or mutation text
+            variables: Query variables
+
+        Returns:
+            Recorded response JSON, or None if missing, expired or not servable
+        """
+        field = root_field(query)
+        ttl = self.ttls.get(field, 0)
+        if not self.offline and (ttl <= 0 or is_mutation(query)):
+            return None
+
+        entry = self._read(self._path(field, self.make_key(query, variables)))
+        if entry is None or (not self.offline and time.time() - entry["stored_at"] > ttl):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry["response"]
+
+    def put(self, query: str, variables: Optional[Dict[str, Any]], response: dict) -> None:
+        """
+        Record a successful response.
+
+        Args:
+            query: GraphQL query or mutation text
+            variables: Query variables
+            response: Response JSON to store
+        """
+        field = root_field(query)
+        path = self._path(field, self.make_key(query, variables))
+        entry = {"root_field": field, "stored_at": time.time(), "response": response}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(json.dumps(entry).encode("utf-8")))
+            os.replace(tmp_path, path)
+            self.writes += 1
+        except OSError as e:
+            logger.warning(f"Failed to write response cache entry {path}: {e}")
+
+    def invalidate(self, root_fields: Iterable[str]) -> None:
+        """
+        Drop every recorded response for the given root fields.
+
+        Args:
+            root_fields: Root field names to forget (e.g. "UnusedIdentities")
+        """
+        for field in root_fields:
+            directory = self.cache_dir / field
+            if directory.exists():
+                shutil.rmtree(directory, ignore_errors=True)
+                logger.info(f"🗑️  Invalidated cached {field} responses")
+
+    def invalidate_after(self, mutation: str) -> None:
+        """
+        Invalidate the reads a successful mutation may have changed.
+
+        Args:
+            mutation: GraphQL mutation text
+        """
+        self.invalidate(INVALIDATED_BY.get(root_field(mutation), ()))
+
+    def clear(self) -> None:
+        """Delete every recorded response."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _path(self, field: str, key: str) -> Path:
+        """Location of a cache entry."""
+        return self.cache_dir / field / f"{key}.json.gz"
+
+    def _read(self, path: Path) -> Optional[dict]:
+        """Load a cache entry, treating unreadable files as missing."""
+        try:
+            with gzip.open(path, "rb") as f:
+                return json.loads(f.read().decode("utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring corrupt response cache entry {path}: {e}")
+            return None
@@ -2,6 +2,10 @@
 
 import json
 import logging
+import os
+import tempfile
+import threading
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set
@@ -11,8 +15,23 @@ from models import EducationalProgress, GameStatus, Vector2
 logger = logging.getLogger(__name__)
 
 
+# Journal events appended before the journal is folded into a fresh snapshot
+JOURNAL_COMPACT_EVENTS = 200
+
+
 class SaveManager:
-    """Manages game state persistence to disk."""
+    """
+    Manages game state persistence to disk.
+
+    State is kept as a snapshot (the save file) plus an append-only journal
+    next to it (<save file>.journal, one JSON event per line). A save only
+    appends what changed since the previous one: newly quarantined
+    identities, newly blocked 3rd parties, newly completed/unlocked levels
+    and the small scalar stats. Every JOURNAL_COMPACT_EVENTS events the
+    journal is compacted into a new snapshot. Loading reads the snapshot and
+    replays the journal on top; a torn last line from a crash is ignored.
+    A lock serializes writers, so saves from any thread never interleave.
+    """
 
     def __init__(self, save_file_path: str = ".zombie_save.json"):
         """
@@ -22,8 +41,15 @@ class SaveManager:
             save_file_path: Path to save file (relative to project root)
         """
         self.save_file = Path(save_file_path)
+        self.journal_file = self.save_file.with_name(self.save_file.name + ".journal")
         self.version = "2.0"
 
+        self._lock = threading.Lock()
+        # Last state written to disk by this instance (None until the first
+        # save, which writes a full snapshot to establish it)
+        self._saved_state: Optional[Dict] = None
+        self._journal_events = 0
+
     def save_game(
         self,
         player_score: int,
@@ -59,9 +85,7 @@ class SaveManager:
             True if save successful, False otherwise
         """
         try:
-            save_data = {
-                "version": self.version,
-                "last_saved": datetime.now().isoformat(),
+            stats = {
                 "player": {
                     "score": player_score,
                     "eliminations": player_eliminations,
@@ -73,26 +97,32 @@ class SaveManager:
                     "current_level": current_level,
                     "play_time": play_time,
                 },
-                "progress": {
-                    "completed_levels": completed_levels,
-                    "unlocked_levels": unlocked_levels,
-                },
-                "quarantined_identities": list(quarantined_identities),
-                "blocked_third_parties": list(blocked_third_parties),
                 "educational_progress": (
                     educational_progress.to_dict() if educational_progress else None
                 ),
             }
 
-            # Write to temporary file first, then rename (atomic operation)
-            temp_file = self.save_file.with_suffix(".tmp")
-            with open(temp_file, "w") as f:
-                json.dump(save_data, f, indent=2)
-
-            # Atomic rename
-            temp_file.replace(self.save_file)
-
-            logger.info(f"Game saved successfully to {self.save_file}")
+            with self._lock:
+                events = self._diff(
+                    stats,
+                    completed_levels,
+                    unlocked_levels,
+                    quarantined_identities,
+                    blocked_third_parties,
+                )
+                if events is None or self._journal_events + len(events) > JOURNAL_COMPACT_EVENTS:
+                    state = self._build_state(
+                        stats,
+                        completed_levels,
+                        unlocked_levels,
+                        quarantined_identities,
+                        blocked_third_parties,
+                    )
+                    self._write_snapshot(state)
+                    logger.info(f"Game saved successfully to {self.save_file} (snapshot)")
+                elif events:
+                    self._append_events(events)
+                    logger.debug(f"Game saved: {len(events)} journal events")
             return True
 
         except Exception as e:
@@ -101,19 +131,18 @@ class SaveManager:
 
     def load_game(self) -> Optional[Dict]:
         """
-        Load game state from disk.
+        Load game state from disk (snapshot plus journal).
 
         Returns:
             Dictionary of saved game state, or None if no save exists or error
         """
         try:
-            if not self.save_file.exists():
+            with self._lock:
+                save_data = self._read_state()
+            if save_data is None:
                 logger.info("No save file found, starting new game")
                 return None
 
-            with open(self.save_file, "r") as f:
-                save_data = json.load(f)
-
             # Version check
             if save_data.get("version") != self.version:
                 logger.warning(
@@ -139,6 +168,23 @@ class SaveManager:
             logger.error(f"Failed to load game: {e}")
             return None
 
+    def compact(self) -> bool:
+        """
+        Fold the journal into a fresh snapshot.
+
+        Returns:
+            True if compacted (or nothing to compact), False on error
+        """
+        try:
+            with self._lock:
+                state = self._read_state()
+                if state is not None and self.journal_file.exists():
+                    self._write_snapshot(state)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to compact save journal: {e}")
+            return False
+
     def delete_save(self) -> bool:
         """
         Delete the save file (for new game).
@@ -147,10 +193,15 @@ class SaveManager:
             True if deleted successfully, False otherwise
         """
         try:
-            if self.save_file.exists():
-                self.save_file.unlink()
-                logger.info("Save file deleted")
-                return True
+            with self._lock:
+                self._saved_state = None
+                self._journal_events = 0
+                existed = self.save_file.exists()
+                self.journal_file.unlink(missing_ok=True)
+                if existed:
+                    self.save_file.unlink()
+                    logger.info("Save file deleted")
+                    return True
             return False
         except Exception as e:
             logger.error(f"Failed to delete save file: {e}")
@@ -173,12 +224,11 @@ class SaveManager:
             Dictionary with save info (last_saved, version, etc.) or None
         """
         try:
-            if not self.save_file.exists():
+            with self._lock:
+                save_data = self._read_state()
+            if save_data is None:
                 return None
 
-            with open(self.save_file, "r") as f:
-                save_data = json.load(f)
-
             return {
                 "last_saved": save_data.get("last_saved"),
                 "version": save_data.get("version"),
@@ -205,3 +255,198 @@ class SaveManager:
             logger.error(f"Failed to load educational progress: {e}")
 
         return EducationalProgress()
+
+    def _diff(
+        self,
+        stats: Dict,
+        completed_levels: List[str],
+        unlocked_levels: List[str],
+        quarantined_identities: Set[str],
+        blocked_third_parties: Set[str],
+    ) -> Optional[List[Dict]]:
+        """
+        Build the journal events taking the last saved state to the current one.
+
+        Returns:
+            Events to append (empty if nothing changed), or None if a full
+            snapshot is needed (first save, or something was removed)
+        """
+        saved = self._saved_state
+        if saved is None:
+            return None
+
+        events: List[Dict] = []
+        for name, key, current in (
+            ("quarantined", "ids", quarantined_identities),
+            ("blocked", "names", blocked_third_parties),
+            ("level_completed", "levels", completed_levels),
+            ("level_unlocked", "levels", unlocked_levels),
+        ):
+            previous = saved[name]
+            added = [item for item in current if item not in previous]
+            if len(previous) + len(added) != len(current):
+                return None  # Items were removed; journal events only add
+            if added:
+                events.append({"event": name, key: added})
+
+        if stats != saved["stats"]:
+            events.append({"event": "stats", **stats})
+        return events
+
+    def _build_state(
+        self,
+        stats: Dict,
+        completed_levels: List[str],
+        unlocked_levels: List[str],
+        quarantined_identities: Set[str],
+        blocked_third_parties: Set[str],
+    ) -> Dict:
+        """Build a full save dictionary (the snapshot format)."""
+        return {
+            "version": self.version,
+            "last_saved": datetime.now().isoformat(),
+            "player": stats["player"],
+            "game_state": stats["game_state"],
+            "progress": {
+                "completed_levels": list(completed_levels),
+                "unlocked_levels": list(unlocked_levels),
+            },
+            "quarantined_identities": list(quarantined_identities),
+            "blocked_third_parties": list(blocked_third_parties),
+            "educational_progress": stats["educational_progress"],
+        }
+
+    def _write_snapshot(self, state: Dict) -> None:
+        """Atomically replace the snapshot with state and start an empty journal."""
+        # Journal lines carry the id of the snapshot they extend, so lines left
+        # over from an interrupted compaction are never replayed twice
+        state["journal_id"] = uuid.uuid4().hex
+
+        self.save_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.save_file.parent, prefix=self.save_file.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f, separators=(",", ":"))
+            os.replace(temp_path, self.save_file)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        self.journal_file.unlink(missing_ok=True)
+
+        self._remember(state)
+        self._journal_events = 0
+
+    def _append_events(self, events: List[Dict]) -> None:
+        """Append events to the journal and fold them into the saved state."""
+        journal_id = self._saved_state["journal_id"]
+        last_saved = datetime.now().isoformat()
+        lines = [
+            json.dumps({"j": journal_id, "at": last_saved, **event}, separators=(",", ":"))
+            for event in events
+        ]
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        with open(self.journal_file, "a+b") as f:
+            # A crash mid-append can leave a torn last line; start on a fresh
+            # line so the first new event is not glued onto it
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
+
+        for event in events:
+            self._apply_to_saved(event)
+        self._journal_events += len(events)
+
+    def _read_state(self) -> Optional[Dict]:
+        """Read the snapshot and replay the journal on top of it."""
+        if not self.save_file.exists():
+            return None
+
+        with open(self.save_file, "r") as f:
+            state = json.load(f)
+
+        journal_id = state.get("journal_id")
+        replayed = 0
+        torn = False
+        if journal_id and self.journal_file.exists():
+            with open(self.journal_file, "r") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        logger.warning("Ignoring torn save journal entry")
+                        torn = True
+                        continue
+                    if event.get("j") != journal_id:
+                        continue  # Left over from before the last compaction
+                    self._apply_to_state(state, event)
+                    replayed += 1
+
+        if torn:
+            # Fold what survived into a fresh snapshot so later appends never
+            # land after the torn line
+            try:
+                self._write_snapshot(state)
+                logger.info("Compacted save journal after a torn entry")
+                return state
+            except OSError as e:
+                logger.error(f"Failed to compact save journal: {e}")
+
+        self._remember(state)
+        self._journal_events = replayed
+        return state
+
+    @staticmethod
+    def _apply_to_state(state: Dict, event: Dict) -> None:
+        """Apply one journal event to a full save dictionary."""
+        kind = event.get("event")
+        if kind == "quarantined":
+            state.setdefault("quarantined_identities", []).extend(event["ids"])
+        elif kind == "blocked":
+            state.setdefault("blocked_third_parties", []).extend(event["names"])
+        elif kind == "level_completed":
+            progress = state.setdefault("progress", {})
+            progress.setdefault("completed_levels", []).extend(event["levels"])
+        elif kind == "level_unlocked":
+            progress = state.setdefault("progress", {})
+            progress.setdefault("unlocked_levels", []).extend(event["levels"])
+        elif kind == "stats":
+            state["player"] = event["player"]
+            state["game_state"] = event["game_state"]
+            state["educational_progress"] = event["educational_progress"]
+        state["last_saved"] = event.get("at", state.get("last_saved"))
+
+    def _remember(self, state: Dict) -> None:
+        """Record state as what is on disk (the baseline for the next diff)."""
+        if not state.get("journal_id"):
+            self._saved_state = None  # Pre-journal save: next save writes a snapshot
+            return
+        progress = state.get("progress", {})
+        self._saved_state = {
+            "journal_id": state["journal_id"],
+            "stats": {
+                "player": state.get("player"),
+                "game_state": state.get("game_state"),
+                "educational_progress": state.get("educational_progress"),
+            },
+            "quarantined": set(state.get("quarantined_identities", [])),
+            "blocked": set(state.get("blocked_third_parties", [])),
+            "level_completed": set(progress.get("completed_levels", [])),
+            "level_unlocked": set(progress.get("unlocked_levels", [])),
+        }
+
+    def _apply_to_saved(self, event: Dict) -> None:
+        """Fold an appended event into the in-memory baseline."""
+        saved = self._saved_state
+        kind = event["event"]
+        if kind == "stats":
+            saved["stats"] = {
+                "player": event["player"],
+                "game_state": event["game_state"],
+                "educational_progress": event["educational_progress"],
+            }
+        else:
+            saved[kind].update(event.get("ids") or event.get("names") or event.get("levels"))
@@ -1,13 +1,17 @@
 """Sonrai API client for fetching and quarantining unused identities."""
 
 import logging
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from api_validator import APIValidator, ValidationError
-from models import QuarantineResult, UnusedIdentity
+from models import EndpointStats, QuarantineResult, UnusedIdentity
+from response_cache import ResponseCache, is_mutation, root_field
 
 if TYPE_CHECKING:
     from models import QuarantineReport
@@ -21,12 +25,51 @@ API_TIMEOUT_STANDARD = 30  # Standard queries (fetch data)
 API_TIMEOUT_MUTATION = 15  # Mutations (quarantine, block)
 API_MAX_RETRIES = 3  # Maximum retry attempts for failed requests
 API_RETRY_DELAY = 1.0  # Initial delay between retries (seconds)
+QUARANTINE_BATCH_SIZE = 50  # Identities per ChangeQuarantineStatus mutation in batch quarantine
+
+# Connection pooling: keep-alive connections are reused across requests so
+# bursts (arcade quarantines, startup loading) skip the TCP+TLS handshake
+API_POOL_CONNECTIONS = 2  # Distinct hosts to keep pools for
+API_POOL_MAXSIZE = 16  # Keep-alive connections per host (>= concurrent API workers)
+API_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})  # Transient HTTP errors
+
+
+class OfflineCacheMiss(requests.exceptions.ConnectionError):
+    """Raised in offline mode when no recorded response exists (never retried)."""
+
+
+class CachedResponse:
+    """Stand-in for requests.Response when a GraphQL response is served from cache."""
+
+    status_code = 200
+
+    def __init__(self, data: dict):
+        """
+        Wrap a recorded response.
+
+        Args:
+            data: Recorded response JSON
+        """
+        self._data = data
+
+    def json(self) -> dict:
+        """Return the recorded response JSON."""
+        return self._data
+
+    def raise_for_status(self) -> None:
+        """Recorded responses were successful, so there is nothing to raise."""
 
 
 class SonraiAPIClient:
     """Handles all communication with the Sonrai Security API."""
 
-    def __init__(self, api_url: str, org_id: str, api_token: str):
+    def __init__(
+        self,
+        api_url: str,
+        org_id: str,
+        api_token: str,
+        response_cache: Optional[ResponseCache] = None,
+    ):
         """
         Initialize the Sonrai API client.
 
@@ -34,6 +77,7 @@ class SonraiAPIClient:
             api_url: GraphQL endpoint URL for the Sonrai API
             org_id: Organization ID
             api_token: API authentication token
+            response_cache: Optional on-disk cache for GraphQL responses
 
         Raises:
             ValidationError: If any parameters are invalid
@@ -46,6 +90,17 @@ class SonraiAPIClient:
         self.api_url = api_url
         self.org_id = org_id
         self.api_token = api_token
+        self.response_cache = response_cache
+        self.session = self._create_session()
+
+        # Per-endpoint request counters, keyed by GraphQL root field
+        self._stats: Dict[str, EndpointStats] = {}
+        self._stats_lock = threading.Lock()
+
+        # CloudHierarchyList scope map, fetched once and shared by every query
+        # that needs it (the lock makes concurrent callers wait for one request)
+        self._account_scopes: Optional[dict] = None
+        self._account_scopes_lock = threading.Lock()
         logger.info("Initialized SonraiAPIClient with validated parameters")
 
     def authenticate(self) -> bool:
@@ -63,10 +118,8 @@ class SonraiAPIClient:
                 __typename
             }
             """
-            response = requests.post(
-                self.api_url,
+            response = self._post(
                 json={"query": query},
-                headers=self._get_headers(),
                 timeout=API_TIMEOUT_SHORT,
             )
             response.raise_for_status()
@@ -87,8 +140,127 @@ class SonraiAPIClient:
         return {
             "Authorization": f"Bearer {self.api_token}",
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
         }
 
+    def _create_session(self) -> requests.Session:
+        """
+        Build the pooled HTTP session shared by every request.
+
+        Headers are set once on the session, and retries are left to
+        _make_request_with_timeout so there is a single retry policy.
+
+        Returns:
+            Configured requests.Session
+        """
+        session = requests.Session()
+        session.headers.update(self._get_headers())
+        adapter = HTTPAdapter(
+            pool_connections=API_POOL_CONNECTIONS,
+            pool_maxsize=API_POOL_MAXSIZE,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+    def get_request_stats(self) -> Dict[str, EndpointStats]:
+        """
+        Get request counters per GraphQL root field.
+
+        Returns:
+            Copy of the stats, keyed by root field (e.g. "ChangeQuarantineStatus")
+        """
+        with self._stats_lock:
+            return {name: replace(stats) for name, stats in self._stats.items()}
+
+    def log_request_stats(self) -> None:
+        """Log request counts, retries and latency per endpoint."""
+        stats = self.get_request_stats()
+        if not stats:
+            return
+        logger.info("📡 Sonrai API request stats:")
+        for name, entry in sorted(stats.items()):
+            logger.info(
+                f"  {name}: {entry.requests} requests, {entry.retries} retries, "
+                f"{entry.failures} failures, avg {entry.average_latency * 1000:.0f}ms, "
+                f"max {entry.max_latency * 1000:.0f}ms"
+            )
+
+    def _record_request(self, endpoint: str, latency: float, failed: bool) -> None:
+        """Add one HTTP round trip to the endpoint's counters."""
+        with self._stats_lock:
+            stats = self._stats.setdefault(endpoint, EndpointStats())
+            stats.requests += 1
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            if failed:
+                stats.failures += 1
+
+    def _record_retry(self, endpoint: str) -> None:
+        """Count a request re-sent by the retry policy."""
+        with self._stats_lock:
+            self._stats.setdefault(endpoint, EndpointStats()).retries += 1
+
+    def _post(self, json: Dict[str, Any], timeout: float):
+        """
+        Send one GraphQL request on the pooled session, via the response cache if set.
+
+        Fresh cached reads are returned without touching the network. Every
+        successful response is recorded (mutations only for offline replay)
+        and successful mutations invalidate the reads they change. In offline
+        mode a request with no recorded response fails like a dropped connection.
+
+        Args:
+            json: GraphQL payload ({"query": ..., "variables": ...})
+            timeout: Request timeout in seconds
+
+        Returns:
+            requests.Response, or CachedResponse when served from cache
+
+        Raises:
+            OfflineCacheMiss: If offline and no response was recorded
+            requests.exceptions.RequestException: If the request fails
+        """
+        cache = self.response_cache
+        query = json["query"]
+        variables = json.get("variables")
+        if cache is not None:
+            cached = cache.get(query, variables)
+            if cached is not None:
+                return CachedResponse(cached)
+            if cache.offline:
+                raise OfflineCacheMiss("Offline replay: no recorded response for this request")
+
+        endpoint = root_field(query)
+        start = time.perf_counter()
+        try:
+            response = self.session.post(self.api_url, json=json, timeout=timeout)
+        except requests.exceptions.RequestException:
+            self._record_request(endpoint, time.perf_counter() - start, failed=True)
+            raise
+        status = response.status_code
+        self._record_request(
+            endpoint,
+            time.perf_counter() - start,
+            failed=isinstance(status, int) and status >= 400,
+        )
+
+        if cache is not None and status == 200:
+            try:
+                data = response.json()
+            except ValueError:
+                return response
+            if isinstance(data, dict) and not data.get("errors"):
+                cache.put(query, variables, data)
+                if is_mutation(query):
+                    cache.invalidate_after(query)
+        return response
+
     def _make_request_with_timeout(
         self,
         query: str,
@@ -99,11 +271,16 @@ class SonraiAPIClient:
         """
         Make API request with timeout and retry logic.
 
+        This is the single retry policy for every GraphQL call: timeouts,
+        dropped connections and transient HTTP errors (429/5xx) are retried
+        with exponential backoff; other HTTP errors and offline cache misses
+        fail immediately.
+
         Args:
             query: GraphQL query or mutation
             variables: Query variables
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts
 
         Returns:
             API response data
@@ -112,38 +289,43 @@ class SonraiAPIClient:
             requests.exceptions.Timeout: If request times out after all retries
             requests.exceptions.RequestException: If request fails after all retries
         """
+        payload: Dict[str, Any] = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        endpoint = root_field(query)
         last_exception: Exception = None
 
         for attempt in range(max_retries):
+            if attempt:
+                delay = API_RETRY_DELAY * (2 ** (attempt - 1))  # Exponential backoff
+                logger.info(f"Retrying {endpoint} in {delay}s...")
+                time.sleep(delay)
+                self._record_retry(endpoint)
+
             try:
-                payload: Dict[str, Any] = {"query": query}
-                if variables:
-                    payload["variables"] = variables
-
-                response = requests.post(
-                    self.api_url,
-                    json=payload,
-                    headers=self._get_headers(),
-                    timeout=timeout,
-                )
+                response = self._post(json=payload, timeout=timeout)
                 response.raise_for_status()
                 return response.json()
 
+            except OfflineCacheMiss:
+                raise
+
             except requests.exceptions.Timeout as e:
                 last_exception = e
                 logger.warning(f"API request timeout (attempt {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    delay = API_RETRY_DELAY * (2**attempt)  # Exponential backoff
-                    logger.info(f"Retrying in {delay}s...")
-                    time.sleep(delay)
 
-            except requests.exceptions.RequestException as e:
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status not in API_RETRY_STATUS_CODES:
+                    raise
+                last_exception = e
+                logger.warning(
+                    f"API request got HTTP {status} (attempt {attempt + 1}/{max_retries}): {e}"
+                )
+
+            except requests.exceptions.ConnectionError as e:
                 last_exception = e
                 logger.warning(f"API request failed (attempt {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    delay = API_RETRY_DELAY * (2**attempt)
-                    logger.info(f"Retrying in {delay}s...")
-                    time.sleep(delay)
 
         # All retries exhausted
         logger.error(f"API request failed after {max_retries} attempts")
@@ -178,14 +360,7 @@ class SonraiAPIClient:
                 }
             }
 
-            response = requests.post(
-                self.api_url,
-                json={"query": query, "variables": variables},
-                headers=self._get_headers(),
-                timeout=30,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._make_request_with_timeout(query, variables, timeout=30)
 
             accounts = {}
             if data and "data" in data and "UnusedIdentities" in data["data"]:
@@ -248,14 +423,7 @@ class SonraiAPIClient:
 
             variables = {"scope": root_scope}
 
-            response = requests.post(
-                self.api_url,
-                json={"query": query, "variables": variables},
-                headers=self._get_headers(),
-                timeout=30,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._make_request_with_timeout(query, variables, timeout=30)
 
             # Group 3rd parties by account
             # Note: The ThirdParties query returns org-level data,
@@ -371,16 +539,7 @@ class SonraiAPIClient:
                 }
             }
 
-            headers = self._get_headers()
-            response = requests.post(
-                self.api_url,
-                json={"query": query, "variables": variables},
-                headers=headers,
-                timeout=30,
-            )
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._make_request_with_timeout(query, variables, timeout=30)
 
             # Validate response structure
             try:
@@ -493,52 +652,43 @@ class SonraiAPIClient:
 
         variables = {"filters": {"scope": {"value": scope_filter, "op": "EQ"}}}
 
-        max_retries = 3
-        retry_delay = 1.0
-
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(
-                    self.api_url,
-                    json={"query": query, "variables": variables},
-                    headers=self._get_headers(),
-                    timeout=30,
-                )
+        try:
+            data = self._make_request_with_timeout(query, variables, timeout=30)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to fetch exemptions: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Error fetching exemptions: {e}")
+            return []
 
-                if response.status_code == 200:
-                    data = response.json()
+        if "errors" in data:
+            logger.error(f"GraphQL errors in exemptions query: {data['errors']}")
+            return []
 
-                    if "errors" in data:
-                        logger.error(f"GraphQL errors in exemptions query: {data['errors']}")
-                        return []
+        exemptions_data = data.get("data", {}).get("AppliedExemptedIdentities", {}).get("items", [])
+        logger.info(f"Fetched {len(exemptions_data)} exempted identities for account {account}")
+        return exemptions_data
 
-                    exemptions_data = (
-                        data.get("data", {}).get("AppliedExemptedIdentities", {}).get("items", [])
-                    )
-                    logger.info(
-                        f"Fetched {len(exemptions_data)} exempted identities for account {account}"
-                    )
-                    return exemptions_data
-                else:
-                    logger.error(f"Failed to fetch exemptions: HTTP {response.status_code}")
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay * (attempt + 1))
-                        continue
-                    return []
+    def _fetch_all_account_scopes(self) -> dict:
+        """
+        Get scopes for all AWS accounts, querying CloudHierarchyList only once.
 
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout fetching exemptions (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (attempt + 1))
-                    continue
-                return []
-            except Exception as e:
-                logger.error(f"Error fetching exemptions: {e}")
-                return []
+        The scope map does not change during a session, so the first successful
+        result is cached and shared (also across worker threads). Empty results
+        are not cached so a failed fetch is retried by the next caller.
 
-        return []
+        Returns:
+            Dictionary mapping account number to full scope path
+        """
+        with self._account_scopes_lock:
+            if self._account_scopes is not None:
+                return self._account_scopes
+            account_scopes = self._query_account_scopes()
+            if account_scopes:
+                self._account_scopes = account_scopes
+            return account_scopes
 
-    def _fetch_all_account_scopes(self) -> dict:
+    def _query_account_scopes(self) -> dict:
         """
         Fetch scopes for all AWS accounts in the organization using CloudHierarchyList.
         Only includes the 7 real MyHealth AWS accounts (filters out OUs and root).
@@ -582,14 +732,7 @@ class SonraiAPIClient:
                 }
             }
 
-            response = requests.post(
-                self.api_url,
-                json={"query": query, "variables": variables},
-                headers=self._get_headers(),
-                timeout=30,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._make_request_with_timeout(query, variables, timeout=30)
 
             account_scopes = {}
             if data and "data" in data and data["data"] and "CloudHierarchyList" in data["data"]:
@@ -634,9 +777,51 @@ class SonraiAPIClient:
         Returns:
             QuarantineResult with success status and any error message
         """
-        max_retries = 3
-        retry_delay = 1.0
+        # Scope MUST be provided - never use fake scopes as they trigger alerts
+        if not scope:
+            error_msg = (
+                f"Cannot quarantine without real scope - no scope provided for {identity_id}"
+            )
+            logger.error(error_msg)
+            return QuarantineResult(success=False, identity_id=identity_id, error_message=error_msg)
+
+        identity = self._build_quarantine_identity(identity_id, identity_name, account, scope)
+        root_scope = self._resolve_root_scope(scope, root_scope)
+
+        try:
+            # Log the quarantine request details
+            logger.info(
+                f"Quarantining {identity['name']}: scope={scope}, rootScope={root_scope}, arn={identity['resourceId']}"
+            )
+
+            # Transient failures are retried inside _make_request_with_timeout
+            result = self._send_quarantine_mutation([identity], root_scope)
+            if result.get("success"):
+                logger.info(f"Successfully quarantined identity {identity_id}")
+                return QuarantineResult(success=True, identity_id=identity_id, error_message=None)
+            raise Exception(f"Quarantine returned success=false, count={result.get('count')}")
 
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Failed to quarantine identity {identity_id}: {error_msg}")
+            return QuarantineResult(success=False, identity_id=identity_id, error_message=error_msg)
+
+    @staticmethod
+    def _build_quarantine_identity(
+        identity_id: str, identity_name: str = None, account: str = None, scope: str = None
+    ) -> Dict[str, Any]:
+        """
+        Build one entry of the ChangeQuarantineStatus "identities" list.
+
+        Args:
+            identity_id: SRN of the identity to quarantine
+            identity_name: Name of the identity (extracted from SRN if not provided)
+            account: AWS account number (extracted from SRN if not provided)
+            scope: Organizational scope path
+
+        Returns:
+            Dictionary with resourceId (AWS ARN), scope, name and account
+        """
         # Extract name and account from SRN if not provided
         if not identity_name:
             identity_name = identity_id.split("/")[-1] if "/" in identity_id else identity_id
@@ -658,14 +843,25 @@ class SonraiAPIClient:
             elif "/Role/" in identity_id:
                 resource_arn = f"arn:aws:iam::{account}:role/{identity_name}"
 
-        # Scope MUST be provided - never use fake scopes as they trigger alerts
-        if not scope:
-            error_msg = (
-                f"Cannot quarantine without real scope - no scope provided for {identity_id}"
-            )
-            logger.error(error_msg)
-            return QuarantineResult(success=False, identity_id=identity_id, error_message=error_msg)
+        return {
+            "resourceId": resource_arn,
+            "scope": scope,
+            "name": identity_name,
+            "account": account,
+        }
 
+    @staticmethod
+    def _resolve_root_scope(scope: str, root_scope: str = None) -> str:
+        """
+        Get the root scope for a quarantine, deriving it from the scope if needed.
+
+        Args:
+            scope: Organizational scope path (e.g. "aws/r-ipxz/ou-abc/123456789012")
+            root_scope: Explicit root scope, if known
+
+        Returns:
+            Root organizational scope
+        """
         if not root_scope:
             # Extract root scope from full scope if available
             if scope:
@@ -674,92 +870,55 @@ class SonraiAPIClient:
                     root_scope = f"{scope_parts[0]}/{scope_parts[1]}"
             if not root_scope:
                 root_scope = "aws/r-ipxz"  # MyHealth root scope (CORRECT)
+        return root_scope
 
-        for attempt in range(max_retries):
-            try:
-                # GraphQL mutation to quarantine the identity
-                mutation = """
-                mutation quarantine($input: ChangeQuarantineStatusInput!) {
-                    ChangeQuarantineStatus(input: $input) {
-                        transactionId
-                        success
-                        count
-                    }
-                }
-                """
-
-                # Build input for the mutation
-                variables = {
-                    "input": {
-                        "identities": [
-                            {
-                                "resourceId": resource_arn,
-                                "scope": scope,
-                                "name": identity_name,
-                                "account": account,
-                            }
-                        ],
-                        "action": "ADD",
-                        "rootScope": root_scope,
-                    }
-                }
+    def _send_quarantine_mutation(
+        self, identities: List[Dict[str, Any]], root_scope: str
+    ) -> Dict[str, Any]:
+        """
+        Send one ChangeQuarantineStatus mutation for one or more identities.
 
-                # Log the quarantine request details
-                logger.info(
-                    f"Quarantining {identity_name}: scope={scope}, rootScope={root_scope}, arn={resource_arn}"
-                )
+        Args:
+            identities: Entries built by _build_quarantine_identity
+            root_scope: Root organizational scope shared by the identities
 
-                headers = self._get_headers()
-                response = requests.post(
-                    self.api_url,
-                    json={"query": mutation, "variables": variables},
-                    headers=headers,
-                    timeout=15,
-                )
-                response.raise_for_status()
+        Returns:
+            The ChangeQuarantineStatus payload (transactionId, success, count)
 
-                data = response.json()
+        Raises:
+            Exception: On HTTP errors, GraphQL errors or an unexpected response
+        """
+        # GraphQL mutation to quarantine the identities
+        mutation = """
+        mutation quarantine($input: ChangeQuarantineStatusInput!) {
+            ChangeQuarantineStatus(input: $input) {
+                transactionId
+                success
+                count
+            }
+        }
+        """
 
-                # Check for GraphQL errors
-                if "errors" in data:
-                    error_msg = data["errors"][0].get("message", "Unknown error")
-                    raise Exception(error_msg)
-
-                # Check if the mutation was successful
-                if data.get("data") and data["data"].get("ChangeQuarantineStatus"):
-                    result = data["data"]["ChangeQuarantineStatus"]
-                    if result.get("success"):
-                        logger.info(f"Successfully quarantined identity {identity_id}")
-                        return QuarantineResult(
-                            success=True, identity_id=identity_id, error_message=None
-                        )
-                    else:
-                        raise Exception(
-                            f"Quarantine returned success=false, count={result.get('count')}"
-                        )
+        # Build input for the mutation
+        variables = {
+            "input": {
+                "identities": identities,
+                "action": "ADD",
+                "rootScope": root_scope,
+            }
+        }
 
-                raise Exception("Unexpected response format")
+        data = self._make_request_with_timeout(mutation, variables, timeout=API_TIMEOUT_MUTATION)
 
-            except Exception as e:
-                logger.warning(
-                    f"Quarantine attempt {attempt + 1}/{max_retries} failed for {identity_id}: {e}"
-                )
+        # Check for GraphQL errors
+        if "errors" in data:
+            error_msg = data["errors"][0].get("message", "Unknown error")
+            raise Exception(error_msg)
 
-                if attempt < max_retries - 1:
-                    # Exponential backoff
-                    time.sleep(retry_delay * (2**attempt))
-                else:
-                    # Final attempt failed
-                    error_msg = str(e)
-                    logger.error(f"Failed to quarantine identity {identity_id}: {error_msg}")
-                    return QuarantineResult(
-                        success=False, identity_id=identity_id, error_message=error_msg
-                    )
+        if data.get("data") and data["data"].get("ChangeQuarantineStatus"):
+            return data["data"]["ChangeQuarantineStatus"]
 
-        # Should not reach here, but return failure just in case
-        return QuarantineResult(
-            success=False, identity_id=identity_id, error_message="Max retries exceeded"
-        )
+        raise Exception("Unexpected response format")
 
     def block_third_party(
         self, third_party_id: str, third_party_name: str = None, root_scope: str = None
@@ -775,96 +934,60 @@ class SonraiAPIClient:
         Returns:
             QuarantineResult with success status and any error message
         """
-        max_retries = 3
-        retry_delay = 1.0
-
         # Use default scope if not provided (MyHealth organization)
         if not root_scope:
             root_scope = "aws/r-ipxz"
 
-        for attempt in range(max_retries):
-            try:
-                # GraphQL mutation to block the 3rd party
-                mutation = """
-                mutation blockThirdParty($thirdPartyId: String!, $scope: String!) {
-                    DenyThirdPartyAccess(input: { thirdPartyId: $thirdPartyId, scope: $scope }) {
-                        success
-                    }
+        try:
+            # GraphQL mutation to block the 3rd party
+            mutation = """
+            mutation blockThirdParty($thirdPartyId: String!, $scope: String!) {
+                DenyThirdPartyAccess(input: { thirdPartyId: $thirdPartyId, scope: $scope }) {
+                    success
                 }
-                """
-
-                # Build input for the mutation
-                variables = {"thirdPartyId": third_party_id, "scope": root_scope}
+            }
+            """
 
-                # Log the request details (only on first attempt to avoid spam)
-                if attempt == 0:
-                    logger.info(
-                        f"Blocking 3rd party {third_party_name or third_party_id} with ID: {third_party_id[:8]}... scope: {root_scope}"
-                    )
+            # Build input for the mutation
+            variables = {"thirdPartyId": third_party_id, "scope": root_scope}
 
-                headers = self._get_headers()
-                response = requests.post(
-                    self.api_url,
-                    json={"query": mutation, "variables": variables},
-                    headers=headers,
-                    timeout=15,
-                )
-                response.raise_for_status()
+            logger.info(
+                f"Blocking 3rd party {third_party_name or third_party_id} with ID: {third_party_id[:8]}... scope: {root_scope}"
+            )
 
-                data = response.json()
+            # Transient failures are retried inside _make_request_with_timeout
+            data = self._make_request_with_timeout(mutation, variables, timeout=15)
 
-                # Log the full response if there are errors
-                if "errors" in data:
+            # Check for GraphQL errors
+            if "errors" in data:
+                logger.info(f"API error response for {third_party_name or third_party_id}: {data}")
+                error_msg = data["errors"][0].get("message", "Unknown error")
+                raise Exception(error_msg)
+
+            # Check if the mutation was successful
+            if data.get("data") and data["data"].get("DenyThirdPartyAccess"):
+                result = data["data"]["DenyThirdPartyAccess"]
+                if result.get("success"):
                     logger.info(
-                        f"API error response for {third_party_name or third_party_id}: {data}"
-                    )
-
-                # Check for GraphQL errors
-                if "errors" in data:
-                    error_msg = data["errors"][0].get("message", "Unknown error")
-                    raise Exception(error_msg)
-
-                # Check if the mutation was successful
-                if data.get("data") and data["data"].get("DenyThirdPartyAccess"):
-                    result = data["data"]["DenyThirdPartyAccess"]
-                    if result.get("success"):
-                        logger.info(
-                            f"Successfully blocked 3rd party {third_party_name or third_party_id}"
-                        )
-                        return QuarantineResult(
-                            success=True, identity_id=third_party_id, error_message=None
-                        )
-                    else:
-                        raise Exception(f"Block returned success=false")
-
-                raise Exception("Unexpected response format")
-
-            except Exception as e:
-                logger.warning(
-                    f"Block attempt {attempt + 1}/{max_retries} failed for {third_party_name or third_party_id}: {e}"
-                )
-
-                if attempt < max_retries - 1:
-                    # Exponential backoff
-                    time.sleep(retry_delay * (2**attempt))
-                else:
-                    # Final attempt failed
-                    error_msg = str(e)
-                    logger.error(
-                        f"Failed to block 3rd party {third_party_name or third_party_id}: {error_msg}"
+                        f"Successfully blocked 3rd party {third_party_name or third_party_id}"
                     )
                     return QuarantineResult(
-                        success=False,
-                        identity_id=third_party_id,
-                        error_message=error_msg,
+                        success=True, identity_id=third_party_id, error_message=None
                     )
+                raise Exception("Block returned success=false")
 
-        # Should not reach here, but return failure just in case
-        return QuarantineResult(
-            success=False,
-            identity_id=third_party_id,
-            error_message="Max retries exceeded",
-        )
+            raise Exception("Unexpected response format")
+
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(
+                f"Failed to block 3rd party {third_party_name or third_party_id}: {error_msg}"
+            )
+            return QuarantineResult(
+                success=False,
+                identity_id=third_party_id,
+                error_message=error_msg,
+            )
 
     def get_connection_status(self) -> bool:
         """
@@ -879,10 +1002,7 @@ class SonraiAPIClient:
                 __typename
             }
             """
-            headers = self._get_headers()
-            response = requests.post(
-                self.api_url, json={"query": query}, headers=headers, timeout=5
-            )
+            response = self._post(json={"query": query}, timeout=5)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
@@ -928,14 +1048,7 @@ class SonraiAPIClient:
 
             variables = {"scope": scope}
 
-            response = requests.post(
-                self.api_url,
-                json={"query": query, "variables": variables},
-                headers=self._get_headers(),
-                timeout=30,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._make_request_with_timeout(query, variables, timeout=30)
 
             # Extract protected service control keys
             protected_services = set()
@@ -1006,14 +1119,7 @@ class SonraiAPIClient:
 
             variables = {"where": {"scope": {"value": scope, "op": "EQ"}}}
 
-            response = requests.post(
-                self.api_url,
-                json={"query": query, "variables": variables},
-                headers=self._get_headers(),
-                timeout=30,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._make_request_with_timeout(query, variables, timeout=30)
 
             permission_sets = []
             if data and "data" in data and data["data"] and "PermissionSets" in data["data"]:
@@ -1159,14 +1265,7 @@ class SonraiAPIClient:
 
             variables = {"where": {"scope": {"value": scope, "op": "EQ"}}}
 
-            response = requests.post(
-                self.api_url,
-                json={"query": query, "variables": variables},
-                headers=self._get_headers(),
-                timeout=30,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._make_request_with_timeout(query, variables, timeout=30)
 
             enrolled_permission_sets = []
             if data and "data" in data and data["data"] and "JitConfiguration" in data["data"]:
@@ -1275,14 +1374,7 @@ class SonraiAPIClient:
             logger.info(f"  scope: {scope}")
             logger.info(f"  permissionSetId: {permission_set_id}")
 
-            response = requests.post(
-                self.api_url,
-                json={"query": mutation, "variables": variables},
-                headers=self._get_headers(),
-                timeout=30,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._make_request_with_timeout(mutation, variables, timeout=30)
 
             # Log only success status, not full response (security)
             if data and "data" in data and data["data"] and "SetJitConfiguration" in data["data"]:
@@ -1409,14 +1501,7 @@ class SonraiAPIClient:
             logger.info(f"  identities: []")
             logger.info(f"  ssoActorIds: []")
 
-            response = requests.post(
-                self.api_url,
-                json={"query": mutation, "variables": variables},
-                headers=self._get_headers(),
-                timeout=30,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._make_request_with_timeout(mutation, variables, timeout=30)
 
             # Log only success status, not full response (security)
             logger.info(f"📥 RECEIVED FROM API:")
@@ -1472,21 +1557,28 @@ class SonraiAPIClient:
             logger.error(error_msg)
             return QuarantineResult(success=False, identity_id="", error_message=error_msg)
 
-    def batch_quarantine_identities(self, zombies: List) -> "QuarantineReport":
+    def batch_quarantine_identities(
+        self, zombies: List, chunk_size: int = QUARANTINE_BATCH_SIZE
+    ) -> "QuarantineReport":
         """
-        Quarantine multiple identities in batches with rate limiting.
+        Quarantine multiple identities with multi-identity mutations.
 
-        Rate limit: 10 API calls per batch with 1-second delay between batches.
+        Zombies are grouped by (scope, rootScope) and each group is sent as
+        ChangeQuarantineStatus mutations of up to chunk_size identities, so
+        hundreds of identities take a handful of round-trips. A chunk that
+        fails or reports fewer identities than it sent falls back to
+        quarantine_identity() per zombie, which has its own retries.
 
         Args:
             zombies: List of Zombie objects to quarantine
+            chunk_size: Maximum identities per mutation
 
         Returns:
             QuarantineReport with success/failure counts
         """
         from models import QuarantineReport
 
-        report = QuarantineReport(total_queued=len(zombies), successful=0, failed=0, errors=[])
+        report = QuarantineReport(total_queued=len(zombies), successful=0, failed=0)
 
         if not zombies:
             logger.info("📭 No zombies to quarantine")
@@ -1494,44 +1586,77 @@ class SonraiAPIClient:
 
         logger.info(f"🔄 Starting batch quarantine of {len(zombies)} identities...")
 
-        batch_size = 10
-        batch_count = (len(zombies) + batch_size - 1) // batch_size
-
-        for batch_idx in range(batch_count):
-            start_idx = batch_idx * batch_size
-            end_idx = min(start_idx + batch_size, len(zombies))
-            batch = zombies[start_idx:end_idx]
+        # Group by (scope, rootScope): both are shared by every identity in a mutation
+        groups: Dict[tuple, List] = {}
+        for zombie in zombies:
+            if not zombie.scope:
+                # Scope MUST be provided - never use fake scopes as they trigger alerts
+                self._record_quarantine_failure(
+                    report, zombie, "Cannot quarantine without real scope"
+                )
+                continue
+            key = (zombie.scope, self._resolve_root_scope(zombie.scope))
+            groups.setdefault(key, []).append(zombie)
+
+        chunks = [
+            (scope, root_scope, group[i : i + chunk_size])
+            for (scope, root_scope), group in groups.items()
+            for i in range(0, len(group), chunk_size)
+        ]
 
+        for chunk_idx, (scope, root_scope, chunk) in enumerate(chunks):
             logger.info(
-                f"📦 Processing batch {batch_idx + 1}/{batch_count} ({len(batch)} identities)"
+                f"📦 Processing batch {chunk_idx + 1}/{len(chunks)} ({len(chunk)} identities, scope={scope})"
             )
+            identities = [
+                self._build_quarantine_identity(
+                    zombie.identity_id, zombie.identity_name, zombie.account, scope
+                )
+                for zombie in chunk
+            ]
 
-            for zombie in batch:
-                result = self.quarantine_identity(
+            try:
+                result = self._send_quarantine_mutation(identities, root_scope)
+                count = result.get("count")
+                if result.get("success") and (count is None or count >= len(chunk)):
+                    report.successful += len(chunk)
+                    for zombie in chunk:
+                        logger.debug(f"  ✅ {zombie.identity_name}")
+                    continue
+                logger.warning(
+                    f"Batch {chunk_idx + 1} partially failed (success={result.get('success')}, "
+                    f"count={result.get('count')}/{len(chunk)}), retrying individually"
+                )
+            except Exception as e:
+                logger.warning(f"Batch {chunk_idx + 1} failed ({e}), retrying individually")
+
+            # Partial failure: the API does not say which identities failed
+            for zombie in chunk:
+                single = self.quarantine_identity(
                     identity_id=zombie.identity_id,
                     identity_name=zombie.identity_name,
                     account=zombie.account,
-                    scope=zombie.scope,
+                    scope=scope,
+                    root_scope=root_scope,
                 )
-
-                if result.success:
+                if single.success:
                     report.successful += 1
                     logger.debug(f"  ✅ {zombie.identity_name}")
                 else:
-                    report.failed += 1
-                    report.errors.append(f"{zombie.identity_name}: {result.error_message}")
-                    logger.warning(f"  ❌ {zombie.identity_name}: {result.error_message}")
-
-            # Rate limiting: 1-second delay between batches
-            if batch_idx < batch_count - 1:
-                logger.debug(f"⏸️  Rate limiting: waiting 1 second before next batch...")
-                time.sleep(1.0)
+                    self._record_quarantine_failure(report, zombie, single.error_message)
 
         logger.info(
             f"✅ Batch quarantine complete: {report.successful} successful, {report.failed} failed"
         )
         return report
 
+    @staticmethod
+    def _record_quarantine_failure(report: "QuarantineReport", zombie, error_message: str) -> None:
+        """Count one failed identity in a batch quarantine report."""
+        report.failed += 1
+        report.error_messages.append(f"{zombie.identity_name}: {error_message}")
+        logger.warning(f"  ❌ {zombie.identity_name}: {error_message}")
+
     # ========== Threat Vectors API ==========
 
     def fetch_threat_vectors(self) -> List[Dict[str, Any]]:
@@ -1559,14 +1684,7 @@ class SonraiAPIClient:
             }
             """
 
-            response = requests.post(
-                self.api_url,
-                json={"query": query},
-                headers=self._get_headers(),
-                timeout=API_TIMEOUT_STANDARD,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._make_request_with_timeout(query, timeout=API_TIMEOUT_STANDARD)
 
             threat_vectors = []
             if data and "data" in data and data["data"] and "ThreatVectors" in data["data"]:
@@ -1609,14 +1727,7 @@ class SonraiAPIClient:
             }
             """
 
-            response = requests.post(
-                self.api_url,
-                json={"query": query},
-                headers=self._get_headers(),
-                timeout=API_TIMEOUT_STANDARD,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._make_request_with_timeout(query, timeout=API_TIMEOUT_STANDARD)
 
             mappings: Dict[str, List[int]] = {}
             if data and "data" in data and data["data"] and "ThreatVectorMappings" in data["data"]:
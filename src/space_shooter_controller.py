@@ -17,6 +17,7 @@ import pygame
 
 from genre_controller import GenreController, GenreControllerFactory, InputState
 from models import GenreType, Vector2
+from text_cache import TEXT_CACHE
 
 logger = logging.getLogger(__name__)
 
@@ -479,7 +480,7 @@ class SpaceShooterController(GenreController):
 
     def _render_zombies(self, surface) -> None:
         """Render zombies with their identity name labels (NO health bars)."""
-        font = pygame.font.Font(None, 18)
+        font = self._get_font(18)
 
         for zombie in self.zombies:
             if zombie.is_hidden:
@@ -507,7 +508,7 @@ class SpaceShooterController(GenreController):
             label_text = zombie.identity_name
             if len(label_text) > 15:
                 label_text = label_text[:12] + "..."
-            label_surface = font.render(label_text, True, (255, 255, 255))
+            label_surface = TEXT_CACHE.render(label_text, font, (255, 255, 255))
             label_x = x - label_surface.get_width() // 2
             label_y = y - 28  # Above the zombie
             surface.blit(label_surface, (label_x, label_y))
@@ -0,0 +1,120 @@
+"""Process-wide sprite atlas for entities that share a small set of looks."""
+
+import logging
+from typing import Callable, Dict, Iterable, Tuple
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+# Builder paints one variant onto a blank SRCALPHA surface and returns it
+SpriteBuilder = Callable[[pygame.Surface], pygame.Surface]
+
+# (variant, base_width, base_height, scaled_width, scaled_height, flashing)
+AtlasKey = Tuple[int, int, int, int, int, bool]
+
+
+class SpriteAtlas:
+    """
+    Cache of pre-rendered sprites shared by every entity of one type.
+
+    Each variant is painted once per (size, zoom, flash state) and handed out
+    by reference, so hundreds of entities cost a handful of surfaces. Zoom is
+    folded into the key as the final pixel size, which keeps the number of
+    cached copies bounded while the landing-zone zoom animates.
+    """
+
+    def __init__(self, builders: Dict[int, SpriteBuilder]):
+        """
+        Initialize the atlas.
+
+        Args:
+            builders: Mapping of variant index to the function that paints it
+        """
+        self._builders = builders
+        self._sprites: Dict[AtlasKey, pygame.Surface] = {}
+
+    @property
+    def variant_count(self) -> int:
+        """Number of variants this atlas can render."""
+        return len(self._builders)
+
+    def get(
+        self,
+        variant: int,
+        width: int,
+        height: int,
+        zoom: float = 1.0,
+        flashing: bool = False,
+    ) -> pygame.Surface:
+        """
+        Get the shared sprite for a variant, rendering it on first use.
+
+        Args:
+            variant: Variant index registered with the atlas
+            width: Base (unzoomed) sprite width
+            height: Base (unzoomed) sprite height
+            zoom: Display zoom factor (1.0 = native size)
+            flashing: True for the white damage-flash version
+
+        Returns:
+            Shared surface - callers must not draw onto it
+        """
+        if zoom == 1.0:
+            scaled_width, scaled_height = width, height
+        else:
+            scaled_width = max(1, int(width * zoom))
+            scaled_height = max(1, int(height * zoom))
+
+        key = (variant, width, height, scaled_width, scaled_height, flashing)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._render(variant, width, height, scaled_width, scaled_height, flashing)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _render(
+        self,
+        variant: int,
+        width: int,
+        height: int,
+        scaled_width: int,
+        scaled_height: int,
+        flashing: bool,
+    ) -> pygame.Surface:
+        """Build one atlas entry from its nearest already-cached parent."""
+        if flashing:
+            sprite = self.get(variant, width, height).copy()
+            sprite.fill((255, 255, 255, 128), special_flags=pygame.BLEND_RGBA_ADD)
+            if (scaled_width, scaled_height) != (width, height):
+                sprite = pygame.transform.scale(sprite, (scaled_width, scaled_height))
+            return sprite
+
+        if (scaled_width, scaled_height) != (width, height):
+            base = self.get(variant, width, height)
+            return pygame.transform.scale(base, (scaled_width, scaled_height))
+
+        builder = self._builders[variant]
+        return builder(pygame.Surface((width, height), pygame.SRCALPHA))
+
+    def prewarm(self, width: int, height: int, variants: Iterable[int] = None) -> None:
+        """
+        Render the native-size and flash sprites ahead of time (e.g. at boot).
+
+        Args:
+            width: Base sprite width
+            height: Base sprite height
+            variants: Variants to render (default: all registered)
+        """
+        for variant in variants if variants is not None else self._builders:
+            self.get(variant, width, height)
+            self.get(variant, width, height, flashing=True)
+        logger.debug(f"Sprite atlas prewarmed: {len(self._sprites)} surfaces")
+
+    def clear(self) -> None:
+        """Drop all cached surfaces (e.g. after the display is recreated)."""
+        self._sprites.clear()
+
+    def __len__(self) -> int:
+        """Number of cached surfaces."""
+        return len(self._sprites)
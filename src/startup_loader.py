@@ -0,0 +1,221 @@
+"""Concurrent, dependency-aware loading of the Sonrai data needed at startup."""
+
+import logging
+import queue
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from api_dispatcher import ApiDispatcher
+from sonrai_client import SonraiAPIClient
+from zombie import Zombie
+
+logger = logging.getLogger(__name__)
+
+# Fetches the zombies for one account: (account number, expected count) -> zombies
+ZombieFetcher = Callable[[str, int], List[Zombie]]
+
+# Tasks the lobby cannot open without
+LOBBY_TASKS = ("auth", "accounts", "third_parties")
+
+
+class StartupLoader:
+    """
+    Loads startup data as a small task graph on a worker pool.
+
+    main() used to authenticate, fetch the account summary, fetch 3rd parties
+    and then fetch zombies account by account, all before the first frame.
+    Here every query whose dependencies are met is in flight at once:
+
+        auth -> accounts, third_parties, scopes
+        accounts + scopes -> zombies:<account> (one task per account)
+
+    The CloudHierarchyList scope map is fetched once by the "scopes" task and
+    shared by every per-account zombie fetch through the client's cache.
+    poll() is called from the pygame loop, never blocks, and hands back each
+    account's zombies as soon as they arrive so the lobby can open early.
+    """
+
+    def __init__(
+        self,
+        api_client: SonraiAPIClient,
+        zombie_fetcher: ZombieFetcher,
+        max_workers: int = 4,
+        third_party_root_scope: str = "aws/r-ipxz",
+    ):
+        """
+        Initialize the loader (nothing is fetched until start()).
+
+        Args:
+            api_client: Sonrai API client used for every query
+            zombie_fetcher: Callable fetching one account's zombies
+            max_workers: Maximum number of queries in flight at once
+            third_party_root_scope: Root scope for the 3rd party query
+        """
+        self.api_client = api_client
+        self.zombie_fetcher = zombie_fetcher
+        self.dispatcher = ApiDispatcher(max_workers=max_workers, max_queued=64, name="startup")
+
+        # name -> (callable, dependency names)
+        self._tasks: Dict[str, Tuple[Callable[[], Any], Tuple[str, ...]]] = {}
+        self._futures: Dict[str, Future] = {}
+        self._completed: Set[str] = set()
+        self.results: Dict[str, Any] = {}
+
+        self.error: Optional[Exception] = None
+        self.zombies: List[Zombie] = []
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+        self._add_task("auth", self._authenticate)
+        self._add_task("accounts", api_client.fetch_accounts_with_unused_identities, ("auth",))
+        self._add_task(
+            "third_parties",
+            lambda: api_client.fetch_third_parties_by_account(root_scope=third_party_root_scope),
+            ("auth",),
+        )
+        self._add_task("scopes", api_client._fetch_all_account_scopes, ("auth",))
+
+    @property
+    def account_data(self) -> Dict[str, int]:
+        """Unused identity count per account (empty until loaded)."""
+        return self.results.get("accounts") or {}
+
+    @property
+    def third_party_data(self) -> dict:
+        """3rd parties per account (empty until loaded)."""
+        return self.results.get("third_parties") or {}
+
+    @property
+    def lobby_ready(self) -> bool:
+        """True once everything the lobby map needs has arrived."""
+        return all(name in self._completed for name in LOBBY_TASKS)
+
+    @property
+    def done(self) -> bool:
+        """True once every task has finished (or loading failed)."""
+        return self.error is not None or len(self._completed) == len(self._tasks)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of known tasks finished, from 0.0 to 1.0."""
+        return len(self._completed) / len(self._tasks)
+
+    @property
+    def status_message(self) -> str:
+        """Short description of what is loading, for the progress screen."""
+        if self.error is not None:
+            return "Failed to reach Sonrai"
+        if "auth" not in self._completed:
+            return "Authenticating with Sonrai..."
+        if not self.lobby_ready:
+            return "Fetching AWS accounts and 3rd parties..."
+        pending = [
+            name
+            for name in self._tasks
+            if name.startswith("zombies:") and name not in self._completed
+        ]
+        if pending:
+            return f"Fetching zombies from {len(pending)} account(s)..."
+        return "Ready"
+
+    def start(self) -> None:
+        """Submit every task whose dependencies are already met."""
+        self.started_at = time.perf_counter()
+        logger.info("🚀 Startup loader started")
+        self._schedule()
+
+    def poll(self) -> List[Zombie]:
+        """
+        Collect finished tasks and submit the ones they unblock (never blocks).
+
+        Returns:
+            Zombies that arrived since the last poll
+        """
+        new_zombies: List[Zombie] = []
+        finished = set(self.dispatcher.poll_completed())
+        for name, future in list(self._futures.items()):
+            if name in self._completed or future not in finished:
+                continue
+            self._completed.add(name)
+            new_zombies.extend(self._on_task_done(name, future))
+
+        if self.error is None:
+            self._schedule()
+
+        if self.done and self.finished_at is None:
+            self.finished_at = time.perf_counter()
+            self.dispatcher.shutdown(timeout=1.0)  # Only idle workers left to stop
+            logger.info(
+                f"⏱️  Startup data loaded in {self.finished_at - self.started_at:.2f}s "
+                f"({len(self.zombies)} zombies)"
+            )
+        return new_zombies
+
+    def wait(self, timeout: float = 60.0) -> None:
+        """
+        Poll until everything is loaded (for callers without a frame loop).
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        deadline = time.monotonic() + timeout
+        while not self.done and time.monotonic() < deadline:
+            self.poll()
+            time.sleep(0.01)
+
+    def _add_task(
+        self, name: str, fn: Callable[[], Any], dependencies: Tuple[str, ...] = ()
+    ) -> None:
+        """Register a task to run once all of its dependencies have completed."""
+        self._tasks[name] = (fn, dependencies)
+
+    def _schedule(self) -> None:
+        """Submit tasks whose dependencies have all completed."""
+        for name, (fn, dependencies) in self._tasks.items():
+            if name in self._futures:
+                continue
+            if not all(dependency in self._completed for dependency in dependencies):
+                continue
+            try:
+                self._futures[name] = self.dispatcher.submit(fn)
+            except queue.Full:
+                return  # Try again on the next poll
+
+    def _on_task_done(self, name: str, future: Future) -> List[Zombie]:
+        """Store a finished task's result and expand the graph it unblocks."""
+        try:
+            result = future.result()
+        except Exception as e:
+            result = None
+            if name.startswith("zombies:"):
+                logger.warning(f"  -> Failed to fetch zombies from account {name[8:]}: {e}")
+            elif name in ("auth", "accounts"):
+                self.error = RuntimeError(f"Failed to load {name}: {e}")
+            else:
+                logger.warning(f"Startup task {name} failed: {e}")
+
+        self.results[name] = result
+        elapsed = time.perf_counter() - self.started_at
+        logger.info(f"⏱️  Startup task {name} finished after {elapsed:.2f}s")
+
+        if name == "accounts" and self.error is None:
+            for account_num, zombie_count in (result or {}).items():
+                if zombie_count > 0:
+                    self._add_task(
+                        f"zombies:{account_num}",
+                        lambda a=account_num, c=zombie_count: self.zombie_fetcher(a, c),
+                        ("accounts", "scopes"),
+                    )
+
+        if name.startswith("zombies:") and result:
+            logger.info(f"  -> Added {len(result)} zombies from account {name[8:]}")
+            self.zombies.extend(result)
+            return result
+        return []
+
+    def _authenticate(self) -> bool:
+        """Verify the API token, raising so the loader reports the failure."""
+        if not self.api_client.authenticate():
+            raise RuntimeError("Failed to authenticate with Sonrai API")
+        return True
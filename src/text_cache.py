@@ -0,0 +1,118 @@
+"""Process-wide cache of rendered text surfaces (entity labels, HUD strings)."""
+
+import logging
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+Color = Tuple[int, ...]
+
+# (text, font, color, outline_color)
+TextKey = Tuple[str, pygame.font.Font, Color, Optional[Color]]
+
+# Diagonal offsets of the 1px outline drawn behind outlined labels
+OUTLINE_OFFSETS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class TextCache:
+    """
+    LRU cache of rendered text, shared by the renderer and genre controllers.
+
+    Labels above entities repeat the same few strings every frame; rendering
+    them once and blitting the cached surface avoids a font.render per label
+    per frame (five with an outline). Outlined labels are pre-composited into
+    a single surface. Memory is bounded by an approximate byte budget.
+    """
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Budget for cached surfaces (width * height * 4 per entry)
+        """
+        self.max_bytes = max_bytes
+        self._surfaces: "OrderedDict[TextKey, pygame.Surface]" = OrderedDict()
+        self.resident_bytes = 0
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(
+        self,
+        text: str,
+        font: pygame.font.Font,
+        color: Color,
+        outline_color: Optional[Color] = None,
+    ) -> pygame.Surface:
+        """
+        Get the rendered text, rendering it on first use.
+
+        Outlined text is 2px wider and taller than the plain text and is drawn
+        at (+1, +1) inside it, so blit it one pixel up and left of where the
+        plain text would go.
+
+        Args:
+            text: String to render
+            font: Font to render with (keep it alive, e.g. as an attribute)
+            color: Text color
+            outline_color: 1px outline color, or None for no outline
+
+        Returns:
+            Shared surface - callers must not draw onto it
+        """
+        key = (text, font, tuple(color), tuple(outline_color) if outline_color else None)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._render(text, font, color, outline_color)
+        self._surfaces[key] = surface
+        self.resident_bytes += self._size_of(surface)
+        while self.resident_bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.resident_bytes -= self._size_of(evicted)
+            self.evictions += 1
+        return surface
+
+    @staticmethod
+    def _render(
+        text: str, font: pygame.font.Font, color: Color, outline_color: Optional[Color]
+    ) -> pygame.Surface:
+        """Render plain text, or composite it over its outline."""
+        label = font.render(text, True, color)
+        if outline_color is None:
+            return label
+
+        outline = font.render(text, True, outline_color)
+        surface = pygame.Surface((label.get_width() + 2, label.get_height() + 2), pygame.SRCALPHA)
+        for dx, dy in OUTLINE_OFFSETS:
+            surface.blit(outline, (1 + dx, 1 + dy))
+        surface.blit(label, (1, 1))
+        return surface
+
+    @staticmethod
+    def _size_of(surface: pygame.Surface) -> int:
+        """Approximate memory used by a cached surface."""
+        return surface.get_width() * surface.get_height() * 4
+
+    def clear(self) -> None:
+        """Drop all cached surfaces (e.g. before fonts are shut down)."""
+        self._surfaces.clear()
+        self.resident_bytes = 0
+
+    def __len__(self) -> int:
+        """Number of cached surfaces."""
+        return len(self._surfaces)
+
+
+# Shared cache: labels rendered by any screen are reused by every other one
+TEXT_CACHE = TextCache()
@@ -61,8 +61,9 @@ class ThirdParty:
             "Sonrai Security Platform" if self.is_protected else None
         )
 
-        # Visual
+        # Visual (the sprite only varies with protection status)
         self.sprite = self._create_sprite()
+        self.sprite_key = ("third_party", self.is_protected)
 
     def _check_if_protected(self) -> bool:
         """
@@ -280,6 +281,11 @@ class ThirdParty:
             int(self.position.x), int(self.position.y), self.width, self.height
         )
 
+    @property
+    def is_being_eliminated(self) -> bool:
+        """True once a block is pending (no longer a collision target)."""
+        return self.is_blocking
+
     def take_damage(self, damage: int) -> bool:
         """
         Apply damage to this third party entity.
@@ -0,0 +1,143 @@
+"""Pre-scaled copies of a large surface for the animated landing-zone zoom."""
+
+import logging
+import math
+from collections import OrderedDict
+from typing import List, Optional
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+# Zoom levels are spaced geometrically: this many steps per halving of size
+ZOOM_STEPS_PER_OCTAVE = 8
+
+
+def quantize_zoom(zoom: float, target_zoom: Optional[float] = None) -> float:
+    """
+    Snap a zoom factor to the nearest pyramid step.
+
+    Steps are ~9% apart, which is invisible while the zoom eases in or out
+    but keeps the number of distinct scaled surfaces small. The target zoom is
+    always an exact level, and the result never overshoots it.
+
+    Args:
+        zoom: Current (animating) zoom factor
+        target_zoom: Zoom the animation is heading to, if any
+
+    Returns:
+        Quantized zoom factor
+    """
+    if zoom <= 0 or zoom == target_zoom:
+        return zoom
+
+    step = round(-math.log2(zoom) * ZOOM_STEPS_PER_OCTAVE)
+    quantized = 2.0 ** (-step / ZOOM_STEPS_PER_OCTAVE)
+
+    if target_zoom is not None:
+        if target_zoom < zoom:
+            quantized = max(quantized, target_zoom)
+        elif target_zoom > zoom:
+            quantized = min(quantized, target_zoom)
+    return quantized
+
+
+class ZoomPyramid:
+    """
+    Zoom levels of one base surface, built lazily and cached.
+
+    Below the base scale a mip chain (each level half the size of the one
+    above) is built on demand; a zoom level is smoothscaled from the nearest
+    larger mip, so no single rescale reads more than 4x its output pixels.
+    Zoom levels are kept in an LRU cache bounded by total pixel count.
+    """
+
+    def __init__(
+        self,
+        base: pygame.Surface,
+        base_zoom: float = 1.0,
+        max_pixels: Optional[int] = None,
+    ):
+        """
+        Initialize the pyramid (only the base is resident until a level is requested).
+
+        Args:
+            base: Source surface
+            base_zoom: World zoom factor the base surface was rendered at
+            max_pixels: Pixel budget for cached zoom levels (default: base size)
+        """
+        self.base = base
+        self.base_zoom = base_zoom
+        base_width, base_height = base.get_size()
+        # World size at zoom 1.0
+        self.world_width = base_width / base_zoom
+        self.world_height = base_height / base_zoom
+        self.max_pixels = max_pixels if max_pixels is not None else base_width * base_height
+
+        self._mips: List[pygame.Surface] = [base]
+        self._levels: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self._level_pixels = 0
+
+        # Stats
+        self.builds = 0
+
+    def get(self, zoom: float) -> pygame.Surface:
+        """
+        Get the whole surface at a world zoom factor, building it on first use.
+
+        Args:
+            zoom: World zoom factor (use quantize_zoom() to keep the cache small)
+
+        Returns:
+            Shared surface of size (world_width * zoom, world_height * zoom) -
+            callers must not draw onto it
+        """
+        size = (
+            max(1, int(self.world_width * zoom)),
+            max(1, int(self.world_height * zoom)),
+        )
+        if size == self.base.get_size():
+            return self.base
+
+        level = self._levels.get(size)
+        if level is not None:
+            self._levels.move_to_end(size)
+            return level
+
+        source = self._nearest_mip(zoom / self.base_zoom)
+        level = pygame.transform.smoothscale(source, size)
+        self.builds += 1
+
+        self._levels[size] = level
+        self._level_pixels += size[0] * size[1]
+        while self._level_pixels > self.max_pixels and len(self._levels) > 1:
+            (evicted_width, evicted_height), _ = self._levels.popitem(last=False)
+            self._level_pixels -= evicted_width * evicted_height
+        return level
+
+    def _nearest_mip(self, scale: float) -> pygame.Surface:
+        """Get the smallest mip that is still at least scale times the base size."""
+        if scale >= 1.0:
+            return self.base
+
+        index = int(math.floor(math.log2(1.0 / scale)))
+        while len(self._mips) <= index:
+            parent = self._mips[-1]
+            width, height = parent.get_size()
+            if width <= 1 and height <= 1:
+                break
+            self._mips.append(
+                pygame.transform.smoothscale(parent, (max(1, width // 2), max(1, height // 2)))
+            )
+        return self._mips[min(index, len(self._mips) - 1)]
+
+    @property
+    def resident_levels(self) -> int:
+        """Number of cached zoom levels (not counting the mip chain)."""
+        return len(self._levels)
+
+    def clear(self) -> None:
+        """Drop all cached levels and mips (the base is kept)."""
+        self._mips = [self.base]
+        self._levels.clear()
+        self._level_pixels = 0
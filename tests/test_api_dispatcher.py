@@ -0,0 +1,293 @@
+"""Tests for the bounded API worker pool."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from unittest.mock import Mock, patch
+
+import pytest
+
+from api_dispatcher import ApiDispatcher
+
+
+def _wait_for(condition, timeout=2.0):
+    """Poll until condition() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+class TestApiDispatcher:
+    """Test concurrency limits, backpressure and draining."""
+
+    def test_submit_returns_future_with_result(self):
+        """Test a submitted call resolves its future with the return value."""
+        dispatcher = ApiDispatcher(max_workers=2)
+
+        future = dispatcher.submit(lambda a, b: a + b, 2, b=3)
+
+        assert future.result(timeout=2) == 5
+        dispatcher.shutdown()
+
+    def test_exceptions_are_captured(self):
+        """Test a failing call sets the exception instead of killing the worker."""
+        dispatcher = ApiDispatcher(max_workers=1)
+
+        failing = dispatcher.submit(Mock(side_effect=ValueError("boom")))
+        working = dispatcher.submit(lambda: "ok")
+
+        with pytest.raises(ValueError):
+            failing.result(timeout=2)
+        assert working.result(timeout=2) == "ok"
+        dispatcher.shutdown()
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than max_workers calls run at once."""
+        dispatcher = ApiDispatcher(max_workers=2, max_queued=10)
+        release = threading.Event()
+
+        for _ in range(6):
+            dispatcher.submit(release.wait)
+
+        assert _wait_for(lambda: dispatcher.in_flight == 2)
+        assert dispatcher.queued == 4
+        assert len(dispatcher._workers) == 2
+
+        release.set()
+        assert dispatcher.shutdown()
+        assert dispatcher.in_flight == 0
+
+    def test_full_queue_raises(self):
+        """Test submit pushes back once the queue is full."""
+        dispatcher = ApiDispatcher(max_workers=1, max_queued=1)
+        release = threading.Event()
+
+        dispatcher.submit(release.wait)
+        assert _wait_for(lambda: dispatcher.in_flight == 1)
+        dispatcher.submit(release.wait)
+
+        with pytest.raises(queue.Full):
+            dispatcher.submit(release.wait)
+
+        release.set()
+        dispatcher.shutdown()
+
+    def test_poll_completed_returns_each_future_once(self):
+        """Test finished futures are handed back once, without blocking."""
+        dispatcher = ApiDispatcher(max_workers=2)
+        futures = [dispatcher.submit(lambda i=i: i) for i in range(3)]
+        _wait_for(lambda: all(f.done() for f in futures))
+
+        assert dispatcher.poll_completed() == futures
+        assert dispatcher.poll_completed() == []
+        dispatcher.shutdown()
+
+    def test_future_finishing_during_poll_is_not_dropped(self):
+        """Test a call completing between done() checks is returned by a later poll."""
+
+        class FinishesWhenChecked(Future):
+            """Reports running on its first done() check and finished afterwards."""
+
+            checks = 0
+
+            def done(self):
+                self.checks += 1
+                return self.checks > 1
+
+        dispatcher = ApiDispatcher()
+        future = FinishesWhenChecked()
+        dispatcher._pending.append(future)
+
+        assert dispatcher.poll_completed() == []
+        assert dispatcher.poll_completed() == [future]
+        assert dispatcher._pending == []
+
+    def test_poll_keeps_futures_submitted_concurrently(self):
+        """Test submits racing with polls are each returned exactly once."""
+        dispatcher = ApiDispatcher(max_workers=2, max_queued=1000)
+        submitted = []
+        collected = []
+
+        def submit_many():
+            for i in range(300):
+                submitted.append(dispatcher.submit(lambda i=i: i))
+
+        submitter = threading.Thread(target=submit_many)
+        submitter.start()
+        while submitter.is_alive():
+            collected.extend(dispatcher.poll_completed())
+        _wait_for(lambda: all(f.done() for f in submitted))
+        collected.extend(dispatcher.poll_completed())
+        dispatcher.shutdown()
+
+        assert sorted(map(id, collected)) == sorted(map(id, submitted))
+
+    def test_shutdown_drains_queue(self):
+        """Test queued calls still run before shutdown returns."""
+        dispatcher = ApiDispatcher(max_workers=1, max_queued=10)
+        calls = []
+
+        for i in range(5):
+            dispatcher.submit(lambda i=i: (time.sleep(0.01), calls.append(i)))
+
+        assert dispatcher.shutdown(timeout=5)
+        assert calls == [0, 1, 2, 3, 4]
+        with pytest.raises(RuntimeError):
+            dispatcher.submit(lambda: None)
+
+
+class TestGameEngineApiCalls:
+    """Test the engine routes quarantine calls through the dispatcher."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create a bare engine with just the API plumbing."""
+        from collections import deque
+
+        from game_engine import GameEngine
+        from models import GameState, GameStatus
+
+        engine = GameEngine.__new__(GameEngine)
+        engine.api_dispatcher = ApiDispatcher(max_workers=1, max_queued=1)
+        engine._deferred_api_calls = deque()
+        engine.quest_dispatcher = ApiDispatcher(max_workers=1, max_queued=1, name="quest")
+        engine._quest_requests = {}
+        engine.game_state = GameState(
+            status=GameStatus.PLAYING,
+            zombies_remaining=0,
+            zombies_quarantined=0,
+            total_zombies=0,
+        )
+        engine._save_game = Mock()
+        return engine
+
+    def test_calls_beyond_queue_are_deferred_then_run(self, engine):
+        """Test a backed-up pool defers calls and feeds them in as it frees up."""
+        release = threading.Event()
+        results = []
+
+        def call(i):
+            def run():
+                release.wait()
+                results.append(i)
+                return True
+
+            return run
+
+        for i in range(4):
+            engine._submit_api_call(call(i))
+        assert len(engine._deferred_api_calls) >= 2
+
+        release.set()
+        deadline = time.monotonic() + 2.0
+        while engine._deferred_api_calls and time.monotonic() < deadline:
+            engine._poll_api_calls()  # What GameEngine.update does every frame
+            time.sleep(0.005)
+        engine.shutdown()
+
+        assert results == [0, 1, 2, 3]
+        assert engine.game_state.api_calls_queued == 0
+
+    def test_save_runs_on_main_thread_once_per_poll(self, engine):
+        """Test successful calls trigger one save from the polling thread."""
+        futures = [engine.api_dispatcher.submit(lambda: True)]
+        _wait_for(lambda: futures[0].done())
+
+        engine._poll_api_calls()
+
+        engine._save_game.assert_called_once()
+        engine.shutdown()
+
+    def test_shutdown_with_leftover_deferred_calls_does_not_raise(self, engine):
+        """Test calls still deferred once the dispatcher has closed are dropped, not submitted."""
+        deferred = Mock(return_value=True)
+        engine._deferred_api_calls.append(deferred)
+        close = engine.api_dispatcher.shutdown
+
+        # No time left to feed the deferred call in, but the pool itself drains
+        with patch.object(engine.api_dispatcher, "shutdown", lambda timeout: close(timeout=2.0)):
+            engine.shutdown(timeout=0.0)
+
+        deferred.assert_not_called()
+        assert list(engine._deferred_api_calls) == [deferred]
+
+
+class TestGameEngineQuestCalls:
+    """Test quest API calls return immediately and apply results on a later frame."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create a bare engine with just the quest call plumbing."""
+        from game_engine import GameEngine
+        from models import GameState, GameStatus
+
+        engine = GameEngine.__new__(GameEngine)
+        engine.quest_dispatcher = ApiDispatcher(max_workers=1, max_queued=4, name="quest")
+        engine._quest_requests = {}
+        engine.game_state = GameState(
+            status=GameStatus.PLAYING,
+            zombies_remaining=0,
+            zombies_quarantined=0,
+            total_zombies=0,
+        )
+        yield engine
+        engine.quest_dispatcher.shutdown(timeout=1.0)
+
+    def test_result_is_applied_on_poll_not_on_request(self, engine):
+        """Test the request returns while the call is still running."""
+        release = threading.Event()
+        results = []
+
+        started = engine._request_quest_call(
+            "protect", "Protecting s3", lambda: release.wait() and "done", results.append
+        )
+
+        assert started is True
+        assert results == []
+        assert engine.game_state.quest_calls_pending == ["Protecting s3"]
+
+        release.set()
+        engine.wait_for_quest_requests(timeout=2.0)
+
+        assert results == ["done"]
+        assert engine.game_state.quest_calls_pending == []
+
+    def test_duplicate_request_is_ignored_while_pending(self, engine):
+        """Test touching a quest target every frame sends one API call."""
+        release = threading.Event()
+        calls = []
+
+        def call():
+            calls.append(1)
+            release.wait()
+            return True
+
+        assert engine._request_quest_call("jit:ps-1", "JIT", call, Mock())
+        assert not engine._request_quest_call("jit:ps-1", "JIT", call, Mock())
+
+        release.set()
+        engine.wait_for_quest_requests(timeout=2.0)
+        assert len(calls) == 1
+
+    def test_failed_call_skips_callback(self, engine):
+        """Test an exception in the API call is logged, not raised in the game loop."""
+        on_result = Mock()
+
+        def call():
+            raise RuntimeError("backend down")
+
+        engine._request_quest_call("protect", "Protecting s3", call, on_result)
+        engine.wait_for_quest_requests(timeout=2.0)
+
+        on_result.assert_not_called()
+        assert engine._quest_requests == {}
+
+    def test_finished_calls_are_released_by_the_dispatcher(self, engine):
+        """Test polling drains the dispatcher so finished futures are not kept forever."""
+        for i in range(3):
+            engine._request_quest_call(f"jit:{i}", "JIT", lambda: True, Mock())
+        engine.wait_for_quest_requests(timeout=2.0)
+
+        assert engine.quest_dispatcher._pending == []
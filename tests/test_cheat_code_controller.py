@@ -50,6 +50,20 @@ class TestCheatCodeController:
         assert result.action == CheatCodeAction.SKIP_LEVEL
         assert result.message is None  # Handled by GameEngine
 
+    def test_profiler_code_detection(self):
+        """TIMING code toggles the frame profiler."""
+        controller = CheatCodeController()
+
+        # Type T-I-M-I-N-G
+        keys = [ord("t"), ord("i"), ord("m"), ord("i"), ord("n"), ord("g")]
+        result = None
+        for key in keys:
+            result = controller.process_key(key, current_time=0)
+
+        assert result.action == CheatCodeAction.TOGGLE_PROFILER
+        assert result.message is None  # Handled by GameEngine
+        assert controller.cheat_buffer == []
+
     def test_konami_code_detection(self):
         """Konami code is detected correctly."""
         controller = CheatCodeController()
@@ -0,0 +1,147 @@
+"""Tests for chunked, lazily rendered level surfaces."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from chunked_surface import ChunkedSurface
+from game_map import GameMap
+
+
+def _striped_renderer(calls):
+    """Renderer that paints each world column with a color derived from x."""
+
+    def render(area):
+        calls.append(area.x)
+        surface = pygame.Surface(area.size)
+        for x in range(area.width):
+            world_x = area.x + x
+            pygame.draw.line(surface, (world_x % 256, 0, 0), (x, 0), (x, area.height - 1))
+        return surface
+
+    return render
+
+
+class TestChunkedSurface:
+    """Test chunk caching and view blitting."""
+
+    def test_chunks_render_lazily(self):
+        """Test nothing is rendered until a chunk is requested."""
+        calls = []
+        chunks = ChunkedSurface(1000, 20, _striped_renderer(calls), chunk_width=100)
+
+        assert chunks.chunk_count == 10
+        assert chunks.resident_chunks == 0
+        assert calls == []
+
+        chunks.get_chunk(3)
+        chunks.get_chunk(3)
+        assert calls == [300]
+
+    def test_last_chunk_is_clipped_to_world_width(self):
+        """Test a partial trailing chunk covers only the remaining width."""
+        chunks = ChunkedSurface(250, 20, _striped_renderer([]), chunk_width=100)
+
+        assert chunks.chunk_count == 3
+        assert chunks.chunk_rect(2) == pygame.Rect(200, 0, 50, 20)
+        assert chunks.get_chunk(2).get_width() == 50
+
+    def test_least_recently_used_chunk_is_evicted(self):
+        """Test the cache never exceeds max_chunks and drops the LRU chunk."""
+        calls = []
+        chunks = ChunkedSurface(1000, 20, _striped_renderer(calls), chunk_width=100, max_chunks=2)
+
+        chunks.get_chunk(0)
+        chunks.get_chunk(1)
+        chunks.get_chunk(0)  # 1 is now least recently used
+        chunks.get_chunk(2)
+
+        assert chunks.resident_chunks == 2
+        assert chunks.evictions == 1
+        chunks.get_chunk(0)
+        assert calls == [0, 100, 200]
+        chunks.get_chunk(1)
+        assert calls == [0, 100, 200, 100]
+
+    def test_blit_view_across_chunk_seam(self):
+        """Test a view spanning two chunks matches the world pixels."""
+        chunks = ChunkedSurface(1000, 20, _striped_renderer([]), chunk_width=100)
+        screen = pygame.Surface((150, 20))
+
+        chunks.blit_view(screen, pygame.Rect(170, 0, 150, 20))
+
+        for x in (0, 29, 30, 129, 149):
+            assert screen.get_at((x, 10))[0] == (170 + x) % 256
+
+    def test_prefetch_renders_neighbours(self):
+        """Test prefetch renders chunks within the margin of the view."""
+        calls = []
+        chunks = ChunkedSurface(1000, 20, _striped_renderer(calls), chunk_width=100)
+
+        chunks.prefetch(pygame.Rect(350, 0, 100, 20))
+
+        assert sorted(calls) == [200, 300, 400, 500]
+
+    def test_render_scaled_does_not_fill_cache(self):
+        """Test building an overview leaves the resident chunks untouched."""
+        chunks = ChunkedSurface(1000, 20, _striped_renderer([]), chunk_width=100, max_chunks=2)
+        chunks.get_chunk(5)
+
+        overview = chunks.render_scaled(100, 2)
+
+        assert overview.get_size() == (100, 2)
+        assert chunks.resident_chunks == 1
+        assert chunks.evictions == 0
+
+
+class TestPlatformerChunks:
+    """Test platformer levels render through chunks."""
+
+    @pytest.fixture
+    def level(self):
+        """Create a small platformer level."""
+        pygame.init()
+        return GameMap("unused.png", 800, 600, account_data={"Test": 50}, mode="platformer")
+
+    def test_platformer_level_has_no_full_surface(self, level):
+        """Test entering a level allocates no full-size map surface."""
+        assert level.map_surface is None
+        assert level.map_chunks.get_size() == (level.map_width, level.map_height)
+        assert level.map_chunks.resident_chunks == 0
+
+    def test_chunks_match_single_pass_render(self, level):
+        """Test stitched chunks are pixel-identical to one render of the level."""
+        whole = level._render_platformer_chunk(pygame.Rect(0, 0, level.map_width, level.map_height))
+        stitched = pygame.Surface((level.map_width, level.map_height))
+        for index in range(level.map_chunks.chunk_count):
+            stitched.blit(level.map_chunks.get_chunk(index), level.map_chunks.chunk_rect(index))
+
+        assert pygame.image.tobytes(stitched, "RGB") == pygame.image.tobytes(whole, "RGB")
+
+    def test_scrolling_keeps_memory_bounded(self, level):
+        """Test scrolling the whole level keeps at most max_chunks resident."""
+        screen = pygame.Surface((800, 600))
+        chunk_bytes = level.PLATFORMER_CHUNK_WIDTH * level.map_height * 4
+
+        for player_x in range(0, level.map_width, 400):
+            level.update_camera(player_x, level.map_height // 2)
+            level.render(screen)
+
+        assert level.map_chunks.resident_chunks <= level.map_chunks.max_chunks
+        assert level.map_chunks.resident_bytes <= level.map_chunks.max_chunks * chunk_bytes
+
+    def test_landing_zone_view_uses_cached_overview(self, level):
+        """Test the overview is built once and reused across frames."""
+        screen = pygame.Surface((800, 600))
+        level.toggle_landing_zone_view()
+        level.zoom = level.target_zoom
+
+        level.render(screen)
+        overview = level._landing_overview
+        level.render(screen)
+
+        assert overview is not None
+        assert level._landing_overview is overview
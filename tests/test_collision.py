@@ -1,5 +1,9 @@
 """Tests for collision detection system."""
 
+import random
+from unittest.mock import patch
+
+import pygame
 import pytest
 from models import Vector2
 from collision import SpatialGrid, check_collisions_with_spatial_grid
@@ -72,3 +76,141 @@ class TestProjectileCollision:
         proj_bounds = projectile.get_bounds()
         zombie_bounds = zombie.get_bounds()
         assert not proj_bounds.colliderect(zombie_bounds)
+
+
+class TestPersistentSpatialGrid:
+    """Test incremental updates and removal in the persistent grid."""
+
+    def _zombie(self, x, y, identity_id="test-123"):
+        return Zombie(
+            identity_id=identity_id,
+            identity_name="test-zombie",
+            position=Vector2(x, y),
+            account="123456789012",
+        )
+
+    def test_update_within_cell_does_not_move_entity(self):
+        """Test small moves inside a cell leave the index untouched."""
+        grid = SpatialGrid(800, 600)
+        zombie = self._zombie(110, 110)
+        grid.update(zombie)
+        cells_before = {k: dict(v) for k, v in grid.cells.items()}
+
+        zombie.position.x += 2
+        grid.update(zombie)
+
+        assert grid.cells == cells_before
+
+    def test_update_across_cell_boundary_moves_entity(self):
+        """Test an entity crossing a boundary is found only at its new cell."""
+        grid = SpatialGrid(800, 600)
+        zombie = self._zombie(100, 100)
+        grid.update(zombie)
+
+        zombie.position.x = 500
+        grid.update(zombie)
+
+        assert zombie not in grid.query(pygame.Rect(100, 100, 4, 4))
+        assert zombie in grid.query(zombie.get_bounds())
+
+    def test_remove_frees_cells(self):
+        """Test removal drops the entity and leaves no empty cells behind."""
+        grid = SpatialGrid(800, 600)
+        zombie = self._zombie(100, 100)
+        grid.update(zombie)
+
+        grid.remove(zombie)
+        grid.remove(zombie)  # second remove is a no-op
+
+        assert zombie not in grid
+        assert len(grid) == 0
+        assert grid.cells == {}
+
+    def test_quarantined_zombie_is_removed_and_not_hit(self):
+        """Test entities being eliminated leave the index and can't be hit."""
+        grid = SpatialGrid(800, 600)
+        zombie = self._zombie(100, 100)
+        bounds = zombie.get_bounds()
+        projectile = Projectile(Vector2(bounds.centerx, bounds.centery))
+        assert check_collisions_with_spatial_grid([projectile], [zombie], grid)
+
+        zombie.mark_for_quarantine()
+
+        assert check_collisions_with_spatial_grid([projectile], [zombie], grid) == []
+        assert zombie not in grid
+
+    def test_only_listed_entities_are_hit(self):
+        """Test entities indexed by an earlier call are ignored if not listed."""
+        grid = SpatialGrid(800, 600)
+        zombie = self._zombie(100, 100)
+        other = self._zombie(400, 400, identity_id="test-456")
+        bounds = zombie.get_bounds()
+        projectile = Projectile(Vector2(bounds.centerx, bounds.centery))
+        check_collisions_with_spatial_grid([projectile], [zombie], grid)
+
+        assert check_collisions_with_spatial_grid([projectile], [other], grid) == []
+
+    def test_overlapping_entities_first_in_list_wins(self):
+        """Test a projectile overlapping two entities hits the earliest listed."""
+        grid = SpatialGrid(800, 600)
+        first = self._zombie(100, 100, identity_id="first")
+        second = self._zombie(102, 100, identity_id="second")
+        bounds = first.get_bounds()
+        projectile = Projectile(Vector2(bounds.centerx, bounds.centery))
+
+        assert check_collisions_with_spatial_grid([projectile], [second, first], grid) == [
+            (projectile, second)
+        ]
+        assert check_collisions_with_spatial_grid([projectile], [first, second], grid) == [
+            (projectile, first)
+        ]
+
+
+class TestVectorizedCollisionBackend:
+    """Test the NumPy backend matches the spatial grid backend."""
+
+    def _crowd(self, count, seed):
+        rng = random.Random(seed)
+        zombies = [
+            Zombie(
+                identity_id=f"test-{i}",
+                identity_name="test-zombie",
+                position=Vector2(rng.uniform(0, 760), rng.uniform(0, 560)),
+                account="123456789012",
+            )
+            for i in range(count)
+        ]
+        projectiles = [
+            Projectile(Vector2(rng.uniform(0, 800), rng.uniform(0, 600))) for _ in range(60)
+        ]
+        return zombies, projectiles
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_spatial_grid_results(self, seed):
+        """Test both backends return identical pairs, in the same order."""
+        pytest.importorskip("numpy")
+        from collision import VectorizedCollisionBackend
+
+        zombies, projectiles = self._crowd(300, seed)
+        for zombie in zombies[::7]:
+            zombie.mark_for_quarantine()
+
+        expected = check_collisions_with_spatial_grid(projectiles, zombies, SpatialGrid(800, 600))
+
+        assert expected
+        assert VectorizedCollisionBackend().check(projectiles, zombies) == expected
+
+    def test_check_collisions_selects_backend_by_entity_count(self):
+        """Test the dispatcher uses NumPy only for large crowds."""
+        pytest.importorskip("numpy")
+        import collision
+
+        zombies, projectiles = self._crowd(collision.VECTORIZED_ENTITY_THRESHOLD, seed=4)
+        grid = SpatialGrid(800, 600)
+
+        with patch.object(collision, "check_collisions_with_spatial_grid") as grid_path:
+            collision.check_collisions(projectiles, zombies, grid)
+            grid_path.assert_not_called()
+
+            collision.check_collisions(projectiles, zombies[:10], grid)
+            grid_path.assert_called_once()
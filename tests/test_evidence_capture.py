@@ -23,6 +23,13 @@ pygame.init()
 from evidence_capture import EvidenceCapture
 
 
+@pytest.fixture
+def recordings_dir(tmp_path):
+    """Write recordings into a temporary directory instead of the repo."""
+    with patch.object(EvidenceCapture, "RECORDINGS_DIR", str(tmp_path)):
+        yield tmp_path
+
+
 class TestEvidenceCaptureInitialization:
     """Tests for EvidenceCapture initialization."""
 
@@ -33,7 +40,7 @@ class TestEvidenceCaptureInitialization:
             assert evidence is not None
             assert evidence.is_recording is False
             assert evidence.recording_start_time == 0.0
-            assert evidence.recording_frames == []
+            assert evidence.encoder is None
             assert evidence.last_frame_time == 0.0
             assert evidence.flash_alpha == 0
             assert evidence._screenshot_pending is False
@@ -301,6 +308,7 @@ class TestDeferredScreenshot:
             assert evidence._screenshot_pending is True
 
 
+@pytest.mark.usefixtures("recordings_dir")
 class TestRecordingControl:
     """Tests for recording start/stop functionality."""
 
@@ -313,7 +321,7 @@ class TestRecordingControl:
 
             assert evidence.is_recording is True
             assert evidence.recording_start_time == 10.0
-            assert evidence.recording_frames == []
+            assert evidence.encoder is None
             assert evidence.last_frame_time == 10.0
 
     def test_start_recording_when_already_recording(self):
@@ -340,7 +348,6 @@ class TestRecordingControl:
         with patch.object(EvidenceCapture, "_ensure_directories"):
             evidence = EvidenceCapture()
             evidence.is_recording = True
-            evidence.recording_frames = []
 
             result = evidence.stop_recording()
 
@@ -361,14 +368,14 @@ class TestRecordingControl:
         """Test toggle_recording stops recording when recording."""
         with patch.object(EvidenceCapture, "_ensure_directories"):
             evidence = EvidenceCapture()
-            evidence.is_recording = True
-            evidence.recording_frames = []  # No frames
+            evidence.is_recording = True  # No frames
 
             result = evidence.toggle_recording(20.0)
 
             assert evidence.is_recording is False
 
 
+@pytest.mark.usefixtures("recordings_dir")
 class TestFrameCapture:
     """Tests for frame capture during recording."""
 
@@ -380,7 +387,7 @@ class TestFrameCapture:
 
             evidence.capture_frame(mock_screen, 10.0)
 
-            assert len(evidence.recording_frames) == 0
+            assert evidence.encoder is None
 
     def test_capture_frame_respects_fps_limit(self):
         """Test that frames are captured at the correct FPS."""
@@ -390,8 +397,9 @@ class TestFrameCapture:
             evidence.recording_start_time = 0.0
             evidence.last_frame_time = 0.0
 
-            mock_screen = Mock(spec=pygame.Surface)
-            mock_screen.copy.return_value = Mock(spec=pygame.Surface)
+            mock_screen = pygame.Surface((64, 48))
+            mock_encoder = Mock()
+            evidence.encoder = mock_encoder
 
             # First frame should be captured (time >= last_frame_time + interval)
             # At time 0.0, last_frame_time is 0.0, interval is ~0.033
@@ -403,7 +411,20 @@ class TestFrameCapture:
             # This should be captured (enough time passed: 0.07 - 0.034 = 0.036 > 0.033)
             evidence.capture_frame(mock_screen, 0.07)
 
-            assert len(evidence.recording_frames) == 2
+            assert mock_encoder.submit.call_count == 2
+            assert len(mock_encoder.submit.call_args[0][0]) == 64 * 48 * 4
+
+    def test_capture_frame_starts_encoder_at_first_frame(self, recordings_dir):
+        """Test that the encoder is created from the first captured frame's size."""
+        evidence = EvidenceCapture(recording_format="gif")
+        evidence.start_recording(0.0)
+
+        evidence.capture_frame(pygame.Surface((64, 48)), 0.034)
+
+        assert evidence.encoder is not None
+        assert evidence.encoder.size == (64, 48)
+        assert evidence.encoder.path.startswith(os.path.join(str(recordings_dir), "ZB_"))
+        assert evidence.wait_for_recording(timeout=5.0) is True
 
     def test_capture_frame_auto_stops_at_max_duration(self):
         """Test that recording auto-stops at max duration."""
@@ -554,54 +575,81 @@ class TestRenderRecordingIndicator:
                     assert mock_font.render.call_count >= 2
 
 
-class TestSaveRecording:
-    """Tests for saving recordings."""
+class TestRecordingFormat:
+    """Tests for choosing the recording format."""
 
-    def test_save_recording_clears_frames(self):
-        """Test that _save_recording clears frames after saving."""
+    def test_recording_format_defaults_to_gif(self, monkeypatch):
+        """Test that GIF is used when nothing is configured."""
+        monkeypatch.delenv("EVIDENCE_RECORDING_FORMAT", raising=False)
         with patch.object(EvidenceCapture, "_ensure_directories"):
-            evidence = EvidenceCapture()
+            assert EvidenceCapture().recording_format == "gif"
 
-            # Create mock frames
-            mock_frame = Mock(spec=pygame.Surface)
-            mock_frame.get_size.return_value = (100, 100)
-            evidence.recording_frames = [mock_frame]
+    def test_recording_format_from_environment(self, monkeypatch):
+        """Test that EVIDENCE_RECORDING_FORMAT selects MP4."""
+        monkeypatch.setenv("EVIDENCE_RECORDING_FORMAT", "MP4")
+        with patch.object(EvidenceCapture, "_ensure_directories"):
+            assert EvidenceCapture().recording_format == "mp4"
 
-            with patch("pygame.image.tostring", return_value=b"\x00" * 30000):
-                with patch.object(
-                    evidence, "_save_frames_as_pngs", return_value="test_folder/"
-                ):
-                    evidence._save_recording()
+    def test_unknown_recording_format_falls_back_to_gif(self):
+        """Test that an unsupported format falls back to GIF."""
+        with patch.object(EvidenceCapture, "_ensure_directories"):
+            assert EvidenceCapture(recording_format="avi").recording_format == "gif"
 
-                    assert evidence.recording_frames == []
 
+@pytest.mark.usefixtures("recordings_dir")
+class TestStopRecording:
+    """Tests for finishing recordings in the background."""
 
-class TestSaveFramesAsPngs:
-    """Tests for PNG fallback saving."""
+    def test_stop_recording_closes_encoder_without_waiting(self):
+        """Test that stopping hands the clip to the encoder and returns its filename."""
+        with patch.object(EvidenceCapture, "_ensure_directories"):
+            evidence = EvidenceCapture()
+            evidence.start_recording(0.0)
+            mock_encoder = Mock(path=os.path.join("recordings", "ZB_20240101_120000.gif"))
+            evidence.encoder = mock_encoder
 
-    def test_save_frames_as_pngs_creates_folder(self):
-        """Test that _save_frames_as_pngs creates a folder for frames."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            original_recordings = EvidenceCapture.RECORDINGS_DIR
+            result = evidence.stop_recording()
 
-            try:
-                EvidenceCapture.RECORDINGS_DIR = tmpdir
+            assert result == "ZB_20240101_120000.gif"
+            mock_encoder.close.assert_called_once()
+            mock_encoder.wait.assert_not_called()
+            assert evidence.encoder is None
 
-                with patch.object(EvidenceCapture, "_ensure_directories"):
-                    evidence = EvidenceCapture()
+    def test_stop_recording_returns_folder_for_png_fallback(self):
+        """Test that a PNG sequence recording returns its folder name."""
+        with patch.object(EvidenceCapture, "_ensure_directories"):
+            evidence = EvidenceCapture()
+            evidence.start_recording(0.0)
+            evidence.encoder = Mock(path=os.path.join("recordings", "ZB_20240101_120000/"))
 
-                    mock_frame = Mock(spec=pygame.Surface)
-                    evidence.recording_frames = [mock_frame]
+            assert evidence.stop_recording() == "ZB_20240101_120000/"
 
-                    with patch("pygame.image.save"):
-                        result = evidence._save_frames_as_pngs()
+    def test_wait_for_recording_waits_for_stopped_clips(self):
+        """Test that wait_for_recording waits for clips still encoding."""
+        with patch.object(EvidenceCapture, "_ensure_directories"):
+            evidence = EvidenceCapture()
+            evidence.start_recording(0.0)
+            mock_encoder = Mock(path="ZB_20240101_120000.gif", done=False)
+            mock_encoder.wait.return_value = True
+            evidence.encoder = mock_encoder
+            evidence.stop_recording()
 
-                        assert result.startswith("ZB_")
-                        assert result.endswith("/")
-            finally:
-                EvidenceCapture.RECORDINGS_DIR = original_recordings
+            assert evidence.wait_for_recording(timeout=1.0) is True
+            mock_encoder.wait.assert_called_once()
 
+    def test_wait_for_recording_reports_timeout(self):
+        """Test that wait_for_recording returns False if a clip is still encoding."""
+        with patch.object(EvidenceCapture, "_ensure_directories"):
+            evidence = EvidenceCapture()
+            evidence.start_recording(0.0)
+            mock_encoder = Mock(path="ZB_20240101_120000.gif", done=False)
+            mock_encoder.wait.return_value = False
+            evidence.encoder = mock_encoder
 
+            assert evidence.wait_for_recording(timeout=0.0) is False
+
+
+@pytest.mark.usefixtures("recordings_dir")
 class TestIntegration:
     """Integration tests for the evidence capture system."""
 
@@ -627,32 +675,34 @@ class TestIntegration:
             evidence.update_flash(0.2)
             assert evidence.flash_alpha == 0
 
-    def test_full_recording_workflow(self):
+    def test_full_recording_workflow(self, recordings_dir):
         """Test complete recording workflow."""
-        with patch.object(EvidenceCapture, "_ensure_directories"):
-            evidence = EvidenceCapture()
+        evidence = EvidenceCapture(recording_format="gif")
 
-            mock_screen = Mock(spec=pygame.Surface)
-            mock_screen.copy.return_value = Mock(spec=pygame.Surface)
+        mock_screen = pygame.Surface((64, 48))
 
-            # Start recording
-            result = evidence.toggle_recording(0.0)
-            assert result is None
-            assert evidence.is_recording is True
+        # Start recording
+        result = evidence.toggle_recording(0.0)
+        assert result is None
+        assert evidence.is_recording is True
 
-            # Capture some frames - need to space them at least 1/30 seconds apart
-            # Frame interval is 1/30 = 0.0333 seconds
-            # Start at 0.034 to ensure first frame captures (0.034 - 0.0 >= 0.033)
-            for i in range(5):
-                evidence.capture_frame(mock_screen, 0.034 + i * 0.034)
+        # Capture some frames - need to space them at least 1/30 seconds apart
+        # Frame interval is 1/30 = 0.0333 seconds
+        # Start at 0.034 to ensure first frame captures (0.034 - 0.0 >= 0.033)
+        for i in range(5):
+            mock_screen.fill((i * 40, 0, 0))
+            evidence.capture_frame(mock_screen, 0.034 + i * 0.034)
 
-            assert len(evidence.recording_frames) == 5
+        encoder = evidence.encoder
 
-            # Stop recording
-            with patch.object(evidence, "_save_recording", return_value="test.gif"):
-                result = evidence.toggle_recording(1.0)
+        # Stop recording
+        result = evidence.toggle_recording(1.0)
 
-                assert evidence.is_recording is False
+        assert evidence.is_recording is False
+        assert result.startswith("ZB_") and result.endswith(".gif")
+        assert evidence.wait_for_recording(timeout=5.0) is True
+        assert encoder.frames_written == 5
+        assert os.path.exists(os.path.join(str(recordings_dir), result))
 
 
 # Run tests if executed directly
@@ -0,0 +1,144 @@
+"""Tests for fixed-rate simulation stepping and render interpolation."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from fixed_timestep import FixedTimestep, Interpolator
+from models import Vector2
+
+
+class FakeEngine:
+    """Just enough of GameEngine for the interpolator."""
+
+    def __init__(self, zombies=(), game_map=None):
+        self.player = SimpleNamespace(position=Vector2(0.0, 0.0))
+        self.zombies = list(zombies)
+        self.game_map = game_map
+
+    def get_player(self):
+        return self.player
+
+    def get_zombies(self):
+        return self.zombies
+
+    def get_third_parties(self):
+        return []
+
+    def get_projectiles(self):
+        return []
+
+    def get_boss(self):
+        return None
+
+    def get_game_map(self):
+        return self.game_map
+
+
+class TestFixedTimestep:
+    """Test turning frame times into fixed steps."""
+
+    def test_steps_carry_remainder(self):
+        """Test that partial steps accumulate across frames."""
+        timestep = FixedTimestep(update_rate=60)
+
+        assert timestep.advance(0.010) == 0
+        assert timestep.alpha == pytest.approx(0.6)
+        assert timestep.advance(0.010) == 1
+        assert timestep.alpha == pytest.approx(0.2)
+
+    def test_render_slower_than_simulation(self):
+        """Test that 30 FPS rendering runs two 60 Hz steps per frame."""
+        timestep = FixedTimestep(update_rate=60)
+
+        steps = [timestep.advance(1 / 30) for _ in range(30)]
+
+        assert sum(steps) == 60
+        assert set(steps) <= {1, 2, 3}
+
+    def test_simulated_time_matches_real_time(self):
+        """Test that uneven frame times add up to the same simulated time."""
+        timestep = FixedTimestep(update_rate=60)
+        frames = [0.005, 0.031, 0.017, 0.022, 0.009, 0.040] * 10
+
+        steps = sum(timestep.advance(frame) for frame in frames)
+
+        assert steps * timestep.step + timestep.accumulator == pytest.approx(sum(frames))
+
+    def test_hitch_is_capped(self):
+        """Test that a long frame runs at most max_steps and drops the rest."""
+        timestep = FixedTimestep(update_rate=60, max_steps=5)
+
+        assert timestep.advance(2.0) == 5
+        assert timestep.accumulator == 0.0
+        assert timestep.dropped_time == pytest.approx(2.0 - 5 / 60)
+        assert timestep.advance(1 / 60) == 1
+
+    def test_rejects_invalid_rates(self):
+        """Test that non-positive rates and step limits are rejected."""
+        with pytest.raises(ValueError):
+            FixedTimestep(update_rate=0)
+        with pytest.raises(ValueError):
+            FixedTimestep(max_steps=0)
+
+
+class TestInterpolator:
+    """Test drawing positions between the last two simulation steps."""
+
+    def test_apply_blends_and_restore_puts_back(self):
+        """Test that positions are blended for rendering and then restored."""
+        engine = FakeEngine()
+        interpolator = Interpolator()
+        interpolator.capture(engine)
+        engine.player.position.x = 10.0
+        engine.player.position.y = -4.0
+
+        interpolator.apply(engine, 0.25)
+        assert (engine.player.position.x, engine.player.position.y) == (2.5, -1.0)
+
+        interpolator.restore()
+        assert (engine.player.position.x, engine.player.position.y) == (10.0, -4.0)
+
+    def test_teleports_and_new_entities_are_not_blended(self):
+        """Test that large jumps and entities added after capture are drawn as is."""
+        zombie = SimpleNamespace(position=Vector2(0.0, 0.0))
+        engine = FakeEngine(zombies=[zombie])
+        interpolator = Interpolator(snap_distance=50.0)
+        interpolator.capture(engine)
+        zombie.position.x = 500.0
+        newcomer = SimpleNamespace(position=Vector2(7.0, 7.0))
+        engine.zombies.append(newcomer)
+
+        interpolator.apply(engine, 0.5)
+
+        assert zombie.position.x == 500.0
+        assert (newcomer.position.x, newcomer.position.y) == (7.0, 7.0)
+
+    def test_camera_is_blended(self):
+        """Test that the map camera follows the interpolated player."""
+        game_map = SimpleNamespace(camera_x=100.0, camera_y=0.0)
+        engine = FakeEngine(game_map=game_map)
+        interpolator = Interpolator()
+        interpolator.capture(engine)
+        game_map.camera_x = 110.0
+
+        interpolator.apply(engine, 0.5)
+        assert game_map.camera_x == 105.0
+
+        interpolator.restore()
+        assert game_map.camera_x == 110.0
+
+    def test_shared_position_is_blended_once(self):
+        """Test that a position vector reachable twice is only moved once."""
+        shared = Vector2(0.0, 0.0)
+        engine = FakeEngine(zombies=[SimpleNamespace(position=shared)])
+        engine.player.position = shared
+        interpolator = Interpolator()
+        interpolator.capture(engine)
+        shared.x = 8.0
+
+        interpolator.apply(engine, 0.5)
+        assert shared.x == 4.0
+
+        interpolator.restore()
+        assert shared.x == 8.0
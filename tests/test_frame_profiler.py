@@ -0,0 +1,185 @@
+"""Tests for the frame profiler."""
+
+import csv
+import json
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from frame_profiler import FRAME, FrameProfiler, percentile
+from renderer import Renderer
+
+
+def profile_frame(profiler, sections):
+    """Profile one frame with fixed section durations in seconds."""
+    profiler.begin_frame()
+    for name, seconds in sections.items():
+        profiler.add(name, seconds)
+    profiler.end_frame()
+
+
+class TestPercentile:
+    """Test the nearest-rank percentile helper."""
+
+    def test_nearest_rank(self):
+        """Test percentiles pick the nearest-rank value."""
+        values = [float(i) for i in range(1, 101)]
+
+        assert percentile(values, 0.50) == 50.0
+        assert percentile(values, 0.95) == 95.0
+        assert percentile(values, 0.99) == 99.0
+
+    def test_empty_and_single_value(self):
+        """Test edge cases do not raise."""
+        assert percentile([], 0.95) == 0.0
+        assert percentile([3.0], 0.01) == 3.0
+
+
+class TestFrameProfiler:
+    """Test section timing, rolling statistics and trace dumps."""
+
+    def test_disabled_profiler_records_nothing(self):
+        """Test every hook is a no-op while disabled."""
+        profiler = FrameProfiler()
+
+        profiler.begin_frame()
+        profiler.mark("update")
+        with profiler.section("collisions"):
+            pass
+        profiler.end_frame()
+
+        assert profiler.frames == 0
+        assert profiler.sections() == []
+        assert not profiler.trace
+
+    def test_marks_and_sections_are_recorded(self):
+        """Test marks charge the time since the previous mark and sections nest."""
+        profiler = FrameProfiler()
+        profiler.enabled = True
+
+        profiler.begin_frame()
+        with profiler.section("collisions"):
+            pass
+        profiler.mark("update")
+        profiler.mark("flip")
+        profiler.end_frame()
+
+        frame = profiler.trace[-1]
+        assert set(frame) == {FRAME, "collisions", "update", "flip"}
+        assert frame["collisions"] <= frame["update"]
+        assert frame["update"] + frame["flip"] <= frame[FRAME]
+        assert profiler.sections() == [FRAME, "collisions", "update", "flip"]
+
+    def test_stats_over_rolling_window(self):
+        """Test percentiles cover only the last `window` frames, in milliseconds."""
+        profiler = FrameProfiler(window=10)
+        profiler.enabled = True
+
+        for _ in range(50):
+            profile_frame(profiler, {"update": 0.100})
+        for ms in range(1, 11):
+            profile_frame(profiler, {"update": ms / 1000})
+
+        p50, p95, p99 = profiler.stats("update")
+        assert p50 == pytest.approx(5.0)
+        assert p95 == pytest.approx(10.0)
+        assert p99 == pytest.approx(10.0)
+        assert len(profiler.frame_times()) == 10
+
+    def test_late_section_is_padded_to_frame_window(self):
+        """Test a section first seen mid-run counts as zero for earlier frames."""
+        profiler = FrameProfiler(window=4)
+        profiler.enabled = True
+
+        profile_frame(profiler, {"update": 0.001})
+        profile_frame(profiler, {"update": 0.001, "boss": 0.002})
+
+        assert profiler.stats("boss")[0] == 0.0
+        assert profiler.stats("boss")[2] == pytest.approx(2.0)
+
+    def test_toggle_off_discards_partial_frame(self):
+        """Test disabling mid-frame drops that frame."""
+        profiler = FrameProfiler()
+        assert profiler.toggle() is True
+
+        profiler.begin_frame()
+        profiler.mark("update")
+        assert profiler.toggle() is False
+        profiler.end_frame()
+
+        assert profiler.frames == 0
+
+    def test_dump_csv(self, tmp_path):
+        """Test the CSV trace has one row per frame and one column per section."""
+        profiler = FrameProfiler()
+        profiler.enabled = True
+        profile_frame(profiler, {"update": 0.004})
+        profile_frame(profiler, {"update": 0.002, "flip": 0.001})
+
+        path = tmp_path / "trace.csv"
+        assert profiler.dump(str(path))
+
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 2
+        assert list(rows[0]) == [FRAME, "flip", "update"]
+        assert float(rows[0]["update"]) == pytest.approx(4.0)
+        assert float(rows[0]["flip"]) == 0.0
+
+    def test_dump_json(self, tmp_path):
+        """Test the JSON trace records milliseconds per frame."""
+        profiler = FrameProfiler()
+        profiler.enabled = True
+        profile_frame(profiler, {"update": 0.003})
+
+        path = tmp_path / "nested" / "trace.json"
+        assert profiler.dump(str(path))
+
+        data = json.loads(path.read_text())
+        assert data["unit"] == "ms"
+        assert data["frames"][0]["update"] == pytest.approx(3.0)
+
+    def test_dump_without_frames(self, tmp_path):
+        """Test nothing is written before any frame was profiled."""
+        path = tmp_path / "trace.csv"
+
+        assert not FrameProfiler().dump(str(path))
+        assert not path.exists()
+
+
+class TestProfilerOverlay:
+    """Test the renderer's profiler overlay."""
+
+    @pytest.fixture
+    def renderer(self):
+        """Create a renderer on an offscreen surface."""
+        pygame.init()
+        return Renderer(pygame.Surface((1280, 720)))
+
+    def test_overlay_is_rebuilt_periodically(self, renderer):
+        """Test the panel is reused between refreshes instead of redrawn every frame."""
+        profiler = FrameProfiler()
+        profiler.enabled = True
+        profile_frame(profiler, {"update": 0.005})
+
+        renderer.render_profiler_overlay(profiler)
+        panel = renderer._profiler_panel
+        assert panel is not None
+
+        profile_frame(profiler, {"update": 0.030})
+        renderer.render_profiler_overlay(profiler)
+        assert renderer._profiler_panel is panel
+
+        for _ in range(10):
+            profile_frame(profiler, {"update": 0.030})
+        renderer.render_profiler_overlay(profiler)
+        assert renderer._profiler_panel is not panel
+
+    def test_overlay_skipped_without_frames(self, renderer):
+        """Test nothing is drawn before the first profiled frame."""
+        renderer.render_profiler_overlay(FrameProfiler())
+
+        assert renderer._profiler_panel is None
@@ -127,3 +127,109 @@ class TestLobbyInitialization:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestLobbyMapCache:
+    """Tests for reusing the lobby map across level transitions."""
+
+    @pytest.fixture
+    def engine(self, mock_pygame, mock_api_client):
+        """Create a lobby engine with a couple of accounts."""
+        pygame.display.init()  # Controller detection pumps events
+        engine = GameEngine(
+            api_client=mock_api_client,
+            zombies=[],
+            screen_width=1280,
+            screen_height=720,
+            use_map=True,
+            account_data={"577945324761": 5, "613056517323": 5},
+            third_party_data={},
+        )
+        engine.start()
+        return engine
+
+    def test_return_to_lobby_reuses_map(self, engine):
+        """Test returning to the lobby does not rebuild the map."""
+        lobby_map = engine.game_map
+        engine.game_map = Mock()  # Stand-in for a platformer level
+
+        with patch("game_engine.GameMap") as mock_map_class:
+            engine._return_to_lobby()
+
+        mock_map_class.assert_not_called()
+        assert engine.game_map is lobby_map
+
+    def test_return_to_lobby_resets_camera_and_zoom(self, engine):
+        """Test the reused map starts from the default view."""
+        engine.game_map.camera_x = 900
+        engine.game_map.toggle_landing_zone_view()
+        engine.game_map.zoom = 0.3
+
+        engine._return_to_lobby()
+
+        assert engine.game_map.camera_x == 0
+        assert engine.game_map.zoom == 1.0
+        assert engine.game_map.landing_zone_view is False
+
+    def test_blocked_third_parties_stay_removed(self, engine):
+        """Test 3rd parties blocked earlier are not shown again."""
+        blocked, allowed = Mock(), Mock()
+        blocked.name = "nOps"
+        allowed.name = "Datadog"
+        engine.game_map.third_parties = [blocked, allowed]
+        engine.blocked_third_parties = {"nOps"}
+
+        engine._return_to_lobby()
+
+        assert engine.game_map.third_parties == [allowed]
+
+    def test_door_marks_follow_completed_levels(self, engine):
+        """Test door completion marks are re-derived on each return."""
+        door = Mock(destination_room_name="MyHealth - Sandbox", is_completed=True)
+        level = Mock(account_name="MyHealth - Sandbox", account_id="577945324761")
+        engine.game_map.doors = [door]
+        engine.level_manager = Mock(levels=[level])
+
+        engine._return_to_lobby()
+        assert door.is_completed is False
+
+        engine.completed_level_account_ids.add("577945324761")
+        engine._return_to_lobby()
+        assert door.is_completed is True
+
+    def test_zombies_return_to_their_lobby_spots(self, engine):
+        """Test zombies moved by a level are put back without re-scattering."""
+        zombie = Zombie("z-1", "zombie-1", Vector2(0, 0), account="577945324761")
+        engine.zombies = engine.all_zombies = [zombie]
+        engine._place_lobby_zombies()
+        lobby_spot = (zombie.position.x, zombie.position.y)
+
+        zombie.position = Vector2(9000, 400)  # Moved onto a platformer level
+        with patch.object(engine.game_map, "scatter_zombies") as scatter:
+            engine._return_to_lobby()
+
+        scatter.assert_not_called()
+        assert (zombie.position.x, zombie.position.y) == lobby_spot
+
+    def test_streamed_zombies_appear_in_lobby(self, engine):
+        """Test zombies loaded after startup join the lobby and the level pool once."""
+        zombie = Zombie("z-2", "zombie-2", Vector2(0, 0), account="613056517323")
+        zombie.is_hidden = True
+
+        engine.add_zombies([zombie])
+        engine.add_zombies([zombie])  # Duplicates are ignored
+
+        assert engine.all_zombies == [zombie]
+        assert engine.zombies == [zombie]
+        assert zombie.is_hidden is False
+        assert "z-2" in engine.lobby_zombie_positions
+
+    def test_no_zombies_message_pauses_lobby(self, engine):
+        """Test the player is told when loading finishes without any zombies."""
+        engine.show_no_zombies_message()
+
+        assert "No unused identities found" in engine.game_state.congratulations_message
+        assert engine.game_state.status == GameStatus.PAUSED
+
+        engine.dismiss_message()
+        assert engine.game_state.status == GameStatus.LOBBY
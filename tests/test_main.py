@@ -104,6 +104,26 @@ class TestLoadConfiguration:
         assert config["target_fps"] == 60  # Default
         assert config["max_zombies"] == 1000  # Default
 
+    @patch("main.load_dotenv")
+    @patch("os.getenv")
+    def test_load_configuration_update_rate(self, mock_getenv, mock_load_dotenv):
+        """Test the simulation rate is configured separately from the render rate."""
+        env_vars = {
+            "SONRAI_API_URL": "https://test.sonrai.com/graphql",
+            "SONRAI_ORG_ID": "test-org-123",
+            "SONRAI_API_TOKEN": "test-token-456",
+            "TARGET_FPS": "30",
+        }
+        mock_getenv.side_effect = lambda key, default=None: env_vars.get(key, default)
+
+        config = load_configuration()
+
+        assert config["target_fps"] == 30
+        assert config["update_rate"] == 60  # Default
+
+        env_vars["UPDATE_RATE"] = "120"
+        assert load_configuration()["update_rate"] == 120
+
 
 class TestCalculateScaledDimensions:
     """Tests for aspect ratio scaling calculations."""
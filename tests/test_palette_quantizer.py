@@ -0,0 +1,126 @@
+"""
+Tests for the lookup-table palette quantizer.
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import palette_quantizer
+from palette_quantizer import PaletteQuantizer, get_quantizer
+
+PALETTE = [(0, 0, 0), (255, 255, 255), (255, 0, 0), (0, 128, 0), (30, 30, 200)]
+
+
+def gradient_image(width=64, height=48) -> Image.Image:
+    """Image with many distinct colors."""
+    image = Image.new("RGB", (width, height))
+    image.putdata([(x * 4, y * 5, (x + y) * 2) for y in range(height) for x in range(width)])
+    return image
+
+
+def pixels_of(image: Image.Image) -> list:
+    """Pixels of an image in row-major order."""
+    return [image.getpixel((x, y)) for y in range(image.height) for x in range(image.width)]
+
+
+def nearest(color, palette=PALETTE):
+    """Brute-force nearest palette color."""
+    return min(palette, key=lambda p: sum((a - b) ** 2 for a, b in zip(color, p)))
+
+
+class TestPaletteQuantizer:
+    """Tests for mapping colors onto a palette."""
+
+    def test_output_uses_only_palette_colors(self):
+        """Test that every output pixel is a palette color."""
+        result = PaletteQuantizer(PALETTE).quantize_image(gradient_image())
+
+        assert result.mode == "RGB"
+        assert result.size == (64, 48)
+        assert set(pixels_of(result)) <= set(PALETTE)
+
+    def test_palette_colors_map_to_themselves(self):
+        """Test that pixels already in the palette are unchanged."""
+        image = Image.new("RGB", (len(PALETTE), 1))
+        image.putdata(PALETTE)
+
+        assert pixels_of(PaletteQuantizer(PALETTE).quantize_image(image)) == PALETTE
+
+    def test_matches_nearest_color_away_from_bin_edges(self):
+        """Test that colors clearly closer to one entry map to it."""
+        colors = [(10, 5, 0), (240, 250, 245), (200, 40, 30), (20, 120, 10), (40, 35, 180)]
+        image = Image.new("RGB", (len(colors), 1))
+        image.putdata(colors)
+
+        result = pixels_of(PaletteQuantizer(PALETTE).quantize_image(image))
+
+        assert result == [nearest(color) for color in colors]
+
+    def test_chunked_mapping_matches_single_chunk(self):
+        """Test that splitting rows into chunks does not change the result."""
+        image = gradient_image(37, 29)
+        quantizer = PaletteQuantizer(PALETTE)
+        whole = quantizer.quantize_image(image)
+
+        with patch.object(palette_quantizer, "CHUNK_PIXELS", 40):
+            chunked = quantizer.quantize_image(image)
+
+        assert pixels_of(chunked) == pixels_of(whole)
+
+    def test_ordered_dither_mixes_colors_in_flat_regions(self):
+        """Test that dithering a mid-tone produces a pattern of palette colors."""
+        quantizer = PaletteQuantizer([(0, 0, 0), (64, 64, 64)])
+        image = Image.new("RGB", (8, 8), (32, 32, 32))
+
+        plain = quantizer.quantize_image(image)
+        dithered = quantizer.quantize_image(image, dither=True)
+
+        assert len(set(pixels_of(plain))) == 1
+        assert set(pixels_of(dithered)) == {(0, 0, 0), (64, 64, 64)}
+
+    def test_converts_non_rgb_images(self):
+        """Test that RGBA and grayscale input is converted first."""
+        quantizer = PaletteQuantizer(PALETTE)
+
+        rgba = quantizer.quantize_image(Image.new("RGBA", (4, 4), (255, 0, 0, 128)))
+        gray = quantizer.quantize_image(Image.new("L", (4, 4), 250))
+
+        assert rgba.mode == "RGB"
+        assert gray.getpixel((0, 0)) == (255, 255, 255)
+
+    def test_rejects_empty_palette(self):
+        """Test that an empty palette is rejected."""
+        with pytest.raises(ValueError):
+            PaletteQuantizer([])
+
+    def test_fallback_without_numpy(self):
+        """Test that Pillow maps onto the palette when NumPy is unavailable."""
+        with patch.object(palette_quantizer, "NUMPY_AVAILABLE", False):
+            quantizer = PaletteQuantizer(PALETTE)
+            result = quantizer.quantize_image(gradient_image())
+
+        assert set(pixels_of(result)) <= set(PALETTE)
+
+
+class TestGetQuantizer:
+    """Tests for the shared quantizer cache."""
+
+    def test_same_palette_shares_quantizer(self):
+        """Test that the lookup table is built once per palette."""
+        assert get_quantizer(PALETTE) is get_quantizer(list(PALETTE))
+
+    def test_different_palettes_get_different_quantizers(self):
+        """Test that each palette gets its own quantizer."""
+        assert get_quantizer(PALETTE) is not get_quantizer(PALETTE[:3])
+
+
+# Run tests if executed directly
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
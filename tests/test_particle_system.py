@@ -0,0 +1,131 @@
+"""Tests for the fixed-capacity particle system."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from particle_system import ALPHA_STEPS, ParticleSystem, build_alpha_stamps
+
+
+@pytest.fixture
+def dot():
+    """Create a small opaque particle sprite."""
+    sprite = pygame.Surface((4, 4), pygame.SRCALPHA)
+    sprite.fill((255, 0, 0, 255))
+    return sprite
+
+
+class TestParticleSystem:
+    """Test emission, integration, retirement and drawing."""
+
+    def test_update_integrates_velocity_and_gravity(self):
+        """Test particles move by their velocity and accelerate downward."""
+        particles = ParticleSystem(capacity=4, gravity=100.0)
+        particles.emit(x=0, y=0, vx=10, vy=0, lifetime=1.0)
+
+        particles.update(0.5)
+        particles.update(0.5 - 1e-6)
+
+        x, y = particles.positions()[0]
+        assert x == pytest.approx(10.0, abs=1e-3)
+        assert y == pytest.approx(25.0, abs=1e-3)
+
+    def test_expired_particles_are_swap_removed(self):
+        """Test dead particles are retired while survivors keep their state."""
+        particles = ParticleSystem(capacity=8)
+        particles.emit(x=1, y=0, vx=0, vy=0, lifetime=0.1)
+        particles.emit(x=2, y=0, vx=0, vy=0, lifetime=1.0)
+        particles.emit(x=3, y=0, vx=0, vy=0, lifetime=0.1)
+        particles.emit(x=4, y=0, vx=0, vy=0, lifetime=1.0)
+
+        particles.update(0.2)
+
+        assert len(particles) == 2
+        assert sorted(x for x, _ in particles.positions()) == [2, 4]
+
+    def test_capacity_is_fixed(self):
+        """Test emission past capacity is dropped instead of growing storage."""
+        particles = ParticleSystem(capacity=3)
+
+        spawned = [particles.emit(x=0, y=0, vx=0, vy=0, lifetime=1.0) for _ in range(5)]
+
+        assert spawned == [True, True, True, False, False]
+        assert len(particles) == 3
+        assert particles.dropped == 2
+        assert len(particles.x) == 3
+
+    def test_landings_reported_once(self):
+        """Test a particle crossing the ground line is reported a single time."""
+        particles = ParticleSystem(capacity=2)
+        particles.emit(x=5, y=0, vx=0, vy=100, lifetime=5.0)
+
+        assert particles.update(0.05, ground_y=10) == []
+        assert particles.update(0.1, ground_y=10) == [(5, pytest.approx(15.0))]
+        assert particles.update(0.1, ground_y=10) == []
+
+    def test_alpha_stamps_are_prerendered(self, dot):
+        """Test fading uses pre-rendered opacity levels from faint to opaque."""
+        stamps = build_alpha_stamps(dot)
+
+        assert len(stamps) == ALPHA_STEPS
+        assert stamps[0].get_alpha() < stamps[-1].get_alpha() == 255
+
+    def test_draw_fades_with_lifetime(self, dot):
+        """Test a particle is drawn fainter as its lifetime runs out."""
+        particles = ParticleSystem(capacity=1)
+        style = particles.add_style(dot, anchor=(0, 0))
+        particles.emit(x=2, y=2, vx=0, vy=0, lifetime=1.0, style=style)
+
+        fresh = pygame.Surface((8, 8))
+        particles.draw(fresh)
+        particles.update(0.8)
+        faded = pygame.Surface((8, 8))
+        particles.draw(faded)
+
+        assert fresh.get_at((2, 2)).r == 255
+        assert 0 < faded.get_at((2, 2)).r < 255
+
+    def test_draw_applies_origin_and_zoom(self, dot):
+        """Test positions are mapped like GameMap.world_to_screen."""
+        particles = ParticleSystem(capacity=1)
+        particles.add_style(dot, anchor=(0, 0), fade=False)
+        particles.emit(x=110, y=60, vx=0, vy=0, lifetime=1.0)
+
+        screen = pygame.Surface((40, 40))
+        particles.draw(screen, origin_x=100, origin_y=50, zoom=2.0)
+
+        assert screen.get_at((20, 20)).r == 255
+        assert screen.get_at((10, 10)).r == 0
+
+
+class TestBossParticles:
+    """Test boss effects run on the shared particle system."""
+
+    def test_wannacry_tears_leave_puddles(self):
+        """Test tears reaching the ground still create puddles."""
+        from cyber_boss import WannaCryBoss
+        from models import Vector2
+
+        boss = WannaCryBoss(Vector2(100, 100))
+        boss.ground_y = boss.position.y + 40
+        boss.tear_particles.clear()
+        boss._spawn_tear_particle()
+
+        for _ in range(30):
+            boss.update(1 / 60, boss.position, game_map=object())
+
+        assert boss.puddles
+
+    def test_boss_fighter_hit_spawns_particles(self):
+        """Test attacks and hits share the fighter's particle system."""
+        from boss_fighter import BossFighter
+
+        boss = BossFighter(700, 500)
+        boss.take_damage(10)
+
+        assert len(boss.effect_particles) > 0
+        boss.reset(700, 500)
+        assert len(boss.effect_particles) == 0
@@ -2,13 +2,21 @@
 
 import os
 import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pygame
 import pytest
-from PIL import Image
+from PIL import Image, ImageChops, ImageEnhance
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from photo_booth import camera_service, retro_filter
+from photo_booth.camera_service import CameraService
+from photo_booth.composite_job import FRAME_FORMAT, STAGES, CompositeJob
 from photo_booth.compositor import PhotoBoothCompositor
 from photo_booth.config import PhotoBoothConfig
 from photo_booth.controller import PhotoBoothController, PhotoBoothState
@@ -294,6 +302,99 @@ class TestRetroFilter:
         # Result should be RGBA
         assert result.mode == "RGBA"
         assert result.size == (100, 100)
+        assert result.getpixel((0, 0)) == (155, 155, 155, 255)
+        assert result.getpixel((0, 1)) == (255, 255, 255, 255)
+
+    def test_scanline_overlay_is_reused(self):
+        """Test that the scanline overlay is built once per size and parameters."""
+        img = Image.new("RGB", (64, 48), (200, 200, 200))
+        RetroFilter.add_scanlines(img, opacity=60, spacing=4)
+        cached = len(retro_filter._OVERLAYS)
+
+        RetroFilter.add_scanlines(img, opacity=60, spacing=4)
+        assert len(retro_filter._OVERLAYS) == cached
+
+        RetroFilter.add_scanlines(img, opacity=60, spacing=2)
+        assert len(retro_filter._OVERLAYS) == cached + 1
+
+    def test_overlay_cache_is_thread_safe(self):
+        """Test that concurrent filters never corrupt or overfill the overlay cache."""
+        errors = []
+
+        def churn(offset):
+            try:
+                for i in range(200):
+                    size = (8 + (offset + i) % 40, 8)
+                    overlay = retro_filter._cached_overlay(
+                        ("test", size), lambda size=size: Image.new("L", size)
+                    )
+                    assert overlay.size == size
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=churn, args=(n * 7,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(retro_filter._OVERLAYS) <= retro_filter.MAX_CACHED_OVERLAYS
+
+    def test_purple_tint_caches_no_overlay(self):
+        """Test that tinting uses the color matrix instead of a cached solid image."""
+        img = Image.new("RGB", (50, 40), (100, 100, 100))
+        cached = len(retro_filter._OVERLAYS)
+
+        result = RetroFilter.add_purple_tint(img, strength=0.5)
+
+        assert len(retro_filter._OVERLAYS) == cached
+        expected = tuple(round((100 + c) / 2) for c in RetroFilter.PURPLE_TINT)
+        assert all(abs(a - b) <= 1 for a, b in zip(result.getpixel((0, 0)), expected))
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_vignette_darkens_corners_only(self, numpy_available):
+        """Test that the vignette leaves the center alone and darkens the corners."""
+        if numpy_available and not retro_filter.NUMPY_AVAILABLE:
+            pytest.skip("NumPy not installed")
+        img = Image.new("RGB", (80, 60), (200, 200, 200))
+
+        with patch.object(retro_filter, "NUMPY_AVAILABLE", numpy_available):
+            retro_filter._OVERLAYS.clear()
+            result = RetroFilter.add_vignette(img, strength=0.5)
+
+        assert result.getpixel((40, 30)) == (200, 200, 200, 255)
+        assert result.getpixel((0, 0))[0] < 120
+
+    def test_grade_colors_matches_separate_steps(self):
+        """Test that the fused grade matches enhancing then tinting step by step."""
+        # Mid-tones, so the separate steps never clip in between
+        img = Image.new("RGB", (40, 30))
+        img.putdata([(70 + x * 3, 80 + y * 3, 90 + x + y) for y in range(30) for x in range(40)])
+        color = ImageEnhance.Color(img).enhance(1.3)
+        expected = Image.blend(
+            ImageEnhance.Contrast(color).enhance(1.1),
+            Image.new("RGB", img.size, RetroFilter.PURPLE_TINT),
+            0.1,
+        )
+
+        result = RetroFilter.grade_colors(img, saturation=1.3, contrast=1.1, tint_strength=0.1)
+
+        difference = ImageChops.difference(result, expected).getextrema()
+        # Each separate step rounds to integers; the fused pass rounds once
+        assert max(high for _, high in difference) <= 3
+
+    def test_reduce_colors_smooth_tints_palette(self):
+        """Test that tinting the palette equals tinting the reduced image."""
+        img = Image.new("RGB", (40, 30))
+        img.putdata([(x * 6, y * 8, (x + y) * 3) for y in range(30) for x in range(40)])
+
+        result = RetroFilter.reduce_colors_smooth(img, num_colors=16, tint_strength=0.1)
+        expected = RetroFilter.add_purple_tint(
+            RetroFilter.reduce_colors_smooth(img, num_colors=16), strength=0.1
+        )
+
+        assert result.tobytes() == expected.tobytes()
 
     def test_full_retro_effect(self):
         """Test complete retro transformation."""
@@ -331,6 +432,20 @@ class TestPhotoBoothCompositor:
         assert result.size == (1920, 1080)
         assert result.mode == "RGB"
 
+    def test_assets_are_resized_once(self):
+        """Test that branding assets are scaled on the first composite only."""
+        compositor = PhotoBoothCompositor()
+        compositor.sonrai_logo = Image.new("RGBA", (600, 200), (255, 255, 255, 255))
+        gameplay = Image.new("RGB", (1280, 720), (0, 100, 0))
+        config = PhotoBoothConfig()
+
+        compositor.generate(selfie=None, gameplay=gameplay, zombie_count=1, config=config)
+        cached = dict(compositor._scaled_assets)
+        compositor.generate(selfie=None, gameplay=gameplay, zombie_count=2, config=config)
+
+        assert any(name == "logo" for name, _ in cached)
+        assert all(compositor._scaled_assets[key] is image for key, image in cached.items())
+
     def test_draw_zombie_icon_creates_pixels(self):
         """Test that _draw_zombie_icon draws pixel art zombie."""
         compositor = PhotoBoothCompositor()
@@ -480,6 +595,200 @@ class TestPhotoBoothCompositor:
         assert non_bg_pixels > 0
 
 
+class FakeCapture:
+    """Stands in for cv2.VideoCapture, cycling through a list of BGR frames."""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.reads = 0
+        self.released = False
+
+    def isOpened(self):
+        return not self.released
+
+    def read(self):
+        frame = self.frames[self.reads % len(self.frames)]
+        self.reads += 1
+        return True, frame
+
+    def release(self):
+        self.released = True
+
+
+def bgr_frame(color=(0, 0, 255), size=(64, 48)) -> np.ndarray:
+    """Flat BGR frame."""
+    return np.full((size[1], size[0], 3), color, dtype=np.uint8)
+
+
+def wait_until(condition, timeout=5.0) -> bool:
+    """Poll condition until it holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestCameraService:
+    """Tests for the background webcam buffer."""
+
+    def test_buffered_frame_is_returned_as_rgb(self):
+        """Test that a selfie comes from the buffer, converted from BGR."""
+        service = CameraService(capture=FakeCapture([bgr_frame((0, 0, 255))]))
+        service.start()
+        try:
+            image = service.capture_image(timeout=5.0)
+        finally:
+            service.stop()
+
+        assert image.mode == "RGB"
+        assert image.getpixel((0, 0)) == (255, 0, 0)
+
+    def test_sharpest_recent_frame_is_picked(self):
+        """Test that a detailed frame beats flat ones in the buffer."""
+        sharp = bgr_frame((0, 0, 0))
+        sharp[::2, ::2] = 255
+        service = CameraService(capture=FakeCapture([bgr_frame(), sharp, bgr_frame()]))
+
+        with patch.object(camera_service, "ACTIVE_FPS", 500.0):
+            service.set_active(True)
+            service.start()
+            try:
+                assert wait_until(lambda: service.frames_captured >= 3)
+                assert service.sharpest_frame(window=60.0) is sharp
+            finally:
+                service.stop()
+
+    def test_capture_rate_is_throttled_when_idle(self):
+        """Test that the idle rate reads far fewer frames than the active rate."""
+        capture = FakeCapture([bgr_frame()])
+        service = CameraService(capture=capture)
+
+        with patch.object(camera_service, "IDLE_FPS", 2.0), patch.object(
+            camera_service, "ACTIVE_FPS", 200.0
+        ):
+            service.start()
+            time.sleep(0.3)
+            idle_reads = capture.reads
+            service.set_active(True)
+            time.sleep(0.3)
+            active_reads = capture.reads - idle_reads
+            service.stop()
+
+        assert idle_reads <= 2
+        assert active_reads > 10
+        assert capture.released
+
+    def test_missing_camera_stops_thread(self):
+        """Test that the service gives up when no camera can be opened."""
+        closed = MagicMock()
+        closed.isOpened.return_value = False
+
+        with patch("cv2.VideoCapture", return_value=closed):
+            service = CameraService(camera_index=3)
+            service.start()
+            assert wait_until(lambda: not service._thread.is_alive())
+
+        assert service.is_open is False
+        assert service.capture_image() is None
+
+
+def gameplay_frame(size=(320, 240), color=(0, 100, 0)) -> bytes:
+    """Raw bytes of a captured gameplay frame."""
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return pygame.image.tobytes(surface, FRAME_FORMAT)
+
+
+class TestCompositeJob:
+    """Tests for the background composite pipeline."""
+
+    def test_runs_every_stage_and_saves(self, tmp_path):
+        """Test that a job saves the composite and publishes a fitted preview."""
+        config = PhotoBoothConfig(output_dir=str(tmp_path))
+        job = CompositeJob(
+            PhotoBoothCompositor(), config, gameplay_frame(), (320, 240), 7, preview_size=(480, 400)
+        )
+        job.start()
+        assert job.wait(timeout=30.0)
+
+        assert job.error is None
+        assert job.succeeded
+        assert job.progress == 1.0
+        assert job.stage == STAGES[-1]
+        assert os.path.dirname(job.path) == str(tmp_path)
+        with Image.open(job.path) as saved:
+            assert saved.size == (1920, 1080)
+        assert job.preview.get_size() == (480, 270)
+
+    def test_raw_selfie_gets_arcade_effect(self, tmp_path):
+        """Test that an unprocessed selfie is filtered in the selfie stage."""
+        config = PhotoBoothConfig(output_dir=str(tmp_path))
+        selfie = Image.new("RGB", (64, 48), (200, 150, 120))
+        job = CompositeJob(
+            PhotoBoothCompositor(),
+            config,
+            gameplay_frame(),
+            (320, 240),
+            7,
+            selfie_source=lambda cancelled: (selfie, False),
+        )
+
+        with patch.object(
+            RetroFilter, "apply_enhanced_arcade_effect", return_value=selfie
+        ) as effect:
+            job.start()
+            job.wait(timeout=30.0)
+
+        effect.assert_called_once_with(selfie)
+        assert job.succeeded
+        assert job.preview is None
+
+    def test_cancel_stops_before_saving(self, tmp_path):
+        """Test that cancelling mid-pipeline writes nothing."""
+        config = PhotoBoothConfig(output_dir=str(tmp_path))
+        in_selfie_stage = threading.Event()
+
+        def slow_selfie(cancelled):
+            in_selfie_stage.set()
+            cancelled.wait(5.0)
+            return None, False
+
+        job = CompositeJob(
+            PhotoBoothCompositor(),
+            config,
+            gameplay_frame(),
+            (320, 240),
+            7,
+            selfie_source=slow_selfie,
+        )
+        job.start()
+        assert in_selfie_stage.wait(timeout=5.0)
+        job.cancel()
+        assert job.wait(timeout=5.0)
+
+        assert job.cancelled
+        assert not job.succeeded
+        assert job.error is None
+        assert os.listdir(tmp_path) == []
+
+    def test_stage_error_is_recorded(self, tmp_path):
+        """Test that a failing stage finishes the job with its error."""
+        compositor = MagicMock()
+        compositor.generate.side_effect = RuntimeError("out of memory")
+        job = CompositeJob(
+            compositor, PhotoBoothConfig(output_dir=str(tmp_path)), gameplay_frame(), (320, 240), 7
+        )
+        job.start()
+        assert job.wait(timeout=5.0)
+
+        assert isinstance(job.error, RuntimeError)
+        assert job.stage == "layout"
+        assert not job.succeeded
+        compositor.save.assert_not_called()
+
+
 class TestPhotoBoothController:
     """Tests for PhotoBoothController."""
 
@@ -942,6 +1251,76 @@ class TestPhotoBoothGameEngineIntegration:
 
         # Should return None (no gameplay image)
         assert result is None
+        assert controller.start_composite(zombie_count=42) is False
+
+    def test_background_composite_reports_progress_and_path(self, tmp_path):
+        """Test that start_composite runs in the background and poll_composite collects it."""
+        config = PhotoBoothConfig(enabled=True, output_dir=str(tmp_path))
+        controller = PhotoBoothController(config)
+        screen = pygame.Surface((320, 240))
+        screen.fill((0, 100, 0))
+        controller.capture_gameplay(screen)
+
+        assert controller.start_composite(zombie_count=5, preview_size=(640, 480))
+        assert controller.state == PhotoBoothState.COMPOSITING
+        controller._composite_job.wait(timeout=30.0)
+
+        path = controller.poll_composite()
+        assert path is not None and os.path.exists(path)
+        assert controller.composite_path == path
+        assert controller.state == PhotoBoothState.COMPLETE
+        assert controller.composite_progress == 1.0
+        assert controller.composite_preview.get_size() == (640, 360)
+        assert controller.is_compositing is False
+
+    def test_selfie_comes_from_camera_buffer(self):
+        """Test that capture_selfie reads the buffer instead of the device."""
+        controller = PhotoBoothController(PhotoBoothConfig(enabled=True))
+        capture = FakeCapture([bgr_frame((255, 0, 0))])
+        controller._camera = CameraService(capture=capture)
+        controller._camera.start()
+        try:
+            assert controller._camera.wait_for_frame(timeout=5.0)
+            controller._selfie_opted_in = True
+            reads = capture.reads
+
+            assert controller.capture_selfie(start_async_processing=False) is True
+            assert capture.reads - reads <= 1  # Only the capture thread reads
+            assert controller._selfie_image.getpixel((0, 0)) == (0, 0, 255)
+        finally:
+            controller.cleanup()
+
+        assert capture.released
+
+    def test_consent_prompt_activates_camera(self):
+        """Test that the camera runs at full rate from the consent prompt on."""
+        controller = PhotoBoothController(PhotoBoothConfig(enabled=True))
+        controller._camera = MagicMock()
+
+        controller.show_consent_prompt()
+        controller._camera.set_active.assert_called_with(True)
+
+        controller.set_camera_active(False)
+        controller._camera.set_active.assert_called_with(False)
+
+    def test_cancel_composite_discards_result(self, tmp_path):
+        """Test that skipping the summary cancels the composite without saving."""
+        config = PhotoBoothConfig(enabled=True, output_dir=str(tmp_path))
+        controller = PhotoBoothController(config)
+        controller.capture_gameplay(pygame.Surface((320, 240)))
+        release = threading.Event()
+
+        with patch.object(
+            PhotoBoothCompositor, "generate", side_effect=lambda **kwargs: release.wait(5.0)
+        ):
+            controller.start_composite(zombie_count=5)
+            controller.cancel_composite()
+            release.set()
+            controller._composite_job.wait(timeout=5.0)
+
+        assert controller.poll_composite() is None
+        assert controller.state == PhotoBoothState.INACTIVE
+        assert os.listdir(tmp_path) == []
 
     def test_consent_complete_after_opt_in(self):
         """Test is_consent_complete returns True after opting in."""
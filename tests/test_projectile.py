@@ -2,7 +2,7 @@
 
 import pytest
 from models import Vector2
-from projectile import Projectile
+from projectile import Projectile, ProjectilePool
 
 
 class TestProjectileInitialization:
@@ -70,3 +70,52 @@ class TestProjectileMovement:
 
         projectile.update(delta_time=0.1)
         assert abs(projectile.position.x - 80) < 1  # 400 * 0.2 = 80
+
+
+class TestProjectilePool:
+    """Test projectile recycling."""
+
+    def test_projectiles_share_one_sprite(self):
+        """Test every projectile of a style uses the same cached surface."""
+        first = Projectile(position=Vector2(0, 0))
+        second = Projectile(position=Vector2(10, 10), direction=Vector2(0, 1))
+
+        assert first.sprite is second.sprite
+
+    def test_released_projectile_is_reused(self):
+        """Test acquire returns a released instance re-armed in place."""
+        pool = ProjectilePool()
+        projectile = pool.acquire(10, 20, Vector2(0, -1))
+        projectile.update(delta_time=1.0)
+
+        pool.release(projectile)
+        recycled = pool.acquire(50, 60, Vector2(1, 0), damage=2)
+
+        assert recycled is projectile
+        assert recycled.active
+        assert (recycled.position.x, recycled.position.y) == (50, 60)
+        assert (recycled.velocity.x, recycled.velocity.y) == (400, 0)
+        assert recycled.damage == 2
+        assert pool.created == 1
+        assert pool.reused == 1
+
+    def test_double_release_is_ignored(self):
+        """Test releasing twice does not hand the same projectile out twice."""
+        pool = ProjectilePool()
+        projectile = pool.acquire(0, 0)
+
+        pool.release(projectile)
+        pool.release(projectile)
+
+        assert not projectile.active
+        assert pool.free_count == 1
+
+    def test_free_list_is_bounded(self):
+        """Test the pool keeps at most max_free idle projectiles."""
+        pool = ProjectilePool(max_free=2)
+        projectiles = [pool.acquire(0, 0) for _ in range(5)]
+
+        pool.release_all(projectiles)
+
+        assert projectiles == []
+        assert pool.free_count == 2
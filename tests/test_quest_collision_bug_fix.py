@@ -162,6 +162,7 @@ class TestQuestCollisionBugFix:
 
         # This should reset the flags
         engine._try_protect_service(quest, service_node)
+        engine.wait_for_quest_requests()  # Result is applied on a later frame
 
         # Verify all flags are reset
         quarantining_count = sum(1 for z in engine.zombies if z.is_quarantining)
@@ -194,6 +195,7 @@ class TestQuestCollisionBugFix:
 
         service_node = create_service_node("bedrock-agentcore", Vector2(5000, 100))
         engine._try_protect_service(quest, service_node)
+        engine.wait_for_quest_requests()  # Result is applied on a later frame
 
         # Verify game is paused
         assert engine.game_state.status == GameStatus.PAUSED
@@ -0,0 +1,246 @@
+"""
+Tests for the background recording encoders.
+"""
+
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+from PIL import Image, ImageSequence
+
+import recording_encoder
+from recording_encoder import (
+    FRAME_FORMAT,
+    GifEncoder,
+    Mp4Encoder,
+    PngSequenceEncoder,
+    RecordingEncoder,
+    create_encoder,
+)
+
+SIZE = (32, 24)
+
+
+def solid_frame(color, size=SIZE) -> bytes:
+    """Raw bytes of a frame filled with one color."""
+    return bytes(color + (255,)) * (size[0] * size[1])
+
+
+def frame_with_square(background, square, size=SIZE) -> bytes:
+    """Raw bytes of a frame with an 8x8 square at (4, 4)."""
+    surface = pygame.Surface(size)
+    surface.fill(background)
+    surface.fill(square, pygame.Rect(4, 4, 8, 8))
+    return pygame.image.tobytes(surface, FRAME_FORMAT)
+
+
+class TestGifEncoder:
+    """Tests for the streaming GIF encoder."""
+
+    def test_writes_playable_gif(self, tmp_path):
+        """Test that every distinct frame ends up in the GIF."""
+        encoder = GifEncoder(str(tmp_path / "clip"), SIZE, 30)
+        for color in [(255, 0, 0), (0, 255, 0), (0, 0, 255)]:
+            assert encoder.submit(solid_frame(color)) is True
+        encoder.close()
+        assert encoder.wait(timeout=5.0)
+
+        assert encoder.error is None
+        assert encoder.frames_written == 3
+        with Image.open(encoder.path) as gif:
+            assert gif.size == SIZE
+            frames = [
+                frame.convert("RGB").getpixel((0, 0)) for frame in ImageSequence.Iterator(gif)
+            ]
+        assert frames == [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+    def test_unchanged_frames_extend_previous_delay(self, tmp_path):
+        """Test that repeated frames lengthen the previous frame instead of adding one."""
+        encoder = GifEncoder(str(tmp_path / "clip"), SIZE, 25)
+        for color in [(255, 0, 0)] * 3 + [(0, 0, 255)]:
+            encoder.submit(solid_frame(color))
+        encoder.close()
+        encoder.wait(timeout=5.0)
+
+        with Image.open(encoder.path) as gif:
+            assert gif.n_frames == 2
+            assert gif.info["duration"] == 120
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_changed_region_only_is_written(self, tmp_path, numpy_available):
+        """Test that later frames are cropped to the changed rectangle."""
+        if numpy_available and not recording_encoder.NUMPY_AVAILABLE:
+            pytest.skip("NumPy not installed")
+        with patch.object(recording_encoder, "NUMPY_AVAILABLE", numpy_available):
+            encoder = GifEncoder(str(tmp_path / "clip"), SIZE, 30)
+            encoder.submit(frame_with_square((0, 0, 0), (255, 255, 255)))
+            encoder.submit(frame_with_square((0, 0, 0), (255, 0, 0)))
+            encoder.close()
+            encoder.wait(timeout=5.0)
+
+        with Image.open(encoder.path) as gif:
+            gif.seek(1)
+            assert gif.tile[0][1] == (4, 4, 12, 12)
+            composited = gif.convert("RGB")
+            assert composited.getpixel((0, 0)) == (0, 0, 0)
+            assert composited.getpixel((6, 6)) == (255, 0, 0)
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_padding_only_change_falls_back_to_one_pixel(self, tmp_path, numpy_available):
+        """Test that frames differing only in the padding byte still encode."""
+        if numpy_available and not recording_encoder.NUMPY_AVAILABLE:
+            pytest.skip("NumPy not installed")
+        with patch.object(recording_encoder, "NUMPY_AVAILABLE", numpy_available):
+            encoder = GifEncoder(str(tmp_path / "clip"), SIZE, 30)
+            encoder.submit(solid_frame((255, 0, 0)))
+            encoder.submit(bytes((255, 0, 0, 0)) * (SIZE[0] * SIZE[1]))
+            encoder.close()
+            encoder.wait(timeout=5.0)
+
+        assert encoder.error is None
+        assert encoder.frames_written == 2
+        with Image.open(encoder.path) as gif:
+            gif.seek(1)
+            assert gif.tile[0][1] == (0, 0, 1, 1)
+
+
+class TestRecordingEncoder:
+    """Tests for the shared queue and thread handling."""
+
+    def test_submit_drops_frames_when_queue_full(self, tmp_path):
+        """Test that submit never blocks when the encoder falls behind."""
+        release = threading.Event()
+
+        class SlowEncoder(RecordingEncoder):
+            extension = "raw"
+
+            def _write(self, frame):
+                release.wait(timeout=5.0)
+
+        with patch.object(recording_encoder, "QUEUE_FRAMES", 2):
+            encoder = SlowEncoder(str(tmp_path / "clip"), SIZE, 30)
+            results = [encoder.submit(solid_frame((0, 0, 0))) for _ in range(6)]
+            release.set()
+            encoder.close()
+            assert encoder.wait(timeout=5.0)
+
+        assert results[:2] == [True, True]
+        assert results.count(False) == encoder.frames_dropped > 0
+        assert encoder.frames_written == results.count(True)
+
+    def test_close_returns_before_encoding_finishes(self, tmp_path):
+        """Test that close() does not wait for queued frames."""
+        release = threading.Event()
+
+        class SlowEncoder(RecordingEncoder):
+            extension = "raw"
+
+            def _write(self, frame):
+                release.wait(timeout=5.0)
+
+        encoder = SlowEncoder(str(tmp_path / "clip"), SIZE, 30)
+        encoder.submit(solid_frame((0, 0, 0)))
+        encoder.close()
+
+        assert encoder.done is False
+        assert encoder.submit(solid_frame((0, 0, 0))) is False
+        release.set()
+        assert encoder.wait(timeout=5.0)
+        assert encoder.frames_written == 1
+
+    def test_write_must_be_implemented(self, tmp_path):
+        """Test that an encoder without _write cannot be created."""
+
+        class NoWrite(RecordingEncoder):
+            pass
+
+        with pytest.raises(TypeError):
+            NoWrite(str(tmp_path / "clip"), SIZE, 30)
+
+    def test_write_error_is_recorded(self, tmp_path):
+        """Test that an encoding failure finishes the encoder with its error."""
+
+        class BrokenEncoder(RecordingEncoder):
+            extension = "raw"
+
+            def _write(self, frame):
+                raise OSError("disk full")
+
+        encoder = BrokenEncoder(str(tmp_path / "clip"), SIZE, 30)
+        encoder.submit(solid_frame((0, 0, 0)))
+        assert encoder.wait(timeout=5.0)
+
+        assert isinstance(encoder.error, OSError)
+        assert encoder.submit(solid_frame((0, 0, 0))) is False
+
+
+class TestOtherEncoders:
+    """Tests for the MP4 and PNG sequence encoders."""
+
+    @pytest.mark.skipif(not recording_encoder.CV2_AVAILABLE, reason="OpenCV not installed")
+    def test_mp4_encoder_writes_video(self, tmp_path):
+        """Test that the MP4 encoder writes a readable video."""
+        import cv2
+
+        encoder = Mp4Encoder(str(tmp_path / "clip"), (64, 48), 30)
+        for color in [(255, 0, 0), (0, 255, 0), (0, 0, 255)]:
+            encoder.submit(solid_frame(color, (64, 48)))
+        encoder.close()
+        assert encoder.wait(timeout=10.0)
+        if encoder.error is not None:
+            pytest.skip(f"mp4v codec unavailable: {encoder.error}")
+
+        video = cv2.VideoCapture(encoder.path)
+        try:
+            assert int(video.get(cv2.CAP_PROP_FRAME_COUNT)) == 3
+        finally:
+            video.release()
+
+    def test_png_sequence_encoder_writes_numbered_frames(self, tmp_path):
+        """Test that the fallback writes one PNG per frame into a folder."""
+        encoder = PngSequenceEncoder(str(tmp_path / "ZB_clip"), SIZE, 30)
+        encoder.submit(solid_frame((255, 0, 0)))
+        encoder.submit(solid_frame((0, 255, 0)))
+        encoder.close()
+        assert encoder.wait(timeout=5.0)
+
+        assert encoder.path.endswith("/")
+        assert sorted(os.listdir(encoder.path)) == ["frame_0000.png", "frame_0001.png"]
+
+
+class TestCreateEncoder:
+    """Tests for picking an encoder."""
+
+    def _finish(self, encoder):
+        encoder.close()
+        encoder.wait(timeout=5.0)
+        return encoder
+
+    def test_gif_by_default(self, tmp_path):
+        """Test that GIF is used for the gif format."""
+        encoder = self._finish(create_encoder("gif", str(tmp_path / "clip"), SIZE, 30))
+        assert isinstance(encoder, GifEncoder)
+
+    def test_mp4_falls_back_to_gif_without_opencv(self, tmp_path):
+        """Test that MP4 falls back to GIF when OpenCV is missing."""
+        with patch.object(recording_encoder, "CV2_AVAILABLE", False):
+            encoder = self._finish(create_encoder("mp4", str(tmp_path / "clip"), SIZE, 30))
+        assert isinstance(encoder, GifEncoder)
+
+    def test_png_fallback_without_pillow(self, tmp_path):
+        """Test that PNG frames are written when Pillow is missing."""
+        with patch.object(recording_encoder, "PIL_AVAILABLE", False):
+            encoder = self._finish(create_encoder("gif", str(tmp_path / "clip"), SIZE, 30))
+        assert isinstance(encoder, PngSequenceEncoder)
+
+
+# Run tests if executed directly
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -385,5 +385,130 @@ class TestJitQuestMessageRendering:
         renderer.render_jit_quest_message(None)
 
 
+class TestZoomedSpriteCache:
+    """Tests for landing zone sprites scaled once per variant and zoom step."""
+
+    def test_player_turning_reuses_scaled_sprites(self, renderer):
+        """Test facing left and right again does not rescale the player."""
+        from player import Player
+
+        player = Player(Vector2(0, 0))
+        scaled = {}
+        with patch("renderer.pygame.transform.scale", wraps=pygame.transform.scale) as mock_scale:
+            for turn in (player.move_left, player.move_right) * 3:
+                turn()
+                sprite = renderer._get_zoomed_sprite(
+                    player.sprite_key, player.sprite, player.width, player.height, 0.5
+                )
+                assert scaled.setdefault(player.sprite_key, sprite) is sprite
+
+        assert mock_scale.call_count == 2
+
+    def test_key_not_surface_identity_selects_entry(self, renderer):
+        """Test entries are found by sprite key, and keys never share entries."""
+        first = renderer._get_zoomed_sprite("a", pygame.Surface((40, 40)), 40, 40, 0.5)
+
+        assert renderer._get_zoomed_sprite("a", pygame.Surface((40, 40)), 40, 40, 0.5) is first
+        assert renderer._get_zoomed_sprite("b", pygame.Surface((40, 40)), 40, 40, 0.5) is not first
+        assert renderer._get_zoomed_sprite("a", pygame.Surface((40, 40)), 40, 40, 0.25) is not first
+
+    def test_cache_is_bounded(self, renderer):
+        """Test least recently used entries are evicted one at a time."""
+        from renderer import ZOOMED_SPRITE_CACHE_SIZE
+
+        sprite = pygame.Surface((40, 40))
+        for i in range(ZOOMED_SPRITE_CACHE_SIZE + 5):
+            renderer._get_zoomed_sprite(i, sprite, 40, 40, 0.5)
+
+        assert len(renderer._zoomed_sprites) == ZOOMED_SPRITE_CACHE_SIZE
+        assert (0, 20, 20) not in renderer._zoomed_sprites
+        assert (ZOOMED_SPRITE_CACHE_SIZE + 4, 20, 20) in renderer._zoomed_sprites
+
+
+class TestTearPuddleStamps:
+    """Tests for tear puddles drawn from pre-rendered opacity stamps."""
+
+    def test_fading_puddles_allocate_no_surfaces(self, renderer):
+        """Test puddles only build stamps once per radius, however often drawn."""
+        puddles = [{"x": 100 + i * 50, "y": 300, "radius": 20, "alpha": 0} for i in range(4)]
+        boss = Mock(puddles=puddles)
+        renderer._render_tear_puddles(boss, 0, 0, None)
+
+        with patch("renderer.pygame.Surface", wraps=pygame.Surface) as mock_surface:
+            for alpha in range(200, 0, -10):
+                for puddle in puddles:
+                    puddle["alpha"] = alpha
+                renderer._render_tear_puddles(boss, 0, 0, None)
+
+        assert mock_surface.call_count == 1
+        assert list(renderer._puddle_stamps) == [20]
+
+    def test_stamp_opacity_follows_puddle_alpha(self, renderer):
+        """Test fainter puddles are drawn with fainter stamps."""
+        faint = Mock(puddles=[{"x": 100, "y": 100, "radius": 20, "alpha": 40}])
+        strong = Mock(puddles=[{"x": 100, "y": 100, "radius": 20, "alpha": 200}])
+
+        with patch.object(renderer, "screen") as screen:
+            renderer._render_tear_puddles(faint, 0, 0, None)
+            renderer._render_tear_puddles(strong, 0, 0, None)
+
+        faint_stamp = screen.blit.call_args_list[0][0][0]
+        strong_stamp = screen.blit.call_args_list[1][0][0]
+        assert faint_stamp.get_alpha() < strong_stamp.get_alpha()
+        assert strong_stamp.get_size() == (40, 12)
+
+
+class TestMessagePanelCache:
+    """Tests for composited message/menu panel caching."""
+
+    PAUSE_MENU = "⏸️ PAUSED\n\n▶ Return to Game\n  Quit Game\n\nENTER = Confirm"
+
+    def test_unchanged_message_is_built_once(self, renderer):
+        """Test a menu on screen for many frames is laid out only once."""
+        with patch.object(
+            renderer, "_replace_emojis_with_ascii", wraps=renderer._replace_emojis_with_ascii
+        ) as mock_replace:
+            for _ in range(30):
+                renderer.render_message_bubble(self.PAUSE_MENU)
+
+        assert mock_replace.call_count == 1
+
+    def test_selection_change_rebuilds_panel(self, renderer):
+        """Test moving the selection produces a different panel."""
+        renderer.render_message_bubble(self.PAUSE_MENU)
+        moved = "⏸️ PAUSED\n\n  Return to Game\n▶ Quit Game\n\nENTER = Confirm"
+        renderer.render_message_bubble(moved)
+
+        first = renderer._panel_cache[("bubble", self.PAUSE_MENU)]
+        second = renderer._panel_cache[("bubble", moved)]
+        assert first is not second
+
+    def test_cache_is_bounded(self, renderer):
+        """Test old panels are evicted."""
+        for i in range(40):
+            renderer.render_message_bubble(f"Message {i}\nPress ENTER to continue")
+
+        assert len(renderer._panel_cache) <= 16
+
+    def test_panel_is_centered(self, renderer):
+        """Test the cached panel is blitted in the middle of the screen."""
+        renderer.screen.fill((0, 0, 0))
+        renderer.render_message_bubble("Hello\nPress ENTER to continue")
+
+        # Panel border is light purple, the dimmed background stays black
+        assert renderer.screen.get_at((640, 360))[:3] != (0, 0, 0)
+        assert renderer.screen.get_at((5, 5))[:3] == (0, 0, 0)
+
+    def test_wrap_text_measures_without_rendering(self, renderer):
+        """Test word wrapping uses font.size instead of font.render."""
+        font = Mock()
+        font.size.side_effect = lambda text: (len(text) * 10, 20)
+
+        lines = renderer._wrap_text("one two three four", font, 100)
+
+        assert lines == ["one two", "three four"]
+        font.render.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,154 @@
+"""Tests for the on-disk GraphQL response cache."""
+
+import gzip
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from response_cache import ResponseCache, root_field
+from sonrai_client import SonraiAPIClient
+
+UNUSED_QUERY = """
+query getUnusedIdentities($filters: UnusedIdentitiesFilter!) {
+    UnusedIdentities(where: $filters) { items { account count } }
+}
+"""
+QUARANTINE_MUTATION = """
+mutation quarantine($input: ChangeQuarantineStatusInput!) {
+    ChangeQuarantineStatus(input: $input) { success count }
+}
+"""
+
+
+def _response(data):
+    """Build a successful HTTP response."""
+    response = Mock(status_code=200)
+    response.json.return_value = data
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an empty cache in a temp directory."""
+    return ResponseCache(str(tmp_path / "cache"))
+
+
+class TestResponseCache:
+    """Test keys, TTLs, compression and invalidation."""
+
+    def test_key_ignores_whitespace_and_variable_order(self):
+        """Test the content address depends on meaning, not formatting."""
+        a = ResponseCache.make_key("query { X }", {"a": 1, "b": 2})
+        b = ResponseCache.make_key("query {\n    X\n}", {"b": 2, "a": 1})
+
+        assert a == b
+        assert a != ResponseCache.make_key("query { X }", {"a": 2, "b": 2})
+
+    def test_root_field(self):
+        """Test queries are namespaced by their root field."""
+        assert root_field(UNUSED_QUERY) == "UnusedIdentities"
+        assert root_field(QUARANTINE_MUTATION) == "ChangeQuarantineStatus"
+
+    def test_round_trip_is_compressed(self, cache):
+        """Test a stored read is served back from a gzip file."""
+        data = {"data": {"UnusedIdentities": {"items": []}}}
+        cache.put(UNUSED_QUERY, {"a": 1}, data)
+
+        assert cache.get(UNUSED_QUERY, {"a": 1}) == data
+        assert cache.get(UNUSED_QUERY, {"a": 2}) is None
+        (path,) = (cache.cache_dir / "UnusedIdentities").iterdir()
+        assert gzip.decompress(path.read_bytes())
+
+    def test_expired_entries_are_not_served_online(self, cache):
+        """Test reads older than their TTL count as misses."""
+        cache.put(UNUSED_QUERY, None, {"data": {}})
+
+        with patch("response_cache.time.time", return_value=time.time() + 301):
+            assert cache.get(UNUSED_QUERY) is None
+
+    def test_offline_replays_everything_recorded(self, cache):
+        """Test offline mode serves expired reads and recorded mutations."""
+        cache.put(UNUSED_QUERY, None, {"data": {"read": True}})
+        cache.put(QUARANTINE_MUTATION, {"id": 1}, {"data": {"write": True}})
+        offline = ResponseCache(str(cache.cache_dir), offline=True)
+
+        assert cache.get(QUARANTINE_MUTATION, {"id": 1}) is None  # Never served online
+        with patch("response_cache.time.time", return_value=time.time() + 10**6):
+            assert offline.get(UNUSED_QUERY) == {"data": {"read": True}}
+        assert offline.get(QUARANTINE_MUTATION, {"id": 1}) == {"data": {"write": True}}
+
+    def test_mutation_invalidates_dependent_reads(self, cache):
+        """Test ChangeQuarantineStatus drops cached unused identities."""
+        cache.put(UNUSED_QUERY, None, {"data": {}})
+
+        cache.invalidate_after(QUARANTINE_MUTATION)
+
+        assert cache.get(UNUSED_QUERY) is None
+
+
+class TestClientResponseCache:
+    """Test SonraiAPIClient routes GraphQL calls through the cache."""
+
+    @pytest.fixture
+    def client(self, cache):
+        """Create a client with a response cache."""
+        return SonraiAPIClient(
+            api_url="https://test.sonrai.com/graphql",
+            org_id="test-org-123",
+            api_token="test-token-456",
+            response_cache=cache,
+        )
+
+    @patch("sonrai_client.requests.Session.post")
+    def test_warm_read_skips_network(self, mock_post, client):
+        """Test a second identical read is served from disk."""
+        mock_post.return_value = _response({"data": {"UnusedIdentities": {"items": []}}})
+        payload = {"query": UNUSED_QUERY, "variables": {"filters": {}}}
+
+        first = client._post(json=payload, timeout=30)
+        second = client._post(json=payload, timeout=30)
+
+        assert mock_post.call_count == 1
+        assert second.json() == first.json()
+
+    @patch("sonrai_client.requests.Session.post")
+    def test_quarantine_invalidates_identities(self, mock_post, client):
+        """Test a successful quarantine forces the next identity read to the network."""
+        mock_post.return_value = _response({"data": {"UnusedIdentities": {"items": []}}})
+        read = {"query": UNUSED_QUERY, "variables": {"filters": {}}}
+        client._post(json=read, timeout=30)
+
+        mock_post.return_value = _response({"data": {"ChangeQuarantineStatus": {"success": True}}})
+        client._post(json={"query": QUARANTINE_MUTATION, "variables": {}}, timeout=15)
+        client._post(json=read, timeout=30)
+
+        assert mock_post.call_count == 3
+
+    @patch("sonrai_client.requests.Session.post")
+    def test_graphql_errors_are_not_cached(self, mock_post, client):
+        """Test responses carrying GraphQL errors are fetched again."""
+        mock_post.return_value = _response({"errors": [{"message": "boom"}]})
+        payload = {"query": UNUSED_QUERY, "variables": {}}
+
+        client._post(json=payload, timeout=30)
+        client._post(json=payload, timeout=30)
+
+        assert mock_post.call_count == 2
+
+    @patch("sonrai_client.requests.Session.post")
+    def test_offline_miss_fails_without_network(self, mock_post, cache):
+        """Test offline mode never touches the network."""
+        cache.offline = True
+        client = SonraiAPIClient(
+            api_url="https://test.sonrai.com/graphql",
+            org_id="test-org-123",
+            api_token="test-token-456",
+            response_cache=cache,
+        )
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client._post(json={"query": UNUSED_QUERY}, timeout=30)
+        assert client.fetch_accounts_with_unused_identities() == {}
+        mock_post.assert_not_called()
@@ -0,0 +1,188 @@
+"""Tests for SaveManager's snapshot + append-only journal persistence."""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import save_manager as save_manager_module
+from models import GameStatus, Vector2
+from save_manager import SaveManager
+
+
+def _save(manager, quarantined, score=0, completed=(), blocked=()):
+    """Save a game state varying only the fields under test."""
+    return manager.save_game(
+        player_score=score,
+        player_eliminations=len(quarantined),
+        damage_multiplier=1.0,
+        player_position=Vector2(10, 20),
+        game_status=GameStatus.LOBBY,
+        current_level=None,
+        play_time=1.5,
+        completed_levels=list(completed),
+        unlocked_levels=["111"],
+        quarantined_identities=set(quarantined),
+        blocked_third_parties=set(blocked),
+    )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a save manager writing into a temporary directory."""
+    return SaveManager(str(tmp_path / "save.json"))
+
+
+class TestSaveJournal:
+    """Tests for incremental saves."""
+
+    def test_first_save_writes_snapshot_then_journal_appends(self, manager):
+        """Test later saves append only the new identity instead of rewriting."""
+        assert _save(manager, {"id-1", "id-2"})
+        snapshot = manager.save_file.read_text()
+        assert not manager.journal_file.exists()
+
+        assert _save(manager, {"id-1", "id-2", "id-3"}, score=50)
+
+        assert manager.save_file.read_text() == snapshot
+        events = [json.loads(line) for line in manager.journal_file.read_text().splitlines()]
+        assert [e["event"] for e in events] == ["quarantined", "stats"]
+        assert events[0]["ids"] == ["id-3"]
+
+    def test_load_replays_snapshot_plus_journal(self, manager):
+        """Test a fresh manager sees every incremental change."""
+        _save(manager, {"id-1"})
+        _save(manager, {"id-1", "id-2"}, score=100, completed=["111"], blocked=["Vendor"])
+
+        data = SaveManager(str(manager.save_file)).load_game()
+
+        assert set(data["quarantined_identities"]) == {"id-1", "id-2"}
+        assert data["blocked_third_parties"] == ["Vendor"]
+        assert data["progress"]["completed_levels"] == ["111"]
+        assert data["player"]["score"] == 100
+        assert data["player"]["position"] == {"x": 10, "y": 20}
+
+    def test_unchanged_save_writes_nothing(self, manager):
+        """Test saving identical state does not grow the journal."""
+        _save(manager, {"id-1"})
+        _save(manager, {"id-1"})
+
+        assert not manager.journal_file.exists()
+
+    def test_torn_last_line_is_ignored(self, manager):
+        """Test a crash mid-append loses only the partial event."""
+        _save(manager, {"id-1"})
+        _save(manager, {"id-1", "id-2"})
+        with open(manager.journal_file, "a") as f:
+            f.write('{"event": "quarantined", "ids": ["id-')
+
+        data = SaveManager(str(manager.save_file)).load_game()
+
+        assert set(data["quarantined_identities"]) == {"id-1", "id-2"}
+
+    def test_torn_tail_is_compacted_before_saving_again(self, manager):
+        """Test saves after loading a torn journal survive the next reload."""
+        _save(manager, {"id-1"})
+        _save(manager, {"id-1", "id-2"})
+        with open(manager.journal_file, "a") as f:
+            f.write('{"event": "quarantined", "ids": ["id-')
+
+        reloaded = SaveManager(str(manager.save_file))
+        reloaded.load_game()
+        assert not reloaded.journal_file.exists()
+        _save(reloaded, {"id-1", "id-2", "id-3"})
+
+        data = SaveManager(str(manager.save_file)).load_game()
+        assert set(data["quarantined_identities"]) == {"id-1", "id-2", "id-3"}
+
+    def test_append_after_torn_tail_starts_a_new_line(self, manager):
+        """Test an append onto a torn journal does not glue onto the partial line."""
+        _save(manager, {"id-1"})
+        _save(manager, {"id-1", "id-2"})
+        with open(manager.journal_file, "a") as f:
+            f.write('{"event": "quarantined", "ids": ["id-')
+
+        _save(manager, {"id-1", "id-2", "id-3"})
+
+        data = SaveManager(str(manager.save_file)).load_game()
+        assert set(data["quarantined_identities"]) == {"id-1", "id-2", "id-3"}
+
+    def test_removal_falls_back_to_snapshot(self, manager):
+        """Test state that shrinks is written as a new snapshot."""
+        _save(manager, {"id-1", "id-2"})
+        _save(manager, {"id-1"})
+
+        assert not manager.journal_file.exists()
+        assert SaveManager(str(manager.save_file)).load_game()["quarantined_identities"] == ["id-1"]
+
+
+class TestCompaction:
+    """Tests for folding the journal into a snapshot."""
+
+    def test_journal_is_compacted_after_threshold(self, manager, monkeypatch):
+        """Test the journal is rewritten into the snapshot once it grows."""
+        monkeypatch.setattr(save_manager_module, "JOURNAL_COMPACT_EVENTS", 3)
+        ids = set()
+        for i in range(6):
+            ids.add(f"id-{i}")
+            _save(manager, ids)
+
+        data = SaveManager(str(manager.save_file)).load_game()
+        assert set(data["quarantined_identities"]) == ids
+        assert len(manager.journal_file.read_text().splitlines()) <= 3
+
+    def test_stale_journal_lines_are_not_replayed(self, manager):
+        """Test lines left behind by an interrupted compaction are skipped."""
+        _save(manager, {"id-1"}, score=10)
+        _save(manager, {"id-1"}, score=20)
+        stale = manager.journal_file.read_text()
+
+        assert manager.compact()
+        _save(manager, {"id-1"}, score=30)
+        with open(manager.journal_file, "a") as f:
+            f.write(stale)
+
+        assert SaveManager(str(manager.save_file)).load_game()["player"]["score"] == 30
+
+    def test_delete_removes_snapshot_and_journal(self, manager):
+        """Test starting a new game clears the journal too."""
+        _save(manager, {"id-1"})
+        _save(manager, {"id-1", "id-2"})
+
+        assert manager.delete_save()
+
+        assert not manager.has_save()
+        assert not manager.journal_file.exists()
+
+
+class TestConcurrentSaves:
+    """Tests for the single serialized writer."""
+
+    def test_concurrent_saves_lose_nothing(self, manager):
+        """Test saves from many threads never interleave or drop identities."""
+        _save(manager, set())
+        lock = threading.Lock()
+        ids = set()
+
+        def worker(n):
+            for i in range(20):
+                with lock:
+                    ids.add(f"id-{n}-{i}")
+                    snapshot = set(ids)
+                _save(manager, snapshot)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        _save(manager, ids)
+
+        data = SaveManager(str(manager.save_file)).load_game()
+        assert set(data["quarantined_identities"]) == ids
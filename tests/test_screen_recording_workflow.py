@@ -370,6 +370,7 @@ class TestScreenRecordingWorkflow:
             None,
         )
         game_engine._enter_level(production_door)
+        game_engine.wait_for_quest_requests()  # Quest API results apply on a later frame
 
         # Verify JIT quest initialized
         assert game_engine.game_state.jit_quest is not None
@@ -400,6 +401,7 @@ class TestScreenRecordingWorkflow:
             None,
         )
         game_engine._enter_level(production_door)
+        game_engine.wait_for_quest_requests()  # Quest API results apply on a later frame
 
         # Get first unprotected admin role
         admin_role = next((r for r in game_engine.admin_roles if not r.has_jit), None)
@@ -411,6 +413,7 @@ class TestScreenRecordingWorkflow:
 
         # Update quest to trigger interaction
         game_engine._update_jit_quest(0.016)
+        game_engine.wait_for_quest_requests()  # Quest API results apply on a later frame
 
         # Verify JIT protection applied
         assert admin_role.has_jit is True
@@ -433,6 +436,7 @@ class TestScreenRecordingWorkflow:
             None,
         )
         game_engine._enter_level(production_door)
+        game_engine.wait_for_quest_requests()  # Quest API results apply on a later frame
 
         # Protect all admin roles
         for admin_role in game_engine.admin_roles:
@@ -440,6 +444,7 @@ class TestScreenRecordingWorkflow:
                 game_engine.player.position.x = admin_role.position.x
                 game_engine.player.position.y = admin_role.position.y
                 game_engine._update_jit_quest(0.016)
+                game_engine.wait_for_quest_requests()  # Quest API results apply on a later frame
 
         # Verify quest completed
         assert game_engine.game_state.jit_quest.quest_completed is True
@@ -490,6 +495,7 @@ class TestScreenRecordingWorkflow:
             None,
         )
         game_engine._enter_level(production_door)
+        game_engine.wait_for_quest_requests()  # Quest API results apply on a later frame
         assert game_engine.game_state.status == GameStatus.PLAYING
         assert game_engine.game_state.current_level == 6
 
@@ -37,7 +37,7 @@ def mock_account_scopes():
 class TestFetchPermissionSets:
     """Tests for fetch_permission_sets method."""
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_fetch_permission_sets_success(self, mock_post, mock_client, mock_account_scopes):
         """Test successful fetch of permission sets with ADMIN and PRIVILEGED labels."""
         # Mock _fetch_all_account_scopes
@@ -93,7 +93,7 @@ class TestFetchPermissionSets:
             assert result[1]["id"] == "ps-priv-456"
             assert result[1]["name"] == "PowerUserAccess"
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_fetch_permission_sets_no_scope(self, mock_post, mock_client):
         """Test fetch_permission_sets when account has no scope."""
         with patch.object(mock_client, "_fetch_all_account_scopes", return_value={}):
@@ -102,7 +102,7 @@ class TestFetchPermissionSets:
             assert result == []
             mock_post.assert_not_called()
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_fetch_permission_sets_empty_response_returns_mock_data(
         self, mock_post, mock_client, mock_account_scopes
     ):
@@ -124,7 +124,7 @@ class TestFetchPermissionSets:
             assert all("name" in ps for ps in result)
             assert all("identityLabels" in ps for ps in result)
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_fetch_permission_sets_api_error_returns_mock_data(
         self, mock_post, mock_client, mock_account_scopes
     ):
@@ -145,7 +145,7 @@ class TestFetchPermissionSets:
 class TestFetchJitConfiguration:
     """Tests for fetch_jit_configuration method."""
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_fetch_jit_configuration_success(self, mock_post, mock_client, mock_account_scopes):
         """Test successful fetch of JIT configuration."""
         with patch.object(
@@ -199,7 +199,7 @@ class TestFetchJitConfiguration:
             assert "ps-admin-123" in result["enrolledPermissionSets"]
             assert "ps-priv-456" in result["enrolledPermissionSets"]
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_fetch_jit_configuration_no_scope(self, mock_post, mock_client):
         """Test fetch_jit_configuration when account has no scope."""
         with patch.object(mock_client, "_fetch_all_account_scopes", return_value={}):
@@ -208,7 +208,7 @@ class TestFetchJitConfiguration:
             assert result == {"enrolledPermissionSets": []}
             mock_post.assert_not_called()
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_fetch_jit_configuration_empty(self, mock_post, mock_client, mock_account_scopes):
         """Test fetch_jit_configuration with no JIT configuration."""
         with patch.object(
@@ -226,7 +226,7 @@ class TestFetchJitConfiguration:
 
             assert result == {"enrolledPermissionSets": []}
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_fetch_jit_configuration_api_error(self, mock_post, mock_client, mock_account_scopes):
         """Test fetch_jit_configuration handles API errors gracefully."""
         with patch.object(
@@ -242,7 +242,7 @@ class TestFetchJitConfiguration:
 class TestApplyJitProtection:
     """Tests for apply_jit_protection method."""
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_apply_jit_protection_success(self, mock_post, mock_client, mock_account_scopes):
         """Test successful application of JIT protection."""
         with patch.object(
@@ -273,7 +273,7 @@ class TestApplyJitProtection:
             assert result.identity_id == "ps-admin-123"
             assert result.error_message is None
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_apply_jit_protection_no_scope(self, mock_post, mock_client):
         """Test apply_jit_protection when account has no scope."""
         with patch.object(mock_client, "_fetch_all_account_scopes", return_value={}):
@@ -285,7 +285,7 @@ class TestApplyJitProtection:
             assert "No scope found" in result.error_message
             mock_post.assert_not_called()
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_apply_jit_protection_graphql_error(self, mock_post, mock_client, mock_account_scopes):
         """Test apply_jit_protection handles GraphQL errors."""
         with patch.object(
@@ -304,7 +304,7 @@ class TestApplyJitProtection:
             assert result.success is False
             assert "Permission set not found" in result.error_message
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_apply_jit_protection_api_returns_false(
         self, mock_post, mock_client, mock_account_scopes
     ):
@@ -333,9 +333,12 @@ class TestApplyJitProtection:
             assert result.success is False
             assert "success=false" in result.error_message
 
-    @patch("sonrai_client.requests.post")
-    def test_apply_jit_protection_network_error(self, mock_post, mock_client, mock_account_scopes):
-        """Test apply_jit_protection handles network errors."""
+    @patch("sonrai_client.time.sleep")
+    @patch("sonrai_client.requests.Session.post")
+    def test_apply_jit_protection_network_error(
+        self, mock_post, mock_sleep, mock_client, mock_account_scopes
+    ):
+        """Test apply_jit_protection handles network errors after retrying."""
         with patch.object(
             mock_client, "_fetch_all_account_scopes", return_value=mock_account_scopes
         ):
@@ -347,8 +350,9 @@ class TestApplyJitProtection:
 
             assert result.success is False
             assert "Network error" in result.error_message
+            assert mock_post.call_count == 3
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_apply_jit_protection_invalid_response(
         self, mock_post, mock_client, mock_account_scopes
     ):
@@ -373,7 +377,7 @@ class TestApplyJitProtection:
 class TestJitIntegration:
     """Integration tests for JIT workflow."""
 
-    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
     def test_jit_workflow_fetch_and_protect(self, mock_post, mock_client, mock_account_scopes):
         """Test complete workflow: fetch permission sets, check JIT config, apply protection."""
         with patch.object(
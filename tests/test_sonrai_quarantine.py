@@ -0,0 +1,173 @@
+"""Tests for Sonrai API client quarantine methods."""
+
+# Add src to path
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from models import QuarantineResult, Vector2
+from sonrai_client import SonraiAPIClient
+from zombie import Zombie
+
+SANDBOX_SCOPE = "aws/r-ipxz/ou-ipxz-87654321/577945324761"
+PROD_SCOPE = "aws/r-ipxz/ou-ipxz-12345678/613056517323"
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock Sonrai API client."""
+    return SonraiAPIClient(
+        api_url="https://test.sonrai.com/graphql",
+        org_id="test-org-123",
+        api_token="test-token-456",
+    )
+
+
+def _zombies(count, scope=SANDBOX_SCOPE, account="577945324761"):
+    """Create zombies with real-looking SRNs in one scope."""
+    return [
+        Zombie(
+            identity_id=f"srn:aws:iam::{account}/User/User/test-user-{i}",
+            identity_name=f"test-user-{i}",
+            position=Vector2(0, 0),
+            account=account,
+            scope=scope,
+        )
+        for i in range(count)
+    ]
+
+
+def _mutation_response(success=True, count=None):
+    """Build a ChangeQuarantineStatus HTTP response."""
+    response = Mock()
+    response.json.return_value = {
+        "data": {
+            "ChangeQuarantineStatus": {
+                "transactionId": "tx-1",
+                "success": success,
+                "count": count,
+            }
+        }
+    }
+    return response
+
+
+def _echo_count(*args, **kwargs):
+    """Respond as if every identity in the mutation was quarantined."""
+    identities = kwargs["json"]["variables"]["input"]["identities"]
+    return _mutation_response(count=len(identities))
+
+
+class TestQuarantineIdentity:
+    """Tests for quarantine_identity method."""
+
+    @patch("sonrai_client.requests.Session.post")
+    def test_sends_single_identity_mutation(self, mock_post, mock_client):
+        """Test the SRN is converted to an ARN and sent with its scopes."""
+        mock_post.return_value = _mutation_response(count=1)
+
+        result = mock_client.quarantine_identity(
+            identity_id="srn:aws:iam::577945324761/User/User/test-user-1",
+            scope=SANDBOX_SCOPE,
+        )
+
+        assert result.success is True
+        payload = mock_post.call_args.kwargs["json"]["variables"]["input"]
+        assert payload["rootScope"] == "aws/r-ipxz"
+        assert payload["identities"] == [
+            {
+                "resourceId": "arn:aws:iam::577945324761:user/test-user-1",
+                "scope": SANDBOX_SCOPE,
+                "name": "test-user-1",
+                "account": "577945324761",
+            }
+        ]
+
+    @patch("sonrai_client.requests.Session.post")
+    def test_requires_scope(self, mock_post, mock_client):
+        """Test no request is sent without a real scope."""
+        result = mock_client.quarantine_identity(identity_id="srn:aws:iam::1/User/User/x")
+
+        assert result.success is False
+        mock_post.assert_not_called()
+
+
+class TestBatchQuarantineIdentities:
+    """Tests for batch_quarantine_identities method."""
+
+    @patch("sonrai_client.requests.Session.post", side_effect=_echo_count)
+    def test_sends_chunked_multi_identity_mutations(self, mock_post, mock_client):
+        """Test identities go out in chunks instead of one request each."""
+        report = mock_client.batch_quarantine_identities(_zombies(120), chunk_size=50)
+
+        assert mock_post.call_count == 3
+        sizes = [
+            len(call.kwargs["json"]["variables"]["input"]["identities"])
+            for call in mock_post.call_args_list
+        ]
+        assert sizes == [50, 50, 20]
+        assert report.total_queued == 120
+        assert report.successful == 120
+        assert report.failed == 0
+
+    @patch("sonrai_client.requests.Session.post", side_effect=_echo_count)
+    def test_groups_by_scope(self, mock_post, mock_client):
+        """Test each mutation only carries identities of one scope."""
+        zombies = _zombies(3) + _zombies(2, scope=PROD_SCOPE, account="613056517323")
+
+        report = mock_client.batch_quarantine_identities(zombies)
+
+        assert mock_post.call_count == 2
+        for call in mock_post.call_args_list:
+            scopes = {i["scope"] for i in call.kwargs["json"]["variables"]["input"]["identities"]}
+            assert len(scopes) == 1
+        assert report.successful == 5
+
+    @patch("sonrai_client.time.sleep")
+    @patch("sonrai_client.requests.Session.post")
+    def test_partial_failure_falls_back_to_single_calls(self, mock_post, mock_sleep, mock_client):
+        """Test a chunk reporting fewer identities is retried one by one."""
+        mock_post.return_value = _mutation_response(count=2)
+        zombies = _zombies(3)
+
+        with patch.object(
+            mock_client,
+            "quarantine_identity",
+            side_effect=[
+                QuarantineResult(success=True, identity_id=zombies[0].identity_id),
+                QuarantineResult(success=True, identity_id=zombies[1].identity_id),
+                QuarantineResult(
+                    success=False, identity_id=zombies[2].identity_id, error_message="denied"
+                ),
+            ],
+        ) as mock_single:
+            report = mock_client.batch_quarantine_identities(zombies)
+
+        assert mock_single.call_count == 3
+        assert report.successful == 2
+        assert report.failed == 1
+        assert report.error_messages == ["test-user-2: denied"]
+        mock_sleep.assert_not_called()
+
+    @patch("sonrai_client.requests.Session.post", side_effect=_echo_count)
+    def test_zombies_without_scope_fail_without_request(self, mock_post, mock_client):
+        """Test identities missing a scope are reported, never sent."""
+        zombies = _zombies(2, scope=None)
+
+        report = mock_client.batch_quarantine_identities(zombies)
+
+        mock_post.assert_not_called()
+        assert report.failed == 2
+        assert report.successful == 0
+
+    def test_empty_queue(self, mock_client):
+        """Test an empty queue returns an empty report."""
+        report = mock_client.batch_quarantine_identities([])
+
+        assert report.total_queued == 0
+        assert report.successful == 0
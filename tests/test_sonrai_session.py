@@ -0,0 +1,130 @@
+"""Tests for the Sonrai client's pooled session, retry policy and request stats."""
+
+# Add src to path
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from response_cache import ResponseCache
+from sonrai_client import API_POOL_MAXSIZE, OfflineCacheMiss, SonraiAPIClient
+
+QUERY = "query { ThirdParties { items { id } } }"
+
+
+@pytest.fixture
+def client():
+    """Create a Sonrai API client without a response cache."""
+    return SonraiAPIClient(
+        api_url="https://test.sonrai.com/graphql",
+        org_id="test-org-123",
+        api_token="test-token-456",
+    )
+
+
+def _response(status_code=200, data=None):
+    """Build an HTTP response with a real raise_for_status()."""
+    response = requests.models.Response()
+    response.status_code = status_code
+    response._content = b"{}"
+    response.json = Mock(return_value=data if data is not None else {"data": {}})
+    return response
+
+
+class TestSession:
+    """Tests for the shared HTTP session."""
+
+    def test_headers_and_pool_are_configured_once(self, client):
+        """The session carries auth and gzip headers and a sized connection pool."""
+        headers = client.session.headers
+        assert headers["Authorization"] == "Bearer test-token-456"
+        assert "gzip" in headers["Accept-Encoding"]
+
+        adapter = client.session.get_adapter("https://test.sonrai.com/graphql")
+        assert adapter._pool_maxsize == API_POOL_MAXSIZE
+        assert adapter.max_retries.total == 0
+
+    @patch("sonrai_client.requests.post")
+    @patch("sonrai_client.requests.Session.post")
+    def test_requests_reuse_the_session(self, mock_session_post, mock_post, client):
+        """Every call goes through the one session instead of requests.post."""
+        mock_session_post.return_value = _response()
+
+        client._make_request_with_timeout(QUERY)
+        client._make_request_with_timeout(QUERY)
+
+        assert mock_session_post.call_count == 2
+        mock_post.assert_not_called()
+
+
+class TestRetryPolicy:
+    """Tests for the unified retry policy in _make_request_with_timeout."""
+
+    @patch("sonrai_client.time.sleep")
+    @patch("sonrai_client.requests.Session.post")
+    def test_transient_errors_are_retried_with_backoff(self, mock_post, mock_sleep, client):
+        """Timeouts and 503s are retried with exponential backoff."""
+        mock_post.side_effect = [
+            requests.exceptions.Timeout("slow"),
+            _response(503),
+            _response(data={"data": {"ok": True}}),
+        ]
+
+        assert client._make_request_with_timeout(QUERY) == {"data": {"ok": True}}
+        assert mock_post.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+
+    @patch("sonrai_client.time.sleep")
+    @patch("sonrai_client.requests.Session.post")
+    def test_client_errors_are_not_retried(self, mock_post, mock_sleep, client):
+        """A 4xx response fails immediately."""
+        mock_post.return_value = _response(401)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            client._make_request_with_timeout(QUERY)
+
+        assert mock_post.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("sonrai_client.time.sleep")
+    @patch("sonrai_client.requests.Session.post")
+    def test_offline_miss_is_not_retried(self, mock_post, mock_sleep, tmp_path):
+        """An offline cache miss fails without retrying or touching the network."""
+        client = SonraiAPIClient(
+            api_url="https://test.sonrai.com/graphql",
+            org_id="test-org-123",
+            api_token="test-token-456",
+            response_cache=ResponseCache(str(tmp_path), offline=True),
+        )
+
+        with pytest.raises(OfflineCacheMiss):
+            client._make_request_with_timeout(QUERY)
+
+        mock_post.assert_not_called()
+        mock_sleep.assert_not_called()
+
+
+class TestRequestStats:
+    """Tests for per-endpoint request counters."""
+
+    @patch("sonrai_client.time.sleep")
+    @patch("sonrai_client.requests.Session.post")
+    def test_counts_requests_retries_and_failures(self, mock_post, mock_sleep, client):
+        """Stats are kept per GraphQL root field."""
+        mock_post.side_effect = [_response(502), _response(), _response()]
+
+        client._make_request_with_timeout(QUERY)
+        client._make_request_with_timeout("query { PermissionSets { items { id } } }")
+
+        stats = client.get_request_stats()
+        assert stats["ThirdParties"].requests == 2
+        assert stats["ThirdParties"].retries == 1
+        assert stats["ThirdParties"].failures == 1
+        assert stats["PermissionSets"].requests == 1
+        assert stats["PermissionSets"].retries == 0
+        assert stats["PermissionSets"].max_latency >= stats["PermissionSets"].average_latency
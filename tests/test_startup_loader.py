@@ -0,0 +1,165 @@
+"""Tests for the concurrent startup loader."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from models import Vector2
+from sonrai_client import SonraiAPIClient
+from startup_loader import StartupLoader
+from zombie import Zombie
+
+
+def _zombie(account, i):
+    """Create a zombie for an account."""
+    return Zombie(
+        identity_id=f"srn:aws:iam::{account}/User/User/u{i}",
+        identity_name=f"u{i}",
+        position=Vector2(0, 0),
+        account=account,
+    )
+
+
+@pytest.fixture
+def api_client():
+    """Create a mock API client with slow, independent queries."""
+    client = Mock()
+    client.authenticate.return_value = True
+    client.fetch_accounts_with_unused_identities.side_effect = lambda: (
+        time.sleep(0.1) or {"111": 2, "222": 1, "333": 0}
+    )
+    client.fetch_third_parties_by_account.side_effect = lambda root_scope: (
+        time.sleep(0.1) or {"111": [{"name": "Vendor"}]}
+    )
+    client._fetch_all_account_scopes.return_value = {"111": "aws/r-1/111"}
+    return client
+
+
+def _run(loader, timeout=5.0):
+    """Poll the loader like the game loop does, collecting streamed zombies."""
+    streamed = []
+    loader.start()
+    deadline = time.monotonic() + timeout
+    while not loader.done and time.monotonic() < deadline:
+        streamed.extend(loader.poll())
+        time.sleep(0.005)
+    return streamed
+
+
+class TestStartupLoader:
+    """Test task ordering, concurrency and zombie streaming."""
+
+    def test_independent_queries_run_concurrently(self, api_client):
+        """Test accounts and 3rd parties overlap instead of running back to back."""
+        loader = StartupLoader(api_client, zombie_fetcher=lambda a, c: [])
+
+        started = time.perf_counter()
+        loader.start()
+        while not loader.lobby_ready:
+            loader.poll()
+            time.sleep(0.005)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.19  # Sequential would take at least 0.2s
+        assert loader.account_data == {"111": 2, "222": 1, "333": 0}
+        assert loader.third_party_data == {"111": [{"name": "Vendor"}]}
+        loader.wait()
+
+    def test_zombies_stream_per_account(self, api_client):
+        """Test each account with zombies is fetched once and streamed to the caller."""
+        fetched = []
+
+        def fetch(account, count):
+            fetched.append(account)
+            return [_zombie(account, i) for i in range(count)]
+
+        loader = StartupLoader(api_client, zombie_fetcher=fetch)
+        streamed = _run(loader)
+
+        assert sorted(fetched) == ["111", "222"]  # Account 333 has no zombies
+        assert len(streamed) == 3
+        assert loader.zombies == streamed
+        assert loader.progress == 1.0
+        api_client._fetch_all_account_scopes.assert_called_once()
+        assert loader.dispatcher._pending == []  # Polling released every future
+
+    def test_failed_account_is_skipped(self, api_client):
+        """Test one account failing does not stop the others."""
+
+        def fetch(account, count):
+            if account == "111":
+                raise RuntimeError("boom")
+            return [_zombie(account, 0)]
+
+        loader = StartupLoader(api_client, zombie_fetcher=fetch)
+        streamed = _run(loader)
+
+        assert loader.error is None
+        assert [z.account for z in streamed] == ["222"]
+
+    def test_auth_failure_stops_loading(self, api_client):
+        """Test a failed authentication is reported and nothing else is fetched."""
+        api_client.authenticate.return_value = False
+
+        loader = StartupLoader(api_client, zombie_fetcher=lambda a, c: [])
+        _run(loader)
+
+        assert isinstance(loader.error, RuntimeError)
+        assert not loader.lobby_ready
+        api_client.fetch_accounts_with_unused_identities.assert_not_called()
+
+
+class TestSharedAccountScopes:
+    """Test the CloudHierarchyList scope map is fetched once per client."""
+
+    @patch("sonrai_client.requests.Session.post")
+    def test_concurrent_callers_share_one_query(self, mock_post):
+        """Test parallel callers wait for one CloudHierarchyList request."""
+        client = SonraiAPIClient(
+            api_url="https://test.sonrai.com/graphql",
+            org_id="test-org-123",
+            api_token="test-token-456",
+        )
+
+        def respond(*args, **kwargs):
+            time.sleep(0.05)
+            response = Mock()
+            response.json.return_value = {
+                "data": {
+                    "CloudHierarchyList": {
+                        "items": [
+                            {"resourceId": "577945324761", "scope": "aws/r-ipxz/577945324761"}
+                        ]
+                    }
+                }
+            }
+            return response
+
+        mock_post.side_effect = respond
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client._fetch_all_account_scopes()))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_post.call_count == 1
+        assert all(r == {"577945324761": "aws/r-ipxz/577945324761"} for r in results)
+
+    @patch("sonrai_client.requests.Session.post", side_effect=Exception("offline"))
+    def test_failed_fetch_is_not_cached(self, mock_post):
+        """Test an empty result is retried by the next caller."""
+        client = SonraiAPIClient(
+            api_url="https://test.sonrai.com/graphql",
+            org_id="test-org-123",
+            api_token="test-token-456",
+        )
+
+        assert client._fetch_all_account_scopes() == {}
+        assert client._fetch_all_account_scopes() == {}
+        assert mock_post.call_count == 2
@@ -0,0 +1,80 @@
+"""Tests for the shared text surface cache."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from models import GenreType
+from space_shooter_controller import SpaceShooterController
+from text_cache import TextCache
+
+
+@pytest.fixture
+def font():
+    """Create a label font."""
+    pygame.font.init()
+    return pygame.font.Font(None, 20)
+
+
+class TestTextCache:
+    """Test caching, outlining and eviction of text surfaces."""
+
+    def test_repeated_text_is_rendered_once(self, font):
+        """Test the same label is served from the cache after the first render."""
+        cache = TextCache()
+
+        first = cache.render("42", font, (255, 255, 255))
+        second = cache.render("42", font, (255, 255, 255))
+
+        assert first is second
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+    def test_key_includes_color_and_outline(self, font):
+        """Test different colors and outlines are cached separately."""
+        cache = TextCache()
+
+        cache.render("nOps", font, (255, 215, 0))
+        cache.render("nOps", font, (255, 255, 255))
+        cache.render("nOps", font, (255, 215, 0), outline_color=(0, 0, 0))
+
+        assert len(cache) == 3
+        assert cache.hits == 0
+
+    def test_outlined_label_is_composited(self, font):
+        """Test an outlined label is one surface with a 1px border of outline."""
+        cache = TextCache()
+
+        plain = cache.render("7", font, (255, 255, 255))
+        outlined = cache.render("7", font, (255, 255, 255), outline_color=(0, 0, 0))
+
+        assert outlined.get_size() == (plain.get_width() + 2, plain.get_height() + 2)
+        # The outline extends past the glyphs on both sides
+        assert outlined.get_bounding_rect().width > plain.get_bounding_rect().width
+
+    def test_memory_budget_evicts_oldest(self, font):
+        """Test the cache stays within its byte budget, dropping the oldest labels."""
+        label_bytes = TextCache._size_of(font.render("0000", True, (255, 255, 255)))
+        cache = TextCache(max_bytes=label_bytes * 3)
+
+        for number in range(1000, 1010):
+            cache.render(str(number), font, (255, 255, 255))
+
+        assert cache.resident_bytes <= cache.max_bytes
+        assert cache.evictions > 0
+        cache.render("1009", font, (255, 255, 255))
+        assert cache.hits == 1
+
+
+class TestGenreControllerFonts:
+    """Test genre controllers reuse fonts between frames."""
+
+    def test_space_shooter_label_font_created_once(self):
+        """Test the label font is built once and reused by later frames."""
+        pygame.init()
+        controller = SpaceShooterController(GenreType.SPACE_SHOOTER, 800, 600)
+
+        assert controller._get_font(18) is controller._get_font(18)
@@ -2,7 +2,7 @@
 
 import pytest
 from models import Vector2
-from zombie import Zombie
+from zombie import ZOMBIE_SPRITE_ATLAS, Zombie
 
 
 class TestZombieInitialization:
@@ -91,3 +91,61 @@ class TestZombieMovement:
         zombie.velocity = Vector2(100, 0)
         assert zombie.velocity.x == 100
         assert zombie.velocity.y == 0
+
+
+class TestZombieSpriteAtlas:
+    """Test zombies share pre-rendered sprites from the atlas."""
+
+    def _make_zombie(self, variant: int) -> Zombie:
+        zombie = Zombie(
+            identity_id=f"test-{variant}",
+            identity_name="test-user-1",
+            position=Vector2(0, 0),
+            account="123456789012",
+        )
+        zombie.variant = variant
+        return zombie
+
+    def test_same_variant_shares_one_surface(self):
+        """Test zombies of the same variant reference the same sprite."""
+        first = self._make_zombie(2)
+        second = self._make_zombie(2)
+
+        assert first.sprite is second.sprite
+        assert first.sprite.get_size() == (first.width, first.height)
+
+    def test_different_variants_have_different_surfaces(self):
+        """Test each variant gets its own sprite."""
+        sprites = {id(self._make_zombie(v).sprite) for v in range(4)}
+
+        assert len(sprites) == 4
+
+    def test_zoomed_sprite_is_cached_at_scaled_size(self):
+        """Test landing-zone zoom returns a cached, pre-scaled sprite."""
+        zombie = self._make_zombie(0)
+
+        zoomed = zombie.get_sprite(0.5)
+
+        assert zoomed.get_size() == (20, 20)
+        assert zombie.get_sprite(0.5) is zoomed
+
+    def test_flashing_sprite_is_separate_entry(self):
+        """Test the damage flash uses its own pre-rendered sprite."""
+        zombie = self._make_zombie(1)
+        normal = zombie.get_sprite()
+
+        zombie.take_damage(1)
+
+        assert zombie.get_sprite() is not normal
+        assert zombie.get_sprite() is ZOMBIE_SPRITE_ATLAS.get(1, 40, 40, flashing=True)
+
+    def test_creating_zombies_does_not_grow_atlas(self):
+        """Test atlas size is independent of zombie count."""
+        Zombie.prewarm_sprites()
+        before = len(ZOMBIE_SPRITE_ATLAS)
+
+        zombies = [self._make_zombie(i % 4) for i in range(200)]
+        for zombie in zombies:
+            zombie.get_sprite()
+
+        assert len(ZOMBIE_SPRITE_ATLAS) == before
@@ -0,0 +1,54 @@
+"""Tests for spreading zombies out across the lobby and platformer levels."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+
+import pytest
+
+from game_map import GameMap
+from models import Vector2
+from zombie import Zombie
+
+
+def _zombies(count, account):
+    """Create zombies belonging to one account."""
+    return [Zombie(f"z-{i}", f"zombie-{i}", Vector2(0, 0), account=account) for i in range(count)]
+
+
+def _closest_pair(zombies):
+    """Smallest distance between any two zombies."""
+    return min(
+        ((a.position.x - b.position.x) ** 2 + (a.position.y - b.position.y) ** 2) ** 0.5
+        for i, a in enumerate(zombies)
+        for b in zombies[i + 1 :]
+    )
+
+
+class TestScatterZombies:
+    """Test zombie placement spacing."""
+
+    @pytest.fixture(params=["lobby", "platformer"])
+    def game_map(self, request):
+        """Create a one-account map in either mode."""
+        random.seed(1)
+        return GameMap("unused.png", 800, 600, account_data={"Test": 20}, mode=request.param)
+
+    def test_placements_keep_min_distance(self, game_map):
+        """Test no two zombies are placed closer than the requested spacing."""
+        zombies = _zombies(20, "Test")
+
+        game_map.scatter_zombies(zombies, min_distance=50)
+
+        assert _closest_pair(zombies) >= 50
+
+    @pytest.mark.parametrize("min_distance", [0, -10])
+    def test_non_positive_min_distance_places_without_spacing(self, game_map, min_distance):
+        """Test a spacing of zero or less places every zombie instead of dividing by it."""
+        zombies = _zombies(20, "Test")
+
+        game_map.scatter_zombies(zombies, min_distance=min_distance)
+
+        assert all(zombie.position != Vector2(0, 0) for zombie in zombies)
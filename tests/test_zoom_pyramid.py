@@ -0,0 +1,130 @@
+"""Tests for the landing zone zoom pyramid."""
+
+import math
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from zoom_pyramid import ZOOM_STEPS_PER_OCTAVE, ZoomPyramid, quantize_zoom
+
+
+class TestQuantizeZoom:
+    """Test snapping zoom factors to pyramid steps."""
+
+    def test_snaps_to_geometric_steps(self):
+        """Test every quantized zoom is a power of the step ratio."""
+        for zoom in (0.93, 0.61, 0.37, 0.12):
+            steps = -ZOOM_STEPS_PER_OCTAVE * math.log2(quantize_zoom(zoom))
+            assert steps == pytest.approx(round(steps))
+
+    def test_target_is_exact(self):
+        """Test the target zoom is returned unchanged once reached."""
+        assert quantize_zoom(0.237, 0.237) == 0.237
+
+    def test_never_overshoots_target(self):
+        """Test a quantized zoom stays on the near side of the target."""
+        assert quantize_zoom(0.24, target_zoom=0.237) >= 0.237
+        assert quantize_zoom(0.99, target_zoom=1.0) <= 1.0
+
+    def test_animation_uses_few_levels(self):
+        """Test a full zoom-out animation touches only a handful of levels."""
+        zoom, target, levels = 1.0, 0.15, set()
+        while zoom != target:
+            zoom += (target - zoom) * 2.0 / 60
+            if abs(zoom - target) < 0.01:
+                zoom = target
+            levels.add(quantize_zoom(zoom, target))
+
+        assert len(levels) <= 3 * ZOOM_STEPS_PER_OCTAVE
+
+
+class TestZoomPyramid:
+    """Test building and caching zoom levels."""
+
+    @pytest.fixture
+    def base(self):
+        """Create a base surface with a gradient so scaling is observable."""
+        surface = pygame.Surface((800, 400))
+        for x in range(0, 800, 8):
+            pygame.draw.rect(surface, (x % 256, 100, 200), (x, 0, 8, 400))
+        return surface
+
+    def test_base_zoom_returns_base(self, base):
+        """Test the base zoom is served without scaling."""
+        pyramid = ZoomPyramid(base)
+
+        assert pyramid.get(1.0) is base
+        assert pyramid.builds == 0
+
+    def test_levels_are_built_once(self, base):
+        """Test a zoom level is scaled on first use and reused afterwards."""
+        pyramid = ZoomPyramid(base)
+
+        level = pyramid.get(0.3)
+        assert level.get_size() == (240, 120)
+        assert pyramid.get(0.3) is level
+        assert pyramid.builds == 1
+
+    def test_cache_respects_pixel_budget(self, base):
+        """Test older levels are evicted once the pixel budget is exceeded."""
+        pyramid = ZoomPyramid(base, max_pixels=100 * 100)
+
+        for zoom in (0.25, 0.2, 0.15, 0.1):
+            pyramid.get(zoom)
+
+        cached_pixels = sum(w * h for w, h in pyramid._levels)
+        assert cached_pixels <= 100 * 100
+        assert pyramid.resident_levels < 4
+
+    def test_scaled_base(self, base):
+        """Test a base rendered below world scale maps zooms to world size."""
+        pyramid = ZoomPyramid(base, base_zoom=0.5)
+
+        assert pyramid.get(0.5) is base
+        assert pyramid.get(0.25).get_size() == (400, 200)
+        assert pyramid.get(1.0).get_size() == (1600, 800)
+
+
+class TestGameMapLandingZoom:
+    """Test the lobby map draws the landing zone view from the pyramid."""
+
+    @pytest.fixture
+    def lobby(self):
+        """Create a lobby map."""
+        pygame.init()
+        from game_map import GameMap
+
+        return GameMap(
+            "assets/reinvent_floorplan.png",
+            1280,
+            720,
+            account_data={"577945324761": 5, "613056517323": 5},
+        )
+
+    def test_animating_zoom_does_not_rescale_every_frame(self, lobby):
+        """Test frames during the zoom animation reuse cached levels."""
+        screen = pygame.Surface((1280, 720))
+        lobby.toggle_landing_zone_view()
+
+        frames = 0
+        while lobby.zoom != lobby.target_zoom:
+            lobby.update_zoom(1 / 60)
+            lobby.render(screen)
+            frames += 1
+
+        assert lobby._zoom_pyramid.builds < frames
+
+    def test_entities_line_up_with_map(self, lobby):
+        """Test world_to_screen uses the same zoom the map is drawn at."""
+        lobby.toggle_landing_zone_view()
+        lobby.zoom = 0.77
+
+        scaled_map = lobby._get_zoom_pyramid().get(lobby.display_zoom)
+        right, bottom = lobby.world_to_screen(lobby.map_width, lobby.map_height)
+        left, top = lobby.world_to_screen(0, 0)
+
+        assert abs((right - left) - scaled_map.get_width()) <= 1
+        assert abs((bottom - top) - scaled_map.get_height()) <= 1